@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+import importlib.util
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+# Benchmark del empalme de websockets del proxy: levanta un eco que acepta el Upgrade (y responde el health de
+# Streamlit), arranca server.py como proxy secundario apuntando a ese eco y mide mensajes por segundo y latencia
+# de ida y vuelta (p50/p99) con N conexiones concurrentes haciendo ping-pong. Compara contra el eco directo,
+# el loop de asyncio y uvloop (si está instalado).
+#   python benchmark_proxy.py --conexiones 200 --mensajes 500 --tamano 256
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+def puerto_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+async def atender_eco(reader, writer):
+    try:
+        cabecera = await reader.readuntil(b"\r\n\r\n")
+        if b"/_stcore/health" in cabecera.split(b"\r\n")[0]:
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+            await writer.drain()
+            return
+        writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n\r\n")
+        while datos := await reader.read(65536):
+            writer.write(datos)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+async def servir_eco(puerto):
+    server = await asyncio.start_server(atender_eco, "127.0.0.1", puerto, backlog=4096)
+    async with server:
+        await server.serve_forever()
+
+async def esperar_listo(puerto, timeout=30):
+    limite = time.monotonic() + timeout
+    while time.monotonic() < limite:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", puerto)
+            writer.write(b"GET /readyz HTTP/1.1\r\nHost: bench\r\n\r\n")
+            estado = await reader.readline()
+            writer.close()
+            if b" 200 " in estado:
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError(f"el proxy en :{puerto} no quedó listo")
+
+async def cliente(puerto, mensajes, tamano, latencias):
+    reader, writer = await asyncio.open_connection("127.0.0.1", puerto)
+    writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    writer.write(b"GET /_stcore/stream HTTP/1.1\r\nHost: bench\r\nConnection: Upgrade\r\nUpgrade: websocket\r\n\r\n")
+    await reader.readuntil(b"\r\n\r\n")
+    mensaje = os.urandom(tamano)
+    for _ in range(mensajes):
+        inicio = time.perf_counter()
+        writer.write(mensaje)
+        await reader.readexactly(tamano)
+        latencias.append(time.perf_counter() - inicio)
+    writer.close()
+
+async def medir(puerto, conexiones, mensajes, tamano):
+    latencias = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(puerto, mensajes, tamano, latencias) for _ in range(conexiones)))
+    total = time.perf_counter() - inicio
+    latencias.sort()
+    return {
+        "msgs_s": len(latencias) / total,
+        "mb_s": 2 * len(latencias) * tamano / total / 1e6,
+        "p50_ms": latencias[len(latencias) // 2] * 1000,
+        "p99_ms": latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))] * 1000,
+    }
+
+def lanzar_proxy(puerto_eco, uvloop):
+    puerto = puerto_libre()
+    env = {
+        **os.environ,
+        "PROXY_SECUNDARIO": "1",
+        "STREAMLIT_WORKERS": "1",
+        "STREAMLIT_PORT": str(puerto_eco),
+        "LISTEN_PORT": str(puerto),
+        "PROXY_UVLOOP": "1" if uvloop else "0",
+    }
+    proc = subprocess.Popen([sys.executable, os.path.join(RAIZ, "server.py")], env=env, cwd=RAIZ, stdout=subprocess.DEVNULL)
+    return proc, puerto
+
+async def correr(args):
+    puerto_eco = puerto_libre()
+    eco = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--eco", str(puerto_eco)])
+    modos = [("directo", None), ("asyncio", False)]
+    if importlib.util.find_spec("uvloop"):
+        modos.append(("uvloop", True))
+    else:
+        print("uvloop no está instalado: se omite ese modo")
+    print(f"{args.conexiones} conexiones x {args.mensajes} mensajes de {args.tamano} B (ping-pong)")
+    print(f"{'modo':<10}{'msgs/s':>12}{'MB/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    try:
+        for nombre, uvloop in modos:
+            proc, puerto = (None, puerto_eco) if uvloop is None else lanzar_proxy(puerto_eco, uvloop)
+            try:
+                await esperar_listo(puerto) if proc else await asyncio.sleep(0.5)
+                await medir(puerto, min(args.conexiones, 10), 20, args.tamano)  # calentamiento
+                r = await medir(puerto, args.conexiones, args.mensajes, args.tamano)
+                print(f"{nombre:<10}{r['msgs_s']:>12.0f}{r['mb_s']:>10.1f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}")
+            finally:
+                if proc:
+                    proc.send_signal(signal.SIGTERM)
+                    proc.wait(timeout=40)
+    finally:
+        eco.terminate()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput y latencia del empalme de websockets de server.py")
+    parser.add_argument("--conexiones", type=int, default=100)
+    parser.add_argument("--mensajes", type=int, default=500)
+    parser.add_argument("--tamano", type=int, default=256)
+    parser.add_argument("--eco", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.eco:
+        asyncio.run(servir_eco(args.eco))
+    else:
+        asyncio.run(correr(args))
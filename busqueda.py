@@ -0,0 +1,173 @@
+import ast
+import math
+import os
+import re
+import unicodedata
+from modulos import MODULOS
+from datos.tutoriales import TUTORIALES
+from datos.diagnosticos import DIAGNOSTICOS
+from datos.plagas import PLAGAS_COMUNES
+from datos.legal import LIMITES_LEGALES
+from datos.consejos_etapa import REGLAS_CONSEJOS, RAMAS_CONSEJOS
+from datos.reglas_riego import REGLAS_RIEGO, RAMAS_RIEGO
+
+# Índice invertido BM25 sobre todo el contenido estático de la app. Se arma una sola vez al importar:
+# las consultas sólo recorren las listas de postings de sus términos, nunca el texto.
+K1, B = 1.5, 0.75
+MIN_TEXTO = 40
+_DIR = os.path.dirname(os.path.abspath(__file__))
+
+STOPWORDS = frozenset("""
+a al algo como con de del desde donde e el en entre es esta este esto hay la las lo los mas muy no o para pero
+por que se si sin sobre su sus tu tus un una uno unos unas y ya le les mi me te cada cuando hasta ni ser son
+""".split())
+
+def plegar(texto):
+    texto = unicodedata.normalize("NFKD", texto.lower())
+    return "".join(c for c in texto if not unicodedata.combining(c))
+
+def _raiz(token):
+    # Plurales regulares: "hojas" -> "hoja", "raices" -> "raiz", "hongos" -> "hongo"
+    if len(token) > 4 and token.endswith("ces"):
+        return token[:-3] + "z"
+    if len(token) > 5 and token.endswith("es"):
+        return token[:-2]
+    if len(token) > 3 and token.endswith("s"):
+        return token[:-1]
+    return token
+
+def tokenizar(texto):
+    return [_raiz(t) for t in re.findall(r"[a-z0-9]+", plegar(texto)) if t not in STOPWORDS]
+
+def _limpiar(texto):
+    texto = re.sub(r"\{[a-z_0-9]+\}", "X", texto)
+    texto = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", texto)
+    texto = re.sub(r"[*#>|`]+", "", texto)
+    return re.sub(r"\s+", " ", texto).strip()
+
+# --- Fuentes ---
+
+_LLAMADAS_TEXTO = {"markdown", "info", "success", "warning", "error", "caption", "write"}
+
+def _literal(nodo):
+    if isinstance(nodo, ast.Constant) and isinstance(nodo.value, str):
+        return nodo.value
+    if isinstance(nodo, ast.JoinedStr):
+        return "".join(v.value for v in nodo.values if isinstance(v, ast.Constant))
+    return None
+
+def _textos_modulo(modulo, ruta):
+    # Recorre las llamadas en orden de aparición: icon_subtitle / "#### ..." / expanders fijan el título,
+    # los textos largos de st.markdown/info/... son los documentos
+    with open(ruta, encoding="utf-8") as f:
+        arbol = ast.parse(f.read())
+    llamadas = sorted((n for n in ast.walk(arbol) if isinstance(n, ast.Call) and isinstance(n.func, (ast.Attribute, ast.Name))),
+                      key=lambda n: (n.lineno, n.col_offset))
+    titulo = modulo
+    for n in llamadas:
+        nombre = n.func.attr if isinstance(n.func, ast.Attribute) else n.func.id
+        if nombre in ("icon_subtitle", "icon_title") and len(n.args) > 1 and isinstance(n.args[1], ast.Constant):
+            titulo = n.args[1].value
+        elif nombre == "expander" and n.args and isinstance(n.args[0], ast.Constant):
+            titulo = n.args[0].value
+        elif nombre in _LLAMADAS_TEXTO and n.args:
+            texto = _literal(n.args[0])
+            if texto is None or texto.lstrip().startswith("<"):
+                continue
+            if texto.startswith("####") and "\n" not in texto.strip():
+                titulo = _limpiar(texto)
+            elif len(texto) >= MIN_TEXTO:
+                yield modulo, _limpiar(titulo), texto
+
+def _nombre_rama(ramas, rama):
+    for nombre, _, valor in ramas:
+        if nombre == rama:
+            return valor[0] if isinstance(valor, tuple) else valor
+    return rama
+
+def _documentos():
+    for modulo, paquete in MODULOS.items():
+        yield from _textos_modulo(modulo, os.path.join(_DIR, *paquete.split(".")) + ".py")
+    for modulo, tut in TUTORIALES.items():
+        yield modulo, f"Tutorial: {tut['titulo']}", tut["desc"] + "\n" + "\n".join(tut["pasos"])
+    for r in DIAGNOSTICOS:
+        titulo = f"{r['zona']} · {', '.join(r['sintomas'])}"
+        yield "Diagnóstico & Plagas", titulo, r["diagnostico"].replace("{sintoma}", "síntoma") + "\n" + r["remedio_casero"]
+    for i, plaga in enumerate(PLAGAS_COMUNES["Plaga/Problema"]):
+        yield "Diagnóstico & Plagas", f"Plaga: {plaga}", " · ".join(f"{k}: {v[i]}" for k, v in PLAGAS_COMUNES.items())
+    yield "Sugerencias Legales", "Límites Legales del Cultivo", "\n".join(f"{c}: {l}" for c, l in zip(*LIMITES_LEGALES.values()))
+    for ambito, _, _, campos in REGLAS_CONSEJOS:
+        etapa = _nombre_rama(RAMAS_CONSEJOS, ambito)
+        for campo, texto in campos.items():
+            yield "Seguimiento de Cultivo", f"{etapa} · {campo.replace('_', ' ')}", texto
+    for ambito, _, _, campos in REGLAS_RIEGO:
+        etapa = _nombre_rama(RAMAS_RIEGO, ambito)
+        for campo, texto in campos.items():
+            yield "Calculadora Riego", f"{etapa} · {campo.replace('_', ' ')}", texto
+
+# --- Índice ---
+
+def construir_indice(documentos):
+    docs = []
+    vistos = set()
+    postings = {}
+    for modulo, titulo, texto in documentos:
+        texto = _limpiar(texto)
+        if (modulo, texto) in vistos:
+            continue
+        vistos.add((modulo, texto))
+        tokens = tokenizar(titulo) + tokenizar(texto)
+        if not tokens:
+            continue
+        doc_id = len(docs)
+        docs.append({"modulo": modulo, "titulo": titulo, "texto": texto, "largo": len(tokens)})
+        frecuencias = {}
+        for t in tokens:
+            frecuencias[t] = frecuencias.get(t, 0) + 1
+        for t, tf in frecuencias.items():
+            postings.setdefault(t, []).append((doc_id, tf))
+    n = len(docs)
+    promedio = sum(d["largo"] for d in docs) / max(n, 1)
+    idf = {t: math.log(1 + (n - len(p) + 0.5) / (len(p) + 0.5)) for t, p in postings.items()}
+    normas = [K1 * (1 - B + B * d["largo"] / promedio) for d in docs]
+    return {"docs": docs, "postings": {t: tuple(p) for t, p in postings.items()}, "idf": idf, "normas": normas}
+
+INDICE = construir_indice(_documentos())
+
+def _fragmento(texto, terminos, largo=180):
+    # Se tokeniza el texto como al indexar (plegado y raíz) para ubicar la primera palabra que coincide. El
+    # plegado es carácter a carácter para que las posiciones sirvan sobre el texto original.
+    plegado = "".join((plegar(c) or " ")[0] for c in texto)
+    inicio = next((m.start() for m in re.finditer(r"[a-z0-9]+", plegado) if _raiz(m.group()) in terminos), 0)
+    inicio = max(0, inicio - largo // 3)
+    fragmento = texto[inicio:inicio + largo]
+    return ("…" if inicio else "") + fragmento + ("…" if inicio + largo < len(texto) else "")
+
+def buscar(consulta, limite=8, indice=INDICE, modulos=None):
+    # modulos: si se pasa, sólo se devuelven documentos de esos módulos (los que el usuario puede abrir)
+    terminos = set(tokenizar(consulta))
+    docs = indice["docs"]
+    puntajes = {}
+    for t in terminos:
+        idf = indice["idf"].get(t)
+        if idf is None:
+            continue
+        for doc_id, tf in indice["postings"][t]:
+            if modulos is not None and docs[doc_id]["modulo"] not in modulos:
+                continue
+            puntajes[doc_id] = puntajes.get(doc_id, 0) + idf * tf * (K1 + 1) / (tf + indice["normas"][doc_id])
+    mejores = sorted(puntajes.items(), key=lambda x: -x[1])[:limite]
+    resultados = []
+    for doc_id, puntaje in mejores:
+        doc = docs[doc_id]
+        resultados.append({
+            "modulo": doc["modulo"],
+            "titulo": doc["titulo"],
+            "fragmento": _fragmento(doc["texto"], terminos),
+            "puntaje": puntaje,
+        })
+    return resultados
+
+def modulos_con_resultados(consulta, indice=INDICE):
+    terminos = [t for t in set(tokenizar(consulta)) if t in indice["postings"]]
+    return {indice["docs"][doc_id]["modulo"] for t in terminos for doc_id, _ in indice["postings"][t]}
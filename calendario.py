@@ -0,0 +1,165 @@
+import datetime
+import functools
+import numpy as np
+from etapas import SISTEMAS, SISTEMAS_INTERIOR, TABLAS_ETAPAS, grupo_sistema
+from solar import serie_solar, dispara_floracion, disparo_floracion, FOTOPERIODO_CRITICO
+from datos.climatologia import TEMP_MAX_MENSUAL, TEMP_MIN_MENSUAL
+
+# Calendario proyectado: cada etapa de la tabla dura sus días nominales a la velocidad de una siembra de
+# referencia (1 de octubre, clima normal). En exterior/invernadero la velocidad real son los grados-día del
+# día sobre los grados-día medios de la referencia en esa fase (vegetativa o floración); en interior es
+# constante. Las fotoperiódicas de exterior además no pasan a Pre-Floración hasta que el día se acorta por
+# debajo del fotoperíodo crítico.
+TEMP_BASE, TEMP_TECHO = 5.0, 30.0
+DELTA_INVERNADERO = 3.0
+HORIZONTE = 730
+MARGEN_ANCLA = 180  # días antes del inicio más viejo, para anclar cultivos que van adelantados por calor
+SIEMBRA_REFERENCIA = (10, 1)
+# (ΔT °C, factor de duración de la floración, ajuste del fotoperíodo crítico): temprano, central, tardío
+ESCENARIOS = ((1.5, 0.9, 0.25), (0.0, 1.0, 0.0), (-1.5, 1.1, -0.25))
+# Fracción de la velocidad de floración que depende de la temperatura; el resto la marca el fotoperíodo/genética
+SENSIBILIDAD_FLORACION = 0.5
+
+_NOMBRES_ETAPA = {g: tuple(e["nombre"] for e in tabla) for g, tabla in TABLAS_ETAPAS.items()}
+_INICIOS = {g: np.array([e["inicio"] for e in tabla], dtype=float) for g, tabla in TABLAS_ETAPAS.items()}
+_MAX_ETAPAS = max(len(t) for t in TABLAS_ETAPAS.values())
+
+def _indice_floracion(grupo):
+    return next(k for k, n in enumerate(_NOMBRES_ETAPA[grupo]) if "Flor" in n)
+
+@functools.lru_cache(maxsize=1)
+def clima_normal():
+    # Interpolación lineal entre mediados de mes, circular: (tmax, tmin) por día del año (0-365)
+    mitad = np.array([(datetime.date(2001, m, 15) - datetime.date(2001, 1, 1)).days for m in range(1, 13)])
+    dias = np.arange(366)
+    tmax = np.interp(dias, mitad, TEMP_MAX_MENSUAL, period=365)
+    tmin = np.interp(dias, mitad, TEMP_MIN_MENSUAL, period=365)
+    tmax.setflags(write=False)
+    tmin.setflags(write=False)
+    return tmax, tmin
+
+def grados_dia(tmax, tmin):
+    return np.maximum((np.minimum(tmax, TEMP_TECHO) + np.maximum(tmin, TEMP_BASE)) / 2 - TEMP_BASE, 0)
+
+@functools.lru_cache(maxsize=None)
+def grados_dia_referencia(grupo, floracion):
+    # Grados-día medios de la siembra de referencia en la fase vegetativa o en la de floración
+    tmax, tmin = clima_normal()
+    siembra = (datetime.date(2001, *SIEMBRA_REFERENCIA) - datetime.date(2001, 1, 1)).days
+    corte = int(_INICIOS[grupo][_indice_floracion(grupo)])
+    fase = np.arange(corte, int(_INICIOS[grupo][-1])) if floracion else np.arange(corte)
+    dias = (siembra + fase) % 365
+    return float(grados_dia(tmax[dias], tmin[dias]).mean())
+
+def _dia_del_anio(fechas):
+    return (fechas - fechas.astype("datetime64[Y]")).astype(np.int64)
+
+def _proximo_disparo(luz, critico):
+    # Para cada día, el primer día desde ahí en que el fotoperíodo dispara la floración (len = nunca)
+    dispara = dispara_floracion(luz, np.concatenate((luz[:1], luz[:-1])), critico)
+    n = len(luz)
+    posiciones = np.where(dispara, np.arange(n), n)
+    return np.append(np.minimum.accumulate(posiciones[::-1])[::-1], n)
+
+def _alcanzar(acumulado, desde, umbrales):
+    # Primer día en que el acumulado desde `desde` llega a cada umbral
+    idx = np.searchsorted(acumulado, acumulado[desde][:, None] + umbrales, side="left")
+    return np.maximum(idx, desde[:, None])
+
+def proyectar_calendario(dias, sistemas, lat, lon, tmax_pronostico=None, tmin_pronostico=None, hoy=None, gdd=None):
+    # gdd: grados-día medidos hasta ayer por cultivo (NaN = sin dato). Si hay dato, el cultivo se ancla en el
+    # inicio "virtual" en que el modelo acumula lo mismo hasta hoy: un cultivo adelantado por calor o atrasado
+    # por frío proyecta sus etapas desde donde realmente está.
+    hoy = np.datetime64(hoy or datetime.date.today(), "D")
+    dias = np.asarray(dias, dtype=np.int64)
+    sistemas = np.asarray(sistemas)
+    n = len(dias)
+    inicios = hoy - dias.astype("timedelta64[D]")
+
+    origen = min(inicios.min(), hoy) - np.timedelta64(MARGEN_ANCLA, "D") if n else hoy
+    largo = int((max(inicios.max(), hoy) - origen).astype(np.int64)) + HORIZONTE if n else HORIZONTE
+    fechas = origen + np.arange(largo).astype("timedelta64[D]")
+    doy = _dia_del_anio(fechas)
+    normal_max, normal_min = clima_normal()
+    tmax, tmin = normal_max[doy].copy(), normal_min[doy].copy()
+    hoy_idx = int((hoy - origen).astype(np.int64))
+    for serie, pronostico in ((tmax, tmax_pronostico), (tmin, tmin_pronostico)):
+        valores = np.array([x for x in (pronostico or []) if x is not None], dtype=float)[:largo - hoy_idx]
+        serie[hoy_idx:hoy_idx + len(valores)] = valores
+    luz = serie_solar(lat, lon, fechas)["duracion"]
+
+    desde = (inicios - origen).astype(np.int64)
+    gdd = np.full(n, np.nan) if gdd is None else np.asarray(gdd, dtype=float)
+    fechas_etapas = np.full((n, _MAX_ETAPAS, len(ESCENARIOS)), np.datetime64("NaT"), dtype="datetime64[D]")
+    cosecha = np.full((n, len(ESCENARIOS)), np.datetime64("NaT"), dtype="datetime64[D]")
+    fotoperiodo = np.zeros(n, dtype=bool)
+    for codigo in np.unique(sistemas):
+        fila = sistemas == codigo
+        sist = SISTEMAS[codigo]
+        grupo = grupo_sistema(sist)
+        nominal = _INICIOS[grupo]
+        k_flor = _indice_floracion(grupo)
+        interior = sist in SISTEMAS_INTERIOR
+        foto = grupo == "fotoperiodico" and not interior
+        fotoperiodo[fila] = foto
+        delta = DELTA_INVERNADERO if "Invernadero" in sist else 0.0
+        d0 = desde[fila]
+        arranque_cultivo = d0
+        if not interior:
+            # El ancla sale de la serie central (medida + normal): los escenarios sólo cambian de hoy en adelante
+            medido = np.isfinite(gdd[fila])
+            if medido.any():
+                acum_gd = np.concatenate(([0.0], np.cumsum(grados_dia(tmax + delta, tmin + delta))))
+                ancla = np.searchsorted(acum_gd, acum_gd[hoy_idx] - gdd[fila][medido], side="left")
+                arranque_cultivo = d0.copy()
+                arranque_cultivo[medido] = np.minimum(ancla, hoy_idx)
+        escenarios = []
+        for delta_t, factor_flor, ajuste_critico in ESCENARIOS:
+            if interior:
+                acum_veg = acum_flor = np.arange(largo + 1, dtype=float)
+            else:
+                futuro = delta + np.where(np.arange(largo) >= hoy_idx, delta_t, 0.0)
+                gd = grados_dia(tmax + futuro, tmin + futuro)
+                acum_veg = np.concatenate(([0.0], np.cumsum(gd / grados_dia_referencia(grupo, False))))
+                velocidad_flor = 1 - SENSIBILIDAD_FLORACION + SENSIBILIDAD_FLORACION * gd / grados_dia_referencia(grupo, True)
+                acum_flor = np.concatenate(([0.0], np.cumsum(velocidad_flor)))
+            idx = _alcanzar(acum_veg, arranque_cultivo, nominal)
+            arranque = idx[:, k_flor]
+            if foto:
+                # La etapa previa a la floración se estira o acorta hasta que el fotoperíodo la dispara
+                disparo = _proximo_disparo(luz, FOTOPERIODO_CRITICO + ajuste_critico)[np.minimum(idx[:, k_flor - 1], largo)]
+                arranque = np.where(disparo < largo, np.maximum(disparo, idx[:, k_flor - 1]), arranque)
+            idx[:, k_flor:] = _alcanzar(acum_flor, np.minimum(arranque, largo), (nominal[k_flor:] - nominal[k_flor]) * factor_flor)
+            validos = idx < largo
+            etapas = np.where(validos, fechas[np.minimum(idx, largo - 1)], np.datetime64("NaT"))
+            etapas[:, 0] = inicios[fila]
+            escenarios.append(etapas)
+        etapas = np.stack(escenarios, axis=2)
+        # Temprano/tardío son el mínimo/máximo de los escenarios por etapa (el fotoperíodo no es monótono con
+        # la temperatura); el máximo queda en NaT si algún escenario cae fuera del horizonte
+        etapas[:, :, 0] = np.sort(etapas, axis=2)[:, :, 0]
+        etapas[:, :, 2] = etapas.max(axis=2)
+        fechas_etapas[fila, :len(nominal)] = etapas
+        cosecha[fila] = etapas[:, -1]
+    return {"fechas_etapas": fechas_etapas, "cosecha": cosecha, "fotoperiodo": fotoperiodo}
+
+def etapa_actual(calendario, hoy=None):
+    # Índice de etapa y progreso dentro de ella según el escenario central
+    hoy = np.datetime64(hoy or datetime.date.today(), "D")
+    inicios = calendario["fechas_etapas"][:, :, 1]
+    idx = np.maximum((inicios <= hoy).sum(axis=1) - 1, 0)
+    filas = np.arange(len(idx))
+    desde = inicios[filas, idx]
+    hasta = inicios[filas, np.minimum(idx + 1, inicios.shape[1] - 1)]
+    duracion = (hasta - desde).astype(np.int64)
+    en_curso = ~np.isnat(hasta) & (idx + 1 < inicios.shape[1]) & (duracion > 0)
+    progreso = np.where(en_curso, (hoy - desde).astype(np.int64) / np.where(en_curso, duracion, 1), 1.0)
+    return idx, np.clip(progreso, 0.0, 1.0)
+
+def cronograma(calendario, i, sist):
+    # Filas (etapa, fecha central, fecha temprana, fecha tardía) de un cultivo, como datetime.date o None
+    filas = []
+    for k, nombre in enumerate(_NOMBRES_ETAPA[grupo_sistema(sist)]):
+        fechas = [None if np.isnat(f) else f.astype(datetime.date) for f in calendario["fechas_etapas"][i, k]]
+        filas.append((nombre, fechas[1], fechas[0], fechas[2]))
+    return filas
@@ -0,0 +1,77 @@
+import functools
+from types import MappingProxyType
+from meteo import calcular_vpd
+from reglas import compilar_reglas, evaluar_mensajes, evaluar_campos, primera_rama
+from datos.reglas_rinde import REGLAS_RINDE, RAMAS_RINDE
+from datos.consejos_etapa import REGLAS_CONSEJOS, RAMAS_CONSEJOS, CAMPOS_CONSEJOS
+from datos.reglas_riego import REGLAS_RIEGO, RAMAS_RIEGO, CAMPOS_RIEGO
+
+# Las tablas se compilan una sola vez al importar; cada consulta sólo recorre las reglas de su etapa
+_RINDE = compilar_reglas(REGLAS_RINDE)
+_CONSEJOS = compilar_reglas(REGLAS_CONSEJOS)
+_RIEGO = compilar_reglas(REGLAS_RIEGO)
+
+SISTEMAS_EXTERIOR = ["Exterior Maceta", "Exterior Tierra Madre", "Exterior Automáticas", "Invernadero Maceta", "Invernadero Tierra"]
+
+def _redondear(x):
+    return round(x, 1) if isinstance(x, float) else x
+
+def consejo_diario_rinde(nombre_etapa, sist, maceta_litros, curr_w, daily_w):
+    if not curr_w:
+        return ("⚠️ No se pudieron obtener datos climáticos. Seguir los consejos generales de la etapa.",)
+
+    t = curr_w.get('temperature_2m', 20)
+    lluvia_prob = 0
+    temp_max = t
+    temp_min = t
+    if daily_w:
+        lluvia_prob = daily_w.get('precipitation_probability_max', [0])[0]
+        temp_max = daily_w.get('temperature_2m_max', [t])[0]
+        temp_min = daily_w.get('temperature_2m_min', [t])[0]
+    clima = (t, curr_w.get('relative_humidity_2m', 50), curr_w.get('wind_speed_10m', 0), lluvia_prob, temp_max, temp_min)
+    return _consejo_rinde(nombre_etapa, sist, maceta_litros, *(_redondear(x) for x in clima))
+
+# Memoizado por (etapa, sistema, maceta, clima redondeado a 1 decimal, la resolución de Open-Meteo):
+# los reruns del mismo cultivo con el mismo pronóstico no vuelven a evaluar reglas ni formatear textos
+@functools.lru_cache(maxsize=4096)
+def _consejo_rinde(nombre_etapa, sist, maceta_litros, t, h, v, lluvia_prob, temp_max, temp_min):
+    ctx = {
+        "nombre_etapa": nombre_etapa,
+        "t": t,
+        "h": h,
+        "v": v,
+        "vpd": calcular_vpd(t, h),
+        "lluvia_prob": lluvia_prob,
+        "temp_max": temp_max,
+        "temp_min": temp_min,
+        "amplitud": temp_max - temp_min,
+        "maceta_litros": maceta_litros,
+        "es_exterior": sist in SISTEMAS_EXTERIOR,
+        "es_interior": sist == "Interior Luz" or sist == "Interior Automáticas",
+        "es_maceta": "Maceta" in sist,
+        "es_auto": "Automáticas" in sist,
+        "es_invern": "Invernadero" in sist,
+        "maceta_chica": maceta_litros and maceta_litros <= 10,
+        "maceta_med": maceta_litros and maceta_litros > 10 and maceta_litros <= 20,
+    }
+    return tuple(evaluar_mensajes(_RINDE, ("comun", primera_rama(RAMAS_RINDE, nombre_etapa)), ctx))
+
+@functools.lru_cache(maxsize=1024)
+def consejos_etapa(nombre_etapa, sist, maceta_litros=None):
+    rama = primera_rama(RAMAS_CONSEJOS, nombre_etapa) or "otra"
+    return MappingProxyType(evaluar_campos(_CONSEJOS, (rama,), {"sistema": sist, "maceta_litros": maceta_litros}, CAMPOS_CONSEJOS))
+
+@functools.lru_cache(maxsize=1024)
+def plan_riego(etapa_nombre, sistema, maceta_litros):
+    ctx = {"sistema": sistema, "maceta_litros": maceta_litros}
+    if maceta_litros:
+        ctx.update({
+            "litros_15": round(maceta_litros * 0.15, 1),
+            "litros_17": round(maceta_litros * 0.17, 1),
+            "litros_18": round(maceta_litros * 0.18, 1),
+            "litros_20": round(maceta_litros * 0.2, 1),
+            "litros_22": round(maceta_litros * 0.22, 1),
+            "litros_25": round(maceta_litros * 0.25, 1),
+            "litros_flush": round(maceta_litros * 3, 0),
+        })
+    return MappingProxyType(evaluar_campos(_RIEGO, (primera_rama(RAMAS_RIEGO, etapa_nombre),), ctx, CAMPOS_RIEGO))
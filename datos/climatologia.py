@@ -0,0 +1,4 @@
+# Normales mensuales aproximadas de la región de La Carlota (sur de Córdoba), °C, enero a diciembre.
+# Se usan para proyectar grados-día más allá de los días de pronóstico.
+TEMP_MAX_MENSUAL = [31.5, 30.0, 27.5, 23.5, 19.5, 16.0, 15.5, 18.5, 21.5, 24.5, 27.5, 30.5]
+TEMP_MIN_MENSUAL = [17.0, 16.0, 14.0, 10.0, 6.0, 2.5, 1.5, 3.0, 6.0, 10.0, 13.0, 15.5]
@@ -0,0 +1,249 @@
+# Condiciones candidatas del diagnóstico diferencial (diferencial.py).
+# - evidencia: zona -> {síntoma: peso}. El peso es cuánto apoya la observación a la condición
+#   (log-verosimilitud aproximada: 3 = muy característico, 1 = compatible, negativo = la contradice).
+# - prior: frecuencia base de la condición en cultivos de la zona.
+# - temporada: mes -> multiplicador del prior (meses no listados = 1). Sólo aplica a cultivos de exterior.
+# - clima: (campo, operador, valor, multiplicador) sobre t, h, lluvia_prob (mismos operadores que reglas.py).
+# - referencia: (zona, síntoma) del registro de datos/diagnosticos.py con el tratamiento.
+VERANO = {12: 1.8, 1: 2.0, 2: 1.8, 3: 1.3}
+OTONIO = {3: 1.6, 4: 2.0, 5: 1.8, 6: 1.3}
+INVIERNO = {6: 1.5, 7: 1.6, 8: 1.4}
+PRIMAVERA = {9: 1.6, 10: 1.8, 11: 1.6, 12: 1.2}
+
+CONDICIONES = [
+    {
+        "nombre": "Deficiencia de Nitrógeno (N)",
+        "tipo": "deficiencia",
+        "prior": 1.2,
+        "evidencia": {
+            "Hojas Viejas (Abajo)": {"Amarilleamiento uniforme": 3.0},
+            "Toda la Planta": {"Amarilleamiento uniforme": 1.5},
+            "Hojas Nuevas (Arriba)": {"Amarilleamiento uniforme": -1.5},
+        },
+        "temporada": {},
+        "clima": [],
+        "referencia": ("Hojas Viejas (Abajo)", "Amarilleamiento uniforme"),
+    },
+    {
+        "nombre": "Deficiencia de Fósforo (P)",
+        "tipo": "deficiencia",
+        "prior": 0.8,
+        "evidencia": {
+            "Tallos y Ramas": {"Tallos púrpuras": 2.5},
+            "Hojas Viejas (Abajo)": {"Tallos púrpuras": 2.0, "Manchas óxido/bronce": 0.8},
+            "Toda la Planta": {"Tallos púrpuras": 1.5},
+        },
+        "temporada": {},
+        "clima": [],
+        "referencia": ("Tallos y Ramas", "Tallos púrpuras"),
+    },
+    {
+        "nombre": "Deficiencia de Magnesio (Mg) o Calcio (Ca)",
+        "tipo": "deficiencia",
+        "prior": 1.0,
+        "evidencia": {
+            "Hojas Viejas (Abajo)": {"Manchas óxido/bronce": 3.0, "Amarilleamiento uniforme": 0.8},
+            "Hojas Nuevas (Arriba)": {"Puntas y bordes quemados": 2.0},
+            "Toda la Planta": {"Manchas óxido/bronce": 1.5},
+        },
+        "temporada": {},
+        "clima": [],
+        "referencia": ("Hojas Viejas (Abajo)", "Manchas óxido/bronce"),
+    },
+    {
+        "nombre": "Deficiencia de micronutrientes (Fe, Zn, Mn)",
+        "tipo": "deficiencia",
+        "prior": 0.7,
+        "evidencia": {
+            "Hojas Nuevas (Arriba)": {"Amarilleamiento uniforme": 3.0, "Manchas óxido/bronce": 2.5},
+            "Toda la Planta": {"Manchas óxido/bronce": 1.5, "Amarilleamiento uniforme": 0.8},
+            "Hojas Viejas (Abajo)": {"Amarilleamiento uniforme": -1.0},
+        },
+        "temporada": {},
+        "clima": [],
+        "referencia": ("Hojas Nuevas (Arriba)", "Amarilleamiento uniforme"),
+    },
+    {
+        "nombre": "Exceso de nutrientes / sales",
+        "tipo": "ambiental",
+        "prior": 1.2,
+        "evidencia": {
+            "Hojas Viejas (Abajo)": {"Puntas y bordes quemados": 3.0},
+            "Toda la Planta": {"Puntas y bordes quemados": 2.5, "Hojas en garra (hacia abajo)": 1.0},
+            "Raíces y Base": {"Puntas y bordes quemados": 2.0},
+        },
+        "temporada": {},
+        "clima": [],
+        "referencia": ("Toda la Planta", "Puntas y bordes quemados"),
+    },
+    {
+        "nombre": "Exceso de Nitrógeno",
+        "tipo": "ambiental",
+        "prior": 0.8,
+        "evidencia": {
+            "Toda la Planta": {"Hojas en garra (hacia abajo)": 2.5},
+            "Hojas Viejas (Abajo)": {"Hojas en garra (hacia abajo)": 1.5},
+            "Hojas Nuevas (Arriba)": {"Amarilleamiento uniforme": -1.0},
+        },
+        "temporada": {},
+        "clima": [],
+        "referencia": ("Toda la Planta", "Hojas en garra (hacia abajo)"),
+    },
+    {
+        "nombre": "Exceso de riego",
+        "tipo": "ambiental",
+        "prior": 1.3,
+        "evidencia": {
+            "Hojas Viejas (Abajo)": {"Hojas en garra (hacia abajo)": 2.5, "Amarilleamiento uniforme": 0.8},
+            "Hojas Nuevas (Arriba)": {"Hojas en garra (hacia abajo)": 2.0},
+            "Raíces y Base": {"Mosquitas en el sustrato": 1.0, "Amarilleamiento uniforme": 1.0},
+        },
+        "temporada": {},
+        "clima": [("lluvia_prob", ">", 60, 1.3)],
+        "referencia": ("Hojas Viejas (Abajo)", "Hojas en garra (hacia abajo)"),
+    },
+    {
+        "nombre": "Pudrición de raíces (Root Rot)",
+        "tipo": "hongo",
+        "prior": 0.6,
+        "evidencia": {
+            "Raíces y Base": {"Amarilleamiento uniforme": 3.0, "Moho gris en cogollos": 1.5},
+            "Toda la Planta": {"Amarilleamiento uniforme": 1.0, "Hojas en garra (hacia abajo)": 1.0},
+        },
+        "temporada": INVIERNO,
+        "clima": [("t", ">", 26, 1.3), ("lluvia_prob", ">", 60, 1.4)],
+        "referencia": ("Raíces y Base", "Amarilleamiento uniforme"),
+    },
+    {
+        "nombre": "Estrés hídrico (falta de agua)",
+        "tipo": "ambiental",
+        "prior": 1.0,
+        "evidencia": {
+            "Hojas Viejas (Abajo)": {"Hojas en garra (hacia arriba)": 2.5},
+            "Toda la Planta": {"Hojas en garra (hacia arriba)": 1.5, "Puntas y bordes quemados": 0.5},
+        },
+        "temporada": VERANO,
+        "clima": [("t", ">", 30, 1.6), ("h", "<", 35, 1.4)],
+        "referencia": ("Hojas Viejas (Abajo)", "Hojas en garra (hacia arriba)"),
+    },
+    {
+        "nombre": "Estrés por calor o luz excesiva",
+        "tipo": "ambiental",
+        "prior": 1.0,
+        "evidencia": {
+            "Hojas Nuevas (Arriba)": {"Hojas en garra (hacia arriba)": 3.0, "Puntas y bordes quemados": 1.0},
+            "Toda la Planta": {"Hojas en garra (hacia arriba)": 2.0},
+        },
+        "temporada": VERANO,
+        "clima": [("t", ">", 32, 2.0), ("t", "<", 15, 0.3)],
+        "referencia": ("Hojas Nuevas (Arriba)", "Hojas en garra (hacia arriba)"),
+    },
+    {
+        "nombre": "Estrés por frío",
+        "tipo": "ambiental",
+        "prior": 0.6,
+        "evidencia": {
+            "Hojas Nuevas (Arriba)": {"Tallos púrpuras": 2.0},
+            "Toda la Planta": {"Tallos púrpuras": 2.0},
+            "Tallos y Ramas": {"Tallos púrpuras": 1.0},
+        },
+        "temporada": INVIERNO,
+        "clima": [("t", "<", 10, 2.0), ("t", ">", 25, 0.3)],
+        "referencia": ("Toda la Planta", "Tallos púrpuras"),
+    },
+    {
+        "nombre": "Arañuela Roja (Ácaro)",
+        "tipo": "plaga",
+        "prior": 1.0,
+        "evidencia": {
+            "Toda la Planta": {"Puntos blancos o telarañas": 3.0, "Manchas óxido/bronce": 0.5},
+            "Hojas Viejas (Abajo)": {"Puntos blancos o telarañas": 3.0},
+            "Hojas Nuevas (Arriba)": {"Puntos blancos o telarañas": 3.0},
+            "Tallos y Ramas": {"Puntos blancos o telarañas": 1.5},
+        },
+        "temporada": VERANO,
+        "clima": [("t", ">", 28, 1.5), ("h", "<", 40, 1.6), ("h", ">", 75, 0.5)],
+        "referencia": ("Toda la Planta", "Puntos blancos o telarañas"),
+    },
+    {
+        "nombre": "Trips o pulgones",
+        "tipo": "plaga",
+        "prior": 0.8,
+        "evidencia": {
+            "Hojas Nuevas (Arriba)": {"Agujeros en hojas": 1.5, "Hojas en garra (hacia arriba)": 0.8, "Puntos blancos o telarañas": 1.0},
+            "Toda la Planta": {"Puntos blancos o telarañas": 0.8},
+        },
+        "temporada": PRIMAVERA,
+        "clima": [("t", ">", 22, 1.3)],
+        "referencia": ("Hojas Nuevas (Arriba)", "Agujeros en hojas"),
+    },
+    {
+        "nombre": "Orugas o caracoles",
+        "tipo": "plaga",
+        "prior": 1.0,
+        "evidencia": {
+            "Toda la Planta": {"Agujeros en hojas": 3.0},
+            "Hojas Viejas (Abajo)": {"Agujeros en hojas": 3.0},
+            "Hojas Nuevas (Arriba)": {"Agujeros en hojas": 2.0},
+            "Tallos y Ramas": {"Agujeros en hojas": 1.5},
+        },
+        "temporada": VERANO,
+        "clima": [("lluvia_prob", ">", 50, 1.3)],
+        "referencia": ("Toda la Planta", "Agujeros en hojas"),
+    },
+    {
+        "nombre": "Mosquita del sustrato (Fungus Gnat)",
+        "tipo": "plaga",
+        "prior": 0.9,
+        "evidencia": {
+            "Raíces y Base": {"Mosquitas en el sustrato": 3.0},
+            "Hojas Viejas (Abajo)": {"Mosquitas en el sustrato": 2.5},
+            "Hojas Nuevas (Arriba)": {"Mosquitas en el sustrato": 2.0},
+            "Tallos y Ramas": {"Mosquitas en el sustrato": 2.0},
+        },
+        "temporada": {},
+        "clima": [("h", ">", 70, 1.3)],
+        "referencia": ("Raíces y Base", "Mosquitas en el sustrato"),
+    },
+    {
+        "nombre": "Oídio (Hongo)",
+        "tipo": "hongo",
+        "prior": 1.0,
+        "evidencia": {
+            "Toda la Planta": {"Manchas blancas (polvo)": 3.0},
+            "Hojas Viejas (Abajo)": {"Manchas blancas (polvo)": 3.0},
+            "Hojas Nuevas (Arriba)": {"Manchas blancas (polvo)": 2.5},
+            "Tallos y Ramas": {"Manchas blancas (polvo)": 2.5},
+        },
+        "temporada": OTONIO,
+        "clima": [("h", ">", 70, 1.6), ("t", ">", 30, 0.6)],
+        "referencia": ("Toda la Planta", "Manchas blancas (polvo)"),
+    },
+    {
+        "nombre": "Botrytis (Moho Gris)",
+        "tipo": "hongo",
+        "prior": 0.9,
+        "evidencia": {
+            "Toda la Planta": {"Moho gris en cogollos": 3.0},
+            "Hojas Nuevas (Arriba)": {"Moho gris en cogollos": 3.0},
+            "Hojas Viejas (Abajo)": {"Moho gris en cogollos": 2.5},
+            "Tallos y Ramas": {"Moho gris en cogollos": 2.5},
+            "Raíces y Base": {"Moho gris en cogollos": 1.5},
+        },
+        "temporada": OTONIO,
+        "clima": [("h", ">", 75, 2.0), ("lluvia_prob", ">", 60, 1.5)],
+        "referencia": ("Toda la Planta", "Moho gris en cogollos"),
+    },
+    {
+        "nombre": "Roya (Hongo)",
+        "tipo": "hongo",
+        "prior": 0.4,
+        "evidencia": {
+            "Tallos y Ramas": {"Manchas óxido/bronce": 3.0},
+            "Hojas Viejas (Abajo)": {"Manchas óxido/bronce": 0.8},
+        },
+        "temporada": OTONIO,
+        "clima": [("h", ">", 75, 1.5)],
+        "referencia": ("Tallos y Ramas", "Manchas óxido/bronce"),
+    },
+]
@@ -0,0 +1,297 @@
+# Consejos generales por etapa: reglas (ámbito, grupo, condiciones, campos) evaluadas con reglas.py.
+# Dentro de un ámbito las reglas posteriores pisan los campos de las anteriores.
+MACETA = ("sistema", "en", ("Exterior Maceta", "Invernadero Maceta"))
+TIERRA = ("sistema", "en", ("Exterior Tierra Madre", "Invernadero Tierra"))
+LUZ = ("sistema", "==", "Interior Luz")
+AUTO = ("sistema", "contiene", "Automáticas")
+LITROS = ("maceta_litros", "si", None)
+
+CAMPOS_CONSEJOS = {
+    "resumen": "",
+    "riego": "",
+    "sustrato": "",
+    "nutricion": "",
+    "ambiente": "",
+    "cuidados": "",
+    "plagas": "",
+    "maceta_consejo": "",
+}
+
+RAMAS_CONSEJOS = (
+    ("germinacion", "==", "Germinación"),
+    ("plantula", "==", "Plántula"),
+    ("vegetativo_temprano", "en", ("Vegetativo Temprano", "Vegetativo")),
+    ("vegetativo_avanzado", "==", "Vegetativo Avanzado"),
+    ("prefloracion", "==", "Pre-Floración"),
+    ("floracion_temprana", "en", ("Floración Temprana", "Floración")),
+    ("floracion_media", "==", "Floración Media"),
+    ("floracion_tardia", "==", "Floración Tardía / Maduración"),
+    ("cosecha", "==", "Flush y Cosecha"),
+)
+
+REGLAS_CONSEJOS = [
+    # Germinación
+    ("germinacion", None, (), {
+        "resumen": "La semilla necesita humedad constante, oscuridad y calor para germinar.",
+        "riego": "Mantener el medio húmedo pero no encharcado. Usar rociador. No regar con chorro directo.",
+        "sustrato": "Sustrato liviano y aireado. Ideal: 50% turba + 30% perlita + 20% humus de lombriz.",
+        "nutricion": "No agregar nutrientes. La semilla tiene reservas propias para los primeros días.",
+        "ambiente": "Temperatura ideal: 22-28°C. Humedad: 70-90%. Oscuridad hasta que asome la radícula.",
+        "cuidados": "Método servilleta: semilla entre servilletas húmedas en plato tapado, lugar cálido y oscuro. Revisar cada 12 hs. Cuando sale la raíz blanca (1-2 cm), plantar con la raíz hacia abajo a 1 cm de profundidad.",
+        "plagas": "No hay riesgo de plagas en esta etapa. Cuidar que no haya hongos en la servilleta.",
+    }),
+    ("germinacion", "maceta", (MACETA,), {
+        "maceta_consejo": "Germinar en vasito de 200 ml o maceta de 1 litro. No usar la maceta definitiva todavía.",
+    }),
+    ("germinacion", "maceta", (TIERRA,), {
+        "maceta_consejo": "Podés germinar directo en tierra preparada o en vasito para trasplantar después. Si es directo, proteger con botella cortada como mini-invernadero.",
+    }),
+    ("germinacion", "maceta", (LUZ,), {
+        "maceta_consejo": "Germinar en vasito o jiffy. Luz suave 18/6 una vez que asome el tallo. No acercar demasiado la luz.",
+    }),
+    ("germinacion", "maceta", (AUTO,), {
+        "maceta_consejo": "IMPORTANTE: Germinar directamente en la maceta definitiva. Las autos no toleran bien el trasplante. Plantar en el centro de la maceta final.",
+    }),
+
+    # Plántula
+    ("plantula", None, (), {
+        "resumen": "La planta es muy frágil. Necesita luz suave, humedad alta y poco riego.",
+        "riego": "Regar en círculo alrededor del tallo, no sobre él. Poco volumen, frecuente. Dejar secar la superficie entre riegos.",
+        "sustrato": "El mismo de germinación. No trasplantar todavía si está en vasito pequeño (esperar a que tenga 3-4 nudos).",
+        "nutricion": "Aún no necesita fertilizantes. Si el sustrato tiene humus, alcanza. Máximo: té de humus muy diluido (1/4 de dosis).",
+        "ambiente": "Temperatura: 20-26°C. Humedad: 60-70%. Brisa suave para fortalecer el tallo.",
+        "cuidados": "Si el tallo se estira mucho (espigamiento), la luz está muy lejos o es muy débil. Acercar la luz o mover a lugar más luminoso. Sostener tallos débiles con palito.",
+        "plagas": "Cuidado con damping off (cuello del tallo se pudre). Prevenir con canela en polvo sobre el sustrato. No sobre-regar.",
+    }),
+    ("plantula", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 5)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Suficiente para plántula. Primer trasplante cuando tenga 3-4 pares de hojas a maceta de 5-7L.",
+    }),
+    ("plantula", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 15)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Si plantaste directo acá, está bien pero cuidá de no sobre-regar. La plántula usa poca agua en maceta grande.",
+    }),
+    ("plantula", "maceta", (MACETA,), {
+        "maceta_consejo": "Mantener en vasito o maceta chica (1-3L). Trasplantar a la siguiente medida cuando las hojas superen el borde de la maceta.",
+    }),
+    ("plantula", "maceta", (TIERRA,), {
+        "maceta_consejo": "Si está en tierra directa, proteger del sol fuerte del mediodía con media sombra. Si está en vasito, esperar 3-4 nudos para trasplantar al cantero.",
+    }),
+    ("plantula", "maceta", (LUZ,), {
+        "maceta_consejo": "Luz 18/6. Distancia: LED 40-60 cm, bajo consumo 15-20 cm. No usar HPS/sodio todavía, es demasiado fuerte.",
+    }),
+    ("plantula", "maceta", (AUTO,), {
+        "maceta_consejo": "Ya debe estar en maceta definitiva. Regar muy poco, solo alrededor de la plántula (no toda la maceta). Circulo de 5 cm de radio.",
+    }),
+
+    # Vegetativo temprano
+    ("vegetativo_temprano", None, (), {
+        "resumen": "La planta crece rápido. Necesita más agua, luz y nutrientes. Es momento de entrenar y dar forma.",
+        "riego": "Aumentar volumen gradualmente. Regar cuando los primeros 2-3 cm de sustrato estén secos. Agua reposada 24 hs para evaporar cloro.",
+        "sustrato": "Primer trasplante si está en vasito. Sustrato enriquecido: turba + perlita + humus + guano suave.",
+        "nutricion": "Empezar con nitrógeno (N). Opciones naturales: purín de ortiga, té de humus, guano de murciélago. Empezar con dosis bajas.",
+        "ambiente": "Temperatura: 22-28°C. Humedad: 50-65%. Buena ventilación para fortalecer tallos.",
+        "cuidados": "Técnicas de entrenamiento: LST (atar ramas para abrir la planta), topping (cortar la punta para ramificar) a partir del 4to-5to nudo. Tutores si crece rápido.",
+        "plagas": "En La Carlota, ojo con pulgones y arañuela en verano (Dic-Feb). Revisar envés de hojas. Preventivo: aceite de neem cada 10-15 días.",
+    }),
+    ("vegetativo_temprano", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 5)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Es chica para vegetativo. Trasplantar pronto a 10-15L para que desarrolle bien las raíces.",
+    }),
+    ("vegetativo_temprano", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 15)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Buen tamaño para vegetativo. Si querés una planta grande, trasplantar a 20-25L antes de floración.",
+    }),
+    ("vegetativo_temprano", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 25)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Excelente tamaño. Puede completar todo el ciclo acá. Regar hasta que drene un 15-20% por abajo.",
+    }),
+    ("vegetativo_temprano", "maceta", (MACETA,), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Gran tamaño, la planta tendrá mucho espacio. Cuidar de no sobre-regar, dejar secar entre riegos.",
+    }),
+    ("vegetativo_temprano", "maceta", (TIERRA,), {
+        "maceta_consejo": "Raíces libres = crecimiento explosivo. Mulch de paja para mantener humedad y frescura. Aportar compost alrededor de la base. Tutores desde temprano si crece mucho.",
+    }),
+    ("vegetativo_temprano", "maceta", (LUZ,), {
+        "maceta_consejo": "Fotoperiodo 18/6. Trasplantar a maceta de 10-15L. Rotar la maceta cada 2 días para crecimiento parejo. Ventilador apuntando al tallo.",
+    }),
+    ("vegetativo_temprano", "maceta", (AUTO,), {
+        "maceta_consejo": "No hacer topping en autos. Solo LST suave (atar la punta principal). El vegetativo es corto (3-4 semanas), aprovecharlo sin estresar.",
+    }),
+
+    # Vegetativo avanzado
+    ("vegetativo_avanzado", None, (), {
+        "resumen": "Crecimiento intenso. La planta define su estructura. Último momento para entrenar antes de floración.",
+        "riego": "Riego abundante. En verano en La Carlota puede necesitar riego diario. Siempre revisar el peso de la maceta.",
+        "sustrato": "Si no trasplantaste a la maceta final, este es el último momento. No trasplantar una vez que empiece la floración.",
+        "nutricion": "Máxima demanda de N. Top dress con guano o humus. Té de ortiga semanal. Si las hojas son verde oscuro intenso, bajar dosis.",
+        "ambiente": "Temperatura: 22-30°C. Humedad: 45-60%. En La Carlota el verano supera los 35°C: media sombra de 12 a 16 hs.",
+        "cuidados": "Último topping o poda apical. Defoliar hojas que tapen sitios de luz. Asegurar tutores. Limpiar ramas bajas que no reciban luz (lollipopping).",
+        "plagas": "Pulgones, trips, arañuela roja. Revisar diariamente. Neem preventivo. Jabón potásico si hay plaga activa.",
+    }),
+    ("vegetativo_avanzado", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Última chance de trasplantar a algo más grande. En maceta chica la planta será más chica pero puede completar el ciclo.",
+    }),
+    ("vegetativo_avanzado", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 20)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Buen tamaño para la definición del ciclo. Empezar a preparar los nutrientes de floración.",
+    }),
+    ("vegetativo_avanzado", "maceta", (MACETA,), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Excelente, la planta va a desarrollar mucha masa. Asegurar tutores firmes.",
+    }),
+    ("vegetativo_avanzado", "maceta", (TIERRA,), {
+        "maceta_consejo": "La planta puede alcanzar 1.5-2.5 m. Tutores robustos. Riego profundo. Si el suelo es alcalino (pH 7.5, típico de La Carlota), aportar azufre o turba ácida para bajar pH.",
+    }),
+    ("vegetativo_avanzado", "maceta", (LUZ,), {
+        "maceta_consejo": "Evaluar el espacio: cuando la planta ocupe el 50-60% del espacio vertical disponible, cambiar a 12/12. La planta duplicará su altura en floración.",
+    }),
+    ("vegetativo_avanzado", "maceta", (AUTO,), {
+        "maceta_consejo": "Las autos entran en pre-flora solas entre semana 3-5. No hacer podas agresivas. LST suave si está disponible.",
+    }),
+
+    # Pre-Floración
+    ("prefloracion", None, (), {
+        "resumen": "La planta muestra su sexo. Aparecen pistilos (pelos blancos = hembra) o sacos (macho). Transición crítica.",
+        "riego": "Mantener riego constante. No estresar con sequía ni encharcamiento.",
+        "sustrato": "No trasplantar. El sustrato debe estar bien aireado y con buen drenaje.",
+        "nutricion": "Transición de N a P y K. Reducir nitrógeno gradualmente, empezar con fósforo (harina de hueso, guano de murciélago fructífero). Melaza 1 cucharada/litro.",
+        "ambiente": "Temperatura: 20-28°C. Humedad: 40-55%. En exterior, las noches más largas de marzo-abril disparan la floración.",
+        "cuidados": "Identificar sexo: pistilos blancos = hembra (deseado), bolitas/sacos = macho (eliminar inmediatamente). Si es regular (no feminizada), revisar a diario.",
+        "plagas": "En La Carlota, marzo-mayo: riesgo de oídio (manchas blancas). Preventivo: bicarbonato 3g/L + jabón potásico pulverizado semanal.",
+    }),
+    ("prefloracion", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Ya no trasplantar. La planta florecerá según el tamaño de raíces que tenga. Optimizar nutrición.",
+    }),
+    ("prefloracion", "maceta", (MACETA,), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Buen volumen de raíces. La floración será proporcional. Preparar malla de soporte para cogollos.",
+    }),
+    ("prefloracion", "maceta", (TIERRA,), {
+        "maceta_consejo": "En La Carlota, la pre-floración exterior ocurre naturalmente en Feb-Mar cuando los días se acortan. La planta puede ser grande: preparar soportes.",
+    }),
+    ("prefloracion", "maceta", (LUZ,), {
+        "maceta_consejo": "Cambiar fotoperiodo a 12/12. Oscuridad total durante las 12 hs de noche (ni un rayo de luz, puede causar hermafroditismo). Revisar sellos de luz.",
+    }),
+    ("prefloracion", "maceta", (AUTO,), {
+        "maceta_consejo": "La auto entra sola en pre-flora. No cambiar nada. Mantener luz 18/6 o 20/4. Empezar nutrientes de floración suavemente.",
+    }),
+
+    # Floración temprana
+    ("floracion_temprana", None, (), {
+        "resumen": "Los cogollos empiezan a formarse. Etapa crítica: máxima demanda de P y K. Cuidar la humedad.",
+        "riego": "Riego regular y constante. No mojar los cogollos. Regar por la base. Si es verano en La Carlota, regar temprano y al atardecer.",
+        "sustrato": "No tocar el sustrato. Mantener buena aireación. Si hay costras en la superficie, romper suavemente con tenedor.",
+        "nutricion": "Fósforo y potasio altos, nitrógeno bajo. Harina de hueso, ceniza de madera (potasio), melaza. Guano de murciélago fructífero. Aplicar cada riego alterno.",
+        "ambiente": "Temperatura: 18-26°C. Humedad: 40-50% máximo. En La Carlota, el otoño es ideal. Si es verano, cuidar calor excesivo.",
+        "cuidados": "No podar ni estresar. Sostener ramas con cogollos pesados con tutores/malla. Defoliar solo hojas que tapen cogollos directamente. No tocar los cogollos con las manos.",
+        "plagas": "Orugas en los cogollos (Dic-Feb): revisar a diario, sacar a mano. Bacillus thuringiensis (BT) preventivo. Oídio: bicarbonato + jabón potásico.",
+    }),
+    ("floracion_temprana", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Los cogollos serán más chicos en maceta limitada. Compensar con buena nutrición. Regar más seguido (raíces copadas).",
+    }),
+    ("floracion_temprana", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 20)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Buenos cogollos posibles. Malla SCROG o tutores para sostener. Regar cuando la maceta se sienta liviana.",
+    }),
+    ("floracion_temprana", "maceta", (MACETA,), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Excelente volumen. Cogollos generosos. Tutores y malla obligatorios para sostener el peso.",
+    }),
+    ("floracion_temprana", "maceta", (TIERRA,), {
+        "maceta_consejo": "Cogollos grandes en tierra madre. Tutores resistentes obligatorios. Malla SCROG horizontal si es posible. Proteger de lluvias fuertes con techo/plástico.",
+    }),
+    ("floracion_temprana", "maceta", (LUZ,), {
+        "maceta_consejo": "Fotoperiodo 12/12 estricto. Mantener temperatura estable. Buena extracción de aire para bajar humedad. SCROG ideal para maximizar producción.",
+    }),
+    ("floracion_temprana", "maceta", (AUTO,), {
+        "maceta_consejo": "Mantener luz 18/6 o 20/4 durante toda la flora. Las autos no dependen del fotoperiodo. Nutrición de floración completa.",
+    }),
+
+    # Floración media
+    ("floracion_media", None, (), {
+        "resumen": "Los cogollos engordan rápido. Aparecen tricomas (cristales). Máxima producción de resina. Etapa de mayor cuidado.",
+        "riego": "Riego constante, sin excesos. Si los cogollos se mojan, riesgo de moho. Regar solo la base. En La Carlota, cuidar lluvias de otoño.",
+        "sustrato": "No modificar. Si hay acumulación de sales (costras blancas), hacer un flush suave con el triple de agua del volumen de la maceta.",
+        "nutricion": "Continuar P+K. Agregar potasio extra (ceniza de madera diluida). Melaza en cada riego para alimentar microvida y engordar cogollos.",
+        "ambiente": "Temperatura: 18-26°C nocturna / 22-28°C diurna. Humedad: 35-45%. Diferencia de temperatura día/noche de 8-10°C mejora colores y resina.",
+        "cuidados": "Revisar tricomas con lupa (60x): transparentes = falta, lechosos = punto óptimo, ámbar = más efecto narcótico. No tocar los cogollos.",
+        "plagas": "Máximo riesgo de botrytis (moho gris) en cogollos densos. Si llueve, sacudir suavemente y secar. Revisar el interior de cogollos grandes.",
+    }),
+    ("floracion_media", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Las raíces están al máximo. Regar con frecuencia, posiblemente todos los días. Flush corto si hay puntas quemadas.",
+    }),
+    ("floracion_media", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 20)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Buena reserva de sustrato. Regar día por medio. Controlar el peso de la maceta.",
+    }),
+    ("floracion_media", "maceta", (MACETA,), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Sustrato amplio. Regar cuando seque los primeros 3-4 cm. Los cogollos deben estar engordando bien.",
+    }),
+    ("floracion_media", "maceta", (TIERRA,), {
+        "maceta_consejo": "Proteger de lluvias con plástico/techo si es posible. Inspeccionar cogollos grandes por dentro (abrir suavemente) buscando moho. Sostener ramas pesadas.",
+    }),
+    ("floracion_media", "maceta", (LUZ,), {
+        "maceta_consejo": "Bajar humedad al mínimo posible. Buena circulación de aire entre cogollos. Deshumidificador si supera 50%. Mantener 12/12 sin interrupciones.",
+    }),
+    ("floracion_media", "maceta", (AUTO,), {
+        "maceta_consejo": "Mantener condiciones estables. Las autos suelen tener cogollos más compactos. Revisar tricomas: las autos maduran más rápido.",
+    }),
+
+    # Floración tardía / maduración
+    ("floracion_tardia", None, (), {
+        "resumen": "Los cogollos maduran. Hojas amarillean naturalmente (la planta consume reservas). Revisar tricomas para determinar punto de cosecha.",
+        "riego": "Reducir riego gradualmente. Si vas a hacer flush, empezar ahora: regar solo con agua limpia (sin nutrientes) las últimas 1-2 semanas.",
+        "sustrato": "Flush: regar con 3x el volumen de la maceta en agua limpia para limpiar sales. Mejora el sabor final.",
+        "nutricion": "Dejar de fertilizar. Solo agua limpia. La planta vive de sus reservas. Las hojas se ponen amarillas: es normal y deseable.",
+        "ambiente": "Temperatura: 18-24°C. Humedad: 30-40%. Noches frescas ayudan a producir colores púrpuras. Cuidar mucho el moho.",
+        "cuidados": "Revisar tricomas diariamente con lupa: 70% lechosos + 30% ámbar = cosecha ideal para mayoría. Solo lechosos = efecto más activo. Más ámbar = más relajante.",
+        "plagas": "Último control de orugas y botrytis. Si encontrás moho en un cogollo, cortarlo inmediatamente. No fumar cogollos con moho.",
+    }),
+    ("floracion_tardia", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Flush rápido (3 días de solo agua). En maceta chica se lava más rápido. Preparar espacio de secado.",
+    }),
+    ("floracion_tardia", "maceta", (MACETA, LITROS, ("maceta_litros", "<=", 20)), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Flush de 7-10 días con agua limpia. Observar que las hojas amarillean uniformemente.",
+    }),
+    ("floracion_tardia", "maceta", (MACETA,), {
+        "maceta_consejo": "Maceta de {maceta_litros}L: Flush de 10-14 días. Mayor volumen de sustrato requiere más tiempo de lavado.",
+    }),
+    ("floracion_tardia", "maceta", (TIERRA,), {
+        "maceta_consejo": "En tierra madre el flush es menos efectivo pero igual dejar de fertilizar 2-3 semanas antes. Regar solo con agua. Preparar tijeras de podar afiladas.",
+    }),
+    ("floracion_tardia", "maceta", (LUZ,), {
+        "maceta_consejo": "Flush de 7-14 días con agua limpia. Algunos bajan la temperatura nocturna a 15-18°C los últimos días para estimular resina. 48 hs de oscuridad antes del corte es opcional.",
+    }),
+    ("floracion_tardia", "maceta", (AUTO,), {
+        "maceta_consejo": "Flush de 5-7 días. Las autos maduran rápido, no esperar demasiado. Cuando los tricomas estén 50-70% lechosos, ya está cerca.",
+    }),
+
+    # Flush y cosecha
+    ("cosecha", None, (), {
+        "resumen": "Momento de cosechar. Cortar, hacer manicura (quitar hojas), secar y curar.",
+        "riego": "Dejar de regar 1-2 días antes de cortar para que el sustrato esté seco. Facilita el corte y secado.",
+        "sustrato": "Ya no importa. Después de la cosecha, el sustrato se puede reutilizar compostándolo.",
+        "nutricion": "Ninguna. Solo agua si no terminaste el flush.",
+        "ambiente": "Secado: 18-22°C, 50-60% humedad, oscuridad total, buena ventilación suave (no directo sobre las ramas). 7-14 días hasta que los tallos crujan.",
+        "cuidados": """Proceso de cosecha:
+1. Cortar la planta por la base o por ramas.
+2. Manicura: quitar hojas grandes y recortar hojas de azúcar (guardarlas para extracciones).
+3. Colgar boca abajo en lugar oscuro, ventilado, 18-22°C.
+4. Secar 7-14 días (tallos deben crujir al doblar).
+5. Curado: poner en frascos de vidrio, abrir 15 min/día las primeras 2 semanas. Mínimo 2 semanas, ideal 1-2 meses.""",
+        "plagas": "Durante el secado: vigilar moho. Si aparece, descartar ese cogollo. Ventilación constante.",
+    }),
+    ("cosecha", "maceta", (MACETA,), {
+        "maceta_consejo": "Mover la maceta adentro 2 días antes del corte si hay pronóstico de lluvia. Cosechar por la mañana cuando los terpenos están más concentrados.",
+    }),
+    ("cosecha", "maceta", (TIERRA,), {
+        "maceta_consejo": "Cortar planta completa o por ramas. Si es grande, ir rama por rama. Tener hilo o perchas listas para colgar. Lugar de secado preparado.",
+    }),
+    ("cosecha", "maceta", (LUZ,), {
+        "maceta_consejo": "Apagar las luces 48 hs antes del corte (opcional, algunos cultivadores creen que aumenta resina). Cosechar con luz verde o en penumbra.",
+    }),
+    ("cosecha", "maceta", (AUTO,), {
+        "maceta_consejo": "Cosecha alrededor de semana 10-12 desde germinación. Las autos suelen ser más compactas, el secado puede ser más rápido (5-10 días).",
+    }),
+
+    # Etapa no reconocida
+    ("otra", None, (), {
+        "resumen": "Etapa no reconocida. Consultá el módulo de Asesoramiento para orientación general.",
+        "riego": "Regar según necesidad del sustrato.",
+        "sustrato": "Mantener buena aireación.",
+        "nutricion": "Seguir plan de nutrición habitual.",
+        "ambiente": "Mantener condiciones óptimas.",
+        "cuidados": "Observar la planta a diario.",
+        "plagas": "Inspección preventiva regular.",
+    }),
+]
@@ -0,0 +1,808 @@
+# Base de conocimiento de Diagnóstico & Plagas: un registro por zona y grupo de síntomas,
+# con el remedio específico de cada grupo de sistema. diagnosticos.py la indexa por (zona, síntoma, grupo).
+ZONAS = ["Hojas Viejas (Abajo)", "Hojas Nuevas (Arriba)", "Tallos y Ramas", "Raíces y Base", "Toda la Planta"]
+
+SINTOMAS = [
+    "Amarilleamiento uniforme",
+    "Puntas y bordes quemados",
+    "Manchas óxido/bronce",
+    "Hojas en garra (hacia abajo)",
+    "Hojas en garra (hacia arriba)",
+    "Manchas blancas (polvo)",
+    "Puntos blancos o telarañas",
+    "Agujeros en hojas",
+    "Tallos púrpuras",
+    "Moho gris en cogollos",
+    "Mosquitas en el sustrato",
+]
+
+DIAGNOSTICOS = [
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Amarilleamiento uniforme"],
+        "diagnostico": "**Deficiencia de Nitrógeno (N).** La planta mueve el N de hojas viejas a las nuevas. Común en vegetativo avanzado.",
+        "remedio_casero": """
+            - **Té de humus:** Remojar 1 kg de humus de lombriz en 10 litros de agua 24-48 hs. Colar y regar.
+            - **Agua de lentejas germinadas:** Remojar lentejas 48 hs, usar el agua de remojo para regar (rico en enzimas y N).
+            - **Ortiga fermentada (purín):** Fermentar 1 kg de ortiga en 10 litros de agua por 7-10 días. Diluir 1:10 y regar.
+            - **Café usado:** Esparcir borra de café seca sobre el sustrato (libera N lentamente).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=deficiencia+nitrogeno+cannabis+solucion+casera",
+        "remedio_sistema": {
+            "maceta": "Aplicar humus líquido cada 3 días. Si es urgente, usar fertilizante con N alto (ej: Namasté Veg). Revisar que la maceta no esté subdimensionada.",
+            "tierra": "Incorporar compost maduro alrededor de la base. El suelo de La Carlota suele necesitar aportes orgánicos periódicos. Aplicar purín de ortiga directo al suelo.",
+            "interior_luz": "Aumentar dosis de N en la solución nutritiva. Verificar EC: si está baja, la planta no está comiendo suficiente. Revisar pH (5.8-6.2).",
+            "automaticas": "Subir dosis suavemente (no más del 20% por vez). Las autos son sensibles, pero la deficiencia de N las frena mucho. Usar té de humus como opción segura.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Puntas y bordes quemados"],
+        "diagnostico": "**Exceso de Nutrientes (Quemadura).** Sales acumuladas queman las puntas. También puede ser exceso de riego.",
+        "remedio_casero": """
+            - **Lavado de raíces:** Regar con 3 veces el volumen de la maceta en agua limpia con pH 6.0-6.5.
+            - **Agua de arroz:** El agua del primer lavado de arroz ayuda a recomponer la microbiología tras un flush.
+            - **Reposo:** No fertilizar por 5-7 días después del lavado. Solo agua.
+            - **Riego con agua de lluvia:** Si tenés acceso, el agua de lluvia es ideal para lavar sales.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=exceso+nutrientes+cannabis+flush+raices",
+        "remedio_sistema": {
+            "maceta": "Hacer flush con agua de lluvia o filtrada. Reducir fertilizante al 50% por 2 semanas. Verificar drenaje de la maceta: los agujeros deben estar libres.",
+            "tierra": "Regar abundante con agua limpia. En tierra madre es menos común, puede ser por fertilizante químico excesivo. Volver a orgánico. Las lluvias naturales ayudan a lavar.",
+            "interior_luz": "Bajar EC inmediatamente. Hacer flush con agua a pH 6.0 y EC 0.3-0.4. Retomar nutrientes al 50% después de 5 días. Revisar run-off.",
+            "automaticas": "Flush suave (2x volumen de maceta). Las autos son muy sensibles al overfert. Retomar con dosis al 30% y subir gradualmente.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Manchas óxido/bronce"],
+        "diagnostico": "**Deficiencia de Magnesio (Mg) o Calcio (Ca).** Manchas óxido entre las nervaduras de hojas viejas.",
+        "remedio_casero": """
+            - **Sal de Epsom (sulfato de magnesio):** 1 cucharadita por litro de agua. Regar o aplicar foliar.
+            - **Cáscara de huevo molida:** Triturar y mezclar en el sustrato (aporta calcio lento).
+            - **Vinagre de manzana:** 1 ml por litro de agua de riego (ayuda a liberar Ca y Mg del sustrato).
+            - **Melaza:** 1 cucharada por litro de agua de riego. Aporta micronutrientes y alimenta la microbiología.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=deficiencia+magnesio+calcio+cannabis+tratamiento",
+        "remedio_sistema": {
+            "maceta": "Aplicar CalMag comercial o sal de Epsom. Revisar pH del agua (el agua de La Carlota con pH alto bloquea Mg). Considerar regar con agua reposada 24hs para evaporar cloro.",
+            "tierra": "Incorporar dolomita al suelo (aporta Ca y Mg a largo plazo). Aplicar sal de Epsom foliar como solución rápida. La cal agrícola también funciona.",
+            "interior_luz": "Agregar CalMag a la solución nutritiva (2-3 ml/L). Verificar pH: fuera de rango 5.8-6.2 se bloquean estos elementos. Revisar EC total.",
+            "automaticas": "Sal de Epsom foliar (1g/L) es la vía más segura. No sobre-corregir: empezar con dosis baja. Respuesta visible en 3-5 días.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Hojas en garra (hacia abajo)"],
+        "diagnostico": "**Exceso de riego o Exceso de Nitrógeno.** Las hojas viejas caen en garra hacia abajo. El sustrato permanece encharcado.",
+        "remedio_casero": """
+            - **Dejar secar:** No regar hasta que los primeros 4-5 cm de sustrato estén secos. Levantar la maceta: si pesa mucho, tiene exceso de agua.
+            - **Mejorar drenaje:** Agregar perlita al sustrato si está muy compacto.
+            - **Palito de madera:** Clavarlo en el sustrato; si sale húmedo al sacarlo, no regar todavía.
+            - **Ventilar la base:** Si la maceta está en plato, retirarlo para que drene libremente.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=exceso+riego+cannabis+hojas+garra+abajo+solucion",
+        "remedio_sistema": {
+            "maceta": "Verificar agujeros de drenaje. Elevar la maceta con ladrillos para mejor escurrimiento. En verano regar menos cantidad pero más seguido. Nunca dejar agua en el plato.",
+            "tierra": "Revisar si la zona se encharca. Hacer canales de drenaje alrededor. El suelo arcilloso de La Carlota retiene mucho: agregar arena gruesa o perlita en la zona de raíces.",
+            "interior_luz": "Espaciar riegos. Usar macetas con mucho drenaje (tela o air-pot). Verificar que la bandeja de drenaje no acumule agua. Ventilar bien la zona de raíces.",
+            "automaticas": "Las autos en maceta chica se sobre-riegan fácil. Regar menos cantidad y verificar peso de la maceta antes de regar. El exceso de riego las frena severamente.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Hojas en garra (hacia arriba)"],
+        "diagnostico": "**Estrés hídrico (falta de agua) o calor en raíces.** Las hojas viejas se curvan hacia arriba por deshidratación.",
+        "remedio_casero": """
+            - **Regar inmediatamente:** Agua a temperatura ambiente, lentamente para que el sustrato absorba bien.
+            - **Mulch:** Cubrir el sustrato con paja, corteza o fibra de coco para retener humedad.
+            - **Aloe vera foliar:** 20 ml de gel de aloe en 1 litro de agua. Pulverizar para hidratar hojas mientras se recuperan raíces.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=falta+agua+cannabis+hojas+marchitas+solucion",
+        "remedio_sistema": {
+            "maceta": "Si el sustrato se separó de las paredes de la maceta, regar por inmersión: sumergir la maceta en un balde con agua 10 minutos. Usar mulch. Considerar maceta más grande.",
+            "tierra": "Regar profundo y lento. Instalar riego por goteo para mantener humedad constante. Mulch grueso (10 cm) alrededor de la base.",
+            "interior_luz": "Si usás fibra de coco, se seca rápido: considerar riego automático por goteo. Verificar que la temperatura del indoor no esté secando demasiado rápido.",
+            "automaticas": "Regar inmediatamente. Las autos no toleran bien el estrés hídrico. Establecer rutina fija de riego y verificar peso de maceta diariamente.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Manchas blancas (polvo)"],
+        "diagnostico": "**Oídio en hojas viejas.** El hongo aparece primero en hojas bajas con poca ventilación y más humedad.",
+        "remedio_casero": """
+            - **Leche foliar:** 1 parte de leche + 9 partes de agua. Pulverizar con sol directo.
+            - **Bicarbonato:** 1 cucharadita por litro de agua + 2 gotas de jabón potásico. Aplicar cada 5 días.
+            - **Vinagre de manzana diluido:** 5 ml por litro. Pulverizar. Cambia el pH de la superficie de la hoja.
+            - **Podar hojas afectadas:** Retirar y descartar lejos del cultivo (no compostar).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=oidio+hojas+viejas+cannabis+tratamiento+natural",
+        "remedio_sistema": {
+            "maceta": "Podar las hojas bajas más afectadas. Separar macetas para mejorar flujo de aire. Aplicar leche foliar preventiva cada 5 días. Evitar regar las hojas.",
+            "tierra": "Defoliar ramas bajas para subir la ventilación desde el suelo. El rocío de La Carlota favorece el oídio en otoño. Leche + bicarbonato preventivo.",
+            "interior_luz": "Bajar humedad a 45%. Aumentar ventilación con oscilante apuntando a la zona baja. Podar hojas afectadas. Desinfectar tijeras con alcohol entre cortes.",
+            "automaticas": "Podar hojas bajas con cuidado (no excederse). Leche foliar es segura para autos. Mejorar ventilación alrededor de la planta.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Puntos blancos o telarañas"],
+        "diagnostico": "**Arañuela roja en hojas viejas.** Los ácaros suelen empezar por las hojas bajas donde hay menos movimiento de aire.",
+        "remedio_casero": """
+            - **Jabón potásico:** 5 ml por litro de agua. Pulverizar bien el envés de las hojas bajas. Repetir cada 3 días.
+            - **Aceite de neem:** 3 ml por litro + jabón potásico. Aplicar al atardecer para evitar quemaduras.
+            - **Agua a presión suave:** Lavar el envés de las hojas con spray de agua.
+            - **Infusión de ajo:** 4 dientes machacados en 1 litro de agua caliente. Dejar enfriar, colar y pulverizar.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=arañuela+hojas+viejas+cannabis+jabon+potasico",
+        "remedio_sistema": {
+            "maceta": "Lavar hojas con manguera suave. Neem + jabón potásico cada 3 días. Mover macetas a zona más ventilada. Las arañuelas se reproducen con calor seco.",
+            "tierra": "Neem preventivo en verano. Plantar aromáticas (albahaca, menta) cerca para repeler. Lavar con manguera las hojas bajas regularmente.",
+            "interior_luz": "Subir humedad a 55-60%. Neem + jabón potásico intensivo. Considerar control biológico (Phytoseiulus persimilis). Limpiar bien la carpa.",
+            "automaticas": "Jabón potásico cada 3 días. No usar neem en floración avanzada. Retirar hojas muy afectadas si la planta tiene suficiente follaje.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Agujeros en hojas"],
+        "diagnostico": "**Orugas, caracoles o insectos masticadores.** Agujeros en hojas viejas bajas. Caracoles y orugas prefieren las hojas cercanas al suelo.",
+        "remedio_casero": """
+            - **BT (Bacillus thuringiensis):** Pulverizar cada 7 días. Solo mata orugas, seguro para la planta.
+            - **Cerveza trampa:** Plato enterrado al ras del suelo con cerveza. Los caracoles caen y se ahogan.
+            - **Ceniza alrededor de la base:** Barrera física que los caracoles no cruzan.
+            - **Inspección nocturna:** Revisar con linterna al atardecer y de noche. Retirar a mano.
+            - **Cáscara de huevo triturada:** Esparcir alrededor de la base como barrera cortante.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=orugas+caracoles+cannabis+hojas+bajas+control+natural",
+        "remedio_sistema": {
+            "maceta": "Barrera de cáscara de huevo en el borde de la maceta. BT semanal en verano. Elevar macetas del suelo para dificultar acceso de caracoles.",
+            "tierra": "BT esencial dic-feb en La Carlota. Trampas de cerveza cada 2 metros. Mantener zona limpia de malezas que sirvan de refugio. Ceniza perimetral.",
+            "interior_luz": "Si aparecen, vinieron con el sustrato o entraron del exterior. Inspeccionar sustrato antes de usar. Sellar entradas de aire con malla fina.",
+            "automaticas": "BT preventivo semanal obligatorio en exterior. Las autos tienen menos hojas: cada hoja cuenta. Inspección diaria.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Moho gris en cogollos"],
+        "diagnostico": "**Botrytis en zona baja.** Humedad acumulada cerca del suelo favorece el moho gris en hojas y ramas bajas.",
+        "remedio_casero": """
+            - **Retirar parte afectada inmediatamente.** Cortar con tijera desinfectada (alcohol 70%).
+            - **Agua oxigenada:** 3 ml de agua oxigenada (10 vol) por litro de agua. Pulverizar zona cercana.
+            - **Canela en polvo:** Aplicar sobre el corte para sellar y prevenir reinfección.
+            - **Defoliar zona baja:** Mejorar ventilación retirando hojas innecesarias cerca del suelo.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=botrytis+hojas+bajas+cannabis+prevencion",
+        "remedio_sistema": {
+            "maceta": "Podar ramas bajas que toquen el sustrato. Separar macetas. Si hay rocío frecuente, mover a zona cubierta de noche.",
+            "tierra": "Defoliar zona baja completamente. Mantener limpio el suelo debajo de la planta. El rocío matinal de La Carlota es el principal factor: ventilar temprano.",
+            "interior_luz": "Bajar humedad urgente. Podar la zona baja (lollipop). Asegurar flujo de aire en la base con ventilador. Desinfectar herramientas.",
+            "automaticas": "Retirar parte afectada. Defoliar suavemente hojas bajas que retengan humedad. Canela sobre el corte.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Tallos púrpuras"],
+        "diagnostico": "**Deficiencia de Fósforo visible en hojas viejas.** Los pecíolos y tallos de hojas bajas se tornan púrpuras. Puede ser también frío nocturno.",
+        "remedio_casero": """
+            - **Té de banana:** Hervir 3 cáscaras de banana en 1 litro, enfriar, colar y regar (alto en P y K).
+            - **Harina de hueso:** 2 cucharadas mezcladas en el sustrato cerca de las raíces.
+            - **Guano de murciélago:** 1 cucharada en 5 litros de agua, remojar 24 hs y regar.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=deficiencia+fosforo+cannabis+tallos+purpuras+hojas+viejas",
+        "remedio_sistema": {
+            "maceta": "Verificar temperatura nocturna: debajo de 10°C bloquea absorción de P. Harina de hueso + té de banana. Si es otoño, puede ser normal.",
+            "tierra": "Incorporar harina de hueso en la zona de raíces. El P se mueve poco en el suelo. En noches frías, cubrir la base con mulch grueso.",
+            "interior_luz": "Verificar temperatura nocturna (no menor a 18°C). Aumentar P en la solución nutritiva. Revisar pH: el P se bloquea fuera de 6.0-7.0.",
+            "automaticas": "Té de banana suave cada 5 días. Si la planta crece bien y es solo color, puede ser genético. No sobre-corregir.",
+        },
+    },
+    {
+        "zona": "Hojas Viejas (Abajo)",
+        "sintomas": ["Mosquitas en el sustrato"],
+        "diagnostico": "**Mosquita del sustrato visible en hojas bajas.** Adultos vuelan alrededor de las hojas viejas y el sustrato. Larvas dañan raíces superficiales.",
+        "remedio_casero": """
+            - **Canela en polvo:** Capa fina sobre el sustrato. Antifúngica y repelente.
+            - **Trampas amarillas pegajosas:** Colocar a la altura de la planta para capturar adultos.
+            - **Dejar secar sustrato:** Las larvas mueren sin humedad constante.
+            - **Tierra de diatomeas:** Espolvorear en superficie cuando el sustrato esté seco.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=mosquita+sustrato+cannabis+canela+trampas",
+        "remedio_sistema": {
+            "maceta": "Canela + secar entre riegos. Trampas amarillas pegajosas. Agregar vermiculita o arena gruesa en la superficie para dificultar oviposición.",
+            "tierra": "Menos frecuente. Si aparecen, mejorar drenaje y reducir frecuencia de riego. Tierra de diatomeas alrededor de la base.",
+            "interior_luz": "Muy común. Canela + trampas + BTi en agua de riego. Cubrir superficie con perlita gruesa. No sobre-regar nunca.",
+            "automaticas": "Canela preventiva desde el inicio. Las autos sufren mucho el daño en raíces por larvas. Mantener sustrato con ciclos de secado.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Amarilleamiento uniforme"],
+        "diagnostico": "**Deficiencia de Hierro (Fe).** Las hojas nuevas amarillean pero las nervaduras quedan verdes (clorosis intervenal).",
+        "remedio_casero": """
+            - **Clavos oxidados en agua:** Dejar 5-6 clavos oxidados en 5 litros de agua 48 hs. Regar con esa agua.
+            - **Vinagre de manzana:** 2 ml por litro de agua de riego (baja pH y libera Fe del sustrato).
+            - **Té de compost ácido:** Fermentar hojas de pino o corteza en agua 1 semana. Diluir y regar.
+            - **Ácido cítrico:** 0.5 g por litro de agua de riego para bajar pH y liberar hierro del sustrato.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=deficiencia+hierro+cannabis+pH+solucion",
+        "remedio_sistema": {
+            "maceta": "Bajar el pH del agua a 6.0-6.3. El agua de red de La Carlota es dura (pH ~7.5): usar ácido cítrico (1g por 10L). Aplicar quelato de hierro EDDHA.",
+            "tierra": "El suelo alcalino de La Carlota bloquea el Fe. Acidificar zona de raíces con azufre elemental o compost de hojas de pino. Quelato de hierro foliar para respuesta rápida.",
+            "interior_luz": "Corregir pH a 5.8-6.0 urgente. Agregar quelato de hierro EDDHA a la solución. Revisar que la EC no esté muy alta (bloquea absorción).",
+            "automaticas": "Ajustar pH inmediatamente. Aplicar hierro foliar quelado (dosis baja). Las autos no tienen tiempo de esperar correcciones lentas: actuar en 24 hs.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Puntas y bordes quemados"],
+        "diagnostico": "**Deficiencia de Calcio (Ca).** Puntas quemadas y deformes en hojas nuevas. Común con agua blanda o de lluvia.",
+        "remedio_casero": """
+            - **Cáscara de huevo en vinagre:** Disolver cáscaras trituradas en vinagre blanco 24-48 hs. Diluir 1:20 y regar.
+            - **Leche diluida:** 50 ml de leche entera en 1 litro de agua. Regar cada 10 días (aporta Ca).
+            - **Cal dolomita:** Espolvorear sobre el sustrato y regar (corrección lenta pero duradera).
+            - **Agua de cáscara de huevo:** Hervir 10 cáscaras en 2 litros 10 min. Enfriar y regar.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=deficiencia+calcio+cannabis+hojas+nuevas",
+        "remedio_sistema": {
+            "maceta": "Agregar CalMag al agua de riego. Si usás agua de lluvia, siempre suplementar calcio. Revisar pH. En La Carlota el agua de red tiene calcio, pero si filtrás mucho lo perdés.",
+            "tierra": "Incorporar yeso agrícola o cal dolomita al suelo. El agua de lluvia no aporta Ca: complementar con riego de red intercalado.",
+            "interior_luz": "Agregar CalMag (2-3 ml/L). Si usás agua de ósmosis, el CalMag es obligatorio siempre. Verificar pH 5.8-6.2.",
+            "automaticas": "CalMag a dosis baja (1-2 ml/L). Aplicar desde la semana 2 como prevención constante.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Manchas óxido/bronce"],
+        "diagnostico": "**Deficiencia de Zinc (Zn) o Manganeso (Mn).** Manchas óxido en hojas nuevas con deformación. Los micronutrientes se bloquean con pH alto.",
+        "remedio_casero": """
+            - **Vinagre de manzana:** 2 ml por litro de agua de riego. Baja pH y libera micronutrientes.
+            - **Algas marinas (kelp):** Extracto líquido de algas, 2 ml por litro. Rico en micronutrientes.
+            - **Compost de calidad:** Incorporar compost maduro que aporta micronutrientes variados.
+            - **Ceniza de madera diluida:** 1 cucharada en 5 litros de agua, remojar 24 hs, colar y regar (aporta Zn y Mn).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=deficiencia+zinc+manganeso+cannabis+hojas+nuevas",
+        "remedio_sistema": {
+            "maceta": "Corregir pH del agua a 6.0-6.5. Aplicar micronutrientes quelatados foliar. El agua dura de La Carlota puede bloquear Zn y Mn.",
+            "tierra": "Incorporar compost rico y extracto de algas. El suelo alcalino bloquea micronutrientes: acidificar zona de raíces con azufre o vinagre.",
+            "interior_luz": "Verificar pH estricto (5.8-6.2). Agregar micronutrientes quelatados a la solución. Revisar si la EC está demasiado alta.",
+            "automaticas": "Extracto de algas foliar es la opción más segura. Corregir pH del agua. Las autos son sensibles a bloqueos de micronutrientes.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Hojas en garra (hacia arriba)"],
+        "diagnostico": "**Estrés por calor o luz excesiva.** Las hojas nuevas se curvan hacia arriba buscando protegerse del exceso de energía.",
+        "remedio_casero": """
+            - **Extracto de aloe vera:** 30 ml de gel de aloe en 1 litro de agua. Pulverizar sobre hojas al atardecer.
+            - **Agua fresca:** Regar con agua a temperatura ambiente (no fría) para refrescar raíces.
+            - **Sombra temporal:** Usar tela o sombrilla en horas pico (12-16 hs).
+            - **Pulverizar agua al atardecer:** Refrescar las hojas cuando baje el sol.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=estres+calor+cannabis+hojas+garra+arriba+solucion",
+        "remedio_sistema": {
+            "maceta": "Mover a media sombra en horas pico (12-16 hs). Regar al atardecer. Usar maceta blanca para reflejar calor. Mulch sobre sustrato.",
+            "tierra": "Instalar malla media sombra 30-50%. Mulch grueso (10 cm) para mantener raíces frescas. Regar temprano a la mañana.",
+            "interior_luz": "Subir la luz 10-15 cm. Bajar temperatura con extracción reforzada. Pasar las luces a horario nocturno en verano. Verificar VPD.",
+            "automaticas": "Reducir intensidad de luz o alejar el panel. Las autos sufren más el estrés por calor. Sombra parcial en exterior durante picos de calor.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Hojas en garra (hacia abajo)"],
+        "diagnostico": "**Exceso de riego o toxicidad.** Hojas nuevas caídas en garra hacia abajo. Las raíces no pueden respirar.",
+        "remedio_casero": """
+            - **Dejar secar completamente:** No regar hasta que el sustrato esté seco al menos 3-4 cm.
+            - **Mejorar aireación:** Pinchar suavemente el sustrato con un palito para dejar entrar aire a las raíces.
+            - **Agua oxigenada:** 2 ml de H2O2 (10 vol) por litro de agua de riego para oxigenar raíces.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=exceso+riego+cannabis+hojas+nuevas+garra+abajo",
+        "remedio_sistema": {
+            "maceta": "Dejar secar. Verificar drenaje: levantar la maceta, debe pesar poco cuando necesita riego. Considerar trasplante a sustrato más aireado con más perlita.",
+            "tierra": "Espaciar riegos. Si el suelo está compacto, aflojar superficie con cuidado sin dañar raíces. Agregar mulch seco para absorber exceso.",
+            "interior_luz": "Espaciar riegos. Usar macetas con drenaje excelente. H2O2 en el agua ayuda a oxigenar. Verificar que el sustrato no esté compactado.",
+            "automaticas": "Dejar secar urgente. Las autos con raíces ahogadas pierden días valiosos. Regar menos cantidad, más seguido, cuando estén secas.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Manchas blancas (polvo)"],
+        "diagnostico": "**Oídio en brotes nuevos.** Ataque temprano de oídio en las hojas jóvenes. Muy agresivo si no se trata.",
+        "remedio_casero": """
+            - **Leche foliar:** 1:9 con agua, pulverizar con sol (la caseína + UV mata las esporas).
+            - **Bicarbonato de sodio:** 1 cucharadita por litro + 2 gotas jabón potásico.
+            - **Aceite de neem preventivo:** 3 ml por litro, aplicar cada 7 días como barrera.
+            - **Cola de caballo (infusión):** Hervir 50g de cola de caballo seca en 1 litro. Diluir 1:5 y pulverizar (antifúngico natural).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=oidio+hojas+nuevas+cannabis+tratamiento+leche",
+        "remedio_sistema": {
+            "maceta": "Leche foliar urgente. Mover maceta a zona con más sol y viento. No pulverizar de noche. Repetir cada 4-5 días hasta que desaparezca.",
+            "tierra": "Aplicar leche + bicarbonato. Asegurar buena distancia entre plantas. El rocío matinal de La Carlota es factor de riesgo: ventilar temprano.",
+            "interior_luz": "Bajar humedad a 40-45%. Bicarbonato foliar con luces apagadas. Aumentar renovación de aire. Desinfectar todo con agua oxigenada.",
+            "automaticas": "Leche foliar inmediata (segura para autos). El oídio en hojas nuevas frena el crecimiento. Defoliar lo afectado si hay suficiente follaje sano.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Puntos blancos o telarañas"],
+        "diagnostico": "**Arañuela roja en brotes.** Ataque en hojas nuevas indica infestación avanzada. Los ácaros suben hacia los brotes.",
+        "remedio_casero": """
+            - **Jabón potásico intensivo:** 5 ml por litro, pulverizar envés cada 2 días.
+            - **Neem + jabón:** 3 ml neem + 3 ml jabón potásico por litro. Al atardecer.
+            - **Ajo + ají macerado:** 5 dientes + 1 ají en 1 litro 24 hs. Colar y pulverizar.
+            - **Agua jabonosa de platos (ecológico):** 2 gotas de detergente biodegradable por litro. Emergencia.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=arañuela+roja+brotes+cannabis+tratamiento+urgente",
+        "remedio_sistema": {
+            "maceta": "Aislar planta afectada. Neem + jabón potásico intensivo. Lavar con manguera el envés. Si está en flora, jabón potásico solo (sin neem).",
+            "tierra": "Tratamiento de choque: neem + jabón potásico + lavado con manguera. Plantar albahaca entre las plantas como repelente. Repetir cada 3 días.",
+            "interior_luz": "Emergencia: subir humedad a 60%, bajar temperatura. Neem + jabón potásico diario por 1 semana. Considerar ácaros depredadores (Phytoseiulus).",
+            "automaticas": "Solo jabón potásico en floración. Retirar hojas muy infestadas. Actuar ya: en autos cada día de estrés se nota en la cosecha.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Agujeros en hojas"],
+        "diagnostico": "**Insectos masticadores en brotes.** Orugas pequeñas o trips pueden hacer agujeros en hojas nuevas tiernas.",
+        "remedio_casero": """
+            - **BT (Bacillus thuringiensis):** Seguro para la planta, mata orugas en 24-48 hs. Aplicar cada 7 días.
+            - **Inspección con lupa:** Las orugas pequeñas se esconden en el centro de los brotes.
+            - **Tabaco macerado:** 2 cigarrillos en 1 litro de agua 24 hs. Colar y pulverizar (insecticida natural).
+            - **Aceite de neem:** 3 ml/L preventivo cada 7 días.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=orugas+brotes+cannabis+BT+tratamiento",
+        "remedio_sistema": {
+            "maceta": "BT preventivo semanal en temporada (dic-feb). Inspección diaria de brotes. Usar malla fina sobre la planta si el ataque es severo.",
+            "tierra": "BT obligatorio en La Carlota en verano. Revisar envés de hojas nuevas cada día. Trampas de luz nocturna para atraer polillas adultas.",
+            "interior_luz": "Si hay orugas en indoor, entraron con el sustrato o al ventilar. Sellar entradas con malla. Retirar manualmente y aplicar BT.",
+            "automaticas": "BT urgente. Las autos no pueden perder brotes nuevos. Inspección con lupa dentro de los apicales cada atardecer.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Moho gris en cogollos"],
+        "diagnostico": "**Botrytis en brotes apicales.** El moho gris ataca los brotes superiores cuando hay humedad y poca ventilación. Muy peligroso.",
+        "remedio_casero": """
+            - **Retirar inmediatamente** el brote afectado. Cortar 5 cm debajo del moho visible.
+            - **Desinfectar tijeras** con alcohol 70% entre cada corte.
+            - **Canela en polvo:** Sellar el corte con canela para prevenir reinfección.
+            - **Agua oxigenada:** 3 ml por litro, pulverizar zona circundante.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=botrytis+brotes+apicales+cannabis+emergencia",
+        "remedio_sistema": {
+            "maceta": "Cortar parte afectada. Mover a lugar ventilado y cubierto de lluvia. Si llueve mucho, considerar cosecha anticipada de lo sano.",
+            "tierra": "Retirar parte afectada. Instalar cobertura contra lluvia si es posible. Defoliar agresivamente para ventilación. Considerar cosecha parcial.",
+            "interior_luz": "Emergencia: humedad a 35%. Máxima extracción. Retirar con guantes, no sacudir (dispersa esporas). Desinfectar todo el espacio.",
+            "automaticas": "Retirar urgente. Si la auto está cerca de cosecha, cosechar todo lo sano ahora. La botrytis se expande rápido y arruina todo.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Tallos púrpuras"],
+        "diagnostico": "**Pecíolos púrpuras en hojas nuevas.** Puede ser genético, frío nocturno, o deficiencia de Fósforo que afecta el crecimiento nuevo.",
+        "remedio_casero": """
+            - **Té de banana:** Hervir 3 cáscaras en 1 litro, enfriar, colar y regar.
+            - **Guano de murciélago:** Rico en P. 1 cucharada en 5 litros, remojar 24 hs.
+            - **Proteger del frío nocturno:** Cubrir la planta o entrarla de noche si baja de 10°C.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=tallos+purpuras+hojas+nuevas+cannabis+fosforo",
+        "remedio_sistema": {
+            "maceta": "Entrar la maceta de noche si la temperatura baja de 10°C. Aplicar harina de hueso + té de banana. Si la planta crece bien, puede ser genético.",
+            "tierra": "Mulch grueso para aislar raíces del frío. Harina de hueso en la zona de raíces. En otoño tardío puede ser normal.",
+            "interior_luz": "Verificar que la temperatura con luces apagadas no baje de 18°C. Aumentar P en la solución. Si crece bien, ignorar.",
+            "automaticas": "Té de banana cada 5 días. Proteger del frío. Si crece bien y es solo color, probablemente genético.",
+        },
+    },
+    {
+        "zona": "Hojas Nuevas (Arriba)",
+        "sintomas": ["Mosquitas en el sustrato"],
+        "diagnostico": "**Mosquitas volando alrededor de brotes.** Los adultos de fungus gnat revolotean cerca de las partes húmedas de la planta.",
+        "remedio_casero": """
+            - **Trampas amarillas pegajosas:** A la altura de los brotes para capturar adultos.
+            - **Canela sobre sustrato:** Previene reproducción en la superficie.
+            - **Dejar secar:** Las larvas están en el sustrato, no en los brotes. Controlar desde abajo.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=mosquita+sustrato+cannabis+control+trampas",
+        "remedio_sistema": {
+            "maceta": "Las mosquitas no dañan las hojas directamente, el problema son las larvas en las raíces. Trampas amarillas + canela + secar sustrato.",
+            "tierra": "Raro en tierra madre. Si aparecen, es por exceso de materia orgánica fresca en superficie. Dejar secar y aplicar tierra de diatomeas.",
+            "interior_luz": "Trampas amarillas + BTi en agua de riego. Cubrir sustrato con perlita gruesa. Ventilar bien.",
+            "automaticas": "Controlar desde el sustrato: canela + secar + trampas. Las mosquitas adultas son molestas pero inofensivas; las larvas son el problema real.",
+        },
+    },
+    {
+        "zona": "Tallos y Ramas",
+        "sintomas": ["Tallos púrpuras"],
+        "diagnostico": "**Deficiencia de Fósforo (P) o genética.** Tallos púrpuras con crecimiento lento = deficiencia. Si la planta crece bien, puede ser genético.",
+        "remedio_casero": """
+            - **Harina de hueso:** Mezclar 2 cucharadas por planta en el sustrato y regar.
+            - **Té de banana:** Hervir 3 cáscaras de banana en 1 litro de agua 15 min. Enfriar, colar y regar (rico en P y K).
+            - **Guano de murciélago:** 1 cucharada en 5 litros de agua. Remojar 24 hs y regar.
+            - **Ceniza de madera:** 1 cucharada en 5 litros de agua. Remojar, colar y regar (rico en K y P).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=deficiencia+fosforo+cannabis+tallos+purpuras",
+        "remedio_sistema": {
+            "maceta": "Agregar harina de hueso al sustrato. Usar fertilizante con P alto en floración. Verificar que la temperatura nocturna no baje de 10°C (frío bloquea P).",
+            "tierra": "Incorporar guano de murciélago o harina de hueso en la zona de raíces. El fósforo se mueve poco en el suelo, aplicar lo más cerca posible de las raíces.",
+            "interior_luz": "Aumentar P en la solución nutritiva. Verificar pH (el P se bloquea fuera de 6.0-7.0). Revisar temperatura de raíces (mínimo 18°C).",
+            "automaticas": "Té de banana es la opción más suave y segura. Aplicar cada 5 días en floración. Si crece bien, puede ser genético.",
+        },
+    },
+    {
+        "zona": "Tallos y Ramas",
+        "sintomas": ["Manchas blancas (polvo)"],
+        "diagnostico": "**Oídio en tallos.** El hongo puede atacar tallos y ramas, especialmente en nudos donde se acumula humedad.",
+        "remedio_casero": """
+            - **Bicarbonato + jabón potásico:** 1 cucharadita bicarbonato + 2 gotas jabón en 1 litro. Frotar tallos afectados con paño embebido.
+            - **Leche pura:** Aplicar con algodón sobre las manchas blancas del tallo.
+            - **Cola de caballo:** Infusión concentrada aplicada con pincel sobre los tallos.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=oidio+tallos+cannabis+tratamiento",
+        "remedio_sistema": {
+            "maceta": "Limpiar tallos con paño embebido en bicarbonato. Mejorar ventilación entre macetas. Podar ramas interiores que estén muy juntas.",
+            "tierra": "Defoliar ramas interiores. Asegurar distancia entre plantas. Aplicar cola de caballo preventiva. Evitar mojar los tallos al regar.",
+            "interior_luz": "Limpiar tallos manualmente. Bajar humedad. Aumentar circulación de aire directo sobre los tallos con ventilador oscilante.",
+            "automaticas": "Limpiar con paño + bicarbonato. Mejorar ventilación. Las autos compactas concentran humedad en el centro: defoliar suavemente.",
+        },
+    },
+    {
+        "zona": "Tallos y Ramas",
+        "sintomas": ["Manchas óxido/bronce"],
+        "diagnostico": "**Roya o infección fúngica en tallos.** Manchas óxido-marrón en ramas pueden ser hongo de roya (Puccinia). Raro pero posible.",
+        "remedio_casero": """
+            - **Podar ramas afectadas:** Cortar por debajo de la lesión con tijera desinfectada.
+            - **Canela en polvo:** Sellar heridas de poda con canela (antifúngica natural).
+            - **Aceite de neem:** 3 ml/L pulverizado sobre los tallos cada 5 días como barrera.
+            - **Azufre en polvo:** Aplicar sobre las manchas si están localizadas (fungicida tradicional).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=roya+tallos+cannabis+hongos+tratamiento",
+        "remedio_sistema": {
+            "maceta": "Podar rama afectada y sellar con canela. Separar de otras plantas. Neem preventivo sobre el resto de tallos. Desinfectar tijeras.",
+            "tierra": "Podar y eliminar (no compostar). Mejorar ventilación podando ramas interiores. El rocío nocturno de La Carlota favorece hongos en tallos.",
+            "interior_luz": "Podar y desinfectar. Bajar humedad. Revisar que no haya agua estancada que salpique los tallos. Desinfectar toda la carpa.",
+            "automaticas": "Podar rama afectada con cuidado. Canela sobre el corte. Las autos soportan pocas podas, ser conservador.",
+        },
+    },
+    {
+        "zona": "Tallos y Ramas",
+        "sintomas": ["Agujeros en hojas"],
+        "diagnostico": "**Barrenadores o daño mecánico en tallos.** Insectos barrenadores pueden hacer agujeros en ramas. También puede ser daño por viento.",
+        "remedio_casero": """
+            - **Inspección detallada:** Buscar excremento o aserrín en la base del agujero (indica barrenador).
+            - **Alambre fino:** Si hay barrenador dentro, insertar un alambre fino para eliminarlo.
+            - **Sellar con canela:** Aplicar canela + miel sobre la herida para proteger y cicatrizar.
+            - **Cinta de injerto:** Envolver la zona dañada para dar soporte estructural.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=barrenador+tallos+cannabis+reparar",
+        "remedio_sistema": {
+            "maceta": "Si es daño de viento, entutorar y reparar con cinta. Si es barrenador, tratar con alambre + sellar con canela y miel. Reforzar tutores.",
+            "tierra": "Los barrenadores son más comunes en plantas grandes. Inspeccionar semanalmente. Sellar heridas con canela. Neem preventivo en la base.",
+            "interior_luz": "Muy raro en indoor. Si es daño mecánico, reparar con cinta de injerto. Reforzar soporte de ramas pesadas en floración.",
+            "automaticas": "Reparar con cinta + canela. Las autos son más frágiles: usar tutores desde temprano para prevenir quiebres.",
+        },
+    },
+    {
+        "zona": "Tallos y Ramas",
+        "sintomas": ["Moho gris en cogollos"],
+        "diagnostico": "**Botrytis en ramas.** El moho gris puede atacar ramas, especialmente donde hay heridas de poda o quiebres.",
+        "remedio_casero": """
+            - **Retirar rama afectada:** Cortar por debajo del moho con tijera desinfectada.
+            - **Agua oxigenada:** 3 ml por litro sobre la zona cercana.
+            - **Canela:** Sellar todos los cortes de poda con canela preventivamente.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=botrytis+ramas+cannabis+poda+prevencion",
+        "remedio_sistema": {
+            "maceta": "Retirar rama. Sellar heridas previas con canela. Mover a zona ventilada. Evitar mojarse con lluvia.",
+            "tierra": "Podar y eliminar (no compostar). Sellar todos los cortes de poda con canela o pasta cicatrizante. Defoliar para ventilación.",
+            "interior_luz": "Retirar urgente. Bajar humedad. Revisar que todas las heridas de LST o poda estén selladas. Desinfectar carpa.",
+            "automaticas": "Retirar con cuidado. Canela sobre el corte. Si hay muchas ramas afectadas, considerar cosecha anticipada.",
+        },
+    },
+    {
+        "zona": "Tallos y Ramas",
+        "sintomas": ["Amarilleamiento uniforme", "Puntas y bordes quemados", "Hojas en garra (hacia abajo)", "Hojas en garra (hacia arriba)", "Puntos blancos o telarañas", "Mosquitas en el sustrato"],
+        "diagnostico": "**Síntoma '{sintoma}' en tallos y ramas.** Puede estar relacionado con estrés general, daño mecánico o problemas de nutrición que se manifiestan en la estructura.",
+        "remedio_casero": """
+            - **Inspección visual detallada:** Revisar si hay insectos, moho o heridas.
+            - **Reforzar tutores:** Si los tallos están débiles, entutorar con cañas de bambú.
+            - **Silicio foliar:** 1 ml de silicato de potasio por litro de agua. Fortalece tallos y paredes celulares.
+            - **Té de cola de caballo:** Rico en silicio natural. Hervir, diluir 1:5, pulverizar sobre tallos.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=tallos+debiles+cannabis+fortalecer+silicio",
+        "remedio_sistema": {
+            "maceta": "Entutorar si es necesario. Aplicar silicio foliar para endurecer tallos. El viento de La Carlota puede debilitar plantas sin soporte.",
+            "tierra": "Instalar tutores firmes. Aplicar cola de caballo para fortalecer. Las plantas en tierra madre crecen más y necesitan más soporte.",
+            "interior_luz": "Ventilar con oscilante para que los tallos se fortalezcan naturalmente. Silicio en la solución nutritiva. Usar red SCROG para soporte.",
+            "automaticas": "Las autos tienen tallos finos: silicio foliar desde la semana 2 ayuda. Usar tutores suaves de bambú.",
+        },
+    },
+    {
+        "zona": "Raíces y Base",
+        "sintomas": ["Mosquitas en el sustrato"],
+        "diagnostico": "**Mosquita del Sustrato (Fungus Gnat).** Larvas que comen raíces finas. Causan marchitez y crecimiento lento.",
+        "remedio_casero": """
+            - **Canela en polvo:** Espolvorear sobre el sustrato. Es antifúngica y repele mosquitas.
+            - **Trampa de vinagre:** Vaso con vinagre de manzana + gota de detergente. Atrapa adultos.
+            - **Dejar secar el sustrato:** Las larvas necesitan humedad. Espaciar riegos hasta que los primeros 3 cm estén secos.
+            - **Tierra de diatomeas:** Espolvorear sobre el sustrato seco. Mata larvas por contacto.
+            - **Arena gruesa en superficie:** Capa de 1-2 cm dificulta la puesta de huevos.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=mosquita+sustrato+fungus+gnat+cannabis+control",
+        "remedio_sistema": {
+            "maceta": "Canela + dejar secar entre riegos. Agregar perlita en superficie para dificultar la puesta de huevos. Usar trampas amarillas pegajosas cerca de la maceta.",
+            "tierra": "Menos común en tierra madre. Si aparecen, reducir riego y aplicar tierra de diatomeas alrededor de la base. Revisar que el drenaje sea bueno.",
+            "interior_luz": "Problema muy común en indoor. Dejar secar, canela, trampas amarillas pegajosas. BTi (Bacillus thuringiensis israelensis) en el agua de riego es lo más efectivo.",
+            "automaticas": "Actuar rápido: las autos no tienen tiempo de recuperarse del daño en raíces. Canela + dejar secar. No sobre-regar nunca.",
+        },
+    },
+    {
+        "zona": "Raíces y Base",
+        "sintomas": ["Amarilleamiento uniforme"],
+        "diagnostico": "**Pudrición de raíces (Root Rot).** Raíces marrones, blandas y con mal olor. La planta amarillea desde abajo uniformemente.",
+        "remedio_casero": """
+            - **Agua oxigenada:** 3-5 ml de H2O2 (10 vol) por litro de agua de riego. Oxigena y desinfecta raíces.
+            - **Canela en polvo:** Espolvorear en la base y sobre el sustrato (antifúngica potente).
+            - **Dejar secar completamente:** Las raíces necesitan oxígeno para recuperarse.
+            - **Carbón activado:** Mezclar en el sustrato para absorber toxinas y patógenos.
+            - **Trichoderma:** Si conseguís, agregar al sustrato para proteger raíces (hongo benéfico).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=pudricion+raices+cannabis+root+rot+solucion",
+        "remedio_sistema": {
+            "maceta": "Sacar la planta, revisar raíces: si son marrones y huelen mal, cortar las podridas. Trasplantar a sustrato nuevo con más perlita. H2O2 en cada riego por 2 semanas.",
+            "tierra": "Más raro en tierra madre. Si ocurre, el suelo está encharcado: hacer canales de drenaje urgentes. Aplicar Trichoderma si está disponible.",
+            "interior_luz": "H2O2 en cada riego. Verificar temperatura del agua (no mayor a 22°C, el calor fomenta root rot). En hidro: agregar oxigenador permanente.",
+            "automaticas": "Emergencia: H2O2 inmediato. Las autos con root rot pueden morir en días. Reducir riego drásticamente. Trasplantar solo si es muy urgente (las autos no toleran trasplante).",
+        },
+    },
+    {
+        "zona": "Raíces y Base",
+        "sintomas": ["Puntas y bordes quemados"],
+        "diagnostico": "**Daño por sales acumuladas en la zona de raíces.** El exceso de fertilizante se acumula en la base y quema las raíces superficiales.",
+        "remedio_casero": """
+            - **Flush (lavado):** Regar con 3x el volumen de la maceta en agua limpia pH 6.0-6.5.
+            - **Agua de lluvia:** Ideal para lavar sales por su bajo contenido mineral.
+            - **Reposo:** Solo agua por 7-10 días después del lavado.
+            - **Revisar EC del run-off:** Si sale muy alta, seguir lavando.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=exceso+sales+raices+cannabis+flush+lavado",
+        "remedio_sistema": {
+            "maceta": "Flush generoso con agua de lluvia o filtrada. Verificar que el run-off salga claro. Reducir dosis de fertilizante un 50% por 2 semanas.",
+            "tierra": "Regar abundante. En tierra madre las sales se dispersan mejor, pero si se usó mucho químico, lavar bien. Volver a nutrición orgánica.",
+            "interior_luz": "Flush con agua pH 6.0, EC 0.3. Medir EC del run-off: debe bajar a menos de 1.5. Retomar nutrientes al 50% después de 5 días.",
+            "automaticas": "Flush suave (2x volumen). Las autos son sensibles: retomar con dosis al 30%. Prevenir siempre es mejor que corregir.",
+        },
+    },
+    {
+        "zona": "Raíces y Base",
+        "sintomas": ["Moho gris en cogollos"],
+        "diagnostico": "**Pudrición del cuello (Damping Off o Botrytis basal).** Moho gris en la base del tallo, donde toca el sustrato. Muy peligroso.",
+        "remedio_casero": """
+            - **Canela en polvo:** Aplicar generosamente alrededor de la base del tallo y sobre el sustrato.
+            - **Agua oxigenada:** 3 ml por litro, regar alrededor de la base (no sobre el moho).
+            - **Mejorar ventilación basal:** Retirar hojas bajas que toquen el sustrato.
+            - **Secar el sustrato:** Reducir riego inmediatamente.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=pudricion+cuello+cannabis+damping+off+base",
+        "remedio_sistema": {
+            "maceta": "Canela urgente. Verificar que el sustrato no esté permanentemente húmedo en la zona del cuello. Elevar maceta para mejorar drenaje.",
+            "tierra": "Aporcar con sustrato seco mezclado con canela. Mejorar drenaje alrededor de la planta. No regar directamente sobre el tallo.",
+            "interior_luz": "Emergencia: secar, canela, ventilación. Si el cuello está blando y marrón, la planta puede no sobrevivir. H2O2 en riego.",
+            "automaticas": "Canela urgente + secar. Si el cuello está firme todavía, puede salvarse. Si está blando, la auto probablemente no se recupere.",
+        },
+    },
+    {
+        "zona": "Raíces y Base",
+        "sintomas": ["Manchas óxido/bronce"],
+        "diagnostico": "**Oxidación en zona de raíces.** Puede indicar exceso de hierro en el agua o sustrato compactado con mal drenaje.",
+        "remedio_casero": """
+            - **Revisar agua de riego:** Si tiene mucho hierro, dejar reposar 24 hs para que precipite.
+            - **Mejorar drenaje:** Agregar perlita al sustrato.
+            - **Flush suave:** Lavar con agua limpia para eliminar acumulación.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=exceso+hierro+raices+cannabis+agua+oxidada",
+        "remedio_sistema": {
+            "maceta": "Si el agua de red tiene mucho hierro (común en pozos de La Carlota), dejar reposar 24 hs en balde destapado. Filtrar antes de regar.",
+            "tierra": "Si la napa freática es ferruginosa, elevar el cantero. Usar mulch para filtrar. El exceso de Fe en suelo se contrarresta con buen drenaje.",
+            "interior_luz": "Revisar la fuente de agua. Si es de pozo, puede tener exceso de hierro. Considerar filtro o agua embotellada. Ajustar pH.",
+            "automaticas": "Filtrar el agua si tiene exceso de hierro. Las autos son sensibles a desequilibrios. Usar agua reposada 24 hs.",
+        },
+    },
+    {
+        "zona": "Raíces y Base",
+        "sintomas": ["Hojas en garra (hacia abajo)", "Hojas en garra (hacia arriba)", "Manchas blancas (polvo)", "Puntos blancos o telarañas", "Agujeros en hojas", "Tallos púrpuras"],
+        "diagnostico": "**Síntoma '{sintoma}' en la zona de raíces.** Los problemas en raíces se manifiestan en toda la planta. Revisar sustrato, drenaje y frecuencia de riego.",
+        "remedio_casero": """
+            - **Revisar raíces:** Sacar la planta con cuidado y observar: blancas = sanas, marrones/blandas = problemas.
+            - **Agua oxigenada:** 3 ml por litro como tratamiento general para raíces.
+            - **Canela preventiva:** Siempre es segura sobre el sustrato.
+            - **Trichoderma:** Si está disponible, excelente protector de raíces.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=problemas+raices+cannabis+diagnostico+solucion",
+        "remedio_sistema": {
+            "maceta": "Verificar drenaje, tamaño de maceta y frecuencia de riego. Si las raíces salen por abajo, trasplantar a maceta más grande.",
+            "tierra": "Revisar si hay encharcamiento o compactación del suelo. Aflojar superficie con cuidado. Agregar compost y perlita.",
+            "interior_luz": "Controlar temperatura del agua (18-22°C ideal). Verificar pH y EC del run-off. Oxigenar si es necesario.",
+            "automaticas": "Las autos son especialmente sensibles en raíces. Maceta definitiva desde semilla, buen drenaje, no sobre-regar.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Amarilleamiento uniforme"],
+        "diagnostico": "**Amarilleamiento general.** Puede ser: deficiencia severa de N, pH muy desajustado, root rot, o final de ciclo natural (flush pre-cosecha).",
+        "remedio_casero": """
+            - **Si está en vegetativo:** Probablemente deficiencia de N severa. Aplicar purín de ortiga o té de humus urgente.
+            - **Si está en floración tardía:** Puede ser normal (la planta consume sus reservas). Verificar tricomas.
+            - **Revisar pH del agua:** pH desajustado bloquea todos los nutrientes. Rango: 6.0-6.5.
+            - **Revisar raíces:** Si huelen mal, es root rot. Tratar con H2O2.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=amarilleamiento+general+cannabis+causas+solucion",
+        "remedio_sistema": {
+            "maceta": "Si es vege: aumentar N urgente (humus líquido o purín de ortiga). Si es flora tardía: verificar tricomas, puede ser hora de cosechar. Revisar pH del agua de La Carlota.",
+            "tierra": "Incorporar compost fresco alrededor de la base. El suelo puede estar agotado: aplicar purín de ortiga + té de humus. Si es flora final, puede ser normal.",
+            "interior_luz": "Verificar pH y EC inmediatamente. Si ambos están bien, revisar raíces. En flora tardía (últimas 2 semanas) es normal y deseable.",
+            "automaticas": "Si la auto tiene más de 8 semanas, puede ser final de ciclo. Si es joven, corregir N y pH urgente. Las autos amarillean rápido al final.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Puntas y bordes quemados"],
+        "diagnostico": "**Quemadura generalizada.** Puntas quemadas en toda la planta indica exceso severo de nutrientes o agua con EC muy alta.",
+        "remedio_casero": """
+            - **Flush urgente:** 3x volumen de la maceta con agua limpia pH 6.0.
+            - **Solo agua por 10 días:** No agregar ningún nutriente.
+            - **Agua de arroz:** Después del flush, regar con agua de arroz para recomponer microbiología.
+            - **Melaza diluida:** 1 cucharada por 5 litros después del flush para alimentar microorganismos beneficiosos.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=quemadura+nutrientes+cannabis+toda+planta+flush",
+        "remedio_sistema": {
+            "maceta": "Flush generoso. Verificar EC del run-off. Si usás fertilizantes comerciales, probablemente la dosis era muy alta. Reducir al 30% y subir gradual.",
+            "tierra": "Regar abundante con agua limpia durante 2-3 días. Dejar de fertilizar 2 semanas. Volver a dosis orgánicas moderadas.",
+            "interior_luz": "Flush con agua pH 6.0 EC 0.3. Medir run-off. No retomar nutrientes hasta que las puntas nuevas crezcan sanas. Empezar al 30% de la dosis.",
+            "automaticas": "Flush suave pero urgente. Las autos quemadas en flora producen poco. Solo agua por 7 días, luego retomar al 25% de dosis.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Manchas óxido/bronce"],
+        "diagnostico": "**Deficiencia múltiple de micronutrientes o pH muy desajustado.** Manchas óxido en toda la planta sugiere bloqueo generalizado de nutrientes.",
+        "remedio_casero": """
+            - **Corregir pH urgente:** El pH es la causa más común. Rango ideal: 6.0-6.5 en tierra, 5.8-6.2 en hidro/coco.
+            - **Extracto de algas (kelp):** 2 ml por litro. Aporta micronutrientes variados.
+            - **Sal de Epsom foliar:** 1g por litro como corrección rápida de Mg.
+            - **Vinagre de manzana:** 1-2 ml por litro de riego para acidificar suavemente.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=manchas+oxido+toda+planta+cannabis+pH+micronutrientes",
+        "remedio_sistema": {
+            "maceta": "Medir y corregir pH del agua. En La Carlota el agua es dura (~7.5): usar ácido cítrico. Aplicar extracto de algas + sal de Epsom foliar.",
+            "tierra": "Acidificar zona de raíces con azufre elemental o vinagre diluido. Incorporar compost ácido (hojas de pino). Extracto de algas en riego.",
+            "interior_luz": "Verificar pH estricto en cada riego. Agregar micronutrientes quelatados. Si usás agua de La Carlota sin corregir, el pH alto bloquea todo.",
+            "automaticas": "Corregir pH ya. Las autos no toleran bloqueos prolongados. Extracto de algas foliar + sal de Epsom como corrección rápida.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Hojas en garra (hacia abajo)"],
+        "diagnostico": "**Exceso de Nitrógeno.** Hojas verde oscuro y en garra hacia abajo. Peligroso en floración.",
+        "remedio_casero": """
+            - **Lavado de raíces (Flush):** Regar con 3x el volumen de la maceta en agua limpia pH 6.0-6.5.
+            - **Reposo de nutrientes:** Solo agua por 7-10 días.
+            - **Carbón activado:** Mezclar un puñado en el sustrato para absorber exceso de sales.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=exceso+nitrogeno+cannabis+hojas+garra+solucion",
+        "remedio_sistema": {
+            "maceta": "Flush generoso. Cambiar a fertilizante de floración si ya está en flora. Reducir dosis general un 40%.",
+            "tierra": "Regar abundante con agua limpia. Dejar de fertilizar por 2 semanas. En tierra madre se corrige más lento, paciencia.",
+            "interior_luz": "Bajar EC a 0.5-0.8 por 1 semana. Flush con agua pH 6.0. Retomar con dosis reducida.",
+            "automaticas": "Flush suave y urgente. Las autos en flora con exceso de N producen cogollos aireados. Solo agua por 7 días.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Hojas en garra (hacia arriba)"],
+        "diagnostico": "**Estrés térmico o lumínico generalizado.** Toda la planta con hojas hacia arriba indica calor excesivo o luz demasiado intensa.",
+        "remedio_casero": """
+            - **Sombra temporal:** Cubrir con malla media sombra 30-50% en horas pico.
+            - **Aloe vera foliar:** 30 ml gel en 1 litro de agua, pulverizar al atardecer.
+            - **Riego refrescante:** Regar al atardecer para bajar temperatura de raíces.
+            - **Mulch grueso:** 10 cm de paja o corteza sobre sustrato para aislar raíces del calor.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=estres+calor+cannabis+toda+planta+solucion",
+        "remedio_sistema": {
+            "maceta": "Mover a media sombra (12-16 hs). Macetas blancas reflejan calor. Regar 2 veces/día en olas de calor. Mulch obligatorio.",
+            "tierra": "Instalar malla media sombra urgente. Mulch grueso. Regar profundo temprano. El calor extremo de La Carlota (40°C+) requiere protección.",
+            "interior_luz": "Subir luces 15-20 cm. Luces de noche en verano. Reforzar extracción. Considerar aire acondicionado si supera 32°C.",
+            "automaticas": "Proteger urgente: sombra parcial exterior o alejar luces indoor. Las autos estresadas por calor producen mucho menos.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Manchas blancas (polvo)"],
+        "diagnostico": "**Oídio (Hongo).** Polvo blanco sobre las hojas. Muy común en otoño con rocío nocturno en La Carlota.",
+        "remedio_casero": """
+            - **Leche diluida:** 1 parte de leche + 9 partes de agua. Pulverizar con sol (la caseína + UV mata el oídio).
+            - **Bicarbonato de sodio:** 1 cucharadita + 1 litro de agua + 2 gotas de jabón potásico. Pulverizar cada 5 días.
+            - **Ajo macerado:** 5 dientes machacados en 1 litro de agua 24 hs. Colar y pulverizar.
+            - **Cola de caballo:** Hervir 50g seca en 1 litro. Diluir 1:5 y pulverizar (antifúngico potente).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=oidio+cannabis+leche+bicarbonato+tratamiento+casero",
+        "remedio_sistema": {
+            "maceta": "Leche foliar cada 5 días con sol. Separar macetas para ventilación. Podar hojas muy afectadas. Mover a zona con más circulación de aire.",
+            "tierra": "Podar ramas bajas para circulación. Aplicar leche + bicarbonato foliar. Mantener distancia entre plantas (1.5 m mínimo). El rocío de La Carlota es factor clave.",
+            "interior_luz": "Bajar humedad a 40-45%. Aumentar ventilación. Aplicar bicarbonato foliar con luces apagadas. Desinfectar la carpa con agua oxigenada.",
+            "automaticas": "Leche foliar es lo más seguro para autos. Defoliar hojas interiores para ventilación. Actuar rápido: las autos no tienen tiempo de recuperarse.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Puntos blancos o telarañas"],
+        "diagnostico": "**Arañuela Roja (Ácaro).** Puntos blancos en el haz, telarañas finas en el envés. Plaga grave en verano.",
+        "remedio_casero": """
+            - **Jabón potásico:** 5 ml por litro de agua. Pulverizar cubriendo el envés de las hojas. Repetir cada 3 días.
+            - **Aceite de neem:** 3 ml por litro + jabón potásico como emulsionante. Aplicar al atardecer.
+            - **Agua a presión:** Lavar las hojas con manguera suave para desalojar ácaros (solo exterior).
+            - **Ajo + ají picante:** Licuar 5 dientes de ajo + 1 ají en 1 litro de agua. Colar y pulverizar.
+            - **Tabaco macerado:** 2 cigarrillos en 1 litro 24 hs. Colar y pulverizar (solo en vegetativo).
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=arañuela+roja+cannabis+tratamiento+jabón+potasico+neem",
+        "remedio_sistema": {
+            "maceta": "Neem + jabón potásico cada 3 días. Lavar hojas con manguera. Aislar plantas afectadas. Subir humedad ambiental (las arañuelas odian la humedad alta).",
+            "tierra": "Neem preventivo cada 10 días en verano. Lavado con manguera intensivo. Plantar albahaca o caléndula cerca como repelente natural.",
+            "interior_luz": "Emergencia: neem + jabón potásico intensivo. Subir humedad a 60%. Bajar temperatura. Considerar ácaros depredadores (Phytoseiulus) como control biológico.",
+            "automaticas": "Jabón potásico es lo más seguro. Neem con precaución en floración (puede afectar sabor). Actuar desde el primer punto blanco visible.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Agujeros en hojas"],
+        "diagnostico": "**Orugas o Caracoles.** Agujeros irregulares en las hojas. Orugas dejan excremento negro; caracoles dejan baba brillante.",
+        "remedio_casero": """
+            - **Bacillus thuringiensis (BT):** Spray biológico que mata orugas sin dañar la planta. Aplicar cada 7 días.
+            - **Inspección manual:** Revisar al atardecer y de noche con linterna. Retirar orugas y caracoles a mano.
+            - **Ceniza o cáscara de huevo:** Barrera física alrededor de la base contra caracoles.
+            - **Cerveza trampa:** Plato con cerveza enterrado al ras del suelo atrae y ahoga caracoles.
+            - **Pimienta de cayena:** Espolvorear alrededor de la planta como repelente.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=orugas+caracoles+cannabis+control+natural+BT",
+        "remedio_sistema": {
+            "maceta": "Inspección nocturna obligatoria en verano. BT preventivo cada 7 días dic-feb. Barrera de cáscara de huevo en el borde de la maceta.",
+            "tierra": "BT es esencial en La Carlota en temporada (dic-feb). Trampas de cerveza cada 2 metros. Revisar el envés de cada hoja y dentro de cogollos.",
+            "interior_luz": "Raro en indoor cerrado. Si aparecen, vinieron en el sustrato o al ventilar. Inspeccionar y retirar manualmente. Sellar entradas con malla.",
+            "automaticas": "BT preventivo semanal. Una oruga puede destruir un cogollo entero en una auto. Inspección diaria en floración es obligatoria.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Moho gris en cogollos"],
+        "diagnostico": "**Botrytis (Moho Gris).** Hongo que pudre cogollos desde adentro. Letal en floración tardía con humedad alta.",
+        "remedio_casero": """
+            - **No hay cura casera efectiva.** El cogollo afectado debe retirarse inmediatamente.
+            - **Prevención:** Defoliar para ventilación. No mojar cogollos. Reducir humedad.
+            - **Agua oxigenada:** Pulverizar 3 ml de agua oxigenada (10 vol) en 1 litro de agua sobre zonas cercanas para frenar propagación.
+            - **Canela en cortes:** Sellar toda herida de poda con canela.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=botrytis+moho+gris+cannabis+prevencion+cogollos",
+        "remedio_sistema": {
+            "maceta": "Cortar cogollo afectado 5 cm por debajo del moho. Mover a zona ventilada. Si llueve, cubrir con plástico sin tocar la planta. Considerar cosecha anticipada.",
+            "tierra": "Retirar partes afectadas. Podar ramas interiores para airear. Si hay pronóstico de lluvia, considerar cosechar anticipada. No compostar partes con botrytis.",
+            "interior_luz": "Bajar humedad a 35-40% urgente. Máxima extracción. Retirar partes afectadas con guantes y desinfectar tijeras con alcohol entre cada corte.",
+            "automaticas": "Retirar la parte afectada inmediatamente. Si falta poco para cosechar, considerar corte anticipado para salvar el resto de la planta.",
+        },
+    },
+    {
+        "zona": "Toda la Planta",
+        "sintomas": ["Tallos púrpuras"],
+        "diagnostico": "**Fósforo bajo o estrés por frío generalizado.** Tallos y pecíolos púrpuras en toda la planta.",
+        "remedio_casero": """
+            - **Té de banana:** 3 cáscaras hervidas en 1 litro. Regar semanalmente.
+            - **Harina de hueso:** 2 cucharadas en el sustrato.
+            - **Protección nocturna:** Si hay frío, cubrir o entrar la planta de noche.
+            - **Melaza:** 1 cucharada por litro de riego, ayuda a movilizar P.
+            """,
+        "video_url": "https://www.youtube.com/results?search_query=tallos+purpuras+cannabis+fosforo+frio+toda+planta",
+        "remedio_sistema": {
+            "maceta": "Si las noches bajan de 10°C, entrar las macetas. Harina de hueso + té de banana. Si crece bien, probablemente es genético.",
+            "tierra": "Mulch grueso para aislar raíces. Guano de murciélago cerca de las raíces. Las noches frías de La Carlota en otoño pueden causar esto.",
+            "interior_luz": "Verificar temperatura con luces apagadas (mínimo 18°C). Aumentar P en nutrientes. Diferencia térmica día/noche mayor a 10°C causa esto.",
+            "automaticas": "Proteger del frío. Té de banana suave. Si la auto está sana y crece, puede ser genético y no hay problema.",
+        },
+    },
+]
@@ -0,0 +1,18 @@
+LIMITES_LEGALES = {
+    "Concepto": [
+        "Plantas en floración",
+        "Plantas en vegetativo",
+        "Flores secas (tenencia)",
+        "Semillas",
+        "Aceite/Tintura (tenencia)",
+        "Transporte de flores secas"
+    ],
+    "Límite": [
+        "Hasta 9 plantas",
+        "Sin límite específico",
+        "Hasta 40 gramos",
+        "Permitidas (sin límite específico)",
+        "Hasta 6 frascos de 30 ml",
+        "Hasta 40 gramos con certificado"
+    ]
+}
@@ -0,0 +1,6 @@
+PLAGAS_COMUNES = {
+    "Plaga/Problema": ["Arañuela Roja", "Orugas", "Pulgones", "Trips", "Oídio", "Botrytis", "Mosquita del Sustrato"],
+    "Temporada": ["Dic-Mar (calor)", "Dic-Feb", "Sep-Nov", "Oct-Dic", "Mar-May (otoño)", "Abr-Jun (humedad)", "Todo el año (indoor)"],
+    "Prevención Natural": ["Neem cada 10 días", "BT semanal", "Jabón potásico", "Aceite de neem", "Leche foliar", "Defoliación", "Canela + secar sustrato"],
+    "Urgencia": ["Alta", "Alta", "Media", "Media", "Media", "Crítica", "Baja"]
+}
@@ -0,0 +1,80 @@
+# Recomendaciones del panel de clima por cultivo: reglas (ámbito, grupo, condiciones, mensaje) evaluadas con reglas.py.
+MACETA = ("sistema", "contiene", "Maceta")
+TIERRA = ("sistema", "en", ("Exterior Tierra Madre", "Invernadero Tierra"))
+LUZ = ("sistema", "==", "Interior Luz")
+AUTO = ("sistema", "contiene", "Automáticas")
+INVERNADERO = ("sistema", "contiene", "Invernadero")
+LITROS = ("maceta_litros", "si", None)
+FLUSH = ("nombre_etapa", "contiene", "Flush")
+
+RAMAS_CLIMA = (
+    ("germinacion", "contiene", "Germinación"),
+    ("vegetativo", "contiene", ("Vegetativo", "Plántula")),
+    ("floracion", "contiene", ("Floración", "Flush", "Maduración")),
+)
+
+REGLAS_CLIMA = [
+    # Germinación
+    ("germinacion", None, (), "🌱 **Germinación:** Mantener humedad constante. No exponer al sol directo ni al viento."),
+    ("germinacion", "temp", (("t", "<", 18),), "🧊 Temp. actual {t}°C — baja para germinar. Buscar un lugar más cálido (22-28°C ideal). Servilleta en lugar abrigado."),
+    ("germinacion", "temp", (("t", ">", 32),), "🔥 Temp. actual {t}°C — alta. Evitar que la semilla se seque. Rociar más seguido."),
+    ("germinacion", "temp", (), "✅ Temp. actual {t}°C — buena para germinar."),
+
+    # Plántula y vegetativo
+    ("vegetativo", "temp", (MACETA, ("t", ">", 33)), "🔥 **{t}°C — Calor extremo.** Mover a media sombra después de las 12 hs. Regar temprano y al atardecer."),
+    ("vegetativo", None, (MACETA, ("t", ">", 33), LITROS, ("maceta_litros", "<=", 10)), "⚠️ Maceta de {maceta_litros}L se calienta rápido. Considerar envolver con tela o elevar del piso."),
+    ("vegetativo", "temp", (MACETA, ("t", "<", 5)), "❄️ **{t}°C — Riesgo de helada.** Entrar las macetas o cubrir con tela antihelada. No regar de noche."),
+    ("vegetativo", "temp", (MACETA, ("t", "<", 15)), "🧊 **{t}°C — Fresco.** El crecimiento será lento. Reducir riego. Aprovechar horas de sol."),
+    ("vegetativo", "temp", (MACETA,), "✅ **{t}°C — Temp. favorable.** Buen día para regar, aplicar neem preventivo o hacer LST/topping."),
+    ("vegetativo", None, (MACETA, ("h", ">", 75)), "💧 Humedad {h}% — alta para vegetativo. Separar macetas para mejorar circulación de aire."),
+    ("vegetativo", None, (MACETA, ("v", ">", 25)), "💨 Viento {v} km/h — proteger plantas jóvenes. Reforzar tutores si hiciste LST."),
+    ("vegetativo", "temp", (TIERRA, ("t", ">", 33)), "🔥 **{t}°C — Calor extremo.** Regar profundo temprano. Mulch grueso para proteger raíces. Media sombra si es posible."),
+    ("vegetativo", "temp", (TIERRA, ("t", "<", 5)), "❄️ **{t}°C — Riesgo de helada.** Cubrir con tela antihelada. Aporcar base del tallo."),
+    ("vegetativo", "temp", (TIERRA, ("t", "<", 15)), "🧊 **{t}°C — Fresco.** Buen día para enmiendas y preparar compost. Riego mínimo."),
+    ("vegetativo", "temp", (TIERRA,), "✅ **{t}°C — Temp. favorable.** Ideal para regar, trasplantar, aplicar purín de ortiga."),
+    ("vegetativo", None, (TIERRA, ("h", ">", 80)), "💧 Humedad {h}% — vigilar oídio. Podar hojas bajas para ventilación."),
+    ("vegetativo", None, (TIERRA, ("lluvia_hoy", ">", 60)), "🌧️ **Lluvia probable.** No regar hoy. Verificar drenaje del terreno."),
+    ("vegetativo", "temp", (LUZ, ("t", ">", 30)), "🔥 **{t}°C exterior.** Tu indoor se calentará más. Prender luces de noche (20-06 hs). Reforzar extracción."),
+    ("vegetativo", "temp", (LUZ, ("t", "<", 10)), "🧊 **{t}°C exterior.** El indoor perderá calor con luces apagadas. Considerar calefactor en período oscuro."),
+    ("vegetativo", "temp", (LUZ,), "✅ **{t}°C exterior** — buenas condiciones para mantener temp. estable en indoor."),
+    ("vegetativo", "vpd", (LUZ, ("vpd", "<", 0.4)), "💧 VPD {vpd} kPa — bajo. Mucha humedad. Aumentar extracción o usar deshumidificador."),
+    ("vegetativo", "vpd", (LUZ, ("vpd", ">", 1.4)), "🏜️ VPD {vpd} kPa — alto. Aire seco. Considerar humidificador para vegetativo."),
+    ("vegetativo", "vpd", (LUZ,), "✅ VPD {vpd} kPa — rango saludable para vegetativo."),
+    ("vegetativo", "temp", (AUTO, ("t", ">", 33)), "🔥 **{t}°C — Calor extremo.** Las autos sufren rápido. Sombra parcial si están afuera. Regar 2 veces al día."),
+    ("vegetativo", "temp", (AUTO, ("t", "<", 5)), "❄️ **{t}°C — Helada.** Proteger urgente. Las autos no tienen tiempo de recuperarse del estrés por frío."),
+    ("vegetativo", "temp", (AUTO, ("t", "<", 15)), "🧊 **{t}°C — Fresco.** Crecimiento lento. Cada día cuenta en una auto. Buscar más horas de sol."),
+    ("vegetativo", "temp", (AUTO,), "✅ **{t}°C — Favorable.** Mantener rutina de riego y nutrición suave. Buen día para LST."),
+    ("vegetativo", None, (AUTO, ("h", ">", 80)), "💧 Humedad {h}% — alta. Defoliar hojas interiores para mejorar ventilación."),
+
+    # Floración, maduración y flush
+    ("floracion", "temp", (MACETA, ("t", ">", 33)), "🔥 **{t}°C — Calor en floración.** Regar al amanecer y atardecer. El calor puede reducir producción de resina."),
+    ("floracion", None, (MACETA, ("t", ">", 33), LITROS, ("maceta_litros", "<=", 10)), "⚠️ Maceta {maceta_litros}L: la raíz sufre más el calor. Envolver maceta con tela o cartón para aislar."),
+    ("floracion", "temp", (MACETA, ("t", "<", 5)), "❄️ **{t}°C — Helada en floración.** Proteger urgente. Los cogollos mojados + frío = botrytis segura."),
+    ("floracion", "temp", (MACETA, ("t", "<", 12)), "🧊 **{t}°C — Fresco.** Buenas noches frías para colores, pero vigilar humedad sobre cogollos."),
+    ("floracion", "temp", (MACETA,), "✅ **{t}°C — Favorable para floración.** Mantener riego estable. No sobre-fertilizar."),
+    ("floracion", None, (MACETA, ("h", ">", 70)), "💧 Humedad {h}% — **ALERTA en floración.** Riesgo de moho en cogollos. Mejorar ventilación urgente. Defoliar si es necesario."),
+    ("floracion", None, (MACETA, ("v", ">", 25)), "💨 Viento {v} km/h — los cogollos pesan. Reforzar tutores para que no se quiebren ramas."),
+    ("floracion", "temp", (TIERRA, ("t", ">", 33)), "🔥 **{t}°C — Calor extremo en flora.** Regar profundo temprano. Media sombra si los cogollos se sienten calientes al tacto."),
+    ("floracion", "temp", (TIERRA, ("t", "<", 5)), "❄️ **{t}°C — Helada en floración.** Cubrir con tela antihelada. Cogollos mojados + frío = botrytis."),
+    ("floracion", "temp", (TIERRA, ("t", "<", 12)), "🧊 **{t}°C — Noches frías.** Puede dar colores morados. Vigilar humedad sobre cogollos, especialmente con rocío matinal."),
+    ("floracion", "temp", (TIERRA,), "✅ **{t}°C — Favorable.** Mantener riego y vigilar tricomas con lupa."),
+    ("floracion", None, (TIERRA, ("h", ">", 70)), "💧 Humedad {h}% — **PELIGRO en flora.** Riesgo de botrytis. Podar hojas que toquen cogollos. Ventilar."),
+    ("floracion", None, (TIERRA, ("lluvia_hoy", ">", 50)), "🌧️ **Lluvia probable + floración = riesgo de moho.** Cubrir si es posible. Si los cogollos se mojan, sacudir suavemente después de la lluvia."),
+    ("floracion", "temp", (LUZ, ("t", ">", 30)), "🔥 **{t}°C exterior.** Indoor se calienta. En flora, temp. ideal es 20-26°C. Luces de noche obligatorio."),
+    ("floracion", "temp", (LUZ, ("t", "<", 10)), "🧊 **{t}°C exterior.** Diferencia de temp. día/noche puede ser grande. Calefactor en período oscuro para mantener 18°C mínimo."),
+    ("floracion", "temp", (LUZ,), "✅ **{t}°C exterior.** Buenas condiciones para mantener indoor estable en floración."),
+    ("floracion", "vpd", (LUZ, ("vpd", "<", 0.4)), "💧 VPD {vpd} kPa — bajo. **Peligroso en floración.** Deshumidificador urgente. Riesgo de moho."),
+    ("floracion", "vpd", (LUZ, ("vpd", ">", 1.6)), "🏜️ VPD {vpd} kPa — alto para flora. Puede estresar los cogollos. Bajar temperatura."),
+    ("floracion", "vpd", (LUZ, ("vpd", ">=", 0.8), ("vpd", "<=", 1.2)), "✅ VPD {vpd} kPa — rango perfecto para floración."),
+    ("floracion", "vpd", (LUZ,), "✅ VPD {vpd} kPa — aceptable para floración."),
+    ("floracion", "temp", (AUTO, ("t", ">", 33)), "🔥 **{t}°C — Calor extremo.** Las autos en flora necesitan sombra parcial y riego extra."),
+    ("floracion", "temp", (AUTO, ("t", "<", 5)), "❄️ **{t}°C — Helada.** Proteger los cogollos urgente. Una helada puede destruir semanas de flora."),
+    ("floracion", "temp", (AUTO,), "✅ **{t}°C — Favorable.** Mantener rutina estable. No cambiar nada drásticamente en flora de autos."),
+    ("floracion", None, (AUTO, ("h", ">", 70)), "💧 Humedad {h}% — las autos son compactas. Defoliar interior para que el aire circule entre cogollos."),
+    ("floracion", None, (FLUSH,), "🚿 **Etapa de flush.** Regar solo con agua sin nutrientes. Lavar sales acumuladas."),
+    ("floracion", None, (FLUSH, ("lluvia_hoy", ">", 60), ("sistema", "no_en", ("Interior Luz",))), "🌧️ La lluvia ayuda al flush natural. Dejar que se moje si no hay riesgo de moho."),
+
+    # Invernadero (cualquier etapa)
+    ("invernadero", "temp", (INVERNADERO, ("t", ">", 30)), "🏡 **Invernadero:** Abrir ventanas y puertas. Riesgo de acumulación de calor y humedad alta."),
+    ("invernadero", "temp", (INVERNADERO,), "🏡 **Invernadero:** Protegido del viento y lluvia. Controlar ventilación interna."),
+]
@@ -0,0 +1,239 @@
+# Plan de riego por etapa: reglas (ámbito, grupo, condiciones, campos) evaluadas con reglas.py.
+# La regla base de cada etapa va primero; los ajustes por sistema/maceta pisan sus campos.
+# Los volúmenes ({litros_15}, {litros_flush}, ...) se precalculan en consejos.plan_riego.
+MACETA = ("sistema", "contiene", "Maceta")
+TIERRA = ("sistema", "en", ("Exterior Tierra Madre", "Invernadero Tierra"))
+LUZ = ("sistema", "==", "Interior Luz")
+AUTO = ("sistema", "contiene", "Automáticas")
+LITROS = ("maceta_litros", "si", None)
+
+CAMPOS_RIEGO = {
+    "volumen": "",
+    "frecuencia": "",
+    "ph_rec": "",
+    "agua_tipo": "",
+    "nutricion_riego": "",
+    "tecnica": "",
+    "errores": "",
+}
+
+RAMAS_RIEGO = (
+    ("germinacion", "==", "Germinación"),
+    ("plantula", "==", "Plántula"),
+    ("vegetativo_temprano", "en", ("Vegetativo Temprano", "Vegetativo")),
+    ("vegetativo_avanzado", "==", "Vegetativo Avanzado"),
+    ("prefloracion", "en", ("Pre-Floración", "Cambio a Floración (12/12)")),
+    ("floracion_temprana", "en", ("Floración Temprana", "Floración")),
+    ("floracion_media", "==", "Floración Media"),
+    ("floracion_tardia", "==", "Floración Tardía / Maduración"),
+    ("cosecha", "==", "Flush y Cosecha"),
+)
+
+REGLAS_RIEGO = [
+    # Germinación
+    ("germinacion", None, (), {
+        "volumen": "Mínimo: solo rociar con pulverizador. 10-30 ml por aplicación.",
+        "frecuencia": "Mantener húmedo constantemente. Rociar 2-3 veces por día si se seca la superficie.",
+        "ph_rec": "pH 6.0-6.5. Si usás agua de red de La Carlota, bajar con vinagre o ácido cítrico (1-2 gotas por litro).",
+        "agua_tipo": "Agua reposada 24 hs (evaporar cloro). Tibia, no fría. Ideal: agua de lluvia si tenés.",
+        "nutricion_riego": "No agregar ningún nutriente al agua. La semilla tiene reservas propias.",
+        "tecnica": "Usar rociador/pulverizador. Nunca chorro directo sobre la semilla. Si usás método servilleta, mantener húmeda sin charco.",
+        "errores": "No encharcar. El exceso de agua pudre la semilla antes de germinar. La servilleta debe estar húmeda, no empapada.",
+    }),
+
+    # Plántula
+    ("plantula", None, (), {
+        "volumen": "50-150 ml por riego según tamaño del recipiente.",
+        "frecuencia": "Cada 2-3 días. Dejar secar la superficie entre riegos (primer cm de sustrato seco al tacto).",
+        "ph_rec": "pH 6.0-6.5. El agua de La Carlota suele estar en 7.2-7.8, corregir siempre.",
+        "agua_tipo": "Agua reposada 24 hs. Temperatura ambiente (20-25°C). No usar agua fría de canilla directo.",
+        "nutricion_riego": "Solo agua limpia. Si el sustrato tiene humus, no hace falta nada más. Máximo: té de humus al 25% de dosis normal.",
+        "tecnica": "Regar en círculo a 3-5 cm del tallo, no encima. Esto obliga a las raíces a expandirse buscando agua.",
+        "errores": "Sobre-riego = causa #1 de muerte en plántulas. Si las hojas se ponen amarillas y el sustrato está húmedo, estás regando de más. Mejor menos que más.",
+    }),
+    ("plantula", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 3)), {
+        "volumen": "Maceta {maceta_litros}L: 50-80 ml por riego. Muy poca agua, la maceta es chica.",
+    }),
+    ("plantula", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 7)), {
+        "volumen": "Maceta {maceta_litros}L: 80-150 ml por riego. Regar alrededor del tallo en círculo pequeño.",
+    }),
+    ("plantula", "sistema", (MACETA, LITROS), {
+        "volumen": "Maceta {maceta_litros}L: 100-200 ml por riego, solo en la zona central. No mojar todo el sustrato, la plántula no lo necesita.",
+    }),
+
+    # Vegetativo temprano
+    ("vegetativo_temprano", None, (), {
+        "volumen": "10-20% del volumen de la maceta por riego.",
+        "frecuencia": "Cada 2-3 días en clima templado. En verano La Carlota (35°C+), puede ser diario.",
+        "ph_rec": "pH 6.0-6.5. Corregir agua de red con ácido cítrico o vinagre de manzana.",
+        "agua_tipo": "Agua reposada 24 hs. En verano, cuidar que no esté caliente por estar al sol. Ideal: 20-22°C.",
+        "nutricion_riego": "Empezar fertilización con N alto. Alternar: un riego con nutrientes, uno solo con agua. Opciones naturales: purín de ortiga (1:10), té de humus, guano diluido.",
+        "tecnica": "Regar lento y parejo por toda la superficie del sustrato. Dejar que drene un 10-15% por abajo (run-off). Esto previene acumulación de sales.",
+        "errores": "No regar por encima de las hojas en exterior a pleno sol (efecto lupa = quemaduras). Regar temprano (antes de las 9 am) o al atardecer.",
+    }),
+    ("vegetativo_temprano", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 5)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_15}-{litros_20} litros por riego. Se seca rápido, revisar diario.",
+        "frecuencia": "Cada 1-2 días en verano. La maceta chica se seca rápido con calor.",
+    }),
+    ("vegetativo_temprano", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 15)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_15}-{litros_20} litros por riego.",
+        "frecuencia": "Cada 2-3 días. Levantar la maceta para sentir el peso: liviana = regar.",
+    }),
+    ("vegetativo_temprano", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 25)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_15}-{litros_20} litros por riego.",
+        "frecuencia": "Cada 2-4 días. Más sustrato = más retención. Meter el dedo 3 cm: si está seco, regar.",
+    }),
+    ("vegetativo_temprano", "sistema", (MACETA, LITROS), {
+        "volumen": "Maceta {maceta_litros}L: {litros_15}-{litros_20} litros por riego.",
+        "frecuencia": "Cada 3-5 días. Maceta grande retiene mucha humedad. Cuidado con el sobre-riego.",
+    }),
+    ("vegetativo_temprano", "sistema", (TIERRA,), {
+        "volumen": "5-10 litros por planta, riego profundo.",
+        "frecuencia": "Cada 3-5 días. La tierra madre retiene mejor la humedad. Usar mulch para conservar.",
+        "tecnica": "Riego profundo: lento y abundante para que el agua llegue a las raíces profundas. Mejor que muchos riegos superficiales.",
+    }),
+    ("vegetativo_temprano", "sistema", (LUZ,), {
+        "tecnica": "Regar hasta obtener 10-15% de run-off. Medir pH y EC del run-off para monitorear la salud de las raíces.",
+    }),
+
+    # Vegetativo avanzado
+    ("vegetativo_avanzado", None, (), {
+        "volumen": "15-25% del volumen de la maceta por riego.",
+        "frecuencia": "Cada 1-3 días según clima. Planta grande = más consumo.",
+        "ph_rec": "pH 6.0-6.5. Medir siempre antes de regar. La planta es grande y cualquier bloqueo se nota rápido.",
+        "agua_tipo": "Agua reposada. Si es posible, mezclar con agua de lluvia (50/50) para mejorar calidad.",
+        "nutricion_riego": "N alto + inicio de P. Purín de ortiga + harina de hueso diluida. O fertilizante completo de vegetativo. Riego alterno: nutrientes/agua limpia.",
+        "tecnica": "Regar toda la superficie de forma pareja. El run-off debe salir limpio. Si sale oscuro o con olor, hay acumulación de sales: hacer flush.",
+        "errores": "En La Carlota, el verano seca rápido las macetas. Si las hojas se caen al mediodía pero se recuperan a la noche, necesita más agua o riego más frecuente.",
+    }),
+    ("vegetativo_avanzado", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_20}-{litros_25} litros. Planta grande en maceta chica = riego diario en verano.",
+        "frecuencia": "Posiblemente todos los días en verano. La planta consume mucho y la maceta se seca rápido.",
+    }),
+    ("vegetativo_avanzado", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 20)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_20}-{litros_25} litros por riego.",
+        "frecuencia": "Cada 1-2 días. Revisar peso de la maceta.",
+    }),
+    ("vegetativo_avanzado", "sistema", (MACETA, LITROS), {
+        "volumen": "Maceta {maceta_litros}L: {litros_15}-{litros_20} litros por riego.",
+        "frecuencia": "Cada 2-3 días. Sustrato amplio retiene bien.",
+    }),
+    ("vegetativo_avanzado", "sistema", (TIERRA,), {
+        "volumen": "10-20 litros por planta por riego.",
+        "frecuencia": "Cada 3-5 días. Riego profundo. Mulch grueso (5-10 cm de paja) para conservar humedad.",
+    }),
+    ("vegetativo_avanzado", "sistema", (LUZ,), {
+        "frecuencia": "Cada 1-2 días. Controlar el peso de la maceta. Medir EC del run-off (debe ser similar a la de entrada).",
+    }),
+
+    # Pre-Floración y cambio a 12/12
+    ("prefloracion", None, (), {
+        "volumen": "15-20% del volumen de la maceta.",
+        "frecuencia": "Mantener riego constante y regular. No cambiar bruscamente la frecuencia.",
+        "ph_rec": "pH 6.0-6.5. Ir subiendo ligeramente hacia 6.3-6.5 para favorecer la absorción de P y K.",
+        "agua_tipo": "Agua reposada, temperatura ambiente. Evitar agua fría que estrese las raíces.",
+        "nutricion_riego": "Transición: reducir N, aumentar P y K. Melaza (1 cucharada por litro) en cada riego para alimentar microvida. Harina de hueso para P, ceniza de madera para K.",
+        "tecnica": "Riego parejo, sin mojar follaje ni futuros sitios de cogollos. Regar por la base siempre.",
+        "errores": "No estresar con sequía ni encharcamiento en esta etapa. El estrés hídrico puede causar hermafroditismo. Mantener constancia.",
+    }),
+    ("prefloracion", "sistema", (MACETA, LITROS), {
+        "volumen": "Maceta {maceta_litros}L: {litros_17}-{litros_22} litros por riego.",
+    }),
+    ("prefloracion", "sistema", (AUTO,), {
+        "nutricion_riego": "Inicio suave de nutrientes de floración. Las autos entran solas en flora, no estresar. Melaza + guano fructífero diluido.",
+    }),
+
+    # Floración temprana
+    ("floracion_temprana", None, (), {
+        "volumen": "15-20% del volumen de la maceta.",
+        "frecuencia": "Regular y constante. No dejar secar demasiado entre riegos.",
+        "ph_rec": "pH 6.2-6.5. Rango ligeramente más alto para favorecer absorción de P (fósforo) y K (potasio).",
+        "agua_tipo": "Agua reposada 24 hs. No mojar cogollos NUNCA (riesgo de moho). Solo regar la base.",
+        "nutricion_riego": "P y K altos, N bajo. Melaza en cada riego (1 cucharada/litro). Harina de hueso (P), ceniza de madera (K), guano de murciélago fructífero. Alternar nutrientes/agua limpia.",
+        "tecnica": "Regar lento por la base. Si la planta es grande, regar en 2-3 pasadas para que el sustrato absorba bien. No dejar agua estancada en el plato.",
+        "errores": "NUNCA mojar los cogollos. Si llueve en exterior, sacudir suavemente después. Si se mojan de noche, riesgo alto de botrytis (moho gris).",
+    }),
+    ("floracion_temprana", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_20}-{litros_25} litros. Raíces al tope, regar frecuente.",
+        "frecuencia": "Cada 1-2 días. La planta en flora consume mucho. Si la maceta se seca en un día, regar diario.",
+    }),
+    ("floracion_temprana", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 20)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_18}-{litros_22} litros.",
+        "frecuencia": "Cada 1-3 días. Controlar peso de maceta.",
+    }),
+    ("floracion_temprana", "sistema", (MACETA, LITROS), {
+        "volumen": "Maceta {maceta_litros}L: {litros_15}-{litros_20} litros.",
+        "frecuencia": "Cada 2-3 días. Buen volumen de sustrato.",
+    }),
+    ("floracion_temprana", "sistema", (TIERRA,), {
+        "volumen": "10-25 litros por planta. Riego profundo.",
+        "tecnica": "Riego profundo 2-3 veces por semana. Mulch obligatorio para conservar humedad. No regar de noche si hay rocío (suma humedad = moho).",
+    }),
+    ("floracion_temprana", "sistema", (LUZ,), {
+        "tecnica": "Regar al inicio del período de luz. Mantener humedad ambiental baja (40-50%). Run-off: medir EC para detectar acumulación.",
+    }),
+    ("floracion_temprana", "sistema", (AUTO,), {
+        "nutricion_riego": "Flora completa: P+K altos. Las autos responden bien a melaza + guano fructífero. Dosis moderadas (70% de lo recomendado).",
+    }),
+
+    # Floración media
+    ("floracion_media", None, (), {
+        "volumen": "15-20% del volumen de la maceta.",
+        "frecuencia": "Constante. No cambiar el patrón de riego ahora.",
+        "ph_rec": "pH 6.2-6.5. Constancia es clave.",
+        "agua_tipo": "Agua reposada, limpia. Si notás costras blancas en la superficie del sustrato, hay acumulación de sales.",
+        "nutricion_riego": "Máximo P y K. Potasio extra: ceniza de madera (1 cucharada por 5L). Melaza en cada riego. Si usás fertilizante comercial, dosis completa de floración.",
+        "tecnica": "Riego por base exclusivamente. Si los cogollos son muy densos, asegurar buena ventilación después de regar para evitar humedad atrapada.",
+        "errores": "Si ves puntas quemadas = exceso de sales. Hacer flush suave (3x volumen de maceta con agua limpia pH 6.3). Si ves hojas amarilleando desde abajo = normal, la planta consume reservas.",
+    }),
+    ("floracion_media", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_20}-{litros_25} litros. Raíces copadas, posiblemente riego diario.",
+    }),
+    ("floracion_media", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 20)), {
+        "volumen": "Maceta {maceta_litros}L: {litros_18}-{litros_22} litros.",
+    }),
+    ("floracion_media", "sistema", (MACETA, LITROS), {
+        "volumen": "Maceta {maceta_litros}L: {litros_15}-{litros_20} litros.",
+    }),
+    ("floracion_media", "sistema", (TIERRA,), {
+        "volumen": "15-25 litros por planta. La planta está en máxima producción.",
+        "errores": "Si llueve sobre cogollos densos: sacudir suavemente cada rama. Inspeccionar por dentro buscando moho.",
+    }),
+
+    # Floración tardía / maduración
+    ("floracion_tardia", None, (), {
+        "volumen": "Reducir gradualmente. 10-15% del volumen de la maceta.",
+        "frecuencia": "Espaciar los riegos. Cada 3-4 días si se empieza flush.",
+        "ph_rec": "pH 6.0-6.5. Solo agua limpia si estás haciendo flush.",
+        "agua_tipo": "Agua limpia sin nutrientes para flush. Agua de lluvia ideal. Reposada 24 hs mínimo.",
+        "nutricion_riego": "FLUSH: dejar de fertilizar. Solo agua limpia las últimas 1-2 semanas. Esto limpia sales del sustrato y mejora el sabor final.",
+        "tecnica": "Regar con 3x el volumen de la maceta en agua limpia para hacer flush. Después, regar normal solo con agua. Las hojas van a amarillear: es lo esperado.",
+        "errores": "No agregar nutrientes en flush. Si las hojas no amarillean durante el flush, puede haber acumulación de N en el sustrato. Extender el flush unos días más.",
+    }),
+    ("floracion_tardia", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 10)), {
+        "tecnica": "Maceta {maceta_litros}L: Flush rápido, 3-5 días de solo agua. En maceta chica se limpia más rápido. Regar con {litros_flush} litros de agua limpia para el flush inicial.",
+    }),
+    ("floracion_tardia", "sistema", (MACETA, LITROS, ("maceta_litros", "<=", 20)), {
+        "tecnica": "Maceta {maceta_litros}L: Flush de 7-10 días. Regar con {litros_flush} litros de agua limpia para lavar sales. Después solo agua normal.",
+    }),
+    ("floracion_tardia", "sistema", (MACETA, LITROS), {
+        "tecnica": "Maceta {maceta_litros}L: Flush de 10-14 días. Regar con {litros_flush} litros para el lavado inicial. Más sustrato = más tiempo de limpieza.",
+    }),
+    ("floracion_tardia", "sistema", (TIERRA,), {
+        "tecnica": "En tierra madre el flush es menos efectivo. Dejar de fertilizar 2-3 semanas antes del corte. Regar solo con agua limpia. Las lluvias naturales ayudan.",
+    }),
+    ("floracion_tardia", "sistema", (AUTO,), {
+        "nutricion_riego": "Flush corto de 5-7 días. Las autos maduran rápido, no extender demasiado. Solo agua limpia.",
+    }),
+
+    # Flush y cosecha
+    ("cosecha", None, (), {
+        "volumen": "Reducir al mínimo. Dejar de regar 1-2 días antes del corte.",
+        "frecuencia": "Solo si el sustrato está muy seco. Idealmente, cortar con sustrato seco.",
+        "ph_rec": "pH no importa en esta etapa. Solo agua limpia si regás.",
+        "agua_tipo": "Agua limpia, sin nada.",
+        "nutricion_riego": "Ningún nutriente. Solo agua si es necesario.",
+        "tecnica": "Dejar secar el sustrato antes de cortar. Cosechar por la mañana temprano cuando los terpenos están más concentrados.",
+        "errores": "No regar el día del corte. Sustrato húmedo = secado más lento y riesgo de moho.",
+    }),
+]
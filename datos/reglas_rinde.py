@@ -0,0 +1,126 @@
+# Consejo diario de rinde: reglas (ámbito, grupo, condiciones, mensaje) evaluadas con reglas.py.
+# Las plantillas usan las claves del contexto armado en consejos.consejo_diario_rinde.
+EXT = ("es_exterior", "si", None)
+INT = ("es_interior", "si", None)
+MAC = ("es_maceta", "si", None)
+AUTO = ("es_auto", "si", None)
+INV = ("es_invern", "si", None)
+CHICA = ("maceta_chica", "si", None)
+MEDIANA = ("maceta_med", "si", None)
+
+RAMAS_RINDE = (
+    ("germinacion", "==", "Germinación"),
+    ("plantula", "==", "Plántula"),
+    ("vegetativo", "contiene", "Vegetativo"),
+    ("prefloracion", "==", "Pre-Floración"),
+    ("floracion", "contiene", ("Floración", "Maduración")),
+    ("cosecha", "==", "Flush y Cosecha"),
+)
+
+REGLAS_RINDE = [
+    # Común a todas las etapas
+    ("comun", None, (), "📊 **Clima ahora:** {t}°C | Humedad {h}% | Viento {v} km/h | VPD {vpd} kPa | Lluvia hoy: {lluvia_prob}%"),
+
+    # Germinación
+    ("germinacion", None, (), "🎯 **Objetivo de rinde:** Lograr una germinación rápida y saludable. El éxito acá define todo el ciclo."),
+    ("germinacion", "temp", (("t", "<", 18),), "🧊 **{t}°C es bajo para germinar.** La semilla tarda más o no germina. Poné la servilleta/vasito en un lugar más cálido (arriba de la heladera, cerca de un calefactor). Ideal: 22-28°C."),
+    ("germinacion", "temp", (("t", ">", 32),), "🔥 **{t}°C es alto.** La semilla puede deshidratarse. Rociar la servilleta cada 6-8 hs. Mantener en lugar fresco y oscuro."),
+    ("germinacion", "temp", (), "✅ **{t}°C — temperatura ideal para germinar.** Revisar la semilla cada 12 hs. La raíz sale entre 24-72 hs."),
+    ("germinacion", "humedad", (("h", "<", 40),), "🏜️ Humedad {h}% baja. Cubrir la servilleta/vasito con film para mantener humedad. Rociar si se seca."),
+    ("germinacion", "humedad", (("h", ">", 85),), "💧 Humedad {h}% muy alta. Cuidar que no se acumule agua. Ventilar levemente para evitar hongos en la semilla."),
+
+    # Plántula
+    ("plantula", None, (), "🎯 **Objetivo de rinde:** Tallo fuerte y raíces sanas. No espigarse. La base de una buena planta se forma acá."),
+    ("plantula", "temp", (EXT, ("t", ">", 33)), "🔥 **{t}°C — la plántula puede quemarse.** Media sombra obligatoria (12-16 hs). Regar suave con rociador."),
+    ("plantula", "temp", (EXT, ("t", "<", 8)), "❄️ **{t}°C — la plántula sufre mucho el frío.** Cubrir con botella cortada o entrar adentro. No regar."),
+    ("plantula", "temp", (EXT, ("t", "<", 15)), "🧊 **{t}°C — crecimiento lento.** Aprovechar las horas de sol directo. Regar poco y con agua tibia."),
+    ("plantula", "temp", (EXT,), "✅ **{t}°C — buena temperatura.** Sol directo por la mañana, sombra parcial al mediodía si supera 30°C."),
+    ("plantula", None, (EXT, ("v", ">", 20)), "💨 Viento {v} km/h puede quebrar la plántula. Proteger con cortaviento o moverla a un lugar reparado."),
+    ("plantula", None, (EXT, ("lluvia_prob", ">", 60)), "🌧️ Lluvia probable. Cubrir la plántula o entrar la maceta. El impacto de gotas puede dañar hojas tiernas."),
+    ("plantula", None, (EXT, INV), "🏡 Invernadero: buen refugio para plántulas. Ventilar en horas de calor para evitar damping off."),
+    ("plantula", "temp", (INT, ("t", ">", 30)), "🔥 **{t}°C exterior — el indoor puede recalentarse.** Ventilar bien. Separar la lámpara de la plántula (40-60 cm LED)."),
+    ("plantula", "temp", (INT, ("t", "<", 10)), "🧊 **{t}°C exterior — frío.** Asegurar que el indoor no baje de 18°C con luces apagadas."),
+    ("plantula", "temp", (INT,), "✅ **{t}°C exterior — fácil de mantener 22-25°C indoor.** Fotoperiodo 18/6."),
+    ("plantula", "vpd", (INT, ("vpd", "<", 0.3)), "💧 VPD {vpd} kPa muy bajo. Riesgo de damping off. Aumentar ventilación, reducir riego."),
+    ("plantula", "vpd", (INT, ("vpd", ">", 1.2)), "🏜️ VPD {vpd} kPa alto para plántula. Rociar las hojas suavemente o usar humidificador."),
+    ("plantula", None, (MAC, CHICA), "🪴 Maceta {maceta_litros}L: suficiente para plántula. Preparar la maceta de vegetativo (7-15L) para trasplantar cuando tenga 3-4 nudos."),
+
+    # Vegetativo
+    ("vegetativo", None, (), "🎯 **Objetivo de rinde:** Maximizar ramas y sitios de floración. Entrenamiento (LST/topping), nutrición rica en nitrógeno, raíces sanas = más cogollos después."),
+    ("vegetativo", "temp", (EXT, ("t", ">", 35)), "🔥 **{t}°C — calor extremo.** El crecimiento se frena arriba de 35°C. Media sombra después de las 12 hs. Regar profundo temprano y al atardecer. Mulch obligatorio."),
+    ("vegetativo", None, (EXT, ("t", ">", 35), MAC, CHICA), "⚠️ Maceta {maceta_litros}L se recalienta rápido. Envolver con tela húmeda o poner dentro de maceta más grande como aislante."),
+    ("vegetativo", "temp", (EXT, ("t", ">", 30)), "🌡️ **{t}°C — caliente pero tolerable.** Regar bien temprano. Buen día para aplicar purín de ortiga diluido (nutrición + fortalecimiento)."),
+    ("vegetativo", "temp", (EXT, ("t", "<", 5)), "❄️ **{t}°C — riesgo de helada.** Cubrir o entrar plantas. El frío extremo detiene el crecimiento y puede matar tejidos jóvenes."),
+    ("vegetativo", "temp", (EXT, ("t", "<", 15)), "🧊 **{t}°C — crecimiento lento.** Aprovechar horas de sol. No fertilizar hoy (la planta absorbe menos con frío)."),
+    ("vegetativo", "temp", (EXT,), "✅ **{t}°C — temperatura ideal para vegetativo.** Buen día para entrenar (LST/topping), fertilizar, o trasplantar."),
+    ("vegetativo", "humedad", (EXT, ("h", ">", 75)), "💧 Humedad {h}% alta. Separar las macetas/plantas para ventilación. Revisar envés de hojas por pulgones. Preventivo: neem."),
+    ("vegetativo", "humedad", (EXT, ("h", "<", 30)), "🏜️ Humedad {h}% muy baja. La planta transpira más. Aumentar frecuencia de riego. Mulch para retener humedad en sustrato."),
+    ("vegetativo", "viento", (EXT, ("v", ">", 30)), "💨 Viento {v} km/h fuerte. Revisar tutores. Si hiciste LST, verificar que los amarres estén firmes. El viento fuerte deshidrata."),
+    ("vegetativo", "viento", (EXT, ("v", ">", 15), ("v", "<=", 30)), "💨 Viento {v} km/h moderado. Esto fortalece los tallos. Buen día para dejar la planta expuesta sin protección."),
+    ("vegetativo", None, (EXT, ("lluvia_prob", ">", 60)), "🌧️ Lluvia probable. No regar hoy. Si acabas de fertilizar, la lluvia puede lavar los nutrientes. Buen día para enmiendas de suelo que necesitan humedad."),
+    ("vegetativo", None, (EXT, ("amplitud", ">", 15)), "🌡️ Amplitud térmica alta ({temp_min:.0f}°C a {temp_max:.0f}°C). Esto puede estresar plantas jóvenes. Proteger de noche si baja de 10°C."),
+    ("vegetativo", "invernadero", (EXT, INV, ("t", ">", 28)), "🏡 **Invernadero:** Abrir ventanas, el calor se acumula rápido."),
+    ("vegetativo", "invernadero", (EXT, INV, ("t", "<", 15)), "🏡 **Invernadero:** Cerrar por la noche para conservar calor."),
+    ("vegetativo", "invernadero", (EXT, INV), "🏡 **Invernadero:** Buenas condiciones. Ventilar moderadamente."),
+    ("vegetativo", "temp", (INT, ("t", ">", 30)), "🔥 **{t}°C exterior.** Indoor se calienta. Prender luces de noche (20-06 hs) para aprovechar frescura nocturna. Reforzar extracción."),
+    ("vegetativo", "temp", (INT, ("t", "<", 10)), "🧊 **{t}°C exterior.** El indoor pierde calor en período oscuro. Calefactor con termostato a 18°C mínimo."),
+    ("vegetativo", "temp", (INT,), "✅ **{t}°C exterior.** Fácil mantener 22-28°C indoor. Fotoperiodo 18/6. Buen día para topping si tiene 4-5 nudos."),
+    ("vegetativo", "vpd", (INT, ("vpd", "<", 0.4)), "💧 VPD {vpd} kPa bajo. Mucha humedad ambiental. Aumentar extracción. Riesgo de hongos si no se ventila."),
+    ("vegetativo", "vpd", (INT, ("vpd", ">", 1.4)), "🏜️ VPD {vpd} kPa alto. La planta transpira demasiado. Humidificador o bajar temperatura. En vegetativo ideal: 0.6-1.0 kPa."),
+    ("vegetativo", "vpd", (INT,), "✅ VPD {vpd} kPa — rango óptimo para crecimiento vegetativo. La planta transpira bien."),
+    ("vegetativo", None, (AUTO,), "⚡ **Auto en veg:** El vegetativo de las autos es corto (3-4 semanas). No estresar con podas agresivas. Solo LST suave. Maximizar horas de luz."),
+    ("vegetativo", "maceta", (MAC, CHICA), "🪴 Maceta {maceta_litros}L: las raíces se están llenando. Trasplantar pronto a 15-20L para no limitar el rinde final."),
+    ("vegetativo", "maceta", (MAC, MEDIANA), "🪴 Maceta {maceta_litros}L: buen tamaño. Si querés más rinde, trasplantar a 25L+ antes de floración."),
+
+    # Pre-Floración
+    ("prefloracion", None, (), "🎯 **Objetivo de rinde:** Transición suave a floración. No estresar la planta. Cada pistilo que aparece es un futuro cogollo."),
+    ("prefloracion", "temp", (EXT, ("t", ">", 33)), "🔥 **{t}°C — calor en pre-flora.** Puede retrasar la floración. Regar bien y dar sombra al mediodía."),
+    ("prefloracion", "temp", (EXT, ("t", "<", 8)), "❄️ **{t}°C — frío puede causar hermafroditismo por estrés.** Proteger de noche. Cubrir con tela."),
+    ("prefloracion", "temp", (EXT,), "✅ **{t}°C — buena transición.** La planta está definiendo su sexo. Revisar diariamente por pistilos o sacos."),
+    ("prefloracion", None, (EXT, ("h", ">", 70)), "💧 Humedad {h}% — empezar a controlar. En floración no debe superar 55%. Ir preparando ventilación."),
+    ("prefloracion", None, (EXT, ("lluvia_prob", ">", 50)), "🌧️ Lluvia probable. No mojar la parte superior de la planta. Los pistilos son sensibles al agua directa."),
+    ("prefloracion", None, (INT,), "💡 Si aún no cambiaste, es momento del fotoperiodo 12/12. Oscuridad total en las 12 hs de noche."),
+    ("prefloracion", None, (INT, ("vpd", ">", 1.2)), "🏜️ VPD {vpd} kPa — empezar a bajar para flora. Ideal en floración: 0.8-1.2 kPa."),
+    ("prefloracion", None, (AUTO,), "⚡ La auto entra sola en pre-flora. No cambiar nada. Empezar nutrientes de floración suavemente (P+K). Mantener fotoperiodo 18/6 o 20/4."),
+
+    # Floración y maduración
+    ("floracion", "objetivo", (("nombre_etapa", "contiene", "Temprana"),), "🎯 **Objetivo de rinde:** Los cogollos se están formando. Cada cuidado ahora se traduce directamente en gramos de cosecha. Máxima atención a nutrición P+K, humedad y plagas."),
+    ("floracion", "objetivo", (("nombre_etapa", "==", "Floración"),), "🎯 **Objetivo de rinde:** Los cogollos se están formando. Cada cuidado ahora se traduce directamente en gramos de cosecha. Máxima atención a nutrición P+K, humedad y plagas."),
+    ("floracion", "objetivo", (("nombre_etapa", "contiene", "Media"),), "🎯 **Objetivo de rinde:** Engorde máximo de cogollos. Esta es la etapa que más define el peso final. Potasio + melaza. Proteger de humedad alta y plagas."),
+    ("floracion", "objetivo", (("nombre_etapa", "contiene", ("Tardía", "Maduración")),), "🎯 **Objetivo de rinde:** Maduración de tricomas y resina. No fertilizar, solo agua. Cada día extra puede mejorar potencia pero ojo con el moho."),
+    ("floracion", "temp", (EXT, ("t", ">", 33)), "🔥 **{t}°C — calor extremo en floración.** Los cogollos sufren. La resina se degrada con calor. Sombra parcial después del mediodía. Regar al amanecer y atardecer."),
+    ("floracion", None, (EXT, ("t", ">", 33), MAC, CHICA), "⚠️ Maceta {maceta_litros}L: las raíces están al límite con este calor. Regar 2-3 veces al día en pequeñas cantidades. Envolver maceta con tela."),
+    ("floracion", "temp", (EXT, ("t", "<", 5)), "❄️ **{t}°C — HELADA en floración.** Los cogollos mojados + frío = botrytis segura. Cubrir urgente o cosechar si los tricomas están listos."),
+    ("floracion", "temp", (EXT, ("t", "<", 12)), "🧊 **{t}°C — fresco.** Las noches frías potencian colores y resina. Pero vigilar rocío matinal sobre cogollos. Sacudir suavemente si se mojan."),
+    ("floracion", "temp", (EXT, ("t", ">=", 18), ("t", "<=", 26)), "✅ **{t}°C — rango perfecto para floración.** Los cogollos engordan mejor entre 18-26°C. Mantener rutina estable."),
+    ("floracion", "temp", (EXT,), "✅ **{t}°C — temperatura aceptable.** Mantener riego y vigilar cogollos."),
+    ("floracion", "humedad", (EXT, ("h", ">", 65)), "💧 **ALERTA: Humedad {h}% — peligrosa en floración.** Riesgo de moho/botrytis en cogollos densos. Defoliar hojas que toquen cogollos. No regar de noche."),
+    ("floracion", "humedad", (EXT, ("h", ">", 55)), "💧 Humedad {h}% — en el límite. Mejorar ventilación entre plantas. Ideal para flora: 40-50%."),
+    ("floracion", "humedad", (EXT, ("h", "<", 30)), "🏜️ Humedad {h}% baja. Los cogollos pueden perder terpenos. Regar para mantener algo de humedad ambiental."),
+    ("floracion", None, (EXT, ("v", ">", 30)), "💨 **Viento {v} km/h fuerte.** Los cogollos pesan y las ramas pueden quebrarse. Revisar tutores y malla SCROG urgente."),
+    ("floracion", None, (EXT, ("lluvia_prob", ">", 40)), "🌧️ **Lluvia probable ({lluvia_prob}%) + floración = riesgo de moho.** Cubrir las plantas si es posible. Después de la lluvia, sacudir suavemente cada cogollo para sacar agua."),
+    ("floracion", None, (EXT, ("amplitud", ">", 12)), "🌡️ Amplitud {temp_min:.0f}°C→{temp_max:.0f}°C. La diferencia día/noche ayuda a producir más resina y colores, pero vigilar condensación sobre cogollos."),
+    ("floracion", "invernadero", (EXT, INV, ("h", ">", 60)), "🏡 **Invernadero en flora:** humedad acumulada peligrosa. Abrir ventanas y puertas durante el día. Deshumidificador si es posible."),
+    ("floracion", "invernadero", (EXT, INV), "🏡 **Invernadero:** Protegido de lluvia directa. Mantener ventilación activa para que la humedad no suba de noche."),
+    ("floracion", None, (INT,), "💡 Fotoperiodo 12/12 estricto. Ni un segundo de luz durante la oscuridad (causa hermafroditismo)."),
+    ("floracion", "temp", (INT, ("t", ">", 30)), "🔥 **{t}°C exterior — indoor se recalienta.** Luces de noche obligatorio. Extractor al máximo. Temp. ideal en flora: 20-26°C."),
+    ("floracion", "temp", (INT, ("t", "<", 10)), "🧊 **{t}°C exterior — frío.** Calefactor en período oscuro. La diferencia día/noche de 8-10°C es positiva para resina."),
+    ("floracion", "temp", (INT,), "✅ **{t}°C exterior.** Buenas condiciones para mantener flora estable indoor."),
+    ("floracion", "vpd", (INT, ("vpd", "<", 0.4)), "💧 **VPD {vpd} kPa — PELIGRO en floración.** Deshumidificador urgente. El moho puede destruir la cosecha."),
+    ("floracion", "vpd", (INT, ("vpd", ">", 1.6)), "🏜️ VPD {vpd} kPa alto para flora. Los cogollos se estresan. Bajar temperatura o subir humedad levemente."),
+    ("floracion", "vpd", (INT, ("vpd", ">=", 0.8), ("vpd", "<=", 1.2)), "✅ VPD {vpd} kPa — rango perfecto para floración. Máxima producción de resina."),
+    ("floracion", "vpd", (INT,), "✅ VPD {vpd} kPa — aceptable para floración."),
+    ("floracion", None, (AUTO,), "⚡ **Auto en flora:** Mantener luz 18/6 o 20/4. No cambiar nada drásticamente. Las autos maduran rápido: revisar tricomas ya."),
+    ("floracion", None, (("nombre_etapa", "contiene", ("Flush", "Tardía", "Maduración")),), "🚿 **Flush/Maduración:** Solo agua sin nutrientes. Las hojas deben amarillear naturalmente. Mejora sabor y suavidad del humo."),
+    ("floracion", None, (("nombre_etapa", "contiene", ("Flush", "Tardía", "Maduración")), ("lluvia_prob", ">", 60), EXT), "🌧️ La lluvia puede servir como flush natural. Pero proteger cogollos maduros del exceso de agua."),
+
+    # Flush y cosecha
+    ("cosecha", None, (), "🎯 **Objetivo:** Cosecha exitosa. El momento perfecto define la potencia y el sabor final."),
+    ("cosecha", None, (EXT, ("lluvia_prob", ">", 40)), "🌧️ Lluvia probable ({lluvia_prob}%). Si los tricomas están listos, **cosechar hoy antes de la lluvia** para evitar moho post-cosecha."),
+    ("cosecha", None, (EXT, ("h", ">", 65)), "💧 Humedad {h}% alta. Si ya cortaste, cuidar el secado: ventilación constante, oscuridad, 18-22°C. No secar al sol."),
+    ("cosecha", "temp", (EXT, ("t", ">", 30)), "🔥 {t}°C — cosechar temprano por la mañana cuando hay más terpenos. El calor degrada los aromas."),
+    ("cosecha", "temp", (EXT, ("t", "<", 5)), "❄️ {t}°C — cosechar antes de que congele. Los cogollos se cristalizan y pierden calidad."),
+    ("cosecha", "temp", (EXT,), "✅ {t}°C — buena temperatura para cosechar y secar. Lugar de secado: oscuro, 18-22°C, humedad 50-60%."),
+    ("cosecha", None, (INT,), "💡 Algunos hacen 48 hs de oscuridad antes del corte (opcional). Cosechar cuando tricomas estén 70% lechosos + 30% ámbar."),
+    ("cosecha", None, (), "✂️ **Tip de rinde:** Secar lento (7-14 días) y curar mínimo 2 semanas en frascos mejora peso, sabor y potencia notablemente."),
+]
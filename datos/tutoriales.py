@@ -0,0 +1,79 @@
+TUTORIALES = {
+    "Clima y Sugerencias": {
+        "icono": "🌦️",
+        "titulo": "Clima y Sugerencias",
+        "desc": "Tu estación meteorológica personal para el cultivo.",
+        "pasos": [
+            "Activá la geolocalización para datos precisos de tu zona",
+            "Consultá temperatura, humedad, viento y VPD en tiempo real",
+            "Revisá el pronóstico de 3 días para planificar tareas",
+            "Si tenés cultivos activos, verás consejos personalizados por planta"
+        ]
+    },
+    "Asesoramiento Cultivo": {
+        "icono": "📘",
+        "titulo": "Asesoramiento de Cultivo",
+        "desc": "Guías completas de sustrato, riego y ambiente para tu sistema.",
+        "pasos": [
+            "Elegí tu categoría y tipo de cultivo en la barra lateral",
+            "Explorá las recomendaciones de sustrato, riego y ambiente",
+            "Encontrá links directos a growshops argentinos verificados",
+            "Los consejos se adaptan al sistema que selecciones"
+        ]
+    },
+    "Calculadora Riego": {
+        "icono": "💧",
+        "titulo": "Calculadora de Riego",
+        "desc": "Calculá el riego exacto y recibí recomendaciones por planta.",
+        "pasos": [
+            "Ingresá el volumen de tu maceta para calcular el riego ideal",
+            "Ajustá frecuencia según el clima actual de tu zona",
+            "Si tenés cultivos en seguimiento, verás riego personalizado por planta",
+            "Incluye corrección de pH para agua de tu zona"
+        ]
+    },
+    "Diagnóstico & Plagas": {
+        "icono": "🛡️",
+        "titulo": "Diagnóstico y Plagas",
+        "desc": "Identificá problemas y encontrá remedios naturales.",
+        "pasos": [
+            "Seleccioná la zona afectada de la planta (hojas, tallo, raíz, etc.)",
+            "Elegí el síntoma que observás para obtener el diagnóstico",
+            "Recibí remedios caseros y naturales paso a paso",
+            "Videos de YouTube complementarios para cada problema"
+        ]
+    },
+    "Estimador de Cosecha": {
+        "icono": "✂️",
+        "titulo": "Estimador de Cosecha",
+        "desc": "Estimá rendimiento y recibí guía completa de cosecha.",
+        "pasos": [
+            "Ingresá datos de tus plantas para estimar el rendimiento",
+            "Si tenés cultivos activos, verás guía personalizada por planta",
+            "6 pestañas: señales, tricomas, rendimiento, corte, secado y curado",
+            "Alertas climáticas para proteger tu cosecha"
+        ]
+    },
+    "Sugerencias Legales": {
+        "icono": "⚖️",
+        "titulo": "Sugerencias Legales",
+        "desc": "Todo sobre REPROCANN y el marco legal en Argentina.",
+        "pasos": [
+            "Consultá las últimas noticias legales actualizadas automáticamente",
+            "Seguí la guía paso a paso para registrarte en REPROCANN",
+            "Conocé los requisitos, límites y tus derechos como cultivador",
+            "Información oficial con links a fuentes gubernamentales"
+        ]
+    },
+    "Seguimiento de Cultivo": {
+        "icono": "🌱",
+        "titulo": "Seguimiento de Cultivo",
+        "desc": "Seguí tus plantas día a día con guías por etapa.",
+        "pasos": [
+            "Agregá un cultivo nuevo con nombre, sistema y fecha de inicio",
+            "La app detecta automáticamente la etapa según los días",
+            "Recibí instrucciones específicas para cada etapa de crecimiento",
+            "Consejos diarios basados en el clima real de tu zona"
+        ]
+    }
+}
@@ -0,0 +1,364 @@
+import os
+import datetime
+import hashlib
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+DATABASE_URL = os.environ.get("DATABASE_URL", "")
+
+def get_db_conn():
+    return psycopg2.connect(DATABASE_URL)
+
+def init_db():
+    if not DATABASE_URL:
+        print("[DB INIT] WARNING: DATABASE_URL not set. Database features will not work.")
+        return
+    try:
+        conn = get_db_conn()
+    except Exception as e:
+        print(f"[DB INIT] Cannot connect to database: {e}")
+        return
+    try:
+        cur = conn.cursor()
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS suscriptores (
+                id SERIAL PRIMARY KEY,
+                email VARCHAR(255) UNIQUE NOT NULL,
+                plan VARCHAR(50) NOT NULL,
+                payment_id VARCHAR(255),
+                external_reference VARCHAR(500),
+                fecha_registro TIMESTAMP DEFAULT NOW(),
+                vencimiento TIMESTAMP NOT NULL,
+                es_trial BOOLEAN DEFAULT FALSE
+            );
+            CREATE TABLE IF NOT EXISTS referidos (
+                id SERIAL PRIMARY KEY,
+                referrer_email VARCHAR(255) NOT NULL,
+                codigo VARCHAR(100) UNIQUE NOT NULL,
+                reward_claimed BOOLEAN DEFAULT FALSE
+            );
+            CREATE TABLE IF NOT EXISTS referidos_detalle (
+                id SERIAL PRIMARY KEY,
+                referido_id INTEGER REFERENCES referidos(id) ON DELETE CASCADE,
+                referred_email VARCHAR(255) NOT NULL,
+                fecha TIMESTAMP DEFAULT NOW()
+            );
+            CREATE TABLE IF NOT EXISTS codigos_referidos (
+                id SERIAL PRIMARY KEY,
+                codigo VARCHAR(100) UNIQUE NOT NULL,
+                email VARCHAR(255) NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS cultivos (
+                id SERIAL PRIMARY KEY,
+                email VARCHAR(255) DEFAULT '',
+                nombre VARCHAR(255) NOT NULL,
+                sistema VARCHAR(100) NOT NULL,
+                categoria VARCHAR(100),
+                maceta VARCHAR(50),
+                inicio DATE NOT NULL
+            );
+            ALTER TABLE cultivos ADD COLUMN IF NOT EXISTS gdd REAL;
+            ALTER TABLE cultivos ADD COLUMN IF NOT EXISTS gdd_hasta DATE;
+            ALTER TABLE cultivos ADD COLUMN IF NOT EXISTS lat REAL;
+            ALTER TABLE cultivos ADD COLUMN IF NOT EXISTS lon REAL;
+        """)
+        cur.execute("""
+            INSERT INTO suscriptores (email, plan, payment_id, external_reference, vencimiento, es_trial)
+            VALUES ('flacogrosso@gmail.com', 'anual', 'owner_lifetime', 'owner', '2126-01-15 00:00:00', false)
+            ON CONFLICT (email) DO NOTHING;
+        """)
+        conn.commit()
+        print("[DB INIT] Database initialized successfully.")
+    except Exception as e:
+        print(f"[DB INIT] Error: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+init_db()
+
+def guardar_cultivos(cultivos, user_email=""):
+    email_key = user_email.strip().lower() if user_email else ""
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM cultivos WHERE LOWER(email) = %s", (email_key,))
+        for c in cultivos:
+            inicio = c.get("inicio")
+            if isinstance(inicio, datetime.datetime):
+                inicio = inicio.date()
+            elif isinstance(inicio, str):
+                inicio = datetime.date.fromisoformat(inicio)
+            cur.execute(
+                "INSERT INTO cultivos (email, nombre, sistema, categoria, maceta, inicio, gdd, gdd_hasta, lat, lon) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+                (email_key, c.get("nombre", ""), c.get("sistema", ""), c.get("categoria", ""), c.get("maceta", ""), inicio, c.get("gdd"), c.get("gdd_hasta"), c.get("lat"), c.get("lon"))
+            )
+        conn.commit()
+    except Exception as e:
+        print(f"[DB] Error guardando cultivos: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+def cargar_cultivos(user_email=""):
+    email_key = user_email.strip().lower() if user_email else ""
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute("SELECT nombre, sistema, categoria, maceta, inicio, gdd, gdd_hasta, lat, lon FROM cultivos WHERE LOWER(email) = %s", (email_key,))
+        rows = cur.fetchall()
+        cultivos = []
+        for r in rows:
+            cultivos.append({
+                "nombre": r["nombre"],
+                "sistema": r["sistema"],
+                "categoria": r.get("categoria", ""),
+                "maceta": r.get("maceta", ""),
+                "inicio": r["inicio"],
+                "gdd": r.get("gdd"),
+                "gdd_hasta": r.get("gdd_hasta"),
+                "lat": r.get("lat"),
+                "lon": r.get("lon")
+            })
+        return cultivos
+    except Exception as e:
+        print(f"[DB] Error cargando cultivos: {e}")
+        return []
+    finally:
+        conn.close()
+
+def cargar_todos_cultivos():
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute("SELECT email, nombre, sistema, inicio, gdd, gdd_hasta, lat, lon FROM cultivos")
+        return [dict(r) for r in cur.fetchall()]
+    except Exception as e:
+        print(f"[DB] Error cargando todos los cultivos: {e}")
+        return []
+    finally:
+        conn.close()
+
+def guardar_grados_dia(cultivos, user_email=None):
+    # Sólo actualiza el acumulador térmico y su ubicación; user_email=None usa el email de cada cultivo (job por lotes)
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor()
+        for c in cultivos:
+            email_key = (c.get("email", "") if user_email is None else user_email).strip().lower()
+            cur.execute(
+                "UPDATE cultivos SET gdd = %s, gdd_hasta = %s, lat = %s, lon = %s WHERE LOWER(email) = %s AND nombre = %s AND inicio = %s",
+                (c.get("gdd"), c.get("gdd_hasta"), c.get("lat"), c.get("lon"), email_key, c.get("nombre", ""), c.get("inicio"))
+            )
+        conn.commit()
+    except Exception as e:
+        print(f"[DB] Error guardando grados-día: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+def guardar_suscriptores(suscriptores):
+    pass
+
+def cargar_suscriptores():
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute("SELECT email, plan, payment_id, external_reference, fecha_registro, vencimiento, es_trial FROM suscriptores")
+        rows = cur.fetchall()
+        result = []
+        for r in rows:
+            result.append({
+                "email": r["email"],
+                "plan": r["plan"],
+                "payment_id": r.get("payment_id", ""),
+                "external_reference": r.get("external_reference", ""),
+                "fecha_registro": r["fecha_registro"].isoformat() if r.get("fecha_registro") else "",
+                "vencimiento": r["vencimiento"].isoformat() if r.get("vencimiento") else "",
+                "es_trial": r.get("es_trial", False)
+            })
+        return result
+    except Exception as e:
+        print(f"[DB] Error cargando suscriptores: {e}")
+        return []
+    finally:
+        conn.close()
+
+def verificar_suscripcion(email):
+    email_lower = email.strip().lower()
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute("SELECT plan, vencimiento, es_trial FROM suscriptores WHERE LOWER(email) = %s AND vencimiento > NOW() ORDER BY vencimiento DESC LIMIT 1", (email_lower,))
+        row = cur.fetchone()
+        if row:
+            venc = row["vencimiento"]
+            dias_restantes = (venc - datetime.datetime.now()).days
+            return {"activa": True, "plan": row["plan"], "vencimiento": venc.strftime("%d/%m/%Y"), "dias_restantes": dias_restantes, "es_trial": row.get("es_trial", False)}
+        return {"activa": False, "plan": "", "vencimiento": "", "dias_restantes": 0, "es_trial": False}
+    except Exception as e:
+        print(f"[DB] Error verificando suscripcion: {e}")
+        return {"activa": False, "plan": "", "vencimiento": "", "dias_restantes": 0, "es_trial": False}
+    finally:
+        conn.close()
+
+def activar_trial(email):
+    email_lower = email.strip().lower()
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT id FROM suscriptores WHERE LOWER(email) = %s", (email_lower,))
+        if cur.fetchone():
+            return False
+        ahora = datetime.datetime.now()
+        vencimiento = ahora + datetime.timedelta(days=7)
+        cur.execute(
+            "INSERT INTO suscriptores (email, plan, payment_id, external_reference, fecha_registro, vencimiento, es_trial) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            (email_lower, "trial", "trial_free", "trial", ahora, vencimiento, True)
+        )
+        conn.commit()
+        return True
+    except Exception as e:
+        print(f"[DB] Error activando trial: {e}")
+        conn.rollback()
+        return False
+    finally:
+        conn.close()
+
+def registrar_suscripcion(email, plan, payment_id, external_reference):
+    email_lower = email.strip().lower()
+    ahora = datetime.datetime.now()
+    if plan == "semanal":
+        vencimiento = ahora + datetime.timedelta(days=7)
+    elif plan == "mensual":
+        vencimiento = ahora + datetime.timedelta(days=30)
+    else:
+        vencimiento = ahora + datetime.timedelta(days=365)
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM suscriptores WHERE LOWER(email) = %s", (email_lower,))
+        cur.execute(
+            "INSERT INTO suscriptores (email, plan, payment_id, external_reference, fecha_registro, vencimiento, es_trial) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            (email_lower, plan, str(payment_id), external_reference, ahora, vencimiento, False)
+        )
+        conn.commit()
+    except Exception as e:
+        print(f"[DB] Error registrando suscripcion: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+def registrar_referido(referidor_email, nuevo_email, plan):
+    ref_key = referidor_email.strip().lower()
+    nuevo_key = nuevo_email.strip().lower()
+    if ref_key == nuevo_key:
+        return False
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute("SELECT id FROM referidos WHERE LOWER(referrer_email) = %s", (ref_key,))
+        row = cur.fetchone()
+        if not row:
+            cur.execute("INSERT INTO referidos (referrer_email, codigo, reward_claimed) VALUES (%s, %s, %s) RETURNING id",
+                        (ref_key, hashlib.md5(ref_key.encode()).hexdigest()[:8], False))
+            ref_id = cur.fetchone()["id"]
+        else:
+            ref_id = row["id"]
+        cur.execute("SELECT id FROM referidos_detalle WHERE referido_id = %s AND LOWER(referred_email) = %s", (ref_id, nuevo_key))
+        if cur.fetchone():
+            conn.commit()
+            return False
+        cur.execute("INSERT INTO referidos_detalle (referido_id, referred_email) VALUES (%s, %s)", (ref_id, nuevo_key))
+        cur.execute("SELECT COUNT(*) as cnt FROM referidos_detalle rd JOIN referidos r ON rd.referido_id = r.id WHERE r.id = %s", (ref_id,))
+        count_row = cur.fetchone()
+        total = count_row["cnt"] if count_row else 0
+        cur.execute("SELECT reward_claimed FROM referidos WHERE id = %s", (ref_id,))
+        reward_row = cur.fetchone()
+        if total >= 5 and not reward_row.get("reward_claimed", False):
+            cur.execute("UPDATE referidos SET reward_claimed = TRUE WHERE id = %s", (ref_id,))
+            conn.commit()
+            registrar_suscripcion(ref_key, "anual", "referido_reward", "referido_5_anuales")
+            return True
+        conn.commit()
+        return False
+    except Exception as e:
+        print(f"[DB] Error registrando referido: {e}")
+        conn.rollback()
+        return False
+    finally:
+        conn.close()
+
+def contar_referidos(email):
+    ref_key = email.strip().lower()
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute("SELECT id, reward_claimed FROM referidos WHERE LOWER(referrer_email) = %s", (ref_key,))
+        row = cur.fetchone()
+        if not row:
+            return 0, False
+        cur.execute("SELECT COUNT(*) as cnt FROM referidos_detalle WHERE referido_id = %s", (row["id"],))
+        count_row = cur.fetchone()
+        return (count_row["cnt"] if count_row else 0), row.get("reward_claimed", False)
+    except Exception as e:
+        print(f"[DB] Error contando referidos: {e}")
+        return 0, False
+    finally:
+        conn.close()
+
+def generar_codigo_referido(email):
+    code = hashlib.md5(email.strip().lower().encode()).hexdigest()[:8]
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor()
+        cur.execute("INSERT INTO codigos_referidos (codigo, email) VALUES (%s, %s) ON CONFLICT (codigo) DO NOTHING", (code, email.strip().lower()))
+        conn.commit()
+    except Exception as e:
+        print(f"[DB] Error generando codigo referido: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+    return code
+
+def resolver_codigo_referido(code):
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute("SELECT email FROM codigos_referidos WHERE codigo = %s", (code,))
+        row = cur.fetchone()
+        if row:
+            return row["email"]
+        cur.execute("SELECT email FROM suscriptores")
+        for r in cur.fetchall():
+            e = r["email"]
+            if hashlib.md5(e.strip().lower().encode()).hexdigest()[:8] == code:
+                return e.strip().lower()
+        return None
+    except Exception as e:
+        print(f"[DB] Error resolviendo codigo referido: {e}")
+        return None
+    finally:
+        conn.close()
+
+def eliminar_datos_usuario(email):
+    email_lower = email.strip().lower()
+    conn = get_db_conn()
+    try:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM suscriptores WHERE LOWER(email) = %s", (email_lower,))
+        cur.execute("SELECT id FROM referidos WHERE LOWER(referrer_email) = %s", (email_lower,))
+        ref_rows = cur.fetchall()
+        for r in ref_rows:
+            cur.execute("DELETE FROM referidos_detalle WHERE referido_id = %s", (r[0],))
+        cur.execute("DELETE FROM referidos WHERE LOWER(referrer_email) = %s", (email_lower,))
+        cur.execute("DELETE FROM referidos_detalle WHERE LOWER(referred_email) = %s", (email_lower,))
+        cur.execute("DELETE FROM codigos_referidos WHERE LOWER(email) = %s", (email_lower,))
+        cur.execute("DELETE FROM cultivos WHERE LOWER(email) = %s", (email_lower,))
+        conn.commit()
+    except Exception as e:
+        print(f"[DB] Error eliminando datos: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+    return True
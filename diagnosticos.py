@@ -0,0 +1,53 @@
+from types import MappingProxyType
+from datos.diagnosticos import ZONAS, SINTOMAS, DIAGNOSTICOS
+
+GRUPOS_DIAGNOSTICO = ("maceta", "tierra", "interior_luz", "automaticas")
+
+def grupo_diagnostico(sistema):
+    if "Maceta" in sistema:
+        return "maceta"
+    if sistema in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+        return "tierra"
+    if sistema == "Interior Luz":
+        return "interior_luz"
+    if "Automáticas" in sistema:
+        return "automaticas"
+    return None
+
+def _indexar(registros):
+    # (zona, síntoma, grupo) -> registro plano; grupo None = sistema sin remedio específico.
+    # Los diagnósticos genéricos llevan {sintoma} y se resuelven acá, una sola vez
+    indice = {}
+    for r in registros:
+        for sintoma in r["sintomas"]:
+            for grupo in GRUPOS_DIAGNOSTICO + (None,):
+                indice[(r["zona"], sintoma, grupo)] = MappingProxyType({
+                    "diagnostico": r["diagnostico"].format(sintoma=sintoma),
+                    "remedio_casero": r["remedio_casero"],
+                    "remedio_sistema": r["remedio_sistema"].get(grupo, ""),
+                    "video_url": r["video_url"],
+                })
+    return indice
+
+BASE_DIAGNOSTICOS = _indexar(DIAGNOSTICOS)
+
+def buscar_diagnostico(zona, sintoma, sistema):
+    return BASE_DIAGNOSTICOS.get((zona, sintoma, grupo_diagnostico(sistema)))
+
+def combinaciones_faltantes():
+    faltantes = []
+    for zona in ZONAS:
+        for sintoma in SINTOMAS:
+            for grupo in GRUPOS_DIAGNOSTICO:
+                registro = BASE_DIAGNOSTICOS.get((zona, sintoma, grupo))
+                if registro is None:
+                    faltantes.append((zona, sintoma, grupo, "sin registro"))
+                elif not registro["remedio_sistema"]:
+                    faltantes.append((zona, sintoma, grupo, "sin remedio para el sistema"))
+    return faltantes
+
+if __name__ == "__main__":
+    faltantes = combinaciones_faltantes()
+    for zona, sintoma, grupo, motivo in faltantes:
+        print(f"[DIAG] {zona} · {sintoma} · {grupo}: {motivo}")
+    print(f"[DIAG] {len(faltantes)} combinaciones incompletas de {len(ZONAS) * len(SINTOMAS) * len(GRUPOS_DIAGNOSTICO)}")
@@ -0,0 +1,71 @@
+import functools
+import numpy as np
+from reglas import OPERADORES
+from datos.diagnosticos import ZONAS, SINTOMAS
+from datos.condiciones import CONDICIONES
+
+# Diagnóstico diferencial: la observación es un vector binario sobre los pares (zona, síntoma) y
+# cada condición candidata es una fila de PESOS. puntaje = PESOS @ x + log(prior) y la confianza
+# es el softmax de los puntajes. Un par observado que la condición no explica resta PENALIZACION.
+PENALIZACION = 1.0
+
+PARES = [(zona, sintoma) for zona in ZONAS for sintoma in SINTOMAS]
+_COLUMNA = {par: j for j, par in enumerate(PARES)}
+
+def _matrices(condiciones):
+    pesos = np.full((len(condiciones), len(PARES)), -PENALIZACION)
+    explica = np.zeros((len(condiciones), len(PARES)), dtype=bool)
+    for i, cond in enumerate(condiciones):
+        for zona, sintomas in cond["evidencia"].items():
+            for sintoma, peso in sintomas.items():
+                pesos[i, _COLUMNA[(zona, sintoma)]] = peso
+                explica[i, _COLUMNA[(zona, sintoma)]] = peso > 0
+    return pesos, explica
+
+PESOS, EXPLICA = _matrices(CONDICIONES)
+_LOG_PRIOR = np.log([c["prior"] for c in CONDICIONES])
+
+@functools.lru_cache(maxsize=512)
+def log_priors(mes, exterior, t=None, h=None, lluvia_prob=None):
+    # Temporada y clima sólo pesan en exterior; adentro el ambiente lo controla el cultivador
+    prior = _LOG_PRIOR.copy()
+    if exterior:
+        ctx = {"t": t, "h": h, "lluvia_prob": lluvia_prob}
+        for i, cond in enumerate(CONDICIONES):
+            factor = cond["temporada"].get(mes, 1)
+            for campo, op, valor, mult in cond["clima"]:
+                if ctx[campo] is not None and OPERADORES[op](ctx[campo], valor):
+                    factor *= mult
+            prior[i] += np.log(factor)
+    prior.setflags(write=False)
+    return prior
+
+def vector_observacion(observaciones):
+    x = np.zeros(len(PARES))
+    for par in observaciones:
+        x[_COLUMNA[par]] = 1
+    return x
+
+def diagnostico_diferencial(observaciones, mes, exterior, t=None, h=None, lluvia_prob=None, top=5):
+    x = vector_observacion(observaciones)
+    if not x.any():
+        return []
+    puntaje = PESOS @ x + log_priors(mes, exterior, t, h, lluvia_prob)
+    confianza = np.exp(puntaje - puntaje.max())
+    confianza /= confianza.sum()
+    explicados = EXPLICA & (x > 0)
+    ranking = []
+    for i in np.argsort(-puntaje, kind="stable"):
+        if not explicados[i].any():
+            continue
+        cond = CONDICIONES[i]
+        ranking.append({
+            "nombre": cond["nombre"],
+            "tipo": cond["tipo"],
+            "confianza": float(confianza[i]),
+            "explica": [PARES[j] for j in explicados[i].nonzero()[0]],
+            "referencia": cond["referencia"],
+        })
+        if len(ranking) == top:
+            break
+    return ranking
@@ -0,0 +1,253 @@
+import asyncio
+import gzip
+import hashlib
+import importlib.util
+import mimetypes
+import os
+import re
+import tempfile
+import urllib.parse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Archivos estáticos que sirve el proxy sin pasar por los workers: static/ del repo en /app/static/ (la misma URL
+# que usa Streamlit con enableStaticServing), el bundle del frontend de Streamlit en /static/ y, en /, el shell
+# de la página (index.html de Streamlit con título y meta tags de la app): una visita que no ejecuta JavaScript
+# (bots, previsualizaciones de links de referidos) no llega a ningún worker; el websocket y la sesión recién se
+# abren cuando arranca la app en el navegador. Las variantes .br/.gz se toman de junto al archivo si existen o
+# se generan una sola vez en CACHE_COMPRIMIDOS, y las respuestas chicas quedan en memoria hasta MEMORIA_MAX.
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+CACHE_COMPRIMIDOS = os.path.join(tempfile.gettempdir(), "glm_estaticos")
+COMPRIMIBLES = {".js", ".css", ".html", ".json", ".map", ".svg", ".txt", ".ttf", ".otf", ".ico", ".wasm"}
+MINIMO_COMPRIMIR = 1024
+BLOQUE = 256 * 1024
+MAX_EN_MEMORIA = 2 * 1024 * 1024
+MEMORIA_MAX = int(float(os.environ.get("ESTATICOS_MEMORIA_MB") or 64) * 1024 * 1024)
+INMUTABLE = "public, max-age=31536000, immutable"
+REVALIDAR = "no-cache"
+# main.3f2a9c1b.js, 1234.5f6e7a8b.chunk.js, index.DucWPHXi.js (el hash lleva algún dígito o mayúscula)
+NOMBRE_CON_HASH = re.compile(r"\.(?=[0-9A-Za-z_-]*[0-9A-Z])[0-9A-Za-z_-]{8,}\.")
+COMPRESORES = {"gzip": (".gz", lambda datos: gzip.compress(datos, 9, mtime=0))}
+if brotli is not None:
+    COMPRESORES["br"] = (".br", lambda datos: brotli.compress(datos, quality=11))
+PREFERENCIA = ("br", "gzip")
+SHELL_TITULO = "GLM App del Cultivador Argentino"
+SHELL_DESCRIPCION = "Clima, riego, diagnóstico de plagas, cosecha y seguimiento de cultivos en La Carlota, Córdoba."
+SHELL_IMAGEN = "/app/static/images/logo_app_v2.png"
+
+INDICE = {}
+MEMORIA_USADA = 0
+_REINDEXANDO = {}
+
+def frontend_streamlit():
+    spec = importlib.util.find_spec("streamlit")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(list(spec.submodule_search_locations)[0], "static")
+
+def directorios():
+    dirs = [("/app/static/", os.path.join(RAIZ, "static"))]
+    frontend = frontend_streamlit()
+    if frontend is not None:
+        dirs.append(("/static/", os.path.join(frontend, "static")))
+    return dirs
+
+def _html_shell(html):
+    meta = (
+        f"<title>{SHELL_TITULO}</title>\n"
+        f'    <meta name="description" content="{SHELL_DESCRIPCION}" />\n'
+        f'    <meta property="og:type" content="website" />\n'
+        f'    <meta property="og:title" content="{SHELL_TITULO}" />\n'
+        f'    <meta property="og:description" content="{SHELL_DESCRIPCION}" />\n'
+        f'    <meta property="og:image" content="{SHELL_IMAGEN}" />'
+    )
+    if re.search(r"<title>.*?</title>", html, re.S):
+        html = re.sub(r"<title>.*?</title>", lambda _: meta, html, count=1, flags=re.S)
+    else:
+        html = html.replace("</head>", f"    {meta}\n  </head>", 1)
+    html = re.sub(r'<html lang="[^"]*">', '<html lang="es">', html, count=1)
+    sin_js = f"<noscript><h1>{SHELL_TITULO}</h1><p>{SHELL_DESCRIPCION}</p><p>Activá JavaScript para usar la app.</p></noscript>"
+    return re.sub(r"<noscript>.*?</noscript>", lambda _: sin_js, html, count=1, flags=re.S)
+
+def _shell(index_html):
+    # Copia de index.html con los meta tags de la app, generada junto a las variantes comprimidas
+    with open(index_html, encoding="utf-8") as f:
+        html = _html_shell(f.read()).encode()
+    destino = os.path.join(CACHE_COMPRIMIDOS, f"shell-{hashlib.md5(html).hexdigest()[:12]}.html")
+    if not os.path.isfile(destino):
+        os.makedirs(CACHE_COMPRIMIDOS, exist_ok=True)
+        temporal = f"{destino}.{os.getpid()}"
+        with open(temporal, "wb") as f:
+            f.write(html)
+        os.replace(temporal, destino)
+    return destino
+
+def _variante(origen, clave, extension, comprimir):
+    junto = origen + extension
+    if os.path.isfile(junto):
+        return junto
+    destino = os.path.join(CACHE_COMPRIMIDOS, clave + extension)
+    if not os.path.isfile(destino):
+        os.makedirs(CACHE_COMPRIMIDOS, exist_ok=True)
+        with open(origen, "rb") as f:
+            datos = comprimir(f.read())
+        temporal = f"{destino}.{os.getpid()}"
+        with open(temporal, "wb") as f:
+            f.write(datos)
+        os.replace(temporal, destino)
+    return destino
+
+def _entrada(archivo, nombre):
+    st = os.stat(archivo)
+    version = f"{int(st.st_mtime):x}-{st.st_size:x}"
+    entrada = {
+        "archivo": archivo,
+        "tamano": st.st_size,
+        "etag": f'"{version}"',
+        "tipo": mimetypes.guess_type(nombre)[0] or "application/octet-stream",
+        "cache": INMUTABLE if NOMBRE_CON_HASH.search(nombre) else REVALIDAR,
+        "variantes": {},
+        "memoria": {},
+    }
+    if os.path.splitext(nombre)[1].lower() in COMPRIMIBLES and st.st_size >= MINIMO_COMPRIMIR:
+        clave = f"{hashlib.md5(archivo.encode()).hexdigest()[:12]}-{version}"
+        for codificacion, (extension, comprimir) in COMPRESORES.items():
+            variante = _variante(archivo, clave, extension, comprimir)
+            tamano = os.path.getsize(variante)
+            if tamano < st.st_size:
+                entrada["variantes"][codificacion] = (variante, tamano, f'"{version}-{codificacion}"')
+    return entrada
+
+def construir_indice():
+    # Bloqueante (lee y comprime): correr en un executor. Reemplaza el índice de una vez.
+    global INDICE, MEMORIA_USADA
+    indice = {}
+    frontend = frontend_streamlit()
+    if frontend is not None and os.path.isdir(frontend):
+        # Archivos sueltos del frontend (favicon, manifest) en la raíz; index.html pasa a ser el shell
+        for nombre in os.listdir(frontend):
+            archivo = os.path.join(frontend, nombre)
+            if not os.path.isfile(archivo) or nombre.endswith((".gz", ".br")):
+                continue
+            try:
+                if nombre == "index.html":
+                    indice["/"] = indice["/index.html"] = _entrada(_shell(archivo), nombre)
+                else:
+                    indice["/" + nombre] = _entrada(archivo, nombre)
+            except OSError as e:
+                print(f"[ESTATICOS] No se pudo indexar {archivo}: {e}")
+    for prefijo, base in directorios():
+        for carpeta, _, archivos in os.walk(base):
+            for nombre in archivos:
+                if nombre.endswith((".gz", ".br")):
+                    continue
+                archivo = os.path.join(carpeta, nombre)
+                url = prefijo + os.path.relpath(archivo, base).replace(os.sep, "/")
+                try:
+                    indice[url] = _entrada(archivo, nombre)
+                except OSError as e:
+                    print(f"[ESTATICOS] No se pudo indexar {archivo}: {e}")
+    INDICE = indice
+    MEMORIA_USADA = 0
+    return len(indice)
+
+def codificacion_aceptada(entrada, accept_encoding):
+    aceptadas = set()
+    for token in accept_encoding.split(","):
+        nombre, _, parametros = token.strip().partition(";")
+        if parametros.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            aceptadas.add(nombre.strip().lower())
+    for codificacion in PREFERENCIA:
+        if codificacion in entrada["variantes"] and (codificacion in aceptadas or "*" in aceptadas):
+            return codificacion
+    return None
+
+def _en_memoria(entrada, codificacion, archivo, tamano):
+    # Bytes de la respuesta si es chica y entra en MEMORIA_MAX; None para mandarla desde el archivo
+    global MEMORIA_USADA
+    datos = entrada["memoria"].get(codificacion)
+    if datos is None and tamano <= MAX_EN_MEMORIA and MEMORIA_USADA + tamano <= MEMORIA_MAX:
+        with open(archivo, "rb") as f:
+            datos = f.read()
+        if len(datos) != tamano:
+            return None
+        entrada["memoria"][codificacion] = datos
+        MEMORIA_USADA += tamano
+    return datos
+
+def coincide_etag(if_none_match, etag):
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (e.strip().removeprefix("W/") for e in if_none_match.split(","))
+
+async def _reindexar(url, entrada):
+    # Releer y comprimir bloquea: va a un executor, una sola vez aunque lleguen varios pedidos juntos
+    global MEMORIA_USADA
+    tarea = _REINDEXANDO.get(url)
+    if tarea is None:
+        loop = asyncio.get_running_loop()
+        tarea = _REINDEXANDO[url] = loop.run_in_executor(None, _entrada, entrada["archivo"], os.path.basename(entrada["archivo"]))
+        tarea.add_done_callback(lambda _: _REINDEXANDO.pop(url, None))
+    nueva = await asyncio.shield(tarea)
+    if INDICE.get(url) is entrada:
+        MEMORIA_USADA -= sum(len(datos) for datos in entrada["memoria"].values())
+        INDICE[url] = nueva
+    return nueva
+
+async def servir(writer, metodo, ruta, pedidas):
+    # Bytes escritos si la ruta es un estático y ya se respondió; 0 para que siga hacia los workers.
+    # `pedidas`: cabeceras del pedido con el nombre en minúscula
+    url = urllib.parse.unquote(ruta.split("?")[0])
+    entrada = INDICE.get(url)
+    if entrada is None or metodo not in ("GET", "HEAD"):
+        return 0
+    try:
+        st = os.stat(entrada["archivo"])
+    except OSError:
+        return 0
+    if f'"{int(st.st_mtime):x}-{st.st_size:x}"' != entrada["etag"]:
+        # Editado desde que se indexó: se reindexa para no mandar un ETag ni un largo viejos
+        try:
+            entrada = await _reindexar(url, entrada)
+        except OSError:
+            return 0
+    codificacion = codificacion_aceptada(entrada, pedidas.get("accept-encoding", ""))
+    archivo, tamano, etag = entrada["variantes"][codificacion] if codificacion else (entrada["archivo"], entrada["tamano"], entrada["etag"])
+    lineas = [
+        f"Content-Type: {entrada['tipo']}",
+        f"Cache-Control: {entrada['cache']}",
+        f"ETag: {etag}",
+    ]
+    if entrada["variantes"]:
+        lineas.append("Vary: Accept-Encoding")
+    if coincide_etag(pedidas.get("if-none-match", ""), etag):
+        cabeza = ("HTTP/1.1 304 Not Modified\r\n" + "\r\n".join(lineas) + "\r\n\r\n").encode()
+        writer.write(cabeza)
+        await writer.drain()
+        return len(cabeza)
+    lineas.append(f"Content-Length: {tamano}")
+    if codificacion:
+        lineas.append(f"Content-Encoding: {codificacion}")
+    cabeza = ("HTTP/1.1 200 OK\r\n" + "\r\n".join(lineas) + "\r\n\r\n").encode()
+    datos = _en_memoria(entrada, codificacion, archivo, tamano) if metodo == "GET" else None
+    if datos is not None:
+        writer.writelines((cabeza, datos))
+        await writer.drain()
+        return len(cabeza) + tamano
+    writer.write(cabeza)
+    await writer.drain()
+    if metodo == "GET":
+        with open(archivo, "rb") as f:
+            try:
+                # Copia cero con os.sendfile cuando el transporte lo permite
+                await asyncio.get_running_loop().sendfile(writer.transport, f, 0, tamano)
+            except (AttributeError, NotImplementedError):
+                # Loops sin sendfile (uvloop): copia por bloques
+                while datos := f.read(BLOQUE):
+                    writer.write(datos)
+                    await writer.drain()
+        return len(cabeza) + tamano
+    return len(cabeza)
@@ -0,0 +1,89 @@
+import bisect
+from types import MappingProxyType
+
+# (nombre, inicio, fin, semanas) por grupo de sistema. Única fuente de verdad para todos los módulos.
+_ETAPAS_BASE = {
+    "automaticas": [
+        ("Germinación", 0, 7, "Semana 1"),
+        ("Plántula", 7, 18, "Semanas 2-3"),
+        ("Vegetativo", 18, 32, "Semanas 3-5"),
+        ("Pre-Floración", 32, 42, "Semanas 5-6"),
+        ("Floración Temprana", 42, 56, "Semanas 6-8"),
+        ("Floración Media", 56, 70, "Semanas 8-10"),
+        ("Floración Tardía / Maduración", 70, 84, "Semanas 10-12"),
+        ("Flush y Cosecha", 84, 999, "Semana 12+"),
+    ],
+    "interior_luz": [
+        ("Germinación", 0, 7, "Semana 1"),
+        ("Plántula", 7, 21, "Semanas 2-3"),
+        ("Vegetativo Temprano", 21, 42, "Semanas 4-6"),
+        ("Vegetativo Avanzado", 42, 63, "Semanas 7-9"),
+        ("Cambio a Floración (12/12)", 63, 77, "Semanas 10-11"),
+        ("Floración Temprana", 77, 98, "Semanas 11-14"),
+        ("Floración Media", 98, 119, "Semanas 14-17"),
+        ("Floración Tardía / Maduración", 119, 140, "Semanas 17-20"),
+        ("Flush y Cosecha", 140, 999, "Semana 20+"),
+    ],
+    "fotoperiodico": [
+        ("Germinación", 0, 10, "Semana 1-2"),
+        ("Plántula", 10, 25, "Semanas 2-4"),
+        ("Vegetativo Temprano", 25, 50, "Semanas 4-7"),
+        ("Vegetativo Avanzado", 50, 90, "Semanas 7-13"),
+        ("Pre-Floración", 90, 110, "Semanas 13-16"),
+        ("Floración Temprana", 110, 140, "Semanas 16-20"),
+        ("Floración Media", 140, 170, "Semanas 20-24"),
+        ("Floración Tardía / Maduración", 170, 200, "Semanas 24-28"),
+        ("Flush y Cosecha", 200, 999, "Semana 28+"),
+    ],
+}
+
+SISTEMAS = ("Interior Luz", "Interior Automáticas", "Exterior Maceta", "Exterior Tierra Madre", "Exterior Automáticas", "Invernadero Maceta", "Invernadero Tierra")
+SISTEMAS_INTERIOR = ("Interior Luz", "Interior Automáticas")
+
+# Duración total estimada del ciclo (germinación a corte) por grupo de sistema
+SEMANAS_CICLO = {"automaticas": 12, "interior_luz": 20, "fotoperiodico": 28}
+
+TABLAS_ETAPAS = {
+    grupo: tuple(MappingProxyType({"nombre": n, "inicio": i, "fin": f, "semanas": s}) for n, i, f, s in filas)
+    for grupo, filas in _ETAPAS_BASE.items()
+}
+_INICIOS = {grupo: tuple(e["inicio"] for e in tabla) for grupo, tabla in TABLAS_ETAPAS.items()}
+
+def grupo_sistema(sist):
+    if "Automáticas" in sist:
+        return "automaticas"
+    if sist == "Interior Luz":
+        return "interior_luz"
+    return "fotoperiodico"
+
+def obtener_etapas(sist):
+    return TABLAS_ETAPAS[grupo_sistema(sist)]
+
+def indice_etapa(dias, sist):
+    # Días negativos (inicio a futuro) caen en la primera etapa; después del último inicio, en la última
+    return max(bisect.bisect_right(_INICIOS[grupo_sistema(sist)], dias) - 1, 0)
+
+def etapa_por_dias(dias, sist):
+    return obtener_etapas(sist)[indice_etapa(dias, sist)]
+
+def indices_etapa(dias, sist):
+    import numpy as np
+    inicios = np.asarray(_INICIOS[grupo_sistema(sist)])
+    idx = np.searchsorted(inicios, np.asarray(dias), side="right") - 1
+    return np.clip(idx, 0, len(inicios) - 1)
+
+def porcentaje_etapa(dias, etapa):
+    rango = etapa["fin"] - etapa["inicio"]
+    if rango <= 0 or rango > 500:
+        return 1.0
+    progreso = (dias - etapa["inicio"]) / rango
+    return min(max(progreso, 0.0), 1.0)
+
+def porcentajes_etapa(dias, idx, sist):
+    import numpy as np
+    tabla = TABLAS_ETAPAS[grupo_sistema(sist)]
+    inicio = np.array([e["inicio"] for e in tabla])[idx]
+    rango = np.array([e["fin"] - e["inicio"] for e in tabla])[idx]
+    valido = (rango > 0) & (rango <= 500)
+    progreso = np.clip((np.asarray(dias) - inicio) / np.where(valido, rango, 1), 0.0, 1.0)
+    return np.where(valido, progreso, 1.0)
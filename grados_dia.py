@@ -0,0 +1,95 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from calendario import grados_dia, clima_normal, DELTA_INVERNADERO, SISTEMAS_INTERIOR
+from meteo import temperaturas_pasadas
+
+# Acumulador térmico por cultivo: gdd = grados-día (base 5, techo 30) sumados desde el inicio hasta
+# gdd_hasta inclusive. Cada actualización sólo suma los días completos nuevos (hasta ayer): primero con
+# temperaturas medidas (Open-Meteo, últimos 92 días) y, para días más viejos o faltantes, con el clima normal.
+# Las temperaturas son las de la ubicación guardada en el cultivo (lat/lon), así la app y el job por lotes
+# suman lo mismo.
+DIAS_MEDIDOS = 92
+
+_EJECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gdd")
+_PEDIDOS = {}  # (lat, lon, día) -> Future de temperaturas_pasadas
+
+def acumula_grados_dia(cultivo):
+    return cultivo.get("sistema") not in SISTEMAS_INTERIOR
+
+def dias_pendientes(cultivo, hoy):
+    hasta = cultivo.get("gdd_hasta")
+    inicio = cultivo["inicio"]
+    if not hasta or hasta < inicio - datetime.timedelta(days=1):
+        return inicio, (hoy - inicio).days
+    return hasta + datetime.timedelta(days=1), (hoy - hasta).days - 1
+
+def actualizar_cultivo(cultivo, medidas, hoy):
+    desde, n = dias_pendientes(cultivo, hoy)
+    if n <= 0:
+        return False
+    fechas = np.arange(np.datetime64(desde, "D"), np.datetime64(hoy, "D"))
+    doy = (fechas - fechas.astype("datetime64[Y]")).astype(np.int64)
+    normal_max, normal_min = clima_normal()
+    tmax, tmin = normal_max[doy].copy(), normal_min[doy].copy()
+    for i, fecha in enumerate(fechas.astype(datetime.date)):
+        medida = medidas.get(fecha)
+        if medida:
+            tmax[i], tmin[i] = medida
+    delta = DELTA_INVERNADERO if "Invernadero" in cultivo["sistema"] else 0.0
+    base = 0.0 if desde == cultivo["inicio"] else (cultivo.get("gdd") or 0.0)
+    cultivo["gdd"] = round(base + float(grados_dia(tmax + delta, tmin + delta).sum()), 1)
+    cultivo["gdd_hasta"] = hoy - datetime.timedelta(days=1)
+    return True
+
+def medidas_sin_esperar(lat, lon, hoy):
+    # Pide las temperaturas en segundo plano; None mientras no llegaron (si falló, el próximo llamado reintenta)
+    clave = (round(lat, 2), round(lon, 2), hoy)
+    pedido = _PEDIDOS.get(clave)
+    if pedido is None:
+        pedido = _PEDIDOS[clave] = _EJECUTOR.submit(temperaturas_pasadas, clave[0], clave[1], DIAS_MEDIDOS)
+    if not pedido.done():
+        return None
+    del _PEDIDOS[clave]
+    return pedido.result()
+
+def actualizar_grados_dia(cultivos, lat=None, lon=None, hoy=None, esperar=True):
+    # lat/lon (la ubicación del usuario) se guarda en los cultivos que todavía no tienen una; los que siguen sin
+    # ubicación se saltean. Devuelve los cultivos que cambiaron (para persistir sólo esos). Con esperar=False no
+    # bloquea: devuelve None mientras falten temperaturas pedidas en segundo plano.
+    hoy = hoy or datetime.date.today()
+    ubicados = []
+    por_ubicacion = {}
+    for c in cultivos:
+        if not acumula_grados_dia(c):
+            continue
+        if c.get("lat") is None and lat is not None:
+            c["lat"], c["lon"] = lat, lon
+            ubicados.append(c)
+        if c.get("lat") is not None and dias_pendientes(c, hoy)[1] > 0:
+            por_ubicacion.setdefault((round(c["lat"], 2), round(c["lon"], 2)), []).append(c)
+    if esperar:
+        medidas = {u: temperaturas_pasadas(*u, DIAS_MEDIDOS) for u in por_ubicacion}
+    else:
+        medidas = {u: medidas_sin_esperar(*u, hoy) for u in por_ubicacion}
+        if None in medidas.values():
+            # Se reintenta todo en el próximo llamado, que vuelve a asignar la ubicación y la persiste
+            for c in ubicados:
+                c["lat"] = c["lon"] = None
+            return None
+    cambiados = list(ubicados)
+    ya = {id(c) for c in ubicados}
+    for ubicacion, pendientes in por_ubicacion.items():
+        # Sin red no se avanza: mañana se completan con datos medidos los días que sigan dentro de la ventana
+        if medidas[ubicacion] is not None:
+            cambiados.extend(c for c in pendientes if actualizar_cultivo(c, medidas[ubicacion], hoy) and id(c) not in ya)
+    return cambiados
+
+if __name__ == "__main__":
+    # Job diario por lotes: python grados_dia.py. Cada cultivo usa su ubicación; los que no tienen la reciben
+    # la próxima vez que su usuario abre la app
+    from db import cargar_todos_cultivos, guardar_grados_dia
+    todos = cargar_todos_cultivos()
+    cambiados = actualizar_grados_dia(todos)
+    guardar_grados_dia(cambiados)
+    print(f"[GDD] {len(cambiados)} de {len(todos)} cultivos actualizados")
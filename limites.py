@@ -0,0 +1,110 @@
+import array
+import ipaddress
+import math
+import os
+import time
+
+# Límites por IP de cliente sobre lo que llega a los workers (pedidos y websockets; salud, estáticos y el shell no
+# cuentan): token bucket de LIMITE_TASA pedidos/s con ráfaga LIMITE_RAFAGA y a lo sumo LIMITE_CONCURRENTES en curso
+# a la vez (un websocket cuenta mientras está abierto). 0 desactiva cada límite. La IP sale de X-Forwarded-For sólo
+# si la conexión viene de una red de PROXY_CONFIABLES. El estado vive en una tabla de TABLA slots (arrays planos);
+# una IP que no encuentra lugar en SONDEO slots comparte el primero, que así limita de más y nunca de menos.
+LIMITE_TASA = float(os.environ.get("LIMITE_TASA") or 10)
+LIMITE_RAFAGA = max(1.0, float(os.environ.get("LIMITE_RAFAGA") or 60))
+LIMITE_CONCURRENTES = int(os.environ.get("LIMITE_CONCURRENTES") or 30)
+CONFIABLES = [
+    ipaddress.ip_network(red.strip(), strict=False)
+    for red in (os.environ.get("PROXY_CONFIABLES") or "127.0.0.0/8,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,fc00::/7").split(",")
+    if red.strip()
+]
+ESPERA_TASA = max(1, math.ceil(1 / LIMITE_TASA)) if LIMITE_TASA > 0 else 1  # segundos para Retry-After
+TABLA = 4096
+SONDEO = 8
+
+_ips = [None] * TABLA
+_fichas = array.array("d", [0.0]) * TABLA
+_ultima = array.array("d", [0.0]) * TABLA
+_en_curso = array.array("i", [0]) * TABLA
+
+def confiable(direccion):
+    return any(direccion in red for red in CONFIABLES)
+
+def _sin_puerto(salto):
+    # "1.2.3.4:5678" -> "1.2.3.4", "[::1]:5678" o "[::1]" -> "::1"; una IPv6 sin corchetes queda igual
+    salto = salto.strip()
+    if salto.startswith("["):
+        return salto[1:].partition("]")[0]
+    if salto.count(":") == 1:
+        return salto.partition(":")[0]
+    return salto
+
+def ip_cliente(peer, forwarded_for):
+    # Desde la derecha de X-Forwarded-For se saltean los proxies confiables; el primero que no lo es es el cliente.
+    # Un salto que no es una IP cuenta como cliente externo (se devuelve tal cual), nunca como el proxy confiable.
+    try:
+        direccion = ipaddress.ip_address(peer)
+    except ValueError:
+        return peer
+    cliente = peer
+    if not forwarded_for or not confiable(direccion):
+        return cliente
+    for salto in reversed(forwarded_for.split(",")):
+        try:
+            direccion = ipaddress.ip_address(_sin_puerto(salto))
+        except ValueError:
+            return salto.strip()
+        cliente = str(direccion)
+        if not confiable(direccion):
+            break
+    return cliente
+
+def interno(peer, forwarded_for):
+    # El cliente real (resuelto como en ip_cliente) es loopback o está en PROXY_CONFIABLES
+    try:
+        direccion = ipaddress.ip_address(ip_cliente(peer, forwarded_for))
+    except ValueError:
+        return False
+    return direccion.is_loopback or confiable(direccion)
+
+def _fichas_al(j, ahora):
+    return min(LIMITE_RAFAGA, _fichas[j] + (ahora - _ultima[j]) * LIMITE_TASA)
+
+def _slot(ip, ahora):
+    inicio = hash(ip) % TABLA
+    libre = None
+    for k in range(SONDEO):
+        j = (inicio + k) % TABLA
+        if _ips[j] == ip:
+            return j
+        # Reciclable: sin nada en curso y con el bucket lleno, es como si nunca hubiera venido
+        if libre is None and (_ips[j] is None or (_en_curso[j] == 0 and (LIMITE_TASA <= 0 or _fichas_al(j, ahora) >= LIMITE_RAFAGA))):
+            libre = j
+    if libre is None:
+        return inicio
+    _ips[libre] = ip
+    _fichas[libre] = LIMITE_RAFAGA
+    _ultima[libre] = ahora
+    _en_curso[libre] = 0
+    return libre
+
+def entrar(ip):
+    # (slot, None) si pasa, y queda en curso hasta salir(slot); (None, motivo) si se rechaza
+    ahora = time.monotonic()
+    j = _slot(ip, ahora)
+    if LIMITE_CONCURRENTES > 0 and _en_curso[j] >= LIMITE_CONCURRENTES:
+        return None, "concurrencia"
+    if LIMITE_TASA > 0:
+        fichas = _fichas_al(j, ahora)
+        _ultima[j] = ahora
+        if fichas < 1:
+            _fichas[j] = fichas
+            return None, "tasa"
+        _fichas[j] = fichas - 1
+    _en_curso[j] += 1
+    return j, None
+
+def salir(j):
+    _en_curso[j] -= 1
+
+def ips_en_tabla():
+    return TABLA - _ips.count(None)
@@ -0,0 +1,92 @@
+import datetime
+import functools
+from etapas import SISTEMAS, SEMANAS_CICLO, TABLAS_ETAPAS, grupo_sistema, indices_etapa, porcentajes_etapa
+from reglas import disparadas_lote, primera_rama
+from consejos import SISTEMAS_EXTERIOR
+from datos.reglas_clima import REGLAS_CLIMA, RAMAS_CLIMA
+from datos.reglas_rinde import REGLAS_RINDE, RAMAS_RINDE
+
+# Evaluación columnar: cada cultivo es una fila (días desde el inicio, código de sistema = índice en
+# SISTEMAS, litros de maceta con NaN si no tiene). El clima puede ser un escalar o un array por fila.
+# numpy se importa dentro de las funciones, como en etapas.py: importar este módulo (Clima) no lo carga.
+@functools.lru_cache(maxsize=1)
+def _nombres():
+    import numpy as np
+    sistemas = np.array(SISTEMAS, dtype=object)
+    etapas = {g: np.array([e["nombre"] for e in tabla], dtype=object) for g, tabla in TABLAS_ETAPAS.items()}
+    return sistemas, etapas
+
+def columnas_cultivos(cultivos, hoy=None):
+    import numpy as np
+    hoy = hoy or datetime.date.today()
+    dias = np.array([(hoy - c["inicio"]).days for c in cultivos], dtype=np.int64)
+    sistemas = np.array([SISTEMAS.index(c["sistema"]) for c in cultivos], dtype=np.int16)
+    macetas = np.array([c.get("maceta_litros") or np.nan for c in cultivos], dtype=float)
+    return dias, sistemas, macetas
+
+def _ramas(ramas, nombres):
+    import numpy as np
+    unicos, inversa = np.unique(nombres, return_inverse=True)
+    return np.array([primera_rama(ramas, n) for n in unicos], dtype=object)[inversa]
+
+def evaluar_cultivos(dias, sistemas, macetas, t, h, v, vpd=None, lluvia=0, temp_max=None, temp_min=None, hoy=None):
+    import numpy as np
+    nombres_sistema, nombres_etapa_grupo = _nombres()
+    hoy = hoy or datetime.date.today()
+    dias = np.asarray(dias, dtype=np.int64)
+    sistemas = np.asarray(sistemas)
+    macetas = np.asarray(macetas, dtype=float)
+    n = len(dias)
+
+    etapa = np.zeros(n, dtype=np.int64)
+    progreso = np.zeros(n)
+    nombre_etapa = np.empty(n, dtype=object)
+    semanas = np.zeros(n, dtype=np.int64)
+    for codigo in np.unique(sistemas):
+        fila = sistemas == codigo
+        sist = SISTEMAS[codigo]
+        grupo = grupo_sistema(sist)
+        idx = indices_etapa(dias[fila], sist)
+        etapa[fila] = idx
+        progreso[fila] = porcentajes_etapa(dias[fila], idx, sist)
+        nombre_etapa[fila] = nombres_etapa_grupo[grupo][idx]
+        semanas[fila] = SEMANAS_CICLO[grupo]
+    # Fecha nominal por SEMANAS_CICLO; la proyectada por clima y fotoperíodo es la de calendario.py
+    cosecha_nominal = np.datetime64(hoy, "D") + (semanas * 7 - dias)
+
+    t, h, v = (np.broadcast_to(np.asarray(x, dtype=float), (n,)) for x in (t, h, v))
+    if vpd is None:
+        es = 0.61078 * np.exp((17.27 * t) / (t + 237.3))
+        vpd = np.round(es - es * (h / 100), 2)
+    vpd = np.broadcast_to(np.asarray(vpd, dtype=float), (n,))
+    lluvia = np.broadcast_to(np.asarray(lluvia, dtype=float), (n,))
+    temp_max = t if temp_max is None else np.broadcast_to(np.asarray(temp_max, dtype=float), (n,))
+    temp_min = t if temp_min is None else np.broadcast_to(np.asarray(temp_min, dtype=float), (n,))
+
+    sistema = nombres_sistema[sistemas]
+    con_maceta = np.nan_to_num(macetas) != 0
+    clima = disparadas_lote(REGLAS_CLIMA, (_ramas(RAMAS_CLIMA, nombre_etapa), "invernadero"), {
+        "nombre_etapa": nombre_etapa, "sistema": sistema, "maceta_litros": macetas,
+        "t": t, "h": h, "v": v, "vpd": vpd, "lluvia_hoy": lluvia,
+    })
+    rinde = disparadas_lote(REGLAS_RINDE, ("comun", _ramas(RAMAS_RINDE, nombre_etapa)), {
+        "nombre_etapa": nombre_etapa,
+        "t": t, "h": h, "v": v, "vpd": vpd,
+        "lluvia_prob": lluvia,
+        "amplitud": temp_max - temp_min,
+        "es_exterior": np.isin(sistema, SISTEMAS_EXTERIOR),
+        "es_interior": np.isin(sistema, ["Interior Luz", "Interior Automáticas"]),
+        "es_maceta": np.char.find(sistema.astype(str), "Maceta") >= 0,
+        "es_auto": np.char.find(sistema.astype(str), "Automáticas") >= 0,
+        "es_invern": np.char.find(sistema.astype(str), "Invernadero") >= 0,
+        "maceta_chica": con_maceta & (macetas <= 10),
+        "maceta_med": con_maceta & (macetas > 10) & (macetas <= 20),
+    })
+    return {
+        "etapa": etapa,
+        "nombre_etapa": nombre_etapa,
+        "progreso": progreso,
+        "cosecha_nominal": cosecha_nominal,
+        "clima": clima,
+        "rinde": rinde,
+    }
@@ -0,0 +1,60 @@
+import datetime
+import math
+import os
+import tempfile
+import requests
+import streamlit as st
+
+LAT_DEFAULT, LON_DEFAULT = -33.42, -63.30
+CIUDAD_DEFAULT = "La Carlota, Córdoba"
+# Se toca en cada pronóstico obtenido; server.py mira su antigüedad para /readyz
+MARCA_CLIMA = os.path.join(tempfile.gettempdir(), "glm_clima_ok")
+
+def _marcar_clima():
+    try:
+        with open(MARCA_CLIMA, "a"):
+            os.utime(MARCA_CLIMA)
+    except OSError:
+        pass
+
+def fetch_weather(lat=None, lon=None):
+    if lat is None:
+        lat = st.session_state.get('user_lat', LAT_DEFAULT)
+    if lon is None:
+        lon = st.session_state.get('user_lon', LON_DEFAULT)
+    url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,relative_humidity_2m,wind_speed_10m&daily=temperature_2m_max,temperature_2m_min,precipitation_probability_max&timezone=auto&forecast_days=3"
+    try:
+        r = requests.get(url, timeout=10).json()
+        if r.get('current'):
+            _marcar_clima()
+        return r.get('current'), r.get('daily')
+    except Exception:
+        return None, None
+
+# (lat, lon, día de consulta, días pasados) -> {fecha: (tmax, tmin)}; sólo se guardan respuestas válidas
+_TEMPERATURAS_PASADAS = {}
+
+def temperaturas_pasadas(lat, lon, dias):
+    dias = max(1, min(int(dias), 92))
+    clave = (round(lat, 2), round(lon, 2), datetime.date.today(), dias)
+    if clave not in _TEMPERATURAS_PASADAS:
+        url = f"https://api.open-meteo.com/v1/forecast?latitude={clave[0]}&longitude={clave[1]}&daily=temperature_2m_max,temperature_2m_min&timezone=auto&past_days={dias}&forecast_days=1"
+        try:
+            d = requests.get(url, timeout=10).json().get('daily') or {}
+        except Exception:
+            return None
+        if not d.get('time'):
+            return None
+        if len(_TEMPERATURAS_PASADAS) > 256:
+            _TEMPERATURAS_PASADAS.clear()
+        _TEMPERATURAS_PASADAS[clave] = {
+            datetime.date.fromisoformat(f): (tx, tn)
+            for f, tx, tn in zip(d['time'], d.get('temperature_2m_max', []), d.get('temperature_2m_min', []))
+            if tx is not None and tn is not None
+        }
+    return _TEMPERATURAS_PASADAS[clave]
+
+def calcular_vpd(t, h):
+    es = 0.61078 * math.exp((17.27 * t) / (t + 237.3))
+    ea = es * (h / 100)
+    return round(es - ea, 2)
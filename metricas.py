@@ -0,0 +1,85 @@
+import bisect
+import os
+import time
+
+# Métricas del proxy para /metrics (formato de texto de Prometheus). Todo se actualiza en el hilo del loop, así
+# que los contadores son enteros en dicts que se suman sin locks; el texto se arma recién cuando se pide. Con
+# PROXY_PROCESOS > 1 cada proceso cuenta lo suyo (etiqueta `pid` en glm_proxy_info).
+BUCKETS_CONEXION = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+INICIO = time.time()
+
+CONTADORES = {"conexiones_aceptadas": 0, "conexiones_activas": 0, "bytes_recibidos": 0, "bytes_enviados": 0}
+PEDIDOS = {}  # destino (salud, metricas, estatico, worker, upgrade) -> pedidos
+PANTALLA_CARGA = {}  # motivo -> veces que se mandó LOADING_PAGE
+ERRORES = {}  # tipo -> errores
+RECHAZOS = {}  # motivo (tasa, concurrencia) -> 429 por límites de la IP
+SESIONES_WS = {}  # worker -> websockets abiertos
+SESIONES_WS_TOTAL = {}  # worker -> websockets empalmados desde el arranque
+LATENCIA_CONEXION = {"buckets": [0] * (len(BUCKETS_CONEXION) + 1), "suma": 0.0, "cuenta": 0}
+
+def sumar(tabla, clave, n=1):
+    tabla[clave] = tabla.get(clave, 0) + n
+
+def error(e):
+    sumar(ERRORES, e if isinstance(e, str) else type(e).__name__)
+
+def observar_conexion(segundos):
+    LATENCIA_CONEXION["buckets"][bisect.bisect_left(BUCKETS_CONEXION, segundos)] += 1
+    LATENCIA_CONEXION["suma"] += segundos
+    LATENCIA_CONEXION["cuenta"] += 1
+
+def _etiquetas(etiquetas):
+    if not etiquetas:
+        return ""
+    # Los valores son nombres propios (motivos, tipos de excepción, números): no hace falta escapar
+    return "{" + ",".join(f'{k}="{v}"' for k, v in etiquetas.items()) + "}"
+
+def _familia(lineas, nombre, tipo, ayuda, muestras):
+    lineas.append(f"# HELP {nombre} {ayuda}")
+    lineas.append(f"# TYPE {nombre} {tipo}")
+    for etiquetas, valor in muestras:
+        lineas.append(f"{nombre}{_etiquetas(etiquetas)} {valor}")
+
+def texto(workers, empalme, rol, ips_limitadas):
+    # workers: por worker {"listo", "drenando", "conexiones", "pool_libres"}; empalme: proxy_http.TOTALES_EMPALME
+    lineas = []
+    _familia(lineas, "glm_proxy_info", "gauge", "Proceso proxy que responde.", [({"pid": os.getpid(), "rol": rol}, 1)])
+    _familia(lineas, "glm_proxy_inicio_segundos", "gauge", "Arranque del proceso (epoch).", [({}, round(INICIO, 3))])
+    _familia(lineas, "glm_proxy_conexiones_activas", "gauge", "Conexiones de clientes abiertas.", [({}, CONTADORES["conexiones_activas"])])
+    _familia(lineas, "glm_proxy_conexiones_total", "counter", "Conexiones de clientes aceptadas.", [({}, CONTADORES["conexiones_aceptadas"])])
+    _familia(lineas, "glm_proxy_pedidos_total", "counter", "Pedidos HTTP por destino.",
+             [({"destino": d}, n) for d, n in sorted(PEDIDOS.items())])
+    _familia(lineas, "glm_proxy_http_bytes_total", "counter", "Bytes HTTP con los clientes (sin websockets).",
+             [({"sentido": "recibidos"}, CONTADORES["bytes_recibidos"]), ({"sentido": "enviados"}, CONTADORES["bytes_enviados"])])
+    _familia(lineas, "glm_proxy_websocket_bytes_total", "counter", "Bytes empalmados en websockets.",
+             [({"sentido": "cliente_a_worker"}, empalme["cliente_a_worker"]), ({"sentido": "worker_a_cliente"}, empalme["worker_a_cliente"])])
+    _familia(lineas, "glm_proxy_websocket_cortados_inactivos_total", "counter", "Websockets cortados por inactividad.",
+             [({}, empalme["cortados_inactivos"])])
+    _familia(lineas, "glm_proxy_websocket_sesiones", "gauge", "Websockets abiertos por worker.",
+             [({"worker": i}, SESIONES_WS.get(i, 0)) for i in range(len(workers))])
+    _familia(lineas, "glm_proxy_websocket_sesiones_total", "counter", "Websockets empalmados por worker.",
+             [({"worker": i}, SESIONES_WS_TOTAL.get(i, 0)) for i in range(len(workers))])
+    for clave, tipo, ayuda in (
+        ("listo", "gauge", "1 si el worker está en rotación."),
+        ("drenando", "gauge", "1 si el worker no recibe sesiones nuevas."),
+        ("conexiones", "gauge", "Pedidos y websockets en curso hacia el worker."),
+        ("pool_libres", "gauge", "Conexiones keep-alive libres en el pool hacia el worker."),
+    ):
+        _familia(lineas, f"glm_proxy_worker_{clave}", tipo, ayuda, [({"worker": i}, int(w[clave])) for i, w in enumerate(workers)])
+    acumulado = 0
+    muestras = []
+    for limite, n in zip(BUCKETS_CONEXION + ("+Inf",), LATENCIA_CONEXION["buckets"]):
+        acumulado += n
+        muestras.append(({"le": limite}, acumulado))
+    _familia(lineas, "glm_proxy_conexion_worker_segundos", "histogram", "Latencia de conexión TCP hacia los workers.", [])
+    lineas.extend(f"glm_proxy_conexion_worker_segundos_bucket{_etiquetas(e)} {v}" for e, v in muestras)
+    lineas.append(f"glm_proxy_conexion_worker_segundos_sum {LATENCIA_CONEXION['suma']:.6f}")
+    lineas.append(f"glm_proxy_conexion_worker_segundos_count {LATENCIA_CONEXION['cuenta']}")
+    _familia(lineas, "glm_proxy_pantalla_carga_total", "counter", "Veces que se respondió la pantalla de carga, por motivo.",
+             [({"motivo": m}, n) for m, n in sorted(PANTALLA_CARGA.items())])
+    _familia(lineas, "glm_proxy_errores_total", "counter", "Errores atendiendo clientes, por tipo.",
+             [({"tipo": t}, n) for t, n in sorted(ERRORES.items())])
+    _familia(lineas, "glm_proxy_rechazos_total", "counter", "Respuestas 429 por límites de la IP del cliente, por motivo.",
+             [({"motivo": m}, n) for m, n in sorted(RECHAZOS.items())])
+    _familia(lineas, "glm_proxy_limites_ips", "gauge", "IPs con estado en la tabla de límites.", [({}, ips_limitadas)])
+    return ("\n".join(lineas) + "\n").encode()
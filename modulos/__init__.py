@@ -0,0 +1,14 @@
+import importlib
+
+MODULOS = {
+    "Clima y Sugerencias": "modulos.clima",
+    "Asesoramiento Cultivo": "modulos.asesoramiento",
+    "Calculadora Riego": "modulos.riego",
+    "Diagnóstico & Plagas": "modulos.diagnostico",
+    "Estimador de Cosecha": "modulos.cosecha",
+    "Sugerencias Legales": "modulos.legal",
+    "Seguimiento de Cultivo": "modulos.seguimiento",
+}
+
+def cargar_modulo(nombre):
+    return importlib.import_module(MODULOS[nombre])
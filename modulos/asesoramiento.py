@@ -0,0 +1,256 @@
+import streamlit as st
+from ui import mostrar_tutorial, icon_title, icon_subtitle, cannabis_banner, cannabis_divider
+
+# --- MÓDULO 2: ASESORAMIENTO POR SISTEMA DE CULTIVO ---
+@st.fragment
+def render(sistema, user_lat, user_lon, ciudad_actual):
+    cannabis_banner("asesoramiento")
+    mostrar_tutorial("Asesoramiento Cultivo")
+    icon_title("asesoramiento", f"Asesoramiento: {sistema}")
+
+    if "Maceta" in sistema:
+        if "Invernadero" in sistema:
+            icon_subtitle("asesoramiento", "Cultivo en Maceta en Invernadero")
+        else:
+            icon_subtitle("asesoramiento", "Cultivo en Maceta al Exterior")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### Sustrato Recomendado")
+            st.markdown("""
+            - **Mezcla base:** 40% tierra negra + 30% perlita + 20% humus de lombriz + 10% fibra de coco.
+            - **Tamaño mínimo:** 20 litros (vegetativo), 50+ litros (floración).
+            - Agregar micorrizas al trasplante para mejorar absorción.
+            """)
+
+            st.markdown("#### Riego")
+            st.markdown("""
+            - Regar cuando los primeros 3 cm de sustrato estén secos.
+            - En verano cordobés (35°C+): regar temprano a la mañana o al atardecer.
+            - Evitar platos con agua estancada para prevenir hongos en raíces.
+            - pH del agua: **6.0 - 6.5**.
+            """)
+
+        with col2:
+            st.markdown("#### Manejo Ambiental")
+            st.markdown("""
+            - Rotar la maceta cada 2-3 días para crecimiento parejo.
+            - Usar maceta blanca o con aislante: el sol directo calienta las raíces.
+            - Proteger del viento Pampero con malla media sombra (30-50%).
+            - En heladas: entrar la planta o cubrir con tela antihelada.
+            """)
+
+            st.markdown("#### Tips La Carlota")
+            st.markdown("""
+            - El agua de red local tiende a pH alto (~7.5). Corregir con ácido cítrico.
+            - En diciembre-enero, el calor extremo seca las macetas rápido: considerar riego 2 veces al día.
+            - Usar mulch (paja, corteza) sobre el sustrato para retener humedad.
+            """)
+
+        if "Invernadero" in sistema:
+            st.info("🏡 **Ventajas del Invernadero:** Protección contra lluvia directa, viento y granizo. Mayor control de temperatura. Permite extender la temporada de cultivo. Controlar ventilación para evitar exceso de calor y humedad.")
+
+        cannabis_divider()
+        icon_subtitle("asesoramiento", "Tiendas Recomendadas para Cultivo en Maceta")
+        st.markdown("""
+| Tienda | Especialidad | Web |
+|--------|-------------|-----|
+| Namasté Nutrientes | Fertilizantes orgánicos y biominerales | [namastenutrientes.com](https://namastenutrientes.com) |
+| Top Crop | Línea completa de nutrición vegetal | [topcropfert.com/ar](https://www.topcropfert.com/ar/) |
+| Ecomambo | Humus, micorrizas, enmiendas orgánicas | [ecomambo.com.ar](https://ecomambo.com.ar) |
+| UP! Growshop | Macetas textiles, sustratos, perlita | [upgrowshop.com](https://www.upgrowshop.com) |
+| Terrafertil | Sustratos, perlita, vermiculita | [terrafertil.com](https://www.terrafertil.com) |
+        """)
+        st.markdown("#### 📞 Contactos y Redes Sociales")
+        st.markdown("""
+- **Namasté Nutrientes** — IG: [@namastenutrientes](https://instagram.com/namastenutrientes) · 📧 contacto@namaste.ar
+- **Top Crop** — IG: [@topcropoficial](https://instagram.com/topcropoficial) · 📧 info@topcropfert.com
+- **Ecomambo** — IG: [@ecomambo](https://instagram.com/ecomambo) · [WhatsApp](https://wa.me/5491132350716) · 📧 info@ecomambo.com.ar
+- **UP! Growshop** — IG: [@upgrowshop](https://instagram.com/upgrowshop) · [WhatsApp](https://wa.me/5491123298811) · Envíos a todo el país
+- **Terrafertil** — IG: [@terrafertilsustratos](https://instagram.com/terrafertilsustratos) · 📱 0810-333-TERRA (83772)
+        """)
+
+    elif sistema in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+        if "Invernadero" in sistema:
+            icon_subtitle("asesoramiento", "Cultivo en Tierra en Invernadero")
+        else:
+            icon_subtitle("asesoramiento", "Cultivo en Tierra Madre (Suelo Directo)")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### Preparación del Suelo")
+            st.markdown("""
+            - Cavar un pozo de **60x60x60 cm** mínimo y rellenar con mezcla enriquecida.
+            - Mezclar tierra del lugar con compost maduro, humus y perlita.
+            - El suelo arcilloso de La Carlota retiene mucha agua: agregar perlita para drenaje.
+            - Incorporar harina de hueso y ceniza de madera como enmiendas de fondo.
+            """)
+
+            st.markdown("#### Riego")
+            st.markdown("""
+            - La tierra madre retiene más humedad que las macetas, regar menos frecuente.
+            - Riego profundo 2-3 veces por semana según clima.
+            - Considerar riego por goteo para eficiencia.
+            - En época de lluvias, vigilar que no se encharque la zona.
+            """)
+
+        with col2:
+            st.markdown("#### Ventajas del Sistema")
+            st.markdown("""
+            - Las raíces no tienen límite: plantas más grandes y productivas.
+            - Menor estrés térmico: el suelo amortigua temperaturas extremas.
+            - La microbiología del suelo aporta nutrientes naturalmente.
+            - Requiere menos fertilizantes que en maceta.
+            """)
+
+            st.markdown("#### Precauciones")
+            st.markdown("""
+            - Proteger de animales (perros, liebres) con cerco perimetral.
+            - Revisar napa freática: si está alta, elevar el cantero.
+            - Mantener distancia entre plantas (1.5 m mínimo) para circulación de aire.
+            - Aplicar neem preventivo cada 15 días en primavera-verano.
+            """)
+
+        if "Invernadero" in sistema:
+            st.info("🏡 **Ventajas del Invernadero:** Protección contra lluvia, viento y granizo. Mejor control de temperatura y humedad. Menos presión de plagas externas. Requiere buena ventilación para evitar acumulación de calor.")
+
+        cannabis_divider()
+        icon_subtitle("asesoramiento", "Tiendas Recomendadas para Cultivo en Tierra")
+        st.markdown("""
+| Tienda | Especialidad | Web |
+|--------|-------------|-----|
+| Namasté Nutrientes | Fertilizantes orgánicos, humus, compost | [namastenutrientes.com](https://namastenutrientes.com) |
+| Ecomambo | Enmiendas orgánicas, harina de hueso, guano | [ecomambo.com.ar](https://ecomambo.com.ar) |
+| Top Crop | Nutrición orgánica y mineral para suelo | [topcropfert.com/ar](https://www.topcropfert.com/ar/) |
+| Terrafertil | Sustratos, perlita, vermiculita a granel | [terrafertil.com](https://www.terrafertil.com) |
+| UP! Growshop | Malla antigranizo, riego por goteo, cercos | [upgrowshop.com](https://www.upgrowshop.com) |
+        """)
+        st.markdown("#### 📞 Contactos y Redes Sociales")
+        st.markdown("""
+- **Namasté Nutrientes** — IG: [@namastenutrientes](https://instagram.com/namastenutrientes) · 📧 contacto@namaste.ar
+- **Ecomambo** — IG: [@ecomambo](https://instagram.com/ecomambo) · [WhatsApp](https://wa.me/5491132350716) · 📧 info@ecomambo.com.ar
+- **Top Crop** — IG: [@topcropoficial](https://instagram.com/topcropoficial) · 📧 info@topcropfert.com
+- **Terrafertil** — IG: [@terrafertilsustratos](https://instagram.com/terrafertilsustratos) · 📱 0810-333-TERRA (83772) · 📧 ventas@terrafertil.com
+- **UP! Growshop** — IG: [@upgrowshop](https://instagram.com/upgrowshop) · [WhatsApp](https://wa.me/5491123298811) · Envíos a todo el país
+        """)
+
+    elif sistema == "Interior Luz":
+        icon_subtitle("asesoramiento", "Cultivo Indoor con Iluminación Artificial")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### Iluminación")
+            st.markdown("""
+            - **Vegetativo:** 18 hs luz / 6 hs oscuridad.
+            - **Floración:** 12 hs luz / 12 hs oscuridad estrictas.
+            - LED recomendado: 200-400W para 1 m² de cultivo.
+            - Mantener distancia de la luz según fabricante (generalmente 30-50 cm).
+            """)
+
+            st.markdown("#### Sustrato y Nutrición")
+            st.markdown("""
+            - Mezcla inerte con control total: fibra de coco + perlita (70/30).
+            - Fertilización completa con cada riego (fertirrigación).
+            - Controlar EC (electroconductividad): 0.8-1.2 en vege, 1.4-1.8 en flora.
+            - pH estricto: **5.8 - 6.2**.
+            """)
+
+        with col2:
+            st.markdown("#### Control Ambiental")
+            st.markdown("""
+            - Temperatura ideal: 24-28°C con luces encendidas, 18-22°C apagadas.
+            - Humedad: 60-70% en vegetativo, 40-50% en floración.
+            - VPD objetivo: 0.8-1.2 kPa.
+            - Ventilación: extractor + ventilador oscilante obligatorios.
+            - Filtro de carbón activado para control de olores.
+            """)
+
+            st.markdown("#### Tips Indoor")
+            st.markdown("""
+            - En verano, el indoor en La Carlota sufre calor: usar luces en horario nocturno.
+            - Técnicas de entrenamiento (LST, SCROG) maximizan el rendimiento por m².
+            - Limpiar bandejas y herramientas con agua oxigenada para evitar patógenos.
+            - Timer digital obligatorio para precisión en fotoperiodo.
+            """)
+
+        cannabis_divider()
+        icon_subtitle("asesoramiento", "Tiendas Recomendadas para Indoor")
+        st.markdown("""
+| Tienda | Especialidad | Web |
+|--------|-------------|-----|
+| UP! Growshop | Paneles LED, carpas, extractores | [upgrowshop.com](https://www.upgrowshop.com) |
+| Insativa | Luminarias LED Samsung Horticulture | [insativa.com.ar](https://www.insativa.com.ar) |
+| Agroled | Paneles Growtech y equipamiento LED | [agroled.com.ar](https://www.agroled.com.ar) |
+| Namasté Nutrientes | Fertilizantes para indoor y fibra de coco | [namastenutrientes.com](https://namastenutrientes.com) |
+| Top Crop | Línea completa indoor: nutrientes y aditivos | [topcropfert.com/ar](https://www.topcropfert.com/ar/) |
+| Ecomambo | Insecticidas ecológicos, enraizantes | [ecomambo.com.ar](https://ecomambo.com.ar) |
+        """)
+        st.markdown("#### 📞 Contactos y Redes Sociales")
+        st.markdown("""
+- **UP! Growshop** — IG: [@upgrowshop](https://instagram.com/upgrowshop) · [WhatsApp](https://wa.me/5491123298811) · Envíos a todo el país
+- **Insativa** — [WhatsApp](https://wa.me/5491157379179) · 📧 info@insativa.com.ar · Salta 3518, Villa Ballester
+- **Agroled** — [WhatsApp](https://wa.me/5491128727061) · [agroled.com.ar/contacto](https://www.agroled.com.ar/contacto/)
+- **Namasté Nutrientes** — IG: [@namastenutrientes](https://instagram.com/namastenutrientes) · 📧 contacto@namaste.ar
+- **Top Crop** — IG: [@topcropoficial](https://instagram.com/topcropoficial) · 📧 info@topcropfert.com
+- **Ecomambo** — IG: [@ecomambo](https://instagram.com/ecomambo) · [WhatsApp](https://wa.me/5491132350716) · 📧 info@ecomambo.com.ar
+        """)
+
+    elif "Automáticas" in sistema:
+        icon_subtitle("asesoramiento", "Cultivo de Variedades Automáticas")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### Características Clave")
+            st.markdown("""
+            - Florecen solas entre las **semanas 3-4** de vida, sin cambio de fotoperiodo.
+            - Ciclo total: **8 a 11 semanas** desde germinación.
+            - No se trasplantan: sembrar en maceta definitiva desde el inicio.
+            - Tamaño compacto: ideal para espacios reducidos o discreción.
+            """)
+
+            st.markdown("#### Nutrición")
+            st.markdown("""
+            - Usar **dosis reducida (50-70%)** respecto a fotodependientes.
+            - Son sensibles al exceso de fertilizante: menos es más.
+            - Empezar con nutrientes suaves a partir de la semana 2.
+            - No hacer lavado de raíces agresivo: mejor prevenir con dosis bajas.
+            """)
+
+        with col2:
+            st.markdown("#### Fotoperiodo")
+            st.markdown("""
+            - Indoor: **20 hs luz / 4 hs oscuridad** durante todo el ciclo.
+            - Exterior: aprovechar todo el sol disponible.
+            - No dependen del fotoperiodo, pero más luz = más producción.
+            """)
+
+            st.markdown("#### Errores Comunes")
+            st.markdown("""
+            - **No trasplantar:** el estrés del trasplante les quita días de un ciclo ya corto.
+            - **No podar en exceso:** técnicas agresivas (topping) pueden reducir el rendimiento.
+            - **LST suave** es la mejor técnica de entrenamiento para autos.
+            - Germinar en maceta definitiva de 15-20 litros.
+            """)
+
+        cannabis_divider()
+        icon_subtitle("asesoramiento", "Tiendas Recomendadas para Automáticas")
+        st.markdown("""
+| Tienda | Especialidad | Web |
+|--------|-------------|-----|
+| Namasté Nutrientes | Fertilizantes suaves ideales para autos | [namastenutrientes.com](https://namastenutrientes.com) |
+| Top Crop | Línea de nutrición con dosis ajustables | [topcropfert.com/ar](https://www.topcropfert.com/ar/) |
+| UP! Growshop | Macetas definitivas, sustratos livianos | [upgrowshop.com](https://www.upgrowshop.com) |
+| Ecomambo | Enmiendas orgánicas suaves para autos | [ecomambo.com.ar](https://ecomambo.com.ar) |
+| Terrafertil | Sustratos livianos, perlita, vermiculita | [terrafertil.com](https://www.terrafertil.com) |
+        """)
+        st.markdown("#### 📞 Contactos y Redes Sociales")
+        st.markdown("""
+- **Namasté Nutrientes** — IG: [@namastenutrientes](https://instagram.com/namastenutrientes) · 📧 contacto@namaste.ar
+- **Top Crop** — IG: [@topcropoficial](https://instagram.com/topcropoficial) · 📧 info@topcropfert.com
+- **UP! Growshop** — IG: [@upgrowshop](https://instagram.com/upgrowshop) · [WhatsApp](https://wa.me/5491123298811) · Envíos a todo el país
+- **Ecomambo** — IG: [@ecomambo](https://instagram.com/ecomambo) · [WhatsApp](https://wa.me/5491132350716) · 📧 info@ecomambo.com.ar
+- **Terrafertil** — IG: [@terrafertilsustratos](https://instagram.com/terrafertilsustratos) · 📱 0810-333-TERRA (83772)
+        """)
+
+    cannabis_divider()
+    st.info(f"Estos consejos están adaptados para el clima y suelo de **La Carlota, Córdoba** y el sistema **{sistema}**.")
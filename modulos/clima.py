@@ -0,0 +1,267 @@
+import datetime
+import html
+import streamlit as st
+from db import cargar_suscriptores, verificar_suscripcion
+from meteo import fetch_weather, calcular_vpd
+from lote import columnas_cultivos, evaluar_cultivos
+from reglas import mensajes_lote
+from datos.reglas_clima import REGLAS_CLIMA
+from etapas import grupo_sistema, SISTEMAS_INTERIOR
+from solar import sol_del_dia, hora_local, disparo_floracion, FOTOPERIODO_CRITICO
+from ui import mostrar_tutorial, icon_html, icon_title, icon_subtitle, cannabis_banner, cannabis_divider
+
+def radar_windy_lazy(radar_url, alto):
+    # Placeholder liviano: el iframe de Windy se inyecta recién al hacer clic o al entrar en pantalla
+    src = html.escape(radar_url, quote=True)
+    st.components.v1.html(f"""
+    <div id="radar" style="height:{alto - 10}px;border-radius:12px;border:1px solid rgba(0,155,58,0.35);
+         background:radial-gradient(circle at 50% 40%, rgba(0,155,58,0.25), rgba(10,10,10,0.95));
+         display:flex;align-items:center;justify-content:center;font-family:sans-serif;">
+        <button id="radar-btn" style="background:#009B3A;color:white;border:none;border-radius:10px;
+                padding:12px 22px;font-weight:700;font-size:15px;cursor:pointer;">🛰️ Cargar radar en vivo</button>
+    </div>
+    <script>
+    (function() {{
+        var cont = document.getElementById("radar");
+        var cargado = false;
+        function cargar() {{
+            if (cargado) return;
+            cargado = true;
+            cont.innerHTML = '<iframe src="{src}" loading="lazy" width="100%" height="{alto - 10}" frameborder="0" style="border-radius:12px;border:0;"></iframe>';
+        }}
+        document.getElementById("radar-btn").addEventListener("click", cargar);
+        if ("IntersectionObserver" in window) {{
+            var obs = new IntersectionObserver(function(entradas) {{
+                entradas.forEach(function(e) {{
+                    if (e.isIntersecting) {{ obs.disconnect(); cargar(); }}
+                }});
+            }}, {{ rootMargin: "200px" }});
+            obs.observe(cont);
+        }}
+    }})();
+    </script>
+    """, height=alto)
+
+# --- MÓDULO 1: CLIMA & VPD ---
+@st.fragment
+def render(sistema, user_lat, user_lon, ciudad_actual):
+    cannabis_banner("clima")
+    mostrar_tutorial("Clima y Sugerencias")
+
+    if not st.session_state.get("suscripcion_activa", False):
+        clima_email = st.session_state.get("suscriptor_email", "")
+        if clima_email:
+            clima_sub_info = verificar_suscripcion(clima_email)
+            if not clima_sub_info["activa"]:
+                trial_usado = False
+                suscriptores_check = cargar_suscriptores()
+                for s in suscriptores_check:
+                    if s.get("email", "").lower() == clima_email.strip().lower():
+                        trial_usado = True
+                        break
+                if trial_usado:
+                    st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, rgba(254,209,0,0.12), rgba(206,17,38,0.08));
+                                border: 1px solid rgba(254,209,0,0.4); border-radius: 14px; padding: 18px; margin-bottom: 20px; text-align: center;">
+                        <p style="color: #FED100; font-size: 1.1em; font-weight: 700; margin: 0 0 8px;">⚠️ Tu suscripción expiró</p>
+                        <p style="color: #CCC; font-size: 0.9em; margin: 0 0 12px;">Renová tu plan para seguir usando los 6 módulos premium. Este módulo siempre es gratuito.</p>
+                        <p style="color: #AAA; font-size: 0.85em; margin: 0;">👈 Elegí un plan en la barra lateral o seleccioná un módulo premium para ver las opciones.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.markdown("""
+                    <div style="background: linear-gradient(135deg, rgba(0,155,58,0.15), rgba(0,100,38,0.08));
+                                border: 2px dashed #00C44F; border-radius: 14px; padding: 18px; margin-bottom: 20px; text-align: center;">
+                        <p style="color: #00C44F; font-size: 1.2em; font-weight: 700; margin: 0 0 8px;">🎁 ¡Tenés 7 días gratis esperándote!</p>
+                        <p style="color: #CCC; font-size: 0.95em; margin: 0 0 12px;">Activá tu prueba gratuita y desbloqueá los 6 módulos premium: Asesoramiento, Riego, Diagnóstico, Cosecha, Legal y Seguimiento.</p>
+                        <p style="color: #AAA; font-size: 0.85em; margin: 0;">👈 Seleccioná cualquier módulo premium en el menú para activar tu prueba gratis. Sin tarjeta de crédito.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+        else:
+            st.markdown("""
+            <div style="background: linear-gradient(135deg, rgba(0,155,58,0.15), rgba(0,100,38,0.08));
+                        border: 2px dashed #00C44F; border-radius: 14px; padding: 18px; margin-bottom: 20px; text-align: center;">
+                <p style="color: #00C44F; font-size: 1.2em; font-weight: 700; margin: 0 0 8px;">🎁 ¡Probá la app completa gratis por 7 días!</p>
+                <p style="color: #CCC; font-size: 0.95em; margin: 0 0 12px;">Este módulo es gratuito. Ingresá tu email en la barra lateral y seleccioná un módulo premium para activar tu prueba gratis.</p>
+                <p style="color: #AAA; font-size: 0.85em; margin: 0;">Sin tarjeta de crédito. 6 módulos premium desbloqueados.</p>
+            </div>
+            """, unsafe_allow_html=True)
+    else:
+        clima_sub_info = verificar_suscripcion(st.session_state.get("suscriptor_email", ""))
+        clima_dias = clima_sub_info.get("dias_restantes", 0)
+        clima_plan = clima_sub_info.get("plan", "")
+        clima_es_trial = clima_sub_info.get("es_trial", False)
+        if clima_es_trial:
+            st.markdown(f"""
+            <div style="background: rgba(0,155,58,0.08); border: 1px solid rgba(0,155,58,0.3); border-radius: 10px; padding: 12px; margin-bottom: 15px; text-align: center;">
+                <span style="color: #00C44F; font-weight: 700;">🎁 Prueba Gratis</span>
+                <span style="color: #CCC;"> — Te quedan <b style="color: #FED100;">{clima_dias} días</b>. Elegí un plan para no perder acceso.</span>
+            </div>
+            """, unsafe_allow_html=True)
+        elif clima_dias <= 5:
+            st.markdown(f"""
+            <div style="background: rgba(206,17,38,0.08); border: 1px solid rgba(206,17,38,0.3); border-radius: 10px; padding: 12px; margin-bottom: 15px; text-align: center;">
+                <span style="color: #CE1126; font-weight: 700;">⏳ Plan {clima_plan.upper()}</span>
+                <span style="color: #CCC;"> — Te quedan <b style="color: #FED100;">{clima_dias} días</b>. ¡Renová pronto!</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    icon_title("clima", f"Monitor Ambiental - {ciudad_actual}")
+    curr, daily = fetch_weather()
+    t, h, v, vpd = 0.0, 0.0, 0.0, 0.0
+    
+    if curr:
+        t, h, v = curr['temperature_2m'], curr['relative_humidity_2m'], curr['wind_speed_10m']
+        vpd = calcular_vpd(t, h)
+        
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Temperatura", f"{t}°C")
+        c2.metric("Humedad", f"{h}%")
+        c3.metric("VPD (Transpiración)", f"{vpd} kPa")
+        c4.metric(f"Viento {ciudad_actual.split(',')[0]}", f"{v} km/h")
+        
+        if v > 35: st.error(f"🚩 ALERTA VIENTO: {v} km/h. Reforzar tutores.")
+
+        cannabis_divider()
+        icon_subtitle("seedling", f"Recomendación del Día para: {sistema}")
+
+        if "Maceta" in sistema:
+            if t > 33:
+                st.warning("🔥 **Calor extremo.** Mover macetas a media sombra por la tarde. Regar 2 veces al día (mañana temprano y atardecer). Usar mulch para retener humedad.")
+            elif t < 5:
+                st.error("❄️ **Riesgo de helada.** Entrar las macetas adentro o cubrir con tela antihelada. No regar de noche.")
+            elif t < 12:
+                st.info("🧊 **Fresco.** Reducir riego, el sustrato tarda más en secar. Aprovechar el sol del mediodía.")
+            else:
+                st.success("✅ **Clima favorable.** Buen día para regar, trasplantar o aplicar fertilizante foliar.")
+
+            if h > 80:
+                st.warning("💧 **Humedad alta.** Riesgo de hongos. Separar macetas para mejorar ventilación. No mojar las hojas.")
+            if v > 25:
+                st.warning(f"💨 **Viento fuerte ({v} km/h).** Proteger con malla cortaviento o reubicar las macetas.")
+            if "Invernadero" in sistema:
+                st.info("🏡 **Invernadero:** Protegido del viento y lluvia directa. Controlar ventilación interna y temperatura. Abrir ventanas en días calurosos para evitar acumulación de calor y humedad.")
+
+        elif sistema in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+            if t > 33:
+                st.warning("🔥 **Calor extremo.** Regar profundo temprano a la mañana. Aplicar mulch grueso. Evitar fertilizar con sol fuerte.")
+            elif t < 5:
+                st.error("❄️ **Riesgo de helada.** Cubrir plantas con tela antihelada o campana plástica. Aporcar la base del tallo.")
+            elif t < 12:
+                st.info("🧊 **Fresco.** Día ideal para enmiendas de suelo y preparación de compost. Riego mínimo.")
+            else:
+                st.success("✅ **Clima favorable.** Buen momento para regar, aplicar neem preventivo o trasplantar.")
+
+            if h > 80:
+                st.warning("💧 **Humedad alta.** Vigilar aparición de oídio y botrytis. Podar hojas bajas para ventilación.")
+            if v > 25:
+                st.warning(f"💨 **Viento fuerte ({v} km/h).** Revisar tutores y amarres. Reforzar estructura de soporte.")
+            if daily and daily['precipitation_probability_max'][0] > 60:
+                st.info("🌧️ **Lluvia probable hoy.** No regar. Verificar drenaje del terreno para evitar encharcamiento.")
+            if "Invernadero" in sistema:
+                st.info("🏡 **Invernadero:** Protegido de lluvias y viento. Controlar ventilación y temperatura interna. En días calurosos, abrir ventanas laterales y cenitales.")
+
+        elif sistema == "Interior Luz":
+            if t > 30:
+                st.warning("🔥 **Calor exterior alto.** Tu indoor se calentará más. Prendé las luces de noche (20-06hs). Reforzar extracción de aire.")
+            elif t < 10:
+                st.info("🧊 **Frío exterior.** El indoor perderá calor rápido con luces apagadas. Considerar calefactor en período oscuro.")
+            else:
+                st.success("✅ **Clima exterior templado.** Buenas condiciones para mantener temperatura estable en el indoor.")
+
+            if vpd < 0.4:
+                st.warning("💧 **VPD bajo.** Humedad excesiva en el ambiente. Aumentar extracción y usar deshumidificador si es necesario.")
+            elif vpd > 1.6:
+                st.warning("🏜️ **VPD alto.** Aire muy seco. Considerar humidificador en vegetativo o reducir temperatura.")
+            else:
+                st.success(f"✅ **VPD en rango ({vpd} kPa).** Transpiración saludable.")
+
+        elif "Automáticas" in sistema:
+            if t > 33:
+                st.warning("🔥 **Calor extremo.** Las automáticas sufren estrés rápido. Si están afuera, proveer sombra parcial. Si están indoor, luces de noche.")
+            elif t < 5:
+                st.error("❄️ **Riesgo de helada.** Las autos no tienen tiempo de recuperarse. Proteger urgente: entrar o cubrir.")
+            elif t < 12:
+                st.info("🧊 **Fresco.** Reducir riego al mínimo. Las autos en exterior crecen lento con frío, cada día cuenta.")
+            else:
+                st.success("✅ **Clima favorable.** Buen día para las automáticas. Mantener rutina de riego y nutrición suave.")
+
+            if h > 80:
+                st.warning("💧 **Humedad alta.** Las autos son compactas y concentran humedad. Defoliar hojas interiores para ventilación.")
+            if v > 25:
+                st.warning(f"💨 **Viento fuerte ({v} km/h).** Las automáticas son pequeñas y frágiles. Proteger con cortaviento.")
+
+    cannabis_divider()
+    icon_subtitle("clima", "Sol y Fotoperíodo")
+    hoy_sol = datetime.date.today()
+    sol = sol_del_dia(user_lat, user_lon, hoy_sol)
+    s1, s2, s3, s4 = st.columns(4)
+    s1.metric("Amanecer", hora_local(sol["amanecer"]))
+    s2.metric("Atardecer", hora_local(sol["atardecer"]))
+    s3.metric("Horas de luz", f"{sol['duracion']:.1f} h", f"{sol['cambio_min']:+.1f} min vs ayer")
+    s4.metric("DLI máx. (despejado)", f"{sol['dli']:.0f} mol/m²")
+    if sistema not in SISTEMAS_INTERIOR:
+        if grupo_sistema(sistema) == "fotoperiodico":
+            disparo = disparo_floracion(user_lat, user_lon, hoy_sol)
+            if disparo and disparo <= hoy_sol:
+                st.info(f"🌗 **Días de menos de {FOTOPERIODO_CRITICO} h y acortándose:** el fotoperíodo ya induce la floración en plantas fotoperiódicas de exterior.")
+            elif disparo:
+                st.info(f"🌞 **Faltan {(disparo - hoy_sol).days} días** ({disparo.strftime('%d/%m')}) para que la luz baje de {FOTOPERIODO_CRITICO} h y arranque la floración natural de las fotoperiódicas.")
+        else:
+            st.caption("Las automáticas florecen por edad, no por fotoperíodo: la duración del día sólo influye en cuánta luz acumulan.")
+
+    cannabis_divider()
+    icon_subtitle("seedling", "Recomendaciones Diarias por Cultivo")
+    if not st.session_state.cultivos:
+        st.info("No tenés cultivos cargados en **Seguimiento de Cultivo**. Agregá al menos uno para ver recomendaciones personalizadas según el clima de hoy.")
+    else:
+        lluvia_hoy = daily['precipitation_probability_max'][0] if daily else 0
+        dias_l, sistemas_l, macetas_l = columnas_cultivos(st.session_state.cultivos)
+        lote = evaluar_cultivos(dias_l, sistemas_l, macetas_l, t, h, v, vpd, lluvia_hoy)
+        for idx_dash, cultivo_dash in enumerate(st.session_state.cultivos):
+            nombre_d = cultivo_dash["nombre"]
+            sistema_d = cultivo_dash["sistema"]
+            maceta_d = cultivo_dash.get("maceta_litros")
+            dias_d = int(dias_l[idx_dash])
+            progreso_d = float(lote["progreso"][idx_dash])
+            nombre_etapa_d = lote["nombre_etapa"][idx_dash]
+            info_mac = f" · {maceta_d}L" if maceta_d else ""
+
+            with st.expander(f"🌱 {nombre_etapa_d} · {sistema_d}{info_mac}", expanded=(idx_dash == 0)):
+                col_izq_d, col_der_d = st.columns([3, 1])
+                with col_izq_d:
+                    st.progress(progreso_d, text=f"{nombre_etapa_d} — {int(progreso_d*100)}%")
+                with col_der_d:
+                    ic_s = icon_html("seedling", 20)
+                    st.markdown(f'<div class="cultivo-info-right"><div class="cultivo-nombre">{ic_s} {nombre_d}</div><div class="cultivo-dia">Día {dias_d}</div></div>', unsafe_allow_html=True)
+
+                recs = []
+                if curr:
+                    recs = mensajes_lote(REGLAS_CLIMA, lote["clima"][idx_dash], {"t": t, "h": h, "v": v, "vpd": vpd, "maceta_litros": maceta_d})
+
+                if recs:
+                    for r in recs:
+                        st.markdown(f"- {r}")
+                else:
+                    st.info("Sin alertas especiales para hoy. Mantener rutina normal de cuidados.")
+
+    cannabis_divider()
+    icon_subtitle("clima", "Pronóstico Preventivo (3 Días)")
+    if daily:
+        cols = st.columns(3)
+        for i in range(3):
+            with cols[i]:
+                ic_cal = icon_html("calendario", 18)
+                ic_tmp = icon_html("temp", 18)
+                ic_lluv = icon_html("lluvia", 18)
+                st.markdown(f'''<div class="forecast-card">
+                    <div class="forecast-date">{ic_cal} {daily['time'][i]}</div>
+                    <div class="forecast-temp">{ic_tmp} {daily['temperature_2m_min'][i]}° / {daily['temperature_2m_max'][i]}°</div>
+                    <div class="forecast-rain">{ic_lluv} Lluvia: {daily['precipitation_probability_max'][i]}%</div>
+                </div>''', unsafe_allow_html=True)
+
+    cannabis_divider()
+    icon_subtitle("clima", "Radar Meteorológico en Vivo")
+    st.markdown(f"Radar de precipitación en tiempo real centrado en **{ciudad_actual}**.")
+    radar_url = f"https://embed.windy.com/embed.html?type=map&location=coordinates&metricRain=mm&metricTemp=°C&metricWind=km/h&zoom=8&overlay=radar&product=radar&level=surface&lat={user_lat}&lon={user_lon}&detailLat={user_lat}&detailLon={user_lon}&marker=true&message=true"
+    radar_windy_lazy(radar_url, 450)
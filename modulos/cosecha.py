@@ -0,0 +1,351 @@
+import datetime
+import streamlit as st
+from etapas import etapa_por_dias, grupo_sistema, SEMANAS_CICLO
+from meteo import fetch_weather
+from lote import columnas_cultivos
+from calendario import proyectar_calendario, cronograma, etapa_actual
+from ui import mostrar_tutorial, icon_html, icon_title, icon_subtitle, cannabis_banner, cannabis_divider, tabla_markdown
+
+# --- MÓDULO 4: COSECHA CRIOLLA ---
+@st.fragment
+def render(sistema, user_lat, user_lon, ciudad_actual):
+    cannabis_banner("cosecha")
+    mostrar_tutorial("Estimador de Cosecha")
+    icon_title("cosecha", "Estimación de Cosecha")
+    st.write("Identificación morfológica para semillas de origen incierto.")
+    
+    col_a, col_b = st.columns(2)
+    with col_a:
+        hoja = st.select_slider("Morfología de Hoja", options=["Índica", "Híbrida", "Sativa"])
+        inicio = st.date_input("Inicio de Floración")
+        
+        
+    with col_b:
+        semanas = {"Índica": 8, "Híbrida": 10, "Sativa": 13}[hoja]
+        cosecha = inicio + datetime.timedelta(weeks=semanas)
+        st.metric("Fecha de Corte Estimada", cosecha.strftime("%d-%m-%Y"))
+        st.info(f"Ciclo estimado: {semanas} semanas.")
+
+    cannabis_divider()
+    icon_subtitle("cosecha", "Guía de Cosecha para Tus Cultivos Activos")
+
+    if "cultivos" not in st.session_state or not st.session_state.cultivos:
+        st.info("No tenés cultivos cargados en Seguimiento de Cultivo. Agregá al menos uno para recibir recomendaciones de cosecha personalizadas.")
+    else:
+        curr_clima_cos, daily_cos = fetch_weather()
+        temp_cos = curr_clima_cos['temperature_2m'] if curr_clima_cos else 25
+        hum_cos = curr_clima_cos['relative_humidity_2m'] if curr_clima_cos else 50
+        mes_cos = datetime.date.today().month
+        daily_cos = daily_cos or {}
+        dias_l, sistemas_l, _ = columnas_cultivos(st.session_state.cultivos)
+        gdd_l = [c["gdd"] if c.get("gdd") is not None and c.get("gdd_hasta") else float("nan") for c in st.session_state.cultivos]
+        calendario = proyectar_calendario(dias_l, sistemas_l, user_lat, user_lon, daily_cos.get('temperature_2m_max'), daily_cos.get('temperature_2m_min'), gdd=gdd_l)
+        etapas_idx, _ = etapa_actual(calendario)
+
+        for idx_cos, cultivo_cos in enumerate(st.session_state.cultivos):
+            nombre_cos = cultivo_cos["nombre"]
+            inicio_cos = cultivo_cos["inicio"]
+            sistema_cos = cultivo_cos["sistema"]
+            maceta_cos = cultivo_cos.get("maceta_litros")
+            dias_cos = (datetime.date.today() - inicio_cos).days
+
+            total_semanas = SEMANAS_CICLO[grupo_sistema(sistema_cos)]
+            # La etapa es la de la tabla por días, como en Seguimiento, Clima y Riego; la del calendario se
+            # muestra aparte como "proyectada"
+            etapa_cos = etapa_por_dias(dias_cos, sistema_cos)["nombre"]
+            filas_cal = cronograma(calendario, idx_cos, sistema_cos)
+            etapa_proyectada = filas_cal[etapas_idx[idx_cos]][0]
+            _, fecha_cosecha_est, cosecha_temprana, cosecha_tardia = filas_cal[-1]
+            proyectada = fecha_cosecha_est is not None
+            if not proyectada:
+                fecha_cosecha_est = inicio_cos + datetime.timedelta(weeks=total_semanas)
+            ciclo_dias = max((fecha_cosecha_est - inicio_cos).days, 1)
+
+            dias_restantes = (fecha_cosecha_est - datetime.date.today()).days
+            progreso = min(max(dias_cos / ciclo_dias, 0), 1.0)
+            info_mac_cos = f" · Maceta: {maceta_cos}L" if maceta_cos else ""
+
+            with st.expander(f"✂️ {etapa_cos} · {sistema_cos}{info_mac_cos}", expanded=(idx_cos == 0)):
+                col_cos_izq, col_cos_der = st.columns([3, 1])
+                with col_cos_der:
+                    ic_co = icon_html("cosecha", 20)
+                    st.markdown(f'<div class="cultivo-info-right"><div class="cultivo-nombre">{ic_co} {nombre_cos}</div><div class="cultivo-dia">Día {dias_cos}</div></div>', unsafe_allow_html=True)
+                col_prog1, col_prog2 = st.columns([2, 1])
+                with col_prog1:
+                    st.progress(progreso, text=f"Progreso: {round(progreso * 100)}%")
+                with col_prog2:
+                    if dias_restantes > 0:
+                        st.metric("Días para cosecha proyectada" if proyectada else "Días para cosecha estimada", f"{dias_restantes} días")
+                    else:
+                        st.metric("Cosecha", "Lista para cortar")
+
+                rango_cos = ""
+                if cosecha_temprana and cosecha_tardia:
+                    rango_cos = f" (entre {cosecha_temprana.strftime('%d/%m')} y {cosecha_tardia.strftime('%d/%m/%Y')})"
+                if proyectada:
+                    st.caption(f"Fecha de cosecha proyectada: **{fecha_cosecha_est.strftime('%d/%m/%Y')}**{rango_cos} | Sistema: **{sistema_cos}**")
+                else:
+                    st.caption(f"Fecha de cosecha estimada: **{fecha_cosecha_est.strftime('%d/%m/%Y')}** (ciclo nominal de {total_semanas} semanas) | Sistema: **{sistema_cos}**")
+                if etapa_proyectada != etapa_cos:
+                    st.caption(f"Etapa proyectada por clima y fotoperíodo: **{etapa_proyectada}** (la guía sigue la etapa por días: {etapa_cos}).")
+                with st.popover("📅 Calendario proyectado"):
+                    tabla_markdown({
+                        "Etapa": [f[0] for f in filas_cal],
+                        "Inicio proyectado": [f[1].strftime('%d/%m/%Y') if f[1] else "—" for f in filas_cal],
+                        "Rango": [f"{f[2].strftime('%d/%m')} – {f[3].strftime('%d/%m')}" if f[2] and f[3] else "—" for f in filas_cal],
+                    })
+                    if cultivo_cos.get("gdd") is not None and "Interior" not in sistema_cos:
+                        st.caption(f"Anclado en {cultivo_cos['gdd']:.0f} °C·día acumulados desde el inicio (medidos hasta el {cultivo_cos['gdd_hasta'].strftime('%d/%m')}).")
+                    if calendario["fotoperiodo"][idx_cos]:
+                        st.caption("Ajustado por grados-día (pronóstico + clima normal de la zona) y por el acortamiento de los días en tu latitud, que dispara la floración.")
+                    elif "Interior" not in sistema_cos:
+                        st.caption("Ajustado por grados-día: pronóstico de los próximos días y clima normal de la zona.")
+
+                rendimiento_est = ""
+                senales_cosecha = ""
+                tricomas = ""
+                flush_guia = ""
+                corte_tecnica = ""
+                secado = ""
+                curado = ""
+                errores_cos = ""
+                clima_cosecha = ""
+
+                if etapa_cos in ["Germinación", "Plántula"]:
+                    st.info("Tu planta recién empieza. La cosecha está lejos todavía, pero podés ir preparándote.")
+                    senales_cosecha = "Aún no hay señales de cosecha. La planta necesita completar todo el ciclo vegetativo y de floración antes de pensar en cosechar."
+                    corte_tecnica = "No aplica todavía. Enfocate en que la planta desarrolle un buen sistema de raíces y estructura sana."
+                    if "Automáticas" in sistema_cos:
+                        rendimiento_est = "Automáticas: rendimiento estimado 30-100g por planta según genética, luz y nutrición."
+                    elif sistema_cos == "Interior Luz":
+                        rendimiento_est = "Indoor: rendimiento estimado 50-150g por planta con buena iluminación y manejo."
+                    elif "Maceta" in sistema_cos:
+                        if maceta_cos and maceta_cos <= 10:
+                            rendimiento_est = f"Maceta {maceta_cos}L exterior: rendimiento estimado 30-80g. Maceta chica limita el tamaño final."
+                        elif maceta_cos and maceta_cos <= 20:
+                            rendimiento_est = f"Maceta {maceta_cos}L exterior: rendimiento estimado 80-200g con buena nutrición."
+                        elif maceta_cos and maceta_cos > 20:
+                            rendimiento_est = f"Maceta {maceta_cos}L exterior: rendimiento estimado 150-400g. Buen volumen de sustrato."
+                        else:
+                            rendimiento_est = "Exterior maceta: rendimiento variable según tamaño de maceta, entre 50-300g."
+                    elif sistema_cos in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+                        rendimiento_est = "Tierra madre exterior: rendimiento estimado 200-1000g+ por planta. Sin límite de raíces, el potencial es enorme."
+
+                elif etapa_cos in ["Vegetativo Temprano", "Vegetativo", "Vegetativo Avanzado"]:
+                    st.info("Tu planta está en crecimiento vegetativo. La cosecha aún está lejos, pero hay cosas que podés hacer ahora para maximizarla.")
+                    senales_cosecha = "Todavía no. La planta debe completar la floración antes de cosechar. Si estás en exterior, la flora empieza naturalmente cuando los días se acortan (marzo en La Carlota)."
+                    corte_tecnica = "**Ahora es momento de técnicas de entrenamiento para mejorar el rendimiento futuro:**"
+                    if "Automáticas" in sistema_cos:
+                        corte_tecnica += "\n- LST (Low Stress Training): doblar ramas suavemente con alambre. No hacer topping a las autos."
+                        corte_tecnica += "\n- Defoliación mínima: solo hojas que bloqueen luz a sitios de cogollos."
+                        rendimiento_est = "Automáticas bien entrenadas: 50-120g por planta."
+                    elif sistema_cos == "Interior Luz":
+                        corte_tecnica += "\n- Topping: cortar la punta principal para generar 2 ramas líderes. Hacer en 4to-5to nudo."
+                        corte_tecnica += "\n- SCROG (Screen of Green): red horizontal para distribuir ramas parejas bajo la luz."
+                        corte_tecnica += "\n- Lollipopping: limpiar ramas bajas que no reciben luz."
+                        rendimiento_est = "Indoor bien manejado: 80-200g por planta."
+                    elif "Maceta" in sistema_cos:
+                        corte_tecnica += "\n- Topping: cortar la punta para ramificar. Ideal en 5to-6to nudo."
+                        corte_tecnica += "\n- LST: amarrar ramas para abrir la planta al sol."
+                        corte_tecnica += "\n- Poda de bajos: limpiar las ramas inferiores que no reciben sol directo."
+                        if maceta_cos and maceta_cos <= 10:
+                            rendimiento_est = f"Maceta {maceta_cos}L: 40-100g estimados. Considerar trasplante a maceta más grande si aún hay tiempo."
+                        elif maceta_cos and maceta_cos <= 20:
+                            rendimiento_est = f"Maceta {maceta_cos}L: 100-250g estimados con buen manejo."
+                        else:
+                            rendimiento_est = f"Maceta {maceta_cos}L: 200-500g estimados. Excelente volumen de sustrato."
+                    elif sistema_cos in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+                        corte_tecnica += "\n- Topping múltiple: se puede hacer 2-3 veces en tierra madre para generar un arbusto grande."
+                        corte_tecnica += "\n- Tutores: ir preparando la estructura de soporte, la planta va a crecer mucho."
+                        corte_tecnica += "\n- Poda selectiva: ir limpiando ramas interiores sin luz para concentrar energía."
+                        rendimiento_est = "Tierra madre: 300-1500g+ por planta. El potencial es enorme con buena nutrición."
+
+                elif etapa_cos in ["Pre-Floración", "Cambio a Floración (12/12)"]:
+                    senales_cosecha = "La planta muestra los primeros pistilos (pelitos blancos). No es momento de cosechar, pero empieza la cuenta regresiva. Desde los primeros pistilos, faltan 8-12 semanas para la cosecha según genética."
+                    tricomas = "Todavía no se observan tricomas maduros. Los pistilos blancos indican inicio de floración. No revisar tricomas todavía, es muy pronto."
+                    corte_tecnica = "**Último momento para entrenar:**\n- Defoliación estratégica: quitar hojas grandes que tapen sitios de cogollos.\n- Lollipopping: limpiar el tercio inferior de la planta.\n- Colocar tutores o malla de soporte para los cogollos que vienen."
+                    flush_guia = "No hacer flush ahora. La planta necesita nutrición completa para formar flores. Flush se hace 1-2 semanas antes del corte."
+                    if "Automáticas" in sistema_cos:
+                        senales_cosecha = "Las autos entran en flora solas. Si ves pistilos, faltan aproximadamente 5-7 semanas para la cosecha."
+                        rendimiento_est = "Automáticas en pre-flora: el rendimiento ya se puede estimar mejor. Si la planta es robusta con muchos sitios de cogollos: 60-120g. Si es flaca: 20-50g."
+                    elif sistema_cos in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+                        rendimiento_est = "La planta en tierra madre debería ser grande a esta altura. Estimación: 300-1000g+ según tamaño y ramificación."
+                    errores_cos = "No podar ramas principales en esta etapa. No estresar la planta con cambios bruscos. El estrés puede causar hermafroditismo (bananas/nanners)."
+
+                elif etapa_cos in ["Floración Temprana", "Floración"]:
+                    senales_cosecha = "Los cogollos empiezan a formarse y engordar. Pistilos blancos abundantes. **No cosechar todavía**, la planta recién está empezando a producir resina y cannabinoides."
+                    tricomas = "Empiezan a aparecer tricomas (cristales) visibles a simple vista. Con lupa 60x se ven transparentes/cristalinos = aún inmaduros. Falta mucho para el punto de cosecha."
+                    flush_guia = "No hacer flush. Mantener nutrición de floración (P y K altos). La planta necesita toda la energía para engordar cogollos."
+                    corte_tecnica = "No podar nada. Solo quitar hojas amarillas o muertas que puedan generar moho. No defoliar en exceso durante la flora."
+                    errores_cos = "NUNCA mojar los cogollos. Si llueve, sacudir las ramas suavemente. Inspeccionar el interior de cogollos densos buscando moho."
+                    if "Automáticas" in sistema_cos:
+                        rendimiento_est = "El rendimiento se define ahora. Cogollos densos y blancos de pistilos = buen camino. Estimación: 40-120g según genética y manejo."
+                    elif sistema_cos == "Interior Luz":
+                        rendimiento_est = "Revisá la distancia de la luz: los cogollos superiores deben estar a 30-40cm del panel. Si están más lejos, acercar para engordar."
+                    elif "Maceta" in sistema_cos:
+                        if maceta_cos and maceta_cos <= 10:
+                            errores_cos += f" Maceta {maceta_cos}L: la planta puede estar limitada en raíces. Si los cogollos no engordan, puede ser falta de espacio."
+                        rendimiento_est = "Exterior maceta en floración: los cogollos empiezan a engordar. Usar tutores si las ramas se doblan por el peso."
+                    elif sistema_cos in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+                        rendimiento_est = "Tierra madre en floración: cogollos pueden ser muy grandes y pesados. Tutores y malla de soporte son fundamentales."
+                    clima_cosecha = "En La Carlota, la floración exterior suele caer en otoño (marzo-mayo). Vigilar el rocío nocturno que aumenta el riesgo de botrytis (moho gris)."
+
+                elif etapa_cos == "Floración Media":
+                    senales_cosecha = "Cogollos engordando fuerte. Pistilos empiezan a cambiar de blanco a naranja/marrón (30-50%). Olor intenso. **Todavía no es momento de cortar.** Faltan 2-4 semanas."
+                    tricomas = """**Empezá a revisar tricomas con lupa 60x o microscopio de celular:**
+- Transparentes/cristalinos = inmaduros, falta.
+- Lechosos/blancos opacos = THC alto, efecto más cerebral y energético.
+- Ámbar/dorados = CBD sube, efecto más corporal y relajante.
+**Punto ideal para la mayoría: 70-80% lechosos + 20-30% ámbar.**"""
+                    flush_guia = "**Preparar el flush:** Si estimás que faltan 2 semanas para cortar, empezar flush ahora. Solo agua limpia, sin nutrientes. Esto limpia sales del sustrato y mejora el sabor final del producto."
+                    corte_tecnica = "Preparar el espacio de secado: lugar oscuro, ventilado, 18-22°C, 55-65% humedad. Limpiar las tijeras de poda con alcohol. Preparar cuerdas o malla para colgar ramas."
+                    secado = "Tener listo el espacio antes de cortar. Necesitás oscuridad total, buena circulación de aire (ventilador indirecto, nunca apuntando directo a las plantas), y temperatura/humedad controlada."
+                    errores_cos = "No cosechar con pistilos todavía blancos (inmaduros). No cosechar solo por los días: siempre revisar tricomas. Cada genética madura diferente."
+                    if "Automáticas" in sistema_cos:
+                        flush_guia = "Autos: flush más corto, 5-7 días. Las autos maduran rápido, no extender demasiado el flush."
+                    if sistema_cos in ["Exterior Maceta", "Exterior Tierra Madre", "Invernadero Maceta", "Invernadero Tierra"]:
+                        clima_cosecha = "**Otoño en La Carlota:** Las lluvias de abril-mayo son el mayor riesgo. Si se anuncian lluvias sobre cogollos maduros, considerar cosechar antes aunque falte un poco. Mejor cortar levemente antes que perder todo por moho."
+
+                elif etapa_cos == "Floración Tardía / Maduración":
+                    senales_cosecha = """**La cosecha está cerca. Señales clave:**
+- 70-90% de pistilos cambiaron a naranja/marrón.
+- Cogollos firmes y densos al tacto.
+- Olor muy intenso y definido.
+- Las hojas grandes (abanico) empiezan a amarillear naturalmente.
+- Tricomas: la señal definitiva (ver abajo)."""
+                    tricomas = """**Revisá tricomas TODOS LOS DÍAS con lupa 60x:**
+- **Mayoría transparentes:** NO CORTAR. Falta.
+- **Mayoría lechosos (70-80%) + pocos ámbar (10-20%):** Efecto más cerebral, energético, eufórico. Buena ventana para cortar.
+- **50% lechosos + 50% ámbar:** Efecto balanceado, cerebral + corporal. Punto medio ideal para uso medicinal.
+- **Mayoría ámbar (60%+):** Efecto muy corporal, sedante, couchlock. Ideal para insomnio y dolor crónico.
+**Elegí el punto de corte según el efecto que buscás.**"""
+                    flush_guia = "Deberías estar en flush (solo agua) hace al menos una semana. Si no empezaste, hacelo ya. Las hojas amarilleando = normal y deseado. La planta consume sus reservas."
+                    corte_tecnica = """**Preparación para el corte:**
+1. Elegir el día: mañana fresca, antes de que pegue el sol. Los terpenos están más concentrados temprano.
+2. Dejar de regar 1-2 días antes del corte para que el sustrato esté seco.
+3. Oscuridad 24-48 hs antes del corte (opcional pero mejora la resina). Algunas técnicas sugieren dejar en oscuridad total 2 días antes.
+4. Cortar rama por rama o la planta entera según preferencia.
+5. Manicurado: en húmedo (cortar hojitas al momento del corte) o en seco (colgar con hojas y manicurar después del secado)."""
+                    secado = """**Secado correcto (fase más importante):**
+- Colgar ramas boca abajo en un espacio **oscuro y ventilado**.
+- Temperatura ideal: **18-22°C**. Nunca superar 25°C (se degradan terpenos y cannabinoides).
+- Humedad ideal: **55-65%**. Muy seca = secado rápido y áspero. Muy húmeda = moho.
+- Circulación de aire suave (ventilador indirecto, NO apuntando a las ramas).
+- Duración: **7-14 días** hasta que los tallos finos se quiebren al doblarlos (no se doblen).
+- **NO usar ventilador directo, microondas, horno ni secadora.** Arruinan la calidad."""
+                    curado = """**Curado (la diferencia entre porro bueno y excelente):**
+- Después del secado, poner los cogollos en frascos de vidrio herméticos (tipo Mason o mermelada).
+- Llenar el frasco al 70-75% (dejar espacio de aire).
+- Primeras 2 semanas: abrir los frascos 2-3 veces por día por 10-15 minutos ("eructar" los frascos).
+- Semanas 3-4: abrir 1 vez por día.
+- Después del primer mes: abrir 1 vez por semana.
+- Duración ideal: **mínimo 2 semanas, óptimo 1-3 meses**. A mayor curado, mejor sabor y suavidad.
+- Si olés a amoníaco al abrir: hay humedad de más. Sacar cogollos del frasco y airear unas horas.
+- Guardar frascos en lugar **oscuro y fresco** (no en la heladera)."""
+                    errores_cos = "No apurarse. Mejor esperar 2-3 días de más que cortar antes de tiempo. Cogollos inmaduros = efecto débil y sabor verde. No secar rápido con calor. No usar bolsas de plástico para curar."
+                    if "Automáticas" in sistema_cos:
+                        corte_tecnica += "\n\n**Autos:** Pueden madurar desparejo (cogollos superiores antes que inferiores). Podés hacer cosecha escalonada: cortar los de arriba primero y dejar madurar los de abajo 5-7 días más."
+                    elif "Maceta" in sistema_cos:
+                        if maceta_cos and maceta_cos <= 10:
+                            rendimiento_est = f"Maceta {maceta_cos}L: rendimiento estimado 30-80g secos. La maceta chica limitó el potencial."
+                        elif maceta_cos and maceta_cos <= 20:
+                            rendimiento_est = f"Maceta {maceta_cos}L: rendimiento estimado 80-200g secos."
+                        else:
+                            rendimiento_est = f"Maceta {maceta_cos}L: rendimiento estimado 150-400g secos."
+                    elif sistema_cos in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+                        rendimiento_est = "Tierra madre: rendimiento estimado 200-1000g+ secos según tamaño de la planta."
+                        clima_cosecha = "**La Carlota otoño:** Si las lluvias amenazan cogollos maduros, NO dudar en cortar. Un temporal puede causar botrytis en horas y perder toda la cosecha."
+                    elif sistema_cos == "Interior Luz":
+                        rendimiento_est = "Indoor: rendimiento estimado 50-200g secos por planta según iluminación y manejo."
+
+                elif etapa_cos == "Flush y Cosecha":
+                    senales_cosecha = """**¡Es hora de cosechar!** Confirmá estos indicadores finales:
+- Pistilos: 80-90%+ naranjas/marrones.
+- Tricomas: según tu preferencia de efecto (ver guía arriba).
+- Hojas abanico: amarillas y cayendo naturalmente.
+- Cogollos: firmes, pesados, aromáticos.
+- Si todo coincide: **cortá mañana temprano, antes de que salga el sol.**"""
+                    tricomas = """**Último chequeo de tricomas:**
+- Lechosos + pocos ámbar = efecto cerebral, creativo, energético.
+- Mitad lechosos + mitad ámbar = balanceado, versátil.
+- Mayoría ámbar = corporal, sedante, medicinal para dolor/insomnio.
+**Una vez decidido, no esperes más.** Los tricomas se degradan si pasás el punto."""
+                    corte_tecnica = """**Paso a paso del corte:**
+1. No regar 1-2 días antes.
+2. Cortar a primera hora de la mañana, antes del sol.
+3. Cortar ramas individuales o la planta entera por la base.
+4. **Manicurado húmedo** (recomendado para La Carlota por la humedad): recortar las hojas con resina (sugar leaves) al momento del corte con tijeras afiladas. Guardar los recortes para hacer manteca o extracciones.
+5. Colgar ramas boca abajo con hilo o gancho.
+6. Si la humedad ambiente es alta (>65%), usar deshumidificador o ventilación extra."""
+                    secado = """**Protocolo de secado para La Carlota:**
+- La Carlota tiene humedad variable: en otoño puede ser alta. Tener ventilación y controlar con higrómetro.
+- Lugar: pieza interior oscura, NO al aire libre (polvo, insectos, lluvia).
+- Temperatura: 18-22°C (en otoño suele estar bien naturalmente).
+- Humedad: 55-65%. Si sube de 70%, usar deshumidificador o ventilador extra.
+- Duración: 7-14 días. Los tallos finos deben quebrarse (no doblarse) al finalizar.
+- Inspeccionar diariamente buscando moho, especialmente en cogollos densos."""
+                    curado = """**Curado final:**
+- Frascos de vidrio al 70-75% de capacidad.
+- Semanas 1-2: abrir 2-3 veces/día, 10-15 min cada vez.
+- Semanas 3-4: abrir 1 vez/día.
+- Mes 2 en adelante: abrir 1 vez/semana.
+- Curado mínimo 2 semanas, ideal 1-3 meses. Más tiempo = mejor sabor.
+- Guardar en oscuridad y fresco (20°C). No heladera. No freezer.
+- Los cogollos bien curados pueden guardarse 6-12 meses sin perder calidad."""
+                    errores_cos = "No secar con calor (horno, microondas, secador). No usar bolsas plásticas. No apretar los cogollos en el frasco. Si olés amoníaco = sacar y airear. Si ves moho = descartar esa parte."
+                    if "Automáticas" in sistema_cos:
+                        corte_tecnica += "\n\n**Cosecha escalonada de autos:** Los cogollos superiores maduran antes. Cortá los de arriba, bajá la luz para los de abajo, y esperá 5-7 días más."
+                    if sistema_cos in ["Exterior Maceta", "Exterior Tierra Madre", "Invernadero Maceta", "Invernadero Tierra"]:
+                        clima_cosecha = "**Atención:** Si se pronostican lluvias, no esperar. Cosechar antes de la lluvia. Un chaparrón sobre cogollos maduros es la receta del desastre (moho gris/botrytis). Mejor unos días antes que perder todo."
+
+                tab_cos1, tab_cos2, tab_cos3, tab_cos4, tab_cos5, tab_cos6 = st.tabs([
+                    "Señales de Cosecha", "Tricomas", "Rendimiento", "Flush & Corte", "Secado", "Curado"
+                ])
+
+                with tab_cos1:
+                    st.markdown("#### ¿Cuándo Cosechar?")
+                    st.markdown(senales_cosecha if senales_cosecha else "Revisá las señales según la etapa de tu planta.")
+                    if errores_cos:
+                        st.error(f"**Errores a evitar:** {errores_cos}")
+
+                with tab_cos2:
+                    st.markdown("#### Lectura de Tricomas")
+                    st.markdown(tricomas if tricomas else "Los tricomas se revisan en las últimas semanas de floración con lupa 60x o microscopio de celular.")
+                    if etapa_cos not in ["Germinación", "Plántula", "Vegetativo Temprano", "Vegetativo", "Vegetativo Avanzado"]:
+                        st.info("**Tip:** Los microscopios para celular se consiguen baratos en Mercado Libre (buscar 'microscopio celular 60x'). Es la mejor inversión para saber cuándo cortar.")
+
+                with tab_cos3:
+                    st.markdown("#### Rendimiento Estimado")
+                    st.markdown(rendimiento_est if rendimiento_est else "El rendimiento depende del sistema, genética, nutrición y manejo general.")
+                    if "Maceta" in sistema_cos and maceta_cos:
+                        st.info(f"**Nota sobre maceta {maceta_cos}L:** El tamaño de la maceta es el factor más limitante en exterior. Más litros = más raíces = más producción.")
+                    elif sistema_cos in ["Exterior Tierra Madre", "Invernadero Tierra"]:
+                        st.info("**Tierra madre** no tiene límite de raíces. Con buena nutrición y sol, una planta puede dar 500g-1.5kg+ en seco.")
+
+                with tab_cos4:
+                    st.markdown("#### Flush y Técnica de Corte")
+                    if flush_guia:
+                        st.markdown("**Flush (lavado de raíces):**")
+                        st.markdown(flush_guia)
+                    st.markdown("**Corte y Preparación:**")
+                    st.markdown(corte_tecnica if corte_tecnica else "Las técnicas de corte se aplican en las etapas finales de la planta.")
+
+                with tab_cos5:
+                    st.markdown("#### Secado")
+                    st.markdown(secado if secado else "El secado se planifica cuando la cosecha está cerca. Preparar un espacio oscuro, ventilado, 18-22°C y 55-65% humedad.")
+                    if etapa_cos in ["Floración Tardía / Maduración", "Flush y Cosecha"]:
+                        st.warning("**Recordatorio:** El secado rápido arruina meses de trabajo. Paciencia. 7-14 días mínimo. No usar calor artificial.")
+
+                with tab_cos6:
+                    st.markdown("#### Curado")
+                    st.markdown(curado if curado else "El curado es el paso final que mejora drásticamente el sabor y la suavidad. Se realiza después del secado en frascos de vidrio.")
+                    if etapa_cos in ["Floración Tardía / Maduración", "Flush y Cosecha"]:
+                        st.success("**Consejo:** Los frascos de vidrio tipo Mason o de mermelada son ideales. Se consiguen en ferreterías y bazares de La Carlota. Comprar suficientes antes de cosechar.")
+
+                if clima_cosecha:
+                    st.warning(f"🌦️ **Alerta Clima La Carlota:** {clima_cosecha}")
+
+                if temp_cos > 28 and etapa_cos in ["Floración Tardía / Maduración", "Flush y Cosecha"]:
+                    st.warning(f"🌡️ **Calor actual ({temp_cos}°C):** El calor excesivo degrada tricomas y terpenos. Si podés, cosechá a primera hora de la mañana cuando hace más fresco. Para el secado, buscar el lugar más fresco de la casa.")
+                if hum_cos > 65 and etapa_cos in ["Floración Tardía / Maduración", "Flush y Cosecha", "Floración Media"]:
+                    st.error(f"💧 **Humedad alta ({hum_cos}%):** Riesgo de moho elevado. En exterior, inspeccionar cogollos densos por dentro. En secado, usar deshumidificador o ventilación extra. No dejar cogollos sin supervisión.")
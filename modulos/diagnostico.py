@@ -0,0 +1,109 @@
+import datetime
+import streamlit as st
+from datos.plagas import PLAGAS_COMUNES
+from datos.diagnosticos import ZONAS, SINTOMAS
+from diagnosticos import buscar_diagnostico
+from diferencial import diagnostico_diferencial
+from consejos import SISTEMAS_EXTERIOR
+from meteo import fetch_weather
+from ui import mostrar_tutorial, icon_title, icon_subtitle, cannabis_banner, cannabis_divider, cannabis_divider_mini, tabla_markdown
+
+@st.cache_data(ttl=1800)
+def _clima_actual(lat, lon):
+    return fetch_weather(lat, lon)
+
+def _render_diferencial(sistema, user_lat, user_lon):
+    st.caption("Marcá todo lo que ves en cada zona; el ranking se actualiza con cada síntoma.")
+    observaciones = []
+    cols = st.columns(len(ZONAS))
+    for col, zona in zip(cols, ZONAS):
+        with col:
+            for sintoma in st.multiselect(zona, SINTOMAS, key=f"dif_{zona}"):
+                observaciones.append((zona, sintoma))
+
+    cannabis_divider_mini()
+
+    if not observaciones:
+        st.info("Seleccioná al menos un síntoma para ver las causas más probables.")
+        return
+
+    exterior = sistema in SISTEMAS_EXTERIOR
+    t = h = lluvia_prob = None
+    if exterior:
+        curr_w, daily_w = _clima_actual(user_lat, user_lon)
+        if curr_w:
+            t = curr_w.get('temperature_2m')
+            h = curr_w.get('relative_humidity_2m')
+        if daily_w:
+            lluvia_prob = daily_w.get('precipitation_probability_max', [None])[0]
+
+    ranking = diagnostico_diferencial(observaciones, datetime.date.today().month, exterior, t, h, lluvia_prob)
+    if not ranking:
+        st.info("Sin coincidencias: ninguna causa cargada explica esos síntomas. Probá quitando alguno o consultá la guía de plagas más abajo.")
+        return
+    icon_subtitle("diagnostico", "Causas más probables")
+    if exterior and t is not None:
+        st.caption(f"Ajustado por temporada y clima actual: {t}°C, {h}% de humedad.")
+    for candidato in ranking:
+        confianza = candidato["confianza"]
+        st.progress(confianza, text=f"**{candidato['nombre']}** ({candidato['tipo']}) — {round(confianza * 100)}%")
+        with st.expander("Por qué y qué hacer"):
+            st.markdown("Explica: " + ", ".join(f"{s} ({z})" for z, s in candidato["explica"]))
+            registro = buscar_diagnostico(*candidato["referencia"], sistema)
+            st.markdown(registro["remedio_casero"])
+            if registro["remedio_sistema"]:
+                st.info(registro["remedio_sistema"])
+
+# --- MÓDULO 3: DIAGNÓSTICO & PLAGAS ---
+@st.fragment
+def render(sistema, user_lat, user_lon, ciudad_actual):
+    cannabis_banner("diagnostico")
+    mostrar_tutorial("Diagnóstico & Plagas")
+    icon_title("diagnostico", "Salud Vegetal y Prevención")
+    
+    mes = datetime.date.today().month
+    if mes in [12, 1, 2]: st.error("⚠️ Temporada de Orugas y Arañuela en Córdoba.")
+    elif mes in [3, 4, 5]: st.warning("⚠️ Riesgo de Oídio y Botrytis por rocío nocturno.")
+    elif mes in [6, 7, 8]: st.info("🧊 Invierno: menor presión de plagas, pero vigilar hongos por humedad.")
+    elif mes in [9, 10, 11]: st.warning("🌱 Primavera: pulgones y trips aparecen con el calor. Prevención temprana.")
+
+    cannabis_divider()
+
+    modo = st.radio("Modo de diagnóstico", ["Un síntoma", "Varios síntomas (diferencial)"], horizontal=True)
+
+    if modo == "Un síntoma":
+        zona = st.radio("¿Zona afectada?", ZONAS)
+        sintoma = st.selectbox("Síntoma", SINTOMAS)
+
+        cannabis_divider_mini()
+
+        registro = buscar_diagnostico(zona, sintoma, sistema)
+
+        if not registro:
+            st.info("Seleccioná la zona afectada y el síntoma para obtener un diagnóstico detallado con remedios caseros y consejos para tu sistema de cultivo.")
+        else:
+            icon_subtitle("diagnostico", "Diagnóstico")
+            st.error(registro["diagnostico"])
+
+            col_rem1, col_rem2 = st.columns(2)
+            with col_rem1:
+                icon_subtitle("remedios", "Remedios Caseros y Naturales")
+                st.markdown(registro["remedio_casero"])
+
+            with col_rem2:
+                icon_subtitle("asesoramiento", f"Consejo para: {sistema}")
+                st.info(registro["remedio_sistema"])
+                if "Invernadero" in sistema:
+                    st.success("🏡 **Nota Invernadero:** Estás protegido del viento y lluvia directa. Controlar ventilación interna para evitar acumulación de humedad. Abrir ventanas laterales durante el día.")
+
+            cannabis_divider_mini()
+            icon_subtitle("diagnostico", "Video Tutoriales")
+            st.markdown(f"Encontrá tutoriales en video sobre este problema:")
+            st.markdown(f"[Ver videos sobre este diagnóstico en YouTube]({registro['video_url']})")
+
+    else:
+        _render_diferencial(sistema, user_lat, user_lon)
+
+    cannabis_divider()
+    icon_subtitle("diagnostico", "Guía Rápida de Plagas Comunes en La Carlota")
+    tabla_markdown(PLAGAS_COMUNES)
@@ -0,0 +1,291 @@
+import datetime
+import html
+import re
+import requests
+import streamlit as st
+from datos.legal import LIMITES_LEGALES
+from ui import mostrar_tutorial, icon_title, icon_subtitle, cannabis_banner, cannabis_divider, cannabis_divider_mini, tabla_markdown
+
+@st.cache_data(ttl=3600*6)
+def obtener_novedades_cannabis():
+    queries = [
+        "cannabis+argentina+ley+REPROCANN",
+        "cannabis+medicinal+argentina+legislación",
+        "cannabis+argentina+regulación+2025+2026"
+    ]
+    import xml.etree.ElementTree as ET
+    noticias = []
+    seen_titles = set()
+    for q in queries:
+        try:
+            url = f"https://news.google.com/rss/search?q={q}&hl=es-419&gl=AR&ceid=AR:es-419"
+            resp = requests.get(url, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
+            if resp.status_code == 200:
+                root = ET.fromstring(resp.content)
+                for item in root.findall(".//item"):
+                    title_el = item.find("title")
+                    link_el = item.find("link")
+                    pubdate_el = item.find("pubDate")
+                    source_el = item.find("source")
+                    if title_el is not None and link_el is not None:
+                        titulo = html.unescape(title_el.text or "")
+                        titulo_clean = re.sub(r'\s*-\s*[^-]+$', '', titulo).strip()
+                        if titulo_clean in seen_titles:
+                            continue
+                        seen_titles.add(titulo_clean)
+                        fuente = source_el.text if source_el is not None else ""
+                        fecha_str = pubdate_el.text if pubdate_el is not None else ""
+                        fecha_display = ""
+                        if fecha_str:
+                            try:
+                                from email.utils import parsedate_to_datetime
+                                fecha_dt = parsedate_to_datetime(fecha_str)
+                                fecha_display = fecha_dt.strftime("%d/%m/%Y")
+                            except Exception:
+                                fecha_display = fecha_str[:16]
+                        noticias.append({
+                            "titulo": titulo,
+                            "link": link_el.text or "",
+                            "fecha": fecha_display,
+                            "fuente": fuente
+                        })
+        except Exception:
+            continue
+    noticias_unicas = []
+    seen_final = set()
+    for n in noticias:
+        key = n["titulo"][:60]
+        if key not in seen_final:
+            seen_final.add(key)
+            noticias_unicas.append(n)
+    noticias_unicas.sort(key=lambda x: x["fecha"], reverse=True)
+    return noticias_unicas[:20]
+
+# --- MÓDULO 5: LEGAL ---
+@st.fragment
+def render(sistema, user_lat, user_lon, ciudad_actual):
+    cannabis_banner("legal")
+    mostrar_tutorial("Sugerencias Legales")
+    icon_title("legal", "REPROCANN & Normativa")
+
+    tab_novedades, tab_info, tab_requisitos, tab_tramite, tab_limites, tab_derechos = st.tabs([
+        "📰 Novedades Legales", "Información General", "Requisitos", "Cómo Tramitar", "Límites Legales", "Derechos y Consejos"
+    ])
+
+    with tab_novedades:
+        icon_subtitle("legal", "Novedades sobre Legislación Cannábica en Argentina")
+        st.caption("Se actualiza automáticamente cada 6 horas buscando noticias recientes sobre leyes, REPROCANN y regulación del cannabis en Argentina.")
+
+        noticias = obtener_novedades_cannabis()
+
+        if noticias:
+            st.success(f"Se encontraron **{len(noticias)}** noticias recientes. Última actualización: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M')}")
+            for i, noticia in enumerate(noticias):
+                fecha_txt = noticia['fecha'] if noticia['fecha'] else ""
+                fuente_txt = noticia['fuente'] if noticia['fuente'] else ""
+                meta_parts = []
+                if fecha_txt:
+                    meta_parts.append(f"📅 {fecha_txt}")
+                if fuente_txt:
+                    meta_parts.append(f"📰 {fuente_txt}")
+                meta_str = " · ".join(meta_parts)
+                st.markdown(f'''<div class="news-card">
+                    <div class="news-title"><a href="{noticia['link']}" target="_blank">{noticia['titulo']}</a></div>
+                    <div class="news-meta">{meta_str}</div>
+                </div>''', unsafe_allow_html=True)
+        else:
+            st.info("No se encontraron noticias recientes. Esto puede deberse a una conexión limitada. Reintentá más tarde.")
+
+        cannabis_divider_mini()
+        st.markdown("#### 🔗 Fuentes Oficiales para Consultar")
+        st.markdown("""
+        - **REPROCANN:** [reprocann.salud.gob.ar](https://reprocann.salud.gob.ar)
+        - **Boletín Oficial:** [boletinoficial.gob.ar](https://www.boletinoficial.gob.ar) — Donde se publican las leyes y decretos.
+        - **InfoLEG:** [infoleg.gob.ar](http://www.infoleg.gob.ar) — Base de datos de legislación argentina.
+        - **Ley 27.350:** [Texto completo en InfoLEG](http://servicios.infoleg.gob.ar/infolegInternet/anexos/270000-274999/273801/norma.htm)
+        - **Decreto 883/2020:** Reglamentación de la Ley 27.350 que creó el REPROCANN.
+        - **ANMAT:** [argentina.gob.ar/anmat](https://www.argentina.gob.ar/anmat) — Regulación de productos de cannabis.
+        """)
+
+    with tab_info:
+        icon_subtitle("legal", "¿Qué es el REPROCANN?")
+        st.markdown("""
+        El **REPROCANN** (Registro del Programa de Cannabis) es el registro nacional del Ministerio de Salud de Argentina
+        que autoriza a pacientes, familiares y cultivadores solidarios a cultivar cannabis con fines medicinales y/o terapéuticos.
+
+        Fue creado por el **Decreto 883/2020** que reglamenta la **Ley 27.350** (Ley de Cannabis Medicinal).
+
+        **¿Para qué sirve?**
+        - Autoriza legalmente el cultivo de cannabis para uso medicinal/terapéutico.
+        - Permite la tenencia de plantas, semillas y derivados (aceites, cremas, tinturas).
+        - Brinda un marco legal que protege al cultivador inscripto ante las fuerzas de seguridad.
+        """)
+
+        st.info("El REPROCANN no autoriza la venta ni la comercialización de cannabis ni sus derivados.")
+
+    with tab_requisitos:
+        icon_subtitle("legal", "Requisitos para Inscribirse")
+
+        st.markdown("#### Documentación Necesaria")
+        st.markdown("""
+        1. **DNI argentino** vigente (frente y dorso escaneado o foto clara).
+        2. **Indicación médica** firmada por un/a profesional de la salud (médico/a matriculado/a).
+           - Debe especificar que el paciente requiere tratamiento con cannabis.
+           - No hace falta que sea especialista: cualquier médico/a con matrícula nacional puede indicarlo.
+        3. **CUIL** del solicitante.
+        4. **Correo electrónico** activo para recibir notificaciones.
+        5. **Foto carnet** actualizada del solicitante.
+        6. **Domicilio de cultivo** (dirección donde se cultivará, en La Carlota, Córdoba).
+        """)
+
+        st.markdown("#### ¿Quiénes pueden inscribirse?")
+        st.markdown("""
+        - **Paciente cultivador/a:** La persona que necesita el tratamiento cultiva para sí misma.
+        - **Familiar cultivador/a:** Un familiar directo cultiva para el/la paciente (padre, madre, hijo/a, hermano/a, cónyuge).
+        - **Cultivador/a solidario/a:** Una persona registrada cultiva para hasta 5 pacientes que no pueden cultivar por sí mismos.
+        - **ONG o Asociación Civil:** Organizaciones registradas que cultivan para sus asociados.
+        """)
+
+        st.warning("El/la médico/a que firma la indicación NO necesita estar especializado en cannabis. Cualquier médico/a con matrícula puede hacerlo.")
+
+    with tab_tramite:
+        icon_subtitle("legal", "Paso a Paso para Obtener el Certificado")
+
+        st.markdown("""
+        #### Paso 1: Conseguir la Indicación Médica
+        - Consultá con tu médico/a de confianza (clínico, generalista, o cualquier especialidad).
+        - Pedile que te haga una **indicación médica** para tratamiento con cannabis.
+        - La indicación debe incluir: nombre del paciente, diagnóstico o condición, firma y sello del médico/a, y matrícula.
+        - **En La Carlota:** Podés consultar en el Hospital Regional o con médicos/as particulares de la zona.
+
+        #### Paso 2: Registrarse en la Plataforma
+        - Ingresá a la web oficial del REPROCANN: **https://reprocann.salud.gob.ar**
+        - Creá una cuenta con tu correo electrónico y una contraseña.
+        - Completá tus datos personales (nombre, DNI, CUIL, domicilio).
+
+        #### Paso 3: Cargar la Documentación
+        - Subí la foto/escaneo de tu DNI (frente y dorso).
+        - Subí la indicación médica firmada (foto clara o PDF).
+        - Subí tu foto carnet actualizada.
+        - Indicá el domicilio donde vas a cultivar.
+        - Elegí la modalidad: paciente, familiar o cultivador solidario.
+
+        #### Paso 4: Esperar la Aprobación
+        - El Ministerio de Salud revisa la solicitud.
+        - **Plazo estimado:** entre 15 y 90 días hábiles (puede variar).
+        - Recibís la respuesta por correo electrónico.
+        - Si es aprobada, podés descargar tu **certificado REPROCANN** desde la plataforma.
+
+        #### Paso 5: Descargar e Imprimir el Certificado
+        - Descargá el certificado en PDF desde la plataforma.
+        - Imprimí una copia y guardá otra digital en tu celular.
+        - El certificado tiene **vigencia de 1 año** y debe renovarse.
+        """)
+
+        st.success("El trámite es **100% gratuito** y se realiza de forma online.")
+
+        st.markdown("#### Renovación")
+        st.markdown("""
+        - El certificado vence al año de su emisión.
+        - Para renovar, necesitás una **nueva indicación médica** actualizada.
+        - El trámite de renovación se hace por la misma plataforma web.
+        - **Recomendación:** Empezar la renovación 30-60 días antes del vencimiento.
+        """)
+
+    with tab_limites:
+        icon_subtitle("legal", "Límites Legales del Cultivo")
+
+        col_lim1, col_lim2 = st.columns(2)
+        with col_lim1:
+            st.markdown("#### Cantidades Autorizadas")
+            tabla_markdown(LIMITES_LEGALES)
+
+        with col_lim2:
+            st.markdown("#### Lo que NO está permitido")
+            st.markdown("""
+            - Vender o comercializar cannabis ni derivados.
+            - Cultivar sin estar registrado en REPROCANN.
+            - Superar los límites de plantas en floración.
+            - Conducir bajo los efectos del cannabis.
+            - Cultivar en espacios públicos.
+            - Proveer a personas no registradas como pacientes.
+            """)
+
+        cannabis_divider_mini()
+        st.markdown("#### Ante un Control Policial")
+        st.markdown("""
+        Si te para la policía o hay un allanamiento:
+
+        1. **Mantené la calma.** Tenés derecho a cultivar si estás registrado.
+        2. **Mostrá tu certificado REPROCANN** (digital o impreso) y tu DNI.
+        3. **No resistás** el procedimiento, pero dejá constancia de que estás registrado.
+        4. **Pedí que se labre acta** de todo lo que suceda.
+        5. **Contactá a un abogado** si la situación se complica.
+        6. **No declares sin abogado** presente si te llevan a declarar.
+        """)
+        st.error("Importante: Las fuerzas de seguridad deben respetar tu inscripción. Si no lo hacen, es una irregularidad denunciable.")
+
+    with tab_derechos:
+        icon_subtitle("legal", "Tus Derechos como Cultivador/a Registrado/a")
+
+        st.markdown("""
+        #### Derechos que te otorga el REPROCANN
+
+        - **Cultivar:** Hasta 9 plantas en floración en tu domicilio registrado.
+        - **Poseer:** Semillas, plantines, flores secas (hasta 40g) y derivados.
+        - **Transportar:** Hasta 40g de flores secas con certificado + DNI.
+        - **Elaborar derivados:** Aceites, tinturas, cremas para uso personal medicinal.
+        - **Protección legal:** Ante controles policiales, tu registro te protege.
+
+        #### Obligaciones
+
+        - Cultivar solo en el domicilio registrado.
+        - Respetar los límites de plantas y cantidades.
+        - Renovar el certificado antes de su vencimiento.
+        - No comercializar ni proveer a terceros no registrados.
+        - Mantener el cultivo en un espacio seguro, fuera del alcance de menores.
+        """)
+
+        cannabis_divider()
+        icon_subtitle("legal", "Recursos y Contactos Útiles")
+
+        st.markdown("""
+        - **Plataforma REPROCANN:** [https://reprocann.salud.gob.ar](https://reprocann.salud.gob.ar)
+        - **Ministerio de Salud:** 0800-222-1002 (línea gratuita)
+        - **ANMAT:** [https://www.argentina.gob.ar/anmat](https://www.argentina.gob.ar/anmat)
+        - **Defensoría del Pueblo:** Para denuncias por irregularidades en controles.
+        """)
+
+        st.markdown("#### Organizaciones y Redes de Apoyo en Córdoba")
+        st.markdown("""
+        - **Mamá Cultiva Argentina:** Red de madres que cultivan para hijos con patologías. Orientación y acompañamiento.
+        - **Asociaciones cannábicas locales:** Buscar en redes sociales grupos de cultivadores de La Carlota y zona sur de Córdoba.
+        - **Médicos amigables:** Consultar en redes de cannabis medicinal por profesionales en la zona de La Carlota que firmen indicaciones.
+        """)
+
+        cannabis_divider()
+        icon_subtitle("legal", "Preguntas Frecuentes")
+
+        with st.expander("¿Necesito un médico especialista para la indicación?"):
+            st.markdown("No. Cualquier médico/a con matrícula nacional puede firmar la indicación. No necesita ser especialista en cannabis ni en ninguna especialidad particular.")
+
+        with st.expander("¿El trámite tiene costo?"):
+            st.markdown("No. El trámite de inscripción y renovación en REPROCANN es **100% gratuito**. Desconfiá de gestores que cobren por hacerlo.")
+
+        with st.expander("¿Cuánto tarda la aprobación?"):
+            st.markdown("El plazo oficial es de 15 a 90 días hábiles, pero puede variar. En general, tarda entre 30 y 60 días. Revisá tu correo electrónico regularmente.")
+
+        with st.expander("¿Puedo cultivar mientras espero la aprobación?"):
+            st.markdown("Legalmente, la autorización rige desde la aprobación. Sin embargo, una vez presentada la solicitud, tenés el comprobante de inicio de trámite que demuestra tu intención de registrarte.")
+
+        with st.expander("¿Qué pasa si me vence el certificado y no renové?"):
+            st.markdown("Si tu certificado venció, legalmente no estás cubierto. Es importante renovar **antes** del vencimiento. Si venció, iniciá la renovación lo antes posible y guardá el comprobante de trámite en curso.")
+
+        with st.expander("¿Puedo cultivar en un departamento o en un balcón?"):
+            st.markdown("Sí, siempre que sea en el domicilio registrado. Podés cultivar en interior (indoor), balcón o terraza. No es obligatorio tener patio o terreno.")
+
+        with st.expander("¿Puedo tener más de 9 plantas si algunas están en vegetativo?"):
+            st.markdown("El límite de 9 se refiere a plantas **en floración**. Podés tener plantines, esquejes y plantas en vegetativo adicionales, siempre y cuando no superes las 9 en floración simultáneamente.")
+
+    cannabis_divider()
+    st.warning("Mantené siempre una copia digital del certificado REPROCANN y el DNI en tu teléfono. En caso de control, son los dos documentos que necesitás mostrar.")
@@ -0,0 +1,80 @@
+import datetime
+import streamlit as st
+from etapas import etapa_por_dias
+from meteo import fetch_weather
+from consejos import plan_riego
+from ui import mostrar_tutorial, icon_html, icon_title, icon_subtitle, cannabis_banner, cannabis_divider
+
+# --- MÓDULO 3: CALCULADORA DE RIEGO ADAPTATIVA ---
+@st.fragment
+def render(sistema, user_lat, user_lon, ciudad_actual):
+    cannabis_banner("riego")
+    mostrar_tutorial("Calculadora Riego")
+    icon_title("riego", f"Nutrición: {sistema}")
+    litros = st.number_input("Litros de agua", 1.0, 100.0, 5.0)
+    fase = st.selectbox("Etapa", ["Vegetativo", "Pre-Flora", "Floración Plena"])
+    marca = st.radio("Línea", ["Namasté", "Top Crop", "Dosis Criolla (50%)"])
+    
+    dosis = 2.0 if fase == "Vegetativo" else 4.0
+    if "Automáticas" in sistema: dosis *= 0.7
+    if "Criolla" in marca: dosis *= 0.5
+    
+    st.success(f"✅ Mezcla final: **{round(litros * dosis, 1)} ml** de fertilizante base.")
+
+    cannabis_divider()
+    icon_subtitle("riego", "Recomendaciones de Riego para Tus Cultivos Activos")
+
+    if "cultivos" not in st.session_state or not st.session_state.cultivos:
+        st.info("No tenés cultivos cargados en Seguimiento de Cultivo. Agregá al menos uno para recibir recomendaciones personalizadas de riego.")
+    else:
+        mes_actual = datetime.date.today().month
+        curr_clima, _ = fetch_weather()
+        temp_actual = curr_clima['temperature_2m'] if curr_clima else 25
+        hum_actual = curr_clima['relative_humidity_2m'] if curr_clima else 50
+
+        for idx_c, cultivo in enumerate(st.session_state.cultivos):
+            nombre_c = cultivo["nombre"]
+            inicio_c = cultivo["inicio"]
+            sistema_c = cultivo["sistema"]
+            maceta_c = cultivo.get("maceta_litros")
+            dias = (datetime.date.today() - inicio_c).days
+
+            etapa_nombre = etapa_por_dias(dias, sistema_c)["nombre"]
+
+            info_mac = f" · Maceta: {maceta_c}L" if maceta_c else ""
+            with st.expander(f"💧 {etapa_nombre} · {sistema_c}{info_mac}", expanded=(idx_c == 0)):
+                col_izq_r, col_der_r = st.columns([3, 1])
+                with col_der_r:
+                    ic_r = icon_html("riego", 20)
+                    st.markdown(f'<div class="cultivo-info-right"><div class="cultivo-nombre">{ic_r} {nombre_c}</div><div class="cultivo-dia">Día {dias}</div></div>', unsafe_allow_html=True)
+                plan = plan_riego(etapa_nombre, sistema_c, maceta_c)
+
+                col_riego1, col_riego2 = st.columns(2)
+                with col_riego1:
+                    st.markdown("#### Volumen de Agua")
+                    st.markdown(plan["volumen"] or "Según necesidad del sustrato.")
+                    st.markdown("#### Frecuencia")
+                    st.markdown(plan["frecuencia"] or "Revisar humedad del sustrato.")
+                    st.markdown("#### pH Recomendado")
+                    st.markdown(plan["ph_rec"] or "pH 6.0-6.5 como regla general.")
+                with col_riego2:
+                    st.markdown("#### Tipo de Agua")
+                    st.markdown(plan["agua_tipo"] or "Agua reposada 24 hs.")
+                    st.markdown("#### Nutrición en el Riego")
+                    st.markdown(plan["nutricion_riego"] or "Según plan de fertilización.")
+                    st.markdown("#### Técnica de Riego")
+                    st.markdown(plan["tecnica"] or "Regar lento y parejo.")
+
+                if plan["errores"]:
+                    st.error(f"**Errores comunes a evitar:** {plan['errores']}")
+
+                if temp_actual > 33:
+                    st.warning(f"🌡️ **Alerta calor ({temp_actual}°C):** Aumentar frecuencia de riego. Regar temprano y al atardecer. Evitar regar al mediodía. Considerar mulch para retener humedad.")
+                elif temp_actual > 28:
+                    st.info(f"🌡️ Temperatura actual {temp_actual}°C: Puede necesitar riego más frecuente. Revisar el sustrato al mediodía.")
+                elif temp_actual < 10:
+                    st.warning(f"🌡️ **Frío ({temp_actual}°C):** Reducir riego. Las raíces absorben menos con frío. Regar solo por la mañana para que seque durante el día.")
+                if hum_actual > 70:
+                    st.warning(f"💨 **Humedad alta ({hum_actual}%):** Espaciar riegos. El sustrato tarda más en secar. Cuidado con hongos en el sustrato.")
+                elif hum_actual < 30:
+                    st.info(f"💨 Humedad baja ({hum_actual}%): El sustrato se seca más rápido. Aumentar frecuencia de riego si es necesario.")
@@ -0,0 +1,159 @@
+import datetime
+import streamlit as st
+from db import guardar_cultivos, cargar_cultivos
+from etapas import obtener_etapas, indice_etapa, porcentaje_etapa
+from meteo import fetch_weather
+from consejos import consejo_diario_rinde, consejos_etapa
+from ui import mostrar_tutorial, icon_html, icon_title, icon_subtitle, cannabis_banner, cannabis_divider, cannabis_divider_mini
+
+# --- MÓDULO 6: SEGUIMIENTO DE CULTIVO ---
+@st.fragment
+def render(sistema, user_lat, user_lon, ciudad_actual):
+    cannabis_banner("seguimiento")
+    mostrar_tutorial("Seguimiento de Cultivo")
+    icon_title("seguimiento", "Seguimiento de Cultivo")
+    st.markdown("Registrá tus cultivos activos y recibí consejos paso a paso según la etapa, el sistema y las condiciones climáticas en tiempo real para lograr el mejor rendimiento.")
+
+    seg_curr, seg_daily = fetch_weather()
+
+    if "cultivos" not in st.session_state:
+        _seg_email = st.session_state.get("suscriptor_email", "")
+        st.session_state.cultivos = cargar_cultivos(_seg_email)
+
+    icon_subtitle("seguimiento", "Agregar Nuevo Cultivo")
+    col_add1, col_add2, col_add3, col_add4 = st.columns(4)
+    with col_add1:
+        nuevo_nombre = st.text_input("Nombre del cultivo", placeholder="Ej: Sativa balcón", key="nuevo_nombre")
+    with col_add2:
+        nuevo_inicio = st.date_input("Fecha de inicio", value=datetime.date.today(), key="nuevo_inicio")
+    with col_add3:
+        nuevo_cat = st.selectbox("Categoría", ["Interior", "Exterior", "Invernadero"], key="nuevo_cat")
+    with col_add4:
+        if nuevo_cat == "Interior":
+            nuevo_sub = st.selectbox("Tipo", ["Luz", "Automáticas"], key="nuevo_sub")
+        elif nuevo_cat == "Exterior":
+            nuevo_sub = st.selectbox("Tipo", ["Maceta", "Tierra Madre", "Automáticas"], key="nuevo_sub")
+        else:
+            nuevo_sub = st.selectbox("Tipo", ["Maceta", "Tierra"], key="nuevo_sub")
+        nuevo_sistema = f"{nuevo_cat} {nuevo_sub}"
+
+    maceta_litros_nuevo = None
+    if "Maceta" in nuevo_sistema:
+        maceta_litros_nuevo = st.slider("Tamaño de maceta (litros)", min_value=1, max_value=50, value=15, key="maceta_litros_nuevo")
+
+    if st.button("Agregar Cultivo"):
+        if nuevo_nombre.strip():
+            st.session_state.cultivos.append({
+                "nombre": nuevo_nombre.strip(),
+                "inicio": nuevo_inicio,
+                "sistema": nuevo_sistema,
+                "maceta_litros": maceta_litros_nuevo,
+                "lat": user_lat,
+                "lon": user_lon
+            })
+            guardar_cultivos(st.session_state.cultivos, st.session_state.get("suscriptor_email", ""))
+            st.success(f"Cultivo '{nuevo_nombre}' agregado correctamente.")
+            st.rerun()
+        else:
+            st.error("Ingresá un nombre para el cultivo.")
+
+    cannabis_divider()
+
+    if not st.session_state.cultivos:
+        st.info("No tenés cultivos registrados. Agregá uno arriba para empezar el seguimiento.")
+    else:
+        icon_subtitle("seguimiento", f"Tus Cultivos Activos ({len(st.session_state.cultivos)})")
+
+        @st.fragment
+        def tarjeta_cultivo(i, cultivo):
+            nombre_c = cultivo["nombre"]
+            inicio_c = cultivo["inicio"]
+            sistema_c = cultivo["sistema"]
+            maceta_c = cultivo.get("maceta_litros")
+
+            dias_transcurridos = (datetime.date.today() - inicio_c).days
+            semanas_transcurridas = dias_transcurridos / 7
+
+            etapas = obtener_etapas(sistema_c)
+            idx_actual = indice_etapa(dias_transcurridos, sistema_c)
+            etapa_actual = etapas[idx_actual]
+            progreso = porcentaje_etapa(dias_transcurridos, etapa_actual)
+
+            info_maceta = f" · Maceta: {maceta_c}L" if maceta_c else ""
+            with st.expander(f"🌱 {etapa_actual['nombre']} · {sistema_c}{info_maceta}", expanded=(i == 0)):
+                col_seg_izq, col_seg_der = st.columns([3, 1])
+                with col_seg_der:
+                    ic_sg = icon_html("seguimiento", 20)
+                    st.markdown(f'<div class="cultivo-info-right"><div class="cultivo-nombre">{ic_sg} {nombre_c}</div><div class="cultivo-dia">Día {dias_transcurridos}</div></div>', unsafe_allow_html=True)
+                col_info1, col_info2, col_info3 = st.columns(3)
+                with col_info1:
+                    st.metric("Días desde inicio", f"{dias_transcurridos} días")
+                with col_info2:
+                    st.metric("Semanas", f"{semanas_transcurridas:.1f}")
+                with col_info3:
+                    st.metric("Sistema", sistema_c)
+
+                st.markdown(f"**Etapa actual:** {etapa_actual['nombre']} ({etapa_actual['semanas']})")
+                st.progress(progreso, text=f"Progreso en etapa: {int(progreso*100)}%")
+                if cultivo.get("gdd") is not None and cultivo.get("gdd_hasta"):
+                    st.caption(f"🌡️ Tiempo térmico acumulado: **{cultivo['gdd']:.0f} °C·día** (base 5 °C, hasta el {cultivo['gdd_hasta'].strftime('%d/%m')})")
+
+                etapas_nombres = [e["nombre"] for e in etapas]
+                barra_etapas = ""
+                for j, en in enumerate(etapas_nombres):
+                    if j < idx_actual:
+                        barra_etapas += f"~~{en}~~ → "
+                    elif j == idx_actual:
+                        barra_etapas += f"**{en}** → "
+                    else:
+                        barra_etapas += f"{en} → "
+                st.markdown("Recorrido: " + barra_etapas.rstrip(" → "))
+
+                cannabis_divider_mini()
+                consejos = consejos_etapa(etapa_actual["nombre"], sistema_c, maceta_c)
+
+                st.markdown(f"### Guía para: {etapa_actual['nombre']}")
+                st.info(consejos["resumen"])
+
+                tab_r, tab_s, tab_n, tab_a, tab_cu, tab_p = st.tabs([
+                    "Riego", "Sustrato", "Nutrición", "Ambiente", "Cuidados", "Plagas"
+                ])
+                with tab_r:
+                    st.markdown(consejos["riego"])
+                with tab_s:
+                    st.markdown(consejos["sustrato"])
+                with tab_n:
+                    st.markdown(consejos["nutricion"])
+                with tab_a:
+                    st.markdown(consejos["ambiente"])
+                with tab_cu:
+                    st.markdown(consejos["cuidados"])
+                with tab_p:
+                    st.markdown(consejos["plagas"])
+
+                if consejos["maceta_consejo"]:
+                    cannabis_divider_mini()
+                    st.markdown(f"**Consejo específico ({sistema_c}{info_maceta}):**")
+                    st.success(consejos["maceta_consejo"])
+
+                cannabis_divider()
+                st.markdown(f"### 🌤️ Consejo Diario para Mejor Rinde — Hoy")
+                tips_rinde = consejo_diario_rinde(etapa_actual["nombre"], sistema_c, maceta_c, seg_curr, seg_daily)
+                for tip in tips_rinde:
+                    st.markdown(f"- {tip}")
+
+                if idx_actual < len(etapas) - 1:
+                    prox = etapas[idx_actual + 1]
+                    dias_para_prox = prox["inicio"] - dias_transcurridos
+                    if dias_para_prox > 0:
+                        st.markdown(f"**Próxima etapa:** {prox['nombre']} en ~{dias_para_prox} días.")
+                    else:
+                        st.markdown(f"**Próxima etapa:** {prox['nombre']} (inminente o ya comenzando).")
+
+                if st.button(f"Eliminar cultivo '{nombre_c}'", key=f"del_{i}"):
+                    st.session_state.cultivos.pop(i)
+                    guardar_cultivos(st.session_state.cultivos, st.session_state.get("suscriptor_email", ""))
+                    st.rerun()
+
+        for i, cultivo in enumerate(st.session_state.cultivos):
+            tarjeta_cultivo(i, cultivo)
@@ -0,0 +1,304 @@
+import asyncio
+import os
+import socket
+
+import metricas
+
+# Núcleo HTTP/1.1 del proxy: la cabecera de cada mensaje se lee de una vez (readuntil sobre el buffer del
+# stream), el cuerpo se copia según su encuadre (Content-Length, chunked o hasta el cierre) y hacia cada
+# worker se reusan conexiones keep-alive de un pool.
+MAX_CABECERA = 64 * 1024
+BLOQUE = 65536
+POOL_MAX = 16  # conexiones libres por worker
+SALTO_A_SALTO = {"connection", "keep-alive", "proxy-connection", "te", "trailer", "upgrade"}
+
+_POOL = {}
+
+async def leer_mensaje(reader, timeout=None):
+    # Pedido o respuesta: {"inicio", "cabeceras" [(nombre, valor)], "indice" {nombre en minúscula: valor}, "largo"}.
+    # None si la conexión se cerró antes de empezar un mensaje; ValueError si está mal formado.
+    try:
+        crudo = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise ValueError("cabecera incompleta")
+    except asyncio.LimitOverrunError:
+        raise ValueError("cabecera demasiado grande")
+    lineas = crudo.decode("latin-1").lstrip("\r\n").split("\r\n")
+    cabeceras = []
+    indice = {}
+    for linea in lineas[1:]:
+        if not linea:
+            continue
+        nombre, sep, valor = linea.partition(":")
+        if not sep or not nombre or nombre != nombre.strip():
+            raise ValueError(f"cabecera inválida: {linea[:80]!r}")
+        valor = valor.strip()
+        cabeceras.append((nombre, valor))
+        clave = nombre.lower()
+        indice[clave] = f"{indice[clave]}, {valor}" if clave in indice else valor
+    partes = lineas[0].split(" ", 2)
+    if len(partes) < 2:
+        raise ValueError(f"línea inicial inválida: {lineas[0][:80]!r}")
+    return {"inicio": lineas[0], "partes": partes, "cabeceras": cabeceras, "indice": indice, "largo": len(crudo)}
+
+def estado(respuesta):
+    return int(respuesta["partes"][1])
+
+def tokens(mensaje, nombre):
+    return {t.strip().lower() for t in mensaje["indice"].get(nombre, "").split(",") if t.strip()}
+
+def quiere_mantener(mensaje, version):
+    conexion = tokens(mensaje, "connection")
+    if version == "HTTP/1.0":
+        return "keep-alive" in conexion
+    return "close" not in conexion
+
+def es_upgrade(pedido):
+    return "upgrade" in tokens(pedido, "connection") and "upgrade" in pedido["indice"]
+
+def encuadre(mensaje, metodo=None):
+    # ("largo", n), ("chunked", None) o ("cierre", None); `metodo` sólo para respuestas
+    if metodo is not None:
+        codigo = estado(mensaje)
+        if metodo == "HEAD" or 100 <= codigo < 200 or codigo in (204, 304):
+            return "largo", 0
+    codificacion = mensaje["indice"].get("transfer-encoding")
+    if codificacion:
+        if codificacion.split(",")[-1].strip().lower() == "chunked":
+            return "chunked", None
+        if metodo is not None:
+            return "cierre", None
+        raise ValueError("transfer-encoding sin chunked en un pedido")
+    largo = mensaje["indice"].get("content-length")
+    if largo is not None:
+        if not largo.isdigit():
+            raise ValueError(f"content-length inválido: {largo!r}")
+        return "largo", int(largo)
+    return ("cierre", None) if metodo is not None else ("largo", 0)
+
+def sin_salto_a_salto(mensaje):
+    nombradas = tokens(mensaje, "connection")
+    return [(n, v) for n, v in mensaje["cabeceras"] if n.lower() not in SALTO_A_SALTO and n.lower() not in nombradas]
+
+def serializar(inicio, cabeceras):
+    return (inicio + "\r\n" + "".join(f"{n}: {v}\r\n" for n, v in cabeceras) + "\r\n").encode("latin-1")
+
+async def copiar_cuerpo(reader, writer, modo, largo):
+    # Devuelve los bytes copiados (con el encuadre chunked incluido)
+    copiados = 0
+    if modo == "largo":
+        while largo > 0:
+            datos = await reader.read(min(largo, BLOQUE))
+            if not datos:
+                raise ConnectionError("cuerpo incompleto")
+            writer.write(datos)
+            largo -= len(datos)
+            copiados += len(datos)
+            await writer.drain()
+    elif modo == "chunked":
+        while True:
+            linea = await reader.readuntil(b"\r\n")
+            writer.write(linea)
+            copiados += len(linea)
+            tamano = int(linea.split(b";")[0].strip(), 16)
+            if tamano == 0:
+                while linea != b"\r\n":
+                    linea = await reader.readuntil(b"\r\n")
+                    writer.write(linea)
+                    copiados += len(linea)
+                await writer.drain()
+                return copiados
+            copiados += await copiar_cuerpo(reader, writer, "largo", tamano + 2)
+    else:
+        while True:
+            datos = await reader.read(BLOQUE)
+            if not datos:
+                return copiados
+            writer.write(datos)
+            copiados += len(datos)
+            await writer.drain()
+    return copiados
+
+def tomar(puerto):
+    libres = _POOL.get(puerto, [])
+    while libres:
+        reader, writer = libres.pop()
+        if not reader.at_eof() and not writer.is_closing():
+            return reader, writer
+        writer.close()
+    return None
+
+def sin_demora(writer):
+    # TCP_NODELAY: los frames chicos del websocket salen sin esperar a Nagle
+    sock = writer.get_extra_info("socket")
+    if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+
+async def conectar(puerto, timeout=5):
+    loop = asyncio.get_running_loop()
+    inicio = loop.time()
+    reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", puerto, limit=MAX_CABECERA), timeout)
+    metricas.observar_conexion(loop.time() - inicio)
+    sin_demora(writer)
+    return reader, writer
+
+def devolver(puerto, conexion):
+    libres = _POOL.setdefault(puerto, [])
+    if len(libres) < POOL_MAX and not conexion[0].at_eof():
+        libres.append(conexion)
+    else:
+        conexion[1].close()
+
+def vaciar(puerto):
+    for _, writer in _POOL.pop(puerto, []):
+        writer.close()
+
+def conexiones_libres(puerto):
+    return len(_POOL.get(puerto, []))
+
+# Empalme de conexiones con Upgrade (websockets de Streamlit): los dos transportes pasan a protocolos propios.
+# Lo recibido se lee en un único buffer compartido (el loop es de un solo hilo y cada lectura se reenvía en el
+# mismo callback, así que una sesión inactiva no retiene memoria) y se escribe como copia en el otro transporte;
+# si su buffer de escritura se llena se pausa la lectura del lado que produce. Se corta una conexión sin
+# tráfico por WS_INACTIVO segundos y una a medio cerrar que no termina de cerrarse en MEDIO_CIERRE.
+WS_INACTIVO = float(os.environ.get("WS_INACTIVO_SEGUNDOS") or 600)
+MEDIO_CIERRE = 30.0
+_BUFFER_EMPALME = memoryview(bytearray(256 * 1024))
+TOTALES_EMPALME = {"activos": 0, "cliente_a_worker": 0, "worker_a_cliente": 0, "cortados_inactivos": 0}
+
+class _Extremo(asyncio.BufferedProtocol):
+    def __init__(self, empalme, contador):
+        self.empalme = empalme
+        self.contador = contador
+        self.transporte = None
+        self.otro = None
+        self.bytes = 0
+
+    def get_buffer(self, sizehint):
+        return _BUFFER_EMPALME
+
+    def buffer_updated(self, nbytes):
+        self.bytes += nbytes
+        TOTALES_EMPALME[self.contador] += nbytes
+        self.empalme.ultima = self.empalme.loop.time()
+        if self.otro.transporte.is_closing():
+            return
+        # Copia obligatoria: desde 3.12 write() encola lo que no pudo mandar como memoryview sin copiar, y la
+        # próxima lectura de cualquier sesión pisaría esos bytes en el buffer compartido
+        self.otro.transporte.write(bytes(_BUFFER_EMPALME[:nbytes]))
+
+    def eof_received(self):
+        if self.otro.transporte.can_write_eof() and not self.otro.transporte.is_closing():
+            self.otro.transporte.write_eof()
+        self.empalme.medio_cerrado()
+        return True
+
+    def pause_writing(self):
+        self.otro.transporte.pause_reading()
+
+    def resume_writing(self):
+        if not self.otro.transporte.is_closing():
+            self.otro.transporte.resume_reading()
+
+    def connection_lost(self, exc):
+        self.otro.transporte.close()
+        self.empalme.perdido()
+
+class _Empalme:
+    def __init__(self, inactivo, medio_cierre):
+        self.loop = asyncio.get_running_loop()
+        self.fin = self.loop.create_future()
+        self.inactivo = inactivo
+        self.medio_cierre = medio_cierre
+        self.ultima = self.loop.time()
+        self.perdidos = 0
+        self.eofs = 0
+        self.timer = self.loop.call_later(inactivo, self.revisar)
+        self.cliente = _Extremo(self, "cliente_a_worker")
+        self.worker = _Extremo(self, "worker_a_cliente")
+        self.cliente.otro, self.worker.otro = self.worker, self.cliente
+
+    def revisar(self):
+        restante = self.ultima + self.inactivo - self.loop.time()
+        if restante > 0:
+            self.timer = self.loop.call_later(restante, self.revisar)
+            return
+        TOTALES_EMPALME["cortados_inactivos"] += 1
+        self.abortar()
+
+    def medio_cerrado(self):
+        self.eofs += 1
+        if self.eofs == 2:
+            for extremo in (self.cliente, self.worker):
+                extremo.transporte.close()
+        else:
+            self.loop.call_later(self.medio_cierre, self.abortar)
+
+    def abortar(self):
+        if self.fin.done():
+            return
+        for extremo in (self.cliente, self.worker):
+            extremo.transporte.abort()
+        # Por si algún transporte ya estaba cerrado y no vuelve a avisar connection_lost
+        self.loop.call_soon(self.terminar)
+
+    def terminar(self):
+        if not self.fin.done():
+            self.timer.cancel()
+            self.fin.set_result(None)
+
+    def perdido(self):
+        self.perdidos += 1
+        if self.perdidos == 2:
+            self.terminar()
+
+def _pendiente(reader):
+    # Lo que el StreamReader ya había leído antes de soltar el transporte. asyncio no tiene API pública para
+    # tomarlo sin esperar, así que se usa su estado interno, verificado: si cambiara se corta el empalme en vez
+    # de perder o duplicar bytes en silencio.
+    buffer, eof = getattr(reader, "_buffer", None), getattr(reader, "_eof", None)
+    if not isinstance(buffer, bytearray) or not isinstance(eof, bool):
+        raise RuntimeError("asyncio.StreamReader sin _buffer/_eof: no se puede empalmar")
+    datos = bytes(buffer)
+    buffer.clear()
+    return datos, eof
+
+async def empalmar(cliente, worker, inactivo=WS_INACTIVO, medio_cierre=MEDIO_CIERRE):
+    # cliente/worker: pares (reader, writer) ya con el handshake hecho. Devuelve (bytes subidos, bytes bajados)
+    # Lo pendiente se toma antes de cambiar los protocolos: entre medio no corre ningún callback
+    try:
+        pendientes = [_pendiente(reader) for reader, _ in (cliente, worker)]
+    except RuntimeError:
+        cliente[1].close()
+        worker[1].close()
+        raise
+    empalme = _Empalme(inactivo, medio_cierre)
+    TOTALES_EMPALME["activos"] += 1
+    try:
+        extremos = ((empalme.cliente, cliente), (empalme.worker, worker))
+        for extremo, (_, writer) in extremos:
+            extremo.transporte = writer.transport
+            extremo.transporte.set_protocol(extremo)
+        if any(extremo.transporte.is_closing() for extremo, _ in extremos):
+            empalme.abortar()
+        for (extremo, _), (datos, eof) in zip(extremos, pendientes):
+            if datos:
+                extremo.bytes += len(datos)
+                TOTALES_EMPALME[extremo.contador] += len(datos)
+                extremo.otro.transporte.write(datos)
+            if eof:
+                extremo.eof_received()
+            elif not extremo.transporte.is_reading():
+                extremo.transporte.resume_reading()
+        await empalme.fin
+    except asyncio.CancelledError:
+        empalme.abortar()
+        raise
+    finally:
+        TOTALES_EMPALME["activos"] -= 1
+    return empalme.cliente.bytes, empalme.worker.bytes
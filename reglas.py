@@ -0,0 +1,103 @@
+import operator
+
+# Una regla es (ámbito, grupo, condiciones, salida).
+# - ámbito: clave de índice (rama de etapa, "comun", etc.).
+# - grupo: dentro de un mismo grupo sólo dispara la primera regla que cumple (equivale a if/elif/else).
+#   None = la regla es independiente.
+# - condiciones: tupla de (campo, operador, valor); todas deben cumplirse.
+# - salida: plantilla str.format, o dict campo -> plantilla.
+OPERADORES = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "en": lambda a, b: a in b,
+    "no_en": lambda a, b: a not in b,
+    "contiene": lambda a, b: any(x in a for x in b) if isinstance(b, tuple) else b in a,
+    "no_contiene": lambda a, b: not any(x in a for x in b) if isinstance(b, tuple) else b not in a,
+    "si": lambda a, b: bool(a),
+    "no": lambda a, b: not a,
+}
+
+def compilar_reglas(reglas):
+    indice = {}
+    for ambito, grupo, condiciones, salida in reglas:
+        conds = tuple((campo, OPERADORES[op], valor) for campo, op, valor in condiciones)
+        indice.setdefault(ambito, []).append((grupo, conds, salida))
+    return {ambito: tuple(lista) for ambito, lista in indice.items()}
+
+def _disparadas(indice, ambitos, ctx):
+    for ambito in ambitos:
+        usados = set()
+        for grupo, conds, salida in indice.get(ambito, ()):
+            if grupo is not None and grupo in usados:
+                continue
+            if all(op(ctx[campo], valor) for campo, op, valor in conds):
+                if grupo is not None:
+                    usados.add(grupo)
+                yield salida
+
+def evaluar_mensajes(indice, ambitos, ctx):
+    return [plantilla.format(**ctx) for plantilla in _disparadas(indice, ambitos, ctx)]
+
+def evaluar_campos(indice, ambitos, ctx, campos):
+    resultado = dict(campos)
+    for salida in _disparadas(indice, ambitos, ctx):
+        for campo, plantilla in salida.items():
+            resultado[campo] = plantilla.format(**ctx)
+    return resultado
+
+def primera_rama(ramas, nombre):
+    for rama, op, valor in ramas:
+        if OPERADORES[op](nombre, valor):
+            return rama
+    return None
+
+def _condicion_lote(columna, op, valor):
+    import numpy as np
+    if isinstance(columna, tuple):
+        # Columna de texto ya codificada: se evalúa una vez por valor distinto y se expande con el índice inverso
+        unicos, inversa = columna
+        return np.array([bool(OPERADORES[op](x, valor)) for x in unicos], dtype=bool)[inversa]
+    if op == "si":
+        return np.nan_to_num(columna) != 0
+    if op == "no":
+        return np.nan_to_num(columna) == 0
+    return OPERADORES[op](columna, valor)
+
+def disparadas_lote(reglas, ambitos, ctx):
+    # Versión columnar de _disparadas: ctx tiene un array por campo (NaN = sin dato) y
+    # ambitos es una secuencia de arrays o escalares con el ámbito de cada fila.
+    # Devuelve una matriz booleana filas x reglas; el id de una regla es su posición en la tabla.
+    import numpy as np
+    columnas = {}
+    for campo, col in ctx.items():
+        col = np.asarray(col)
+        columnas[campo] = np.unique(col, return_inverse=True) if col.dtype == object else col
+    n = len(np.asarray(next(iter(ctx.values()))))
+    ambitos = [np.broadcast_to(np.asarray(a, dtype=object), (n,)) for a in ambitos]
+    disparo = np.zeros((n, len(reglas)), dtype=bool)
+    por_ambito = {}
+    usados = {}
+    for i, (ambito, grupo, condiciones, _) in enumerate(reglas):
+        if ambito not in por_ambito:
+            por_ambito[ambito] = np.logical_or.reduce([a == ambito for a in ambitos])
+        mascara = por_ambito[ambito].copy()
+        for campo, op, valor in condiciones:
+            if not mascara.any():
+                break
+            mascara &= _condicion_lote(columnas[campo], op, valor)
+        if grupo is not None:
+            clave = (ambito, grupo)
+            if clave in usados:
+                mascara &= ~usados[clave]
+                usados[clave] |= mascara
+            else:
+                usados[clave] = mascara.copy()
+        disparo[:, i] = mascara
+    return disparo
+
+def mensajes_lote(reglas, fila, ctx):
+    return [reglas[i][3].format(**ctx) for i in fila.nonzero()[0]]
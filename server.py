@@ -1,53 +1,381 @@
 import asyncio
-import subprocess
-import threading
+import json
+import math
+import mmap
+import os
 import signal
 import sys
+import tempfile
+import time
 
-STREAMLIT_PORT = 8501
-LISTEN_PORT = 5000
-streamlit_ready = False
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-def start_streamlit():
-    global streamlit_ready
-    proc = subprocess.Popen([
+import estaticos
+import limites
+import metricas
+import proxy_http
+
+# Pool de workers Streamlit en puertos consecutivos desde STREAMLIT_PORT. Cada sesión del navegador queda
+# pegada a un worker con la cookie COOKIE_WORKER (la sesión, los uploads y los media viven en ese proceso);
+# las sesiones nuevas van al worker listo con menos conexiones abiertas.
+STREAMLIT_PORT = int(os.environ.get("STREAMLIT_PORT") or 8501)
+LISTEN_PORT = int(os.environ.get("LISTEN_PORT") or 5000)
+WORKERS_POR_DEFECTO_MAX = 4  # cada worker Streamlit ocupa ~150 MB
+
+def cpus_disponibles():
+    # CPUs que el proceso puede usar de verdad: afinidad y, en un contenedor, la cuota de cgroup v2 (cpu.max)
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            cuota, periodo = f.read().split()
+        if cuota != "max":
+            cpus = min(cpus, math.ceil(int(cuota) / int(periodo)))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
+
+WORKERS = max(1, int(os.environ.get("STREAMLIT_WORKERS") or min(cpus_disponibles(), WORKERS_POR_DEFECTO_MAX)))
+COOKIE_WORKER = "glm_worker"
+# Supervisión: un worker caído se relanza con espera exponencial (se reinicia si vivió VIDA_ESTABLE).
+# SIGTERM/SIGINT: deja de aceptar y espera hasta DRAIN_SEGUNDOS a que cierren las conexiones abiertas.
+# SIGHUP: reinicio escalonado para deploys, un worker por vez: deja de recibir sesiones nuevas y se relanza
+# recién cuando cierran las suyas (un websocket quieto lo corta WS_INACTIVO_SEGUNDOS) o a los
+# REINICIO_DRAIN_SEGUNDOS (0 = sin límite). Las sesiones que sigan abiertas a ese límite se cortan y pierden su
+# estado de Streamlit.
+BACKOFF_MIN, BACKOFF_MAX = 1.0, 30.0
+VIDA_ESTABLE = 60.0
+DRAIN_SEGUNDOS = float(os.environ.get("DRAIN_SEGUNDOS") or 30)
+REINICIO_DRAIN_SEGUNDOS = float(os.environ.get("REINICIO_DRAIN_SEGUNDOS") or 4 * 3600)
+# Salud: /livez responde mientras el proxy atiende; /readyz y /_stcore/health salen de un estado que una tarea
+# de fondo refresca cada INTERVALO_SALUD (health de cada worker, SELECT 1 en la base y antigüedad del último
+# pronóstico). Un worker que falla FALLAS_MAX chequeos seguidos sale de rotación y se relanza.
+INTERVALO_SALUD = 10.0
+FALLAS_MAX = 3
+CLIMA_VIGENCIA = 3 * 3600
+MARCA_CLIMA = os.path.join(tempfile.gettempdir(), "glm_clima_ok")  # la toca meteo.fetch_weather
+# Rendimiento: uvloop si está instalado (PROXY_UVLOOP=0 lo desactiva), backlog de listen configurable y
+# PROXY_PROCESOS > 1 lanza procesos proxy secundarios que comparten LISTEN_PORT con SO_REUSEPORT (el kernel
+# reparte las conexiones). Un secundario (PROXY_SECUNDARIO=1) no lanza workers: los sigue por health check.
+USAR_UVLOOP = uvloop is not None and os.environ.get("PROXY_UVLOOP", "1") != "0"
+PROXY_BACKLOG = int(os.environ.get("PROXY_BACKLOG") or 1024)
+PROXY_PROCESOS = max(1, int(os.environ.get("PROXY_PROCESOS") or 1))
+SECUNDARIO = os.environ.get("PROXY_SECUNDARIO") == "1"
+REUSE_PORT = PROXY_PROCESOS > 1 or SECUNDARIO or os.environ.get("PROXY_REUSE_PORT") == "1"
+# Estado compartido entre el principal y sus secundarios: un archivo mapeado con una fila de WORKERS enteros por
+# proceso. La fila 0 son las marcas de drenaje (las escribe el principal) y la fila k las conexiones abiertas del
+# secundario k (PROXY_INDICE). Cada fila tiene un solo escritor, así que no hace falta lock: en el reinicio
+# escalonado los secundarios dejan de mandar sesiones al worker que drena y el principal espera también sus
+# conexiones antes de detenerlo.
+ESTADO_COMPARTIDO = os.path.join(tempfile.gettempdir(), f"glm_proxy_{LISTEN_PORT}.estado")
+INDICE_PROXY = int(os.environ.get("PROXY_INDICE") or 0)
+
+def mapear_estado():
+    if (SECUNDARIO and not INDICE_PROXY) or (not SECUNDARIO and PROXY_PROCESOS == 1):
+        return None
+    tamano = 4 * WORKERS * PROXY_PROCESOS
+    if not SECUNDARIO:
+        with open(ESTADO_COMPARTIDO, "wb") as f:
+            f.write(bytes(tamano))
+    with open(ESTADO_COMPARTIDO, "r+b") as f:
+        return memoryview(mmap.mmap(f.fileno(), tamano)).cast("i")
+
+estado_compartido = mapear_estado()
+workers_ready = [False] * WORKERS
+drenando = estado_compartido[:WORKERS] if estado_compartido is not None else [False] * WORKERS
+reiniciando = [False] * WORKERS
+procesos = [None] * WORKERS
+procesos_proxy = []
+if estado_compartido is not None and SECUNDARIO:
+    conexiones = estado_compartido[INDICE_PROXY * WORKERS:(INDICE_PROXY + 1) * WORKERS]
+else:
+    conexiones = [0] * WORKERS
+fallas = [0] * WORKERS
+salud = {"db": "sin verificar", "clima_edad": None, "verificado": None}
+respuestas_salud = {}
+turno = 0
+apagando = False
+reinicio_en_curso = False
+
+def puerto_worker(i):
+    return STREAMLIT_PORT + i
+
+def comando_streamlit(i):
+    return [
         "streamlit", "run", "app.py",
-        "--server.port", str(STREAMLIT_PORT),
+        "--server.port", str(puerto_worker(i)),
         "--server.address", "127.0.0.1",
         "--server.headless", "true",
         "--server.enableCORS", "false",
         "--server.enableXsrfProtection", "false",
-    ])
-    proc.wait()
-    sys.exit(1)
+        # Los workers emiten /app/static/... (GLM_ASSETS_URL): si el índice del proxy todavía no está o falló,
+        # el pedido pasa al worker y lo sirve Streamlit
+        "--server.enableStaticServing", "true",
+    ]
 
-async def check_streamlit_ready():
-    global streamlit_ready
-    while True:
-        try:
-            r, w = await asyncio.open_connection("127.0.0.1", STREAMLIT_PORT)
-            w.close()
-            await w.wait_closed()
-            streamlit_ready = True
-            return
-        except Exception:
-            await asyncio.sleep(1)
+async def worker_sano(i):
+    try:
+        r, w = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", puerto_worker(i)), timeout=2)
+    except Exception:
+        return False
+    try:
+        w.write(b"GET /_stcore/health HTTP/1.0\r\nHost: 127.0.0.1\r\n\r\n")
+        await w.drain()
+        estado = await asyncio.wait_for(r.readline(), timeout=2)
+        return b" 200 " in estado
+    except Exception:
+        return False
+    finally:
+        w.close()
+
+def respuesta_http(estado, tipo, cuerpo, extra=()):
+    return (
+        f"HTTP/1.1 {estado}\r\n"
+        f"Content-Type: {tipo}\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n"
+        "Cache-Control: no-store\r\n"
+        + "".join(f"{n}: {v}\r\n" for n, v in extra) +
+        "Connection: close\r\n\r\n"
+    ).encode() + cuerpo
+
+def actualizar_respuestas():
+    # /readyz suma la base y el apagado; /_stcore/health (lo consulta el frontend de Streamlit) sólo mira que haya
+    # algún worker vivo, para que un error de la base no muestre "conexión perdida" en módulos que no la usan
+    vivo = any(workers_ready)
+    listo = not apagando and vivo and salud["db"] != "error"
+    edad = salud["clima_edad"]
+    cuerpo = json.dumps({
+        "listo": listo,
+        "workers": [{"puerto": puerto_worker(i), "listo": workers_ready[i], "drenando": bool(drenando[i])} for i in range(WORKERS)],
+        "db": salud["db"],
+        "clima": {"edad_s": None if edad is None else round(edad), "fresco": edad is not None and edad < CLIMA_VIGENCIA},
+        "verificado": salud["verificado"],
+    }).encode()
+    estado = "200 OK" if listo else "503 Service Unavailable"
+    respuestas_salud["/readyz"] = respuesta_http(estado, "application/json", cuerpo)
+    respuestas_salud["/_stcore/health"] = (
+        respuesta_http("200 OK", "text/plain", b"ok") if vivo else respuesta_http("503 Service Unavailable", "text/plain", b"unavailable")
+    )
+
+def respuesta_metricas():
+    workers = [
+        {"listo": workers_ready[i], "drenando": drenando[i], "conexiones": conexiones[i], "pool_libres": proxy_http.conexiones_libres(puerto_worker(i))}
+        for i in range(WORKERS)
+    ]
+    cuerpo = metricas.texto(workers, proxy_http.TOTALES_EMPALME, "secundario" if SECUNDARIO else "principal", limites.ips_en_tabla())
+    return respuesta_http("200 OK", "text/plain; version=0.0.4; charset=utf-8", cuerpo)
 
-async def relay(reader, writer):
+def marcar_worker(i, listo):
+    workers_ready[i] = listo
+    if not listo:
+        proxy_http.vaciar(puerto_worker(i))
+    fallas[i] = 0
+    actualizar_respuestas()
+
+def verificar_db():
+    url = os.environ.get("DATABASE_URL", "")
+    if not url:
+        return "sin configurar"
     try:
-        while True:
-            data = await reader.read(65536)
-            if not data:
-                break
-            writer.write(data)
-            await writer.drain()
+        import psycopg2
+        conn = psycopg2.connect(url, connect_timeout=3)
     except Exception:
-        pass
+        return "error"
+    try:
+        conn.cursor().execute("SELECT 1")
+        return "ok"
+    except Exception:
+        return "error"
     finally:
+        conn.close()
+
+async def chequear_worker(i):
+    if not workers_ready[i]:
+        return
+    if await worker_sano(i):
+        fallas[i] = 0
+        return
+    fallas[i] += 1
+    if fallas[i] >= FALLAS_MAX and workers_ready[i]:
+        print(f"[PROXY] Worker {i} no responde al health check; se saca de rotación")
+        marcar_worker(i, False)
+        if not SECUNDARIO:
+            asyncio.ensure_future(detener(i))
+
+async def vigilar_salud():
+    loop = asyncio.get_running_loop()
+    while not apagando:
+        await asyncio.gather(*(chequear_worker(i) for i in range(WORKERS)))
+        salud["db"] = await loop.run_in_executor(None, verificar_db)
         try:
-            writer.close()
-        except Exception:
-            pass
+            salud["clima_edad"] = time.time() - os.path.getmtime(MARCA_CLIMA)
+        except OSError:
+            salud["clima_edad"] = None
+        salud["verificado"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        actualizar_respuestas()
+        await asyncio.sleep(INTERVALO_SALUD)
+
+async def supervisar(i):
+    loop = asyncio.get_running_loop()
+    espera = BACKOFF_MIN
+    while not apagando:
+        inicio = loop.time()
+        try:
+            proc = await asyncio.create_subprocess_exec(*comando_streamlit(i), env={**os.environ, "GLM_ASSETS_URL": "1"})
+        except OSError as e:
+            print(f"[PROXY] No se pudo lanzar el worker {i}: {e}")
+            await asyncio.sleep(espera)
+            espera = min(espera * 2, BACKOFF_MAX)
+            continue
+        procesos[i] = proc
+        fin = asyncio.ensure_future(proc.wait())
+        # Sólo recibe tráfico cuando responde el health check de Streamlit
+        while not fin.done() and not await worker_sano(i):
+            await asyncio.wait({fin}, timeout=1)
+        if not fin.done():
+            marcar_worker(i, True)
+            print(f"[PROXY] Worker {i} listo en :{puerto_worker(i)}")
+        await fin
+        marcar_worker(i, False)
+        procesos[i] = None
+        if apagando:
+            return
+        if reiniciando[i]:
+            reiniciando[i] = False
+            espera = BACKOFF_MIN
+            continue
+        if loop.time() - inicio > VIDA_ESTABLE:
+            espera = BACKOFF_MIN
+        print(f"[PROXY] Worker {i} terminó con código {proc.returncode}; se relanza en {espera:.0f}s")
+        await asyncio.sleep(espera)
+        espera = min(espera * 2, BACKOFF_MAX)
+
+async def observar(i):
+    # Proxy secundario: el worker lo supervisa el principal; acá vuelve a rotación cuando responde
+    while not apagando:
+        if not workers_ready[i] and await worker_sano(i):
+            marcar_worker(i, True)
+        await asyncio.sleep(1)
+
+async def supervisar_proxy(k):
+    while not apagando:
+        env = {**os.environ, "PROXY_SECUNDARIO": "1", "PROXY_INDICE": str(k)}
+        proc = await asyncio.create_subprocess_exec(sys.executable, os.path.abspath(__file__), env=env)
+        procesos_proxy.append(proc)
+        await proc.wait()
+        procesos_proxy.remove(proc)
+        if apagando:
+            return
+        print(f"[PROXY] Proxy secundario terminó con código {proc.returncode}; se relanza en {BACKOFF_MIN:.0f}s")
+        await asyncio.sleep(BACKOFF_MIN)
+
+def avisar_proxies(sig):
+    for proc in procesos_proxy:
+        if proc.returncode is None:
+            proc.send_signal(sig)
+
+async def detener(i):
+    proc = procesos[i]
+    if proc is None or proc.returncode is not None:
+        return
+    proc.terminate()
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=10)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+def conexiones_worker(j):
+    # En el principal incluye las de los secundarios
+    if estado_compartido is None or SECUNDARIO:
+        return conexiones[j]
+    return conexiones[j] + sum(estado_compartido[k * WORKERS + j] for k in range(1, PROXY_PROCESOS))
+
+async def esperar_drenaje(indices, segundos):
+    # segundos <= 0 espera sin límite; devuelve las conexiones que quedaron abiertas
+    loop = asyncio.get_running_loop()
+    limite = loop.time() + segundos if segundos > 0 else math.inf
+    while any(conexiones_worker(j) for j in indices) and loop.time() < limite:
+        await asyncio.sleep(0.5)
+    return sum(conexiones_worker(j) for j in indices)
+
+async def indexar_estaticos():
+    try:
+        n = await asyncio.get_running_loop().run_in_executor(None, estaticos.construir_indice)
+        print(f"[PROXY] {n} archivos estáticos servidos por el proxy")
+    except Exception as e:
+        print(f"[PROXY] No se pudieron indexar los estáticos: {e}")
+
+async def reinicio_escalonado():
+    global reinicio_en_curso
+    if reinicio_en_curso or apagando:
+        return
+    reinicio_en_curso = True
+    print("[PROXY] Reinicio escalonado de workers")
+    asyncio.ensure_future(indexar_estaticos())
+    avisar_proxies(signal.SIGHUP)
+    try:
+        for i in range(WORKERS):
+            # Sin sesiones nuevas mientras drena; las que tienen la cookie siguen hasta cerrar o hasta el límite
+            drenando[i] = True
+            quedan = await esperar_drenaje([i], REINICIO_DRAIN_SEGUNDOS)
+            if apagando:
+                return
+            if quedan:
+                print(f"[PROXY] Worker {i}: se cortan {quedan} conexiones abiertas tras {REINICIO_DRAIN_SEGUNDOS:.0f}s de drenaje")
+            reiniciando[i] = True
+            await detener(i)
+            while not workers_ready[i] and not apagando:
+                await asyncio.sleep(0.5)
+            drenando[i] = False
+    finally:
+        for j in range(WORKERS):
+            drenando[j] = False
+        reinicio_en_curso = False
+
+async def apagar(server, terminado):
+    global apagando
+    if apagando:
+        return
+    apagando = True
+    server.close()
+    actualizar_respuestas()
+    print(f"[PROXY] Apagando: drenando {sum(conexiones)} conexiones (hasta {DRAIN_SEGUNDOS:.0f}s)")
+    avisar_proxies(signal.SIGTERM)
+    await esperar_drenaje(range(WORKERS), DRAIN_SEGUNDOS)
+    # Los secundarios drenan sus propias conexiones hacia los workers antes de que se detengan
+    if procesos_proxy:
+        await asyncio.wait([asyncio.ensure_future(p.wait()) for p in procesos_proxy], timeout=DRAIN_SEGUNDOS)
+    await asyncio.gather(*(detener(i) for i in range(WORKERS)))
+    terminado.set()
+
+def worker_de_cookie(cookie):
+    for par in cookie.split(";"):
+        clave, _, dato = par.strip().partition("=")
+        if clave == COOKIE_WORKER and dato.isdigit() and int(dato) < WORKERS:
+            return int(dato)
+    return None
+
+def elegir_worker(cookie):
+    # (worker, hay que fijar la cookie); None si todavía no hay ninguno listo. Empates: ronda circular
+    global turno
+    i = worker_de_cookie(cookie)
+    if i is not None and workers_ready[i]:
+        return i, False
+    listos = [j for j in range(WORKERS) if workers_ready[j] and not drenando[j]]
+    listos = listos or [j for j in range(WORKERS) if workers_ready[j]]
+    if not listos:
+        return None, False
+    turno += 1
+    return min(listos, key=lambda j: (conexiones[j], (j - turno) % WORKERS)), True
+
+def cookie_worker(i):
+    return ("Set-Cookie", f"{COOKIE_WORKER}={i}; Path=/; HttpOnly; SameSite=Lax")
 
 LOADING_PAGE = (
     b"HTTP/1.1 200 OK\r\n"
@@ -59,77 +387,231 @@ LOADING_PAGE = (
     b"<h2>Cargando GLM App del Cultivador...</h2></body></html>"
 )
 
-HEALTH_OK = (
-    b"HTTP/1.1 200 OK\r\n"
-    b"Content-Type: text/plain\r\n"
-    b"Content-Length: 2\r\n"
-    b"Connection: close\r\n\r\n"
-    b"ok"
-)
+LIVEZ_OK = respuesta_http("200 OK", "text/plain", b"ok")
+BAD_REQUEST = respuesta_http("400 Bad Request", "text/plain", b"bad request")
+NOT_FOUND = respuesta_http("404 Not Found", "text/plain", b"not found")
+DEMASIADOS_PEDIDOS = {
+    "tasa": respuesta_http("429 Too Many Requests", "text/plain", b"demasiados pedidos", [("Retry-After", limites.ESPERA_TASA)]),
+    "concurrencia": respuesta_http("429 Too Many Requests", "text/plain", b"demasiadas conexiones", [("Retry-After", 5)]),
+}
+TIMEOUT_INACTIVO = 10  # keep-alive del cliente entre pedidos
+TIMEOUT_WORKER = 60  # hasta la cabecera de la respuesta del worker
 
-async def handle_client(client_reader, client_writer):
-    try:
-        first_line = await asyncio.wait_for(client_reader.readline(), timeout=10)
-        if not first_line:
-            client_writer.close()
-            return
+def responder(writer, datos):
+    writer.write(datos)
+    metricas.CONTADORES["bytes_enviados"] += len(datos)
 
-        first_line_str = first_line.decode("utf-8", errors="replace").strip()
+def pantalla_carga(writer, motivo):
+    metricas.sumar(metricas.PANTALLA_CARGA, motivo)
+    responder(writer, LOADING_PAGE)
 
-        headers_raw = b""
-        while True:
-            line = await asyncio.wait_for(client_reader.readline(), timeout=10)
-            headers_raw += line
-            if line == b"\r\n" or line == b"\n" or not line:
-                break
+async def enviar_pedido(pedido, client_reader, puerto, cabeza, modo, largo):
+    # Manda el pedido por una conexión del pool (o una nueva) y devuelve (conexión, respuesta). Si una conexión
+    # reusada resulta cerrada por el worker y el pedido no tiene cuerpo, se reintenta una vez con una nueva.
+    sin_cuerpo = modo == "largo" and largo == 0
+    while True:
+        conexion = proxy_http.tomar(puerto)
+        reusada = conexion is not None
+        conexion = conexion or await proxy_http.conectar(puerto)
+        upstream_reader, upstream_writer = conexion
+        try:
+            upstream_writer.write(cabeza)
+            metricas.CONTADORES["bytes_recibidos"] += await proxy_http.copiar_cuerpo(client_reader, upstream_writer, modo, largo)
+            respuesta = await proxy_http.leer_mensaje(upstream_reader, TIMEOUT_WORKER)
+        except (ConnectionError, ValueError):
+            upstream_writer.close()
+            if reusada and sin_cuerpo:
+                continue
+            raise
+        if respuesta is None:
+            upstream_writer.close()
+            if reusada and sin_cuerpo:
+                continue
+            raise ConnectionError("el worker cerró sin responder")
+        return conexion, respuesta
 
-        is_health = ("GET / HTTP" in first_line_str or
-                     "GET /_stcore/health" in first_line_str)
+async def reenviar(pedido, client_reader, client_writer, worker, nuevo):
+    # Un pedido HTTP común hacia el worker; devuelve si la conexión con el cliente sigue abierta
+    metodo, version = pedido["partes"][0], pedido["partes"][-1]
+    puerto = puerto_worker(worker)
+    modo, largo = proxy_http.encuadre(pedido)
+    cabeza = proxy_http.serializar(pedido["inicio"], proxy_http.sin_salto_a_salto(pedido) + [("Connection", "keep-alive")])
+    conexiones[worker] += 1
+    try:
+        try:
+            conexion, respuesta = await enviar_pedido(pedido, client_reader, puerto, cabeza, modo, largo)
+        except (OSError, ValueError, asyncio.TimeoutError) as e:
+            # Sin respuesta del worker: todavía no se le mandó nada al cliente
+            metricas.error(e)
+            pantalla_carga(client_writer, "worker_sin_respuesta")
+            return False
+        upstream_reader, upstream_writer = conexion
+        # Respuestas intermedias (100 Continue) pasan tal cual
+        while 100 <= proxy_http.estado(respuesta) < 200:
+            responder(client_writer, proxy_http.serializar(respuesta["inicio"], respuesta["cabeceras"]))
+            respuesta = await proxy_http.leer_mensaje(upstream_reader, TIMEOUT_WORKER)
+            if respuesta is None:
+                upstream_writer.close()
+                return False
+        modo_r, largo_r = proxy_http.encuadre(respuesta, metodo)
+        mantener = proxy_http.quiere_mantener(pedido, version) and modo_r != "cierre" and not apagando
+        cabeceras = proxy_http.sin_salto_a_salto(respuesta)
+        if nuevo:
+            cabeceras.append(cookie_worker(worker))
+        cabeceras.append(("Connection", "keep-alive" if mantener else "close"))
+        responder(client_writer, proxy_http.serializar(respuesta["inicio"], cabeceras))
+        try:
+            metricas.CONTADORES["bytes_enviados"] += await proxy_http.copiar_cuerpo(upstream_reader, client_writer, modo_r, largo_r)
+        except BaseException:
+            upstream_writer.close()
+            raise
+        if modo_r != "cierre" and proxy_http.quiere_mantener(respuesta, respuesta["partes"][0]):
+            proxy_http.devolver(puerto, conexion)
+        else:
+            upstream_writer.close()
+        return mantener
+    finally:
+        conexiones[worker] -= 1
 
-        if not streamlit_ready:
-            if is_health:
-                client_writer.write(HEALTH_OK)
-            else:
-                client_writer.write(LOADING_PAGE)
-            await client_writer.drain()
-            client_writer.close()
+async def empalmar(pedido, client_reader, client_writer, worker, nuevo):
+    # WebSocket (o cualquier Upgrade): conexión propia hacia el worker y copia directa en ambos sentidos
+    upstream_reader, upstream_writer = await proxy_http.conectar(puerto_worker(worker))
+    conexiones[worker] += 1
+    try:
+        upstream_writer.write(proxy_http.serializar(pedido["inicio"], pedido["cabeceras"]))
+        respuesta = await proxy_http.leer_mensaje(upstream_reader, TIMEOUT_WORKER)
+        if respuesta is None:
+            upstream_writer.close()
             return
+        cabeceras = respuesta["cabeceras"] + ([cookie_worker(worker)] if nuevo else [])
+        responder(client_writer, proxy_http.serializar(respuesta["inicio"], cabeceras))
+        await client_writer.drain()
+        if proxy_http.estado(respuesta) == 101:
+            metricas.sumar(metricas.SESIONES_WS, worker)
+            metricas.sumar(metricas.SESIONES_WS_TOTAL, worker)
+            try:
+                await proxy_http.empalmar((client_reader, client_writer), (upstream_reader, upstream_writer))
+            finally:
+                metricas.sumar(metricas.SESIONES_WS, worker, -1)
+        else:
+            # Upgrade rechazado: se pasa la respuesta y se cierra
+            try:
+                metricas.CONTADORES["bytes_enviados"] += await proxy_http.copiar_cuerpo(
+                    upstream_reader, client_writer, *proxy_http.encuadre(respuesta, pedido["partes"][0]))
+            finally:
+                upstream_writer.close()
+    finally:
+        conexiones[worker] -= 1
 
-        try:
-            upstream_reader, upstream_writer = await asyncio.wait_for(
-                asyncio.open_connection("127.0.0.1", STREAMLIT_PORT), timeout=5
-            )
-        except Exception:
-            if is_health:
-                client_writer.write(HEALTH_OK)
-            else:
-                client_writer.write(LOADING_PAGE)
-            await client_writer.drain()
-            client_writer.close()
-            return
+async def handle_client(client_reader, client_writer):
+    proxy_http.sin_demora(client_writer)
+    peer = (client_writer.get_extra_info("peername") or ("",))[0]
+    metricas.CONTADORES["conexiones_aceptadas"] += 1
+    metricas.CONTADORES["conexiones_activas"] += 1
+    try:
+        # Keep-alive con el cliente: cada pedido se resuelve por separado (salud, estático o worker según su
+        # cookie); un Upgrade se empalma con el worker y ocupa el resto de la conexión
+        while True:
+            try:
+                pedido = await proxy_http.leer_mensaje(client_reader, TIMEOUT_INACTIVO)
+            except ValueError:
+                metricas.error("pedido_invalido")
+                responder(client_writer, BAD_REQUEST)
+                break
+            except asyncio.TimeoutError:
+                # Keep-alive vencido sin pedido nuevo: cierre normal, no es un error
+                break
+            if pedido is None:
+                break
+            metricas.CONTADORES["bytes_recibidos"] += pedido["largo"]
+            metodo, version = pedido["partes"][0], pedido["partes"][-1]
+            ruta = pedido["partes"][1].split("?")[0]
+            try:
+                sin_cuerpo = proxy_http.encuadre(pedido) == ("largo", 0)
+            except ValueError:
+                metricas.error("pedido_invalido")
+                responder(client_writer, BAD_REQUEST)
+                break
 
-        upstream_writer.write(first_line + headers_raw)
-        await upstream_writer.drain()
+            if sin_cuerpo and ruta == "/metrics":
+                # Sólo para la red interna: desde afuera (aunque llegue por el proxy de adelante) no existe
+                metricas.sumar(metricas.PEDIDOS, "metricas")
+                interno = limites.interno(peer, pedido["indice"].get("x-forwarded-for", ""))
+                responder(client_writer, respuesta_metricas() if interno else NOT_FOUND)
+                break
+            if sin_cuerpo and (ruta == "/livez" or ruta in respuestas_salud):
+                metricas.sumar(metricas.PEDIDOS, "salud")
+                responder(client_writer, LIVEZ_OK if ruta == "/livez" else respuestas_salud[ruta])
+                break
+            enviados = await estaticos.servir(client_writer, metodo, ruta, pedido["indice"]) if sin_cuerpo else 0
+            if enviados:
+                metricas.sumar(metricas.PEDIDOS, "estatico")
+                metricas.CONTADORES["bytes_enviados"] += enviados
+                if not proxy_http.quiere_mantener(pedido, version):
+                    break
+                continue
 
-        await asyncio.gather(
-            relay(client_reader, upstream_writer),
-            relay(upstream_reader, client_writer),
-        )
-    except Exception:
-        pass
+            # Lo que sigue va a un worker: pasa por los límites de la IP del cliente
+            slot, motivo = limites.entrar(limites.ip_cliente(peer, pedido["indice"].get("x-forwarded-for", "")))
+            if slot is None:
+                metricas.sumar(metricas.RECHAZOS, motivo)
+                responder(client_writer, DEMASIADOS_PEDIDOS[motivo])
+                break
+            try:
+                worker, nuevo = elegir_worker(pedido["indice"].get("cookie", ""))
+                if worker is None:
+                    pantalla_carga(client_writer, "sin_workers")
+                    break
+                if proxy_http.es_upgrade(pedido):
+                    metricas.sumar(metricas.PEDIDOS, "upgrade")
+                    try:
+                        await empalmar(pedido, client_reader, client_writer, worker, nuevo)
+                    except (OSError, ValueError, asyncio.TimeoutError) as e:
+                        metricas.error(e)
+                        pantalla_carga(client_writer, "upgrade_fallido")
+                    break
+                metricas.sumar(metricas.PEDIDOS, "worker")
+                if not await reenviar(pedido, client_reader, client_writer, worker, nuevo):
+                    break
+            finally:
+                limites.salir(slot)
+        await client_writer.drain()
+    except Exception as e:
+        metricas.error(e)
     finally:
+        metricas.CONTADORES["conexiones_activas"] -= 1
         try:
             client_writer.close()
         except Exception:
             pass
 
 async def main():
-    asyncio.get_event_loop().run_in_executor(None, start_streamlit)
-    asyncio.create_task(check_streamlit_ready())
-    server = await asyncio.start_server(handle_client, "0.0.0.0", LISTEN_PORT)
-    print(f"TCP proxy on :{LISTEN_PORT} -> Streamlit :{STREAMLIT_PORT}")
-    async with server:
-        await server.serve_forever()
+    loop = asyncio.get_running_loop()
+    actualizar_respuestas()
+    for i in range(WORKERS):
+        conexiones[i] = 0  # un secundario relanzado no hereda las cuentas del anterior en su fila
+        asyncio.create_task(observar(i) if SECUNDARIO else supervisar(i))
+    if not SECUNDARIO:
+        for k in range(1, PROXY_PROCESOS):
+            asyncio.create_task(supervisar_proxy(k))
+    asyncio.create_task(vigilar_salud())
+    asyncio.create_task(indexar_estaticos())
+    server = await asyncio.start_server(
+        handle_client, "0.0.0.0", LISTEN_PORT,
+        limit=proxy_http.MAX_CABECERA, backlog=PROXY_BACKLOG, reuse_port=REUSE_PORT,
+    )
+    terminado = asyncio.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, lambda: asyncio.ensure_future(apagar(server, terminado)))
+    loop.add_signal_handler(signal.SIGHUP, lambda: asyncio.ensure_future(indexar_estaticos() if SECUNDARIO else reinicio_escalonado()))
+    rol = "secundario" if SECUNDARIO else f"{PROXY_PROCESOS} proceso(s)"
+    print(f"TCP proxy on :{LISTEN_PORT} -> {WORKERS} Streamlit workers :{STREAMLIT_PORT}-{puerto_worker(WORKERS - 1)} "
+          f"({'uvloop' if USAR_UVLOOP else 'asyncio'}, {rol}, backlog {PROXY_BACKLOG})")
+    await terminado.wait()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if USAR_UVLOOP:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        asyncio.run(main())
@@ -0,0 +1,144 @@
+import datetime
+import functools
+import math
+from types import MappingProxyType
+
+# Geometría solar sin red: duración del día (modelo CBM, Forsythe et al. 1995), mediodía solar, amanecer y
+# atardecer (ecuación del tiempo de NOAA) y radiación de cielo despejado (FAO-56). `dia` es el día del año
+# (0 = 1 de enero); las funciones base aceptan escalares o arrays, incluida la latitud/longitud.
+# Las horas se expresan en UTC decimal; sumar UTC_ARGENTINA para la hora local.
+# numpy se importa dentro de las funciones vectorizadas: lo que muestra Clima (sol_del_dia, disparo_floracion)
+# hace la misma cuenta en escalar con math, así la página gratuita no lo carga.
+ALTURA_AMANECER = 0.8333  # grados bajo el horizonte: refracción + radio del disco solar
+CONSTANTE_SOLAR = 0.0820  # MJ m-2 min-1
+PAR_POR_MJ = 2.1  # mol de fotones PAR por MJ de radiación global (~48% PAR x 4.57 µmol/J)
+UTC_ARGENTINA = -3
+CELDA = 0.25  # grados; las tablas anuales se cachean por celda de esta grilla
+CAMPOS_SOLARES = ("duracion", "mediodia", "amanecer", "atardecer", "radiacion", "dli")
+# Horas de luz por debajo de las cuales, con días acortándose, dispara la floración. Calibrado para que la
+# siembra de referencia en La Carlota (-33.4°) entre en Pre-Floración a fin de diciembre, como la tabla.
+FOTOPERIODO_CRITICO = 14.3
+FOTOPERIODO_CORTO = 12.0  # por debajo florece aunque los días se estén alargando (siembras de invierno)
+
+def declinacion(dia):
+    import numpy as np
+    theta = 0.2163108 + 2 * np.arctan(0.9671396 * np.tan(0.00860 * (np.asarray(dia) + 1 - 186)))
+    return np.arcsin(0.39795 * np.cos(theta))
+
+def duracion_dia(lat, dia):
+    import numpy as np
+    phi = np.radians(lat)
+    p = np.radians(ALTURA_AMANECER)
+    cos_h = (np.sin(p) + np.sin(phi) * np.sin(declinacion(dia))) / (np.cos(phi) * np.cos(declinacion(dia)))
+    return 24 - (24 / np.pi) * np.arccos(np.clip(cos_h, -1, 1))
+
+def ecuacion_del_tiempo(dia):
+    # Minutos que el sol verdadero adelanta al medio
+    import numpy as np
+    g = 2 * np.pi / 365 * np.asarray(dia)
+    return 229.18 * (0.000075 + 0.001868 * np.cos(g) - 0.032077 * np.sin(g) - 0.014615 * np.cos(2 * g) - 0.040849 * np.sin(2 * g))
+
+def mediodia_solar(lon, dia):
+    import numpy as np
+    return (720 - 4 * np.asarray(lon) - ecuacion_del_tiempo(dia)) / 60
+
+def radiacion_cielo_despejado(lat, dia, altitud=0):
+    # Rso (FAO-56, ec. 21 y 37) en MJ m-2 día-1
+    import numpy as np
+    phi = np.radians(lat)
+    delta = declinacion(dia)
+    dr = 1 + 0.033 * np.cos(2 * np.pi / 365 * (np.asarray(dia) + 1))
+    ws = np.arccos(np.clip(-np.tan(phi) * np.tan(delta), -1, 1))
+    ra = 24 * 60 / np.pi * CONSTANTE_SOLAR * dr * (ws * np.sin(phi) * np.sin(delta) + np.cos(phi) * np.cos(delta) * np.sin(ws))
+    return (0.75 + 2e-5 * altitud) * ra
+
+def celda(lat, lon):
+    return round(round(lat / CELDA) * CELDA, 4), round(round(lon / CELDA) * CELDA, 4)
+
+@functools.lru_cache(maxsize=512)
+def _tabla_anual(lat, lon, anio):
+    import numpy as np
+    dias = np.arange(366 if anio % 4 == 0 and (anio % 100 != 0 or anio % 400 == 0) else 365)
+    duracion = duracion_dia(lat, dias)
+    mediodia = mediodia_solar(lon, dias)
+    radiacion = radiacion_cielo_despejado(lat, dias)
+    tabla = {
+        "duracion": duracion,
+        "mediodia": mediodia,
+        "amanecer": mediodia - duracion / 2,
+        "atardecer": mediodia + duracion / 2,
+        "radiacion": radiacion,
+        "dli": radiacion * PAR_POR_MJ,
+    }
+    for serie in tabla.values():
+        serie.setflags(write=False)
+    return MappingProxyType(tabla)
+
+def tabla_anual(lat, lon, anio):
+    return _tabla_anual(*celda(lat, lon), int(anio))
+
+def serie_solar(lat, lon, fechas):
+    # Campos solares para un rango arbitrario de fechas (datetime64[D]) leyendo de las tablas anuales cacheadas
+    import numpy as np
+    fechas = np.asarray(fechas, dtype="datetime64[D]")
+    inicio_anio = fechas.astype("datetime64[Y]")
+    anios = inicio_anio.astype(np.int64) + 1970
+    dias = (fechas - inicio_anio).astype(np.int64)
+    serie = {campo: np.empty(len(fechas)) for campo in CAMPOS_SOLARES}
+    for anio in np.unique(anios):
+        fila = anios == anio
+        tabla = tabla_anual(lat, lon, anio)
+        for campo in CAMPOS_SOLARES:
+            serie[campo][fila] = tabla[campo][dias[fila]]
+    return serie
+
+def hora_local(horas_utc, utc_offset=UTC_ARGENTINA):
+    minutos = int(round(((horas_utc + utc_offset) % 24) * 60)) % (24 * 60)
+    return f"{minutos // 60:02d}:{minutos % 60:02d}"
+
+def _dia_escalar(lat, lon, fecha):
+    # Las mismas fórmulas que las funciones base, para un solo día y sin numpy
+    dia = (fecha - datetime.date(fecha.year, 1, 1)).days
+    decl = math.asin(0.39795 * math.cos(0.2163108 + 2 * math.atan(0.9671396 * math.tan(0.00860 * (dia + 1 - 186)))))
+    phi = math.radians(lat)
+    cos_h = (math.sin(math.radians(ALTURA_AMANECER)) + math.sin(phi) * math.sin(decl)) / (math.cos(phi) * math.cos(decl))
+    duracion = 24 - (24 / math.pi) * math.acos(min(max(cos_h, -1), 1))
+    g = 2 * math.pi / 365 * dia
+    eot = 229.18 * (0.000075 + 0.001868 * math.cos(g) - 0.032077 * math.sin(g) - 0.014615 * math.cos(2 * g) - 0.040849 * math.sin(2 * g))
+    mediodia = (720 - 4 * lon - eot) / 60
+    dr = 1 + 0.033 * math.cos(2 * math.pi / 365 * (dia + 1))
+    ws = math.acos(min(max(-math.tan(phi) * math.tan(decl), -1), 1))
+    ra = 24 * 60 / math.pi * CONSTANTE_SOLAR * dr * (ws * math.sin(phi) * math.sin(decl) + math.cos(phi) * math.cos(decl) * math.sin(ws))
+    radiacion = 0.75 * ra
+    return {
+        "duracion": duracion,
+        "mediodia": mediodia,
+        "amanecer": mediodia - duracion / 2,
+        "atardecer": mediodia + duracion / 2,
+        "radiacion": radiacion,
+        "dli": radiacion * PAR_POR_MJ,
+    }
+
+def sol_del_dia(lat, lon, fecha):
+    lat, lon = celda(lat, lon)
+    sol = _dia_escalar(lat, lon, fecha)
+    sol["cambio_min"] = (sol["duracion"] - _dia_escalar(lat, lon, fecha - datetime.timedelta(days=1))["duracion"]) * 60
+    return sol
+
+def dispara_floracion(luz, luz_ayer, critico=FOTOPERIODO_CRITICO):
+    # Días por debajo del fotoperíodo crítico y acortándose, o por debajo de FOTOPERIODO_CORTO aunque se alarguen
+    return (luz <= critico) & ((luz < luz_ayer) | (luz <= FOTOPERIODO_CORTO))
+
+def disparo_floracion(lat, lon, hoy=None):
+    # Fecha en que el fotoperíodo dispara (o ya disparó) la floración de las fotoperiódicas de exterior; None si
+    # no pasa en el próximo año
+    hoy = hoy or datetime.date.today()
+    lat, lon = celda(lat, lon)
+    luz_ayer = _dia_escalar(lat, lon, hoy - datetime.timedelta(days=1))["duracion"]
+    for k in range(366):
+        fecha = hoy + datetime.timedelta(days=k)
+        luz = _dia_escalar(lat, lon, fecha)["duracion"]
+        if dispara_floracion(luz, luz_ayer):
+            return fecha
+        luz_ayer = luz
+    return None
@@ -0,0 +1,16 @@
+import busqueda
+
+def test_fragmento_por_raiz():
+    texto = "Al principio no hace falta nada. " * 8 + "Después revisá las raíces: si están marrones, hay pudrición."
+    fragmento = busqueda._fragmento(texto, set(busqueda.tokenizar("raiz")))
+    assert fragmento.startswith("…") and "raíces" in fragmento
+    # Sin coincidencia, desde el principio
+    assert busqueda._fragmento(texto, {"inexistente"}).startswith("Al principio")
+
+def test_filtro_por_modulo():
+    consulta = "viento fuerte"
+    todos = busqueda.buscar(consulta, limite=50)
+    assert {r["modulo"] for r in todos} - {"Clima y Sugerencias"}
+    libres = busqueda.buscar(consulta, modulos=["Clima y Sugerencias"])
+    assert libres and all(r["modulo"] == "Clima y Sugerencias" for r in libres)
+    assert busqueda.modulos_con_resultados(consulta) == {r["modulo"] for r in busqueda.buscar(consulta, limite=len(busqueda.INDICE["docs"]))}
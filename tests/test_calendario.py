@@ -0,0 +1,58 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from calendario import proyectar_calendario, cronograma, etapa_actual
+from etapas import SISTEMAS
+from meteo import LAT_DEFAULT, LON_DEFAULT
+
+DIAS = list(range(0, 421, 15))
+HOYS = [datetime.date(2026, m, 1) for m in (1, 4, 7, 10)]
+
+def _ordenadas(calendario, sistemas):
+    for i, codigo in enumerate(sistemas):
+        for nombre, central, temprana, tardia in cronograma(calendario, i, SISTEMAS[codigo]):
+            fechas = [f for f in (temprana, central, tardia) if f is not None]
+            assert fechas == sorted(fechas), (SISTEMAS[codigo], i, nombre, temprana, central, tardia)
+            if central is not None:
+                assert temprana is not None and temprana <= central
+
+@pytest.mark.parametrize("hoy", HOYS)
+@pytest.mark.parametrize("gdd", [None, 0.0, 800.0, 2500.0, 5000.0])
+def test_escenarios_ordenados(hoy, gdd):
+    sistemas = np.repeat(np.arange(len(SISTEMAS)), len(DIAS))
+    dias = np.tile(DIAS, len(SISTEMAS))
+    calendario = proyectar_calendario(dias, sistemas, LAT_DEFAULT, LON_DEFAULT, hoy=hoy,
+                                      gdd=None if gdd is None else np.full(len(dias), gdd))
+    _ordenadas(calendario, sistemas)
+
+def test_invernadero_anclado():
+    # Caso del informe: Invernadero Maceta a 120 días, anclado por grados-día
+    hoy = datetime.date(2026, 10, 19)
+    codigo = SISTEMAS.index("Invernadero Maceta")
+    calendario = proyectar_calendario([120], [codigo], LAT_DEFAULT, LON_DEFAULT, hoy=hoy, gdd=[1500.0])
+    _ordenadas(calendario, [codigo])
+    temprana, central, tardia = calendario["cosecha"][0]
+    assert temprana <= central <= tardia
+
+def test_etapas_en_orden_y_ancla():
+    hoy = datetime.date(2026, 1, 15)
+    codigo = SISTEMAS.index("Exterior Tierra Madre")
+    sin_dato, adelantado = (proyectar_calendario([60, 60], [codigo, codigo], LAT_DEFAULT, LON_DEFAULT, hoy=hoy, gdd=g)
+                            for g in ([np.nan, np.nan], [np.nan, 3000.0]))
+    central = sin_dato["fechas_etapas"][0, :, 1]
+    assert (np.diff(central[~np.isnat(central)]).astype(int) >= 0).all()
+    # Más grados-día acumulados que el modelo: etapa igual o más avanzada, cosecha igual o antes
+    assert etapa_actual(adelantado, hoy)[0][1] >= etapa_actual(sin_dato, hoy)[0][1]
+    assert adelantado["cosecha"][1, 1] <= sin_dato["cosecha"][1, 1]
+
+def test_interior_sin_escenarios_termicos():
+    hoy = datetime.date(2026, 1, 15)
+    codigo = SISTEMAS.index("Interior Luz")
+    calendario = proyectar_calendario([0], [codigo], LAT_DEFAULT, LON_DEFAULT, hoy=hoy)
+    filas = cronograma(calendario, 0, "Interior Luz")
+    assert filas[0][1] == hoy
+    # Sin temperatura la vegetativa dura lo nominal en los tres escenarios; sólo la floración cambia
+    assert filas[4][1] == filas[4][2] == filas[4][3] == hoy + datetime.timedelta(days=63)
+    assert filas[-1][2] < filas[-1][1] < filas[-1][3]
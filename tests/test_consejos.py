@@ -0,0 +1,66 @@
+import datetime
+import json
+import os
+
+import pytest
+
+import consejos
+import lote
+from etapas import SISTEMAS
+from meteo import calcular_vpd
+from reglas import mensajes_lote
+from datos.reglas_clima import REGLAS_CLIMA
+
+# Salida dorada de los consejos: golden_consejos.json se generó con las funciones if/elif anteriores a las
+# tablas de reglas (commit c7f5d2d: seguimiento.consejo_diario_rinde/consejos_etapa, las recomendaciones de
+# clima.render y el plan de riego.render) sobre una grilla de etapas, sistemas, macetas y climas. Los textos
+# están una sola vez en "textos" y los casos los referencian por posición.
+with open(os.path.join(os.path.dirname(__file__), "golden_consejos.json"), encoding="utf-8") as f:
+    GOLDEN = json.load(f)
+TEXTOS = GOLDEN["textos"]
+HOY = datetime.date(2026, 1, 15)
+
+def _textos(indices):
+    return [TEXTOS[i] for i in indices]
+
+def _clima(k):
+    c = GOLDEN["climas"][k]
+    return {"temperature_2m": c["t"], "relative_humidity_2m": c["h"], "wind_speed_10m": c["v"]}, c["daily"]
+
+@pytest.mark.parametrize("etapa, sistema, maceta, esperado_consejos, esperado_riego", GOLDEN["etapa"])
+def test_consejos_etapa_y_plan_riego(etapa, sistema, maceta, esperado_consejos, esperado_riego):
+    consejos_etapa = consejos.consejos_etapa(etapa, sistema, maceta)
+    assert list(consejos_etapa) == GOLDEN["campos_consejos"]
+    assert list(consejos_etapa.values()) == _textos(esperado_consejos)
+    plan = consejos.plan_riego(etapa, sistema, maceta)
+    assert list(plan) == GOLDEN["campos_riego"]
+    assert list(plan.values()) == _textos(esperado_riego)
+
+def test_consejo_diario_rinde():
+    diferencias = []
+    for etapa, sistema, maceta, k, esperado in GOLDEN["rinde"]:
+        curr, daily = _clima(k) if k is not None else (None, None)
+        obtenido = list(consejos.consejo_diario_rinde(etapa, sistema, maceta, curr, daily))
+        if obtenido != _textos(esperado):
+            diferencias.append((etapa, sistema, maceta, k))
+    assert not diferencias, f"{len(diferencias)} casos distintos, p. ej. {diferencias[:5]}"
+
+def test_recomendaciones_clima():
+    # Como clima.render: todos los cultivos en una pasada de lote.evaluar_cultivos y los textos con mensajes_lote
+    casos = GOLDEN["clima"]
+    diferencias = []
+    for k, c in enumerate(GOLDEN["climas"]):
+        filas = [caso for caso in casos if caso[3] == k]
+        cultivos = [{"inicio": HOY - datetime.timedelta(days=d), "sistema": s, "maceta_litros": m} for d, s, m, _, _ in filas]
+        dias, sistemas, macetas = lote.columnas_cultivos(cultivos, HOY)
+        vpd = calcular_vpd(c["t"], c["h"])
+        lluvia = c["daily"]["precipitation_probability_max"][0] if c["daily"] else 0
+        resultado = lote.evaluar_cultivos(dias, sistemas, macetas, c["t"], c["h"], c["v"], vpd, lluvia, hoy=HOY)
+        for i, (d, s, m, _, esperado) in enumerate(filas):
+            ctx = {"t": c["t"], "h": c["h"], "v": c["v"], "vpd": vpd, "maceta_litros": m}
+            if mensajes_lote(REGLAS_CLIMA, resultado["clima"][i], ctx) != _textos(esperado):
+                diferencias.append((d, s, m, k))
+    assert not diferencias, f"{len(diferencias)} casos distintos, p. ej. {diferencias[:5]}"
+
+def test_grilla_cubre_todos_los_sistemas():
+    assert {caso[1] for caso in GOLDEN["etapa"]} == set(SISTEMAS)
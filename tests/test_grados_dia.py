@@ -0,0 +1,78 @@
+import datetime
+import threading
+
+import pytest
+
+import grados_dia
+from calendario import clima_normal, grados_dia as gd
+
+HOY = datetime.date(2026, 1, 15)
+
+def _cultivo(dias, sistema="Exterior Maceta", **extra):
+    return {"nombre": "c", "sistema": sistema, "inicio": HOY - datetime.timedelta(days=dias), **extra}
+
+def _normal(fecha, delta=0.0):
+    tmax, tmin = clima_normal()
+    doy = fecha.timetuple().tm_yday - 1
+    return float(gd(tmax[doy] + delta, tmin[doy] + delta))
+
+def test_dias_pendientes():
+    c = _cultivo(10)
+    assert grados_dia.dias_pendientes(c, HOY) == (c["inicio"], 10)
+    c["gdd_hasta"] = HOY - datetime.timedelta(days=1)
+    assert grados_dia.dias_pendientes(c, HOY) == (HOY, 0)
+    c["gdd_hasta"] = HOY - datetime.timedelta(days=4)
+    assert grados_dia.dias_pendientes(c, HOY) == (HOY - datetime.timedelta(days=3), 3)
+    # Acumulado de un inicio anterior (se cambió la fecha de inicio): se recalcula desde el inicio nuevo
+    c["gdd_hasta"] = c["inicio"] - datetime.timedelta(days=5)
+    assert grados_dia.dias_pendientes(c, HOY) == (c["inicio"], 10)
+
+def test_actualizar_cultivo_medido_y_normal():
+    c = _cultivo(3)
+    ayer = HOY - datetime.timedelta(days=1)
+    assert grados_dia.actualizar_cultivo(c, {ayer: (25.0, 15.0)}, HOY)
+    esperado = _normal(HOY - datetime.timedelta(days=3)) + _normal(HOY - datetime.timedelta(days=2)) + 15.0
+    assert c["gdd"] == pytest.approx(esperado, abs=0.1)
+    assert c["gdd_hasta"] == ayer
+    # Al día siguiente sólo se suma el día nuevo
+    assert grados_dia.actualizar_cultivo(c, {HOY: (40.0, 2.0)}, HOY + datetime.timedelta(days=1))
+    assert c["gdd"] == pytest.approx(esperado + 12.5, abs=0.1)
+    assert not grados_dia.actualizar_cultivo(c, {}, HOY + datetime.timedelta(days=1))
+
+def test_actualizar_cultivo_invernadero():
+    c = _cultivo(1, "Invernadero Maceta")
+    grados_dia.actualizar_cultivo(c, {HOY - datetime.timedelta(days=1): (20.0, 10.0)}, HOY)
+    assert c["gdd"] == pytest.approx(13.0)
+
+def test_ubicacion_por_cultivo(monkeypatch):
+    pedidos = []
+    def temperaturas(lat, lon, dias):
+        pedidos.append((lat, lon))
+        return {HOY - datetime.timedelta(days=1): (20.0 + lat, 10.0)}
+    monkeypatch.setattr(grados_dia, "temperaturas_pasadas", temperaturas)
+    propio = _cultivo(1, lat=1.0, lon=1.0)
+    sin_ubicacion = _cultivo(1)
+    interior = _cultivo(1, "Interior Luz")
+    cambiados = grados_dia.actualizar_grados_dia([propio, sin_ubicacion, interior], 2.0, 2.0, hoy=HOY)
+    assert sorted(pedidos) == [(1.0, 1.0), (2.0, 2.0)]
+    assert (sin_ubicacion["lat"], sin_ubicacion["lon"]) == (2.0, 2.0)
+    assert propio["gdd"] == pytest.approx(10.5) and sin_ubicacion["gdd"] == pytest.approx(11.0)
+    assert len(cambiados) == 2 and "gdd" not in interior and "lat" not in interior
+    # El job por lotes no tiene ubicación propia: saltea los cultivos sin ubicación
+    otro = _cultivo(1)
+    assert grados_dia.actualizar_grados_dia([otro], hoy=HOY) == []
+    assert "gdd" not in otro and otro.get("lat") is None
+
+def test_sin_esperar(monkeypatch):
+    liberar = threading.Event()
+    def temperaturas(lat, lon, dias):
+        liberar.wait(5)
+        return {HOY - datetime.timedelta(days=1): (20.0, 10.0)}
+    monkeypatch.setattr(grados_dia, "temperaturas_pasadas", temperaturas)
+    c = _cultivo(1)
+    assert grados_dia.actualizar_grados_dia([c], 3.0, 3.0, hoy=HOY, esperar=False) is None
+    assert c.get("lat") is None and "gdd" not in c
+    liberar.set()
+    grados_dia._PEDIDOS[(3.0, 3.0, HOY)].result(5)
+    assert grados_dia.actualizar_grados_dia([c], 3.0, 3.0, hoy=HOY, esperar=False) == [c]
+    assert c["lat"] == 3.0 and c["gdd"] == pytest.approx(10.0)
@@ -0,0 +1,24 @@
+import pytest
+
+import limites
+
+@pytest.mark.parametrize("peer, forwarded_for, cliente, interno", [
+    ("203.0.113.9", "", "203.0.113.9", False),
+    ("127.0.0.1", "", "127.0.0.1", True),
+    # Sólo se cree X-Forwarded-For si la conexión viene de un proxy confiable
+    ("203.0.113.9", "10.0.0.1", "203.0.113.9", False),
+    ("127.0.0.1", "198.51.100.7, 10.0.0.4", "198.51.100.7", False),
+    ("127.0.0.1", "10.0.0.3, 192.168.1.1", "10.0.0.3", True),
+    # Saltos con puerto, también IPv6 entre corchetes
+    ("127.0.0.1", "1.2.3.4:5678", "1.2.3.4", False),
+    ("127.0.0.1", "[2001:db8::1]:443", "2001:db8::1", False),
+    ("127.0.0.1", "[2001:db8::1]", "2001:db8::1", False),
+    ("127.0.0.1", "2001:db8::2", "2001:db8::2", False),
+    ("127.0.0.1", "10.0.0.3, 192.168.1.1:8080", "10.0.0.3", True),
+    # Un salto ilegible es un cliente externo, no el proxy confiable que lo reenvió
+    ("127.0.0.1", "unknown", "unknown", False),
+    ("127.0.0.1", "1.2.3.4, basura, 10.0.0.2:99", "basura", False),
+])
+def test_ip_cliente(peer, forwarded_for, cliente, interno):
+    assert limites.ip_cliente(peer, forwarded_for) == cliente
+    assert limites.interno(peer, forwarded_for) is interno
@@ -0,0 +1,38 @@
+import datetime
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import solar
+from calendario import _proximo_disparo
+
+LUGARES = [(-33.42, -63.30), (-54.8, -68.3), (-22.0, -65.6), (10.5, -66.9)]
+
+@pytest.mark.parametrize("lat, lon", LUGARES)
+def test_escalar_igual_a_tabla(lat, lon):
+    for fecha in (datetime.date(2026, 1, 1), datetime.date(2026, 6, 21), datetime.date(2028, 12, 31)):
+        sol = solar.sol_del_dia(lat, lon, fecha)
+        serie = solar.serie_solar(lat, lon, np.array([fecha - datetime.timedelta(days=1), fecha], dtype="datetime64[D]"))
+        for campo in solar.CAMPOS_SOLARES:
+            assert sol[campo] == pytest.approx(serie[campo][1], abs=1e-9)
+        assert sol["cambio_min"] == pytest.approx((serie["duracion"][1] - serie["duracion"][0]) * 60, abs=1e-6)
+
+@pytest.mark.parametrize("lat, lon", LUGARES)
+def test_disparo_igual_al_vectorizado(lat, lon):
+    for mes in range(1, 13):
+        hoy = datetime.date(2026, mes, 10)
+        fechas = np.datetime64(hoy, "D") + np.arange(-1, 366).astype("timedelta64[D]")
+        idx = _proximo_disparo(solar.serie_solar(lat, lon, fechas)["duracion"], solar.FOTOPERIODO_CRITICO)[1]
+        esperado = None if idx >= len(fechas) else fechas[idx].astype(datetime.date)
+        assert solar.disparo_floracion(lat, lon, hoy) == esperado
+
+def test_clima_sin_numpy():
+    # Lo que usa la página gratuita de Clima no carga numpy
+    codigo = ("import sys, datetime, solar, lote, etapas; "
+              "solar.sol_del_dia(-33.42, -63.3, datetime.date(2026, 1, 1)); solar.disparo_floracion(-33.42, -63.3); "
+              "print('numpy' in sys.modules)")
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert salida.stdout.strip() == "False"
@@ -0,0 +1,215 @@
+import os
+import base64
+import streamlit as st
+from streamlit_js_eval import streamlit_js_eval
+from datos.tutoriales import TUTORIALES
+
+def mostrar_tutorial(modulo_nombre):
+    tut = TUTORIALES.get(modulo_nombre)
+    if not tut:
+        return
+    
+    visit_key = f"tutorial_visits_{modulo_nombre.replace(' ', '_').replace('&', 'y')}"
+    dismiss_key = f"tutorial_dismissed_{modulo_nombre.replace(' ', '_').replace('&', 'y')}"
+    
+    if dismiss_key not in st.session_state:
+        st.session_state[dismiss_key] = False
+    if visit_key not in st.session_state:
+        st.session_state[visit_key] = 0
+    
+    if f"tutorial_ls_checked_{modulo_nombre}" not in st.session_state:
+        try:
+            ls_key_visits = f"glm_tutorial_visits_{modulo_nombre.replace(' ', '_').replace('&', 'y')}"
+            ls_key_dismiss = f"glm_tutorial_dismiss_{modulo_nombre.replace(' ', '_').replace('&', 'y')}"
+            stored_visits = streamlit_js_eval(
+                js_expressions=f"localStorage.getItem('{ls_key_visits}')",
+                key=f"read_tut_visits_{modulo_nombre.replace(' ', '_')}", want_output=True
+            )
+            stored_dismiss = streamlit_js_eval(
+                js_expressions=f"localStorage.getItem('{ls_key_dismiss}')",
+                key=f"read_tut_dismiss_{modulo_nombre.replace(' ', '_')}", want_output=True
+            )
+            if stored_visits and str(stored_visits).isdigit():
+                st.session_state[visit_key] = int(stored_visits)
+            if stored_dismiss == "true":
+                st.session_state[dismiss_key] = True
+        except Exception:
+            pass
+        st.session_state[f"tutorial_ls_checked_{modulo_nombre}"] = True
+    
+    visits = st.session_state[visit_key]
+    
+    new_visits = visits + 1
+    st.session_state[visit_key] = new_visits
+    try:
+        ls_key_visits = f"glm_tutorial_visits_{modulo_nombre.replace(' ', '_').replace('&', 'y')}"
+        streamlit_js_eval(
+            js_expressions=f"localStorage.setItem('{ls_key_visits}', '{new_visits}')",
+            key=f"write_tut_visits_{modulo_nombre.replace(' ', '_')}"
+        )
+    except Exception:
+        pass
+    
+    if st.session_state[dismiss_key]:
+        return
+    
+    show_dismiss_option = new_visits >= 10
+    
+    pasos_html = "".join([f"<li>{p}</li>" for p in tut["pasos"]])
+    
+    st.markdown(f"""
+    <div class="tutorial-card">
+        <h4>{tut['icono']} {tut['titulo']} — Guía rápida</h4>
+        <p>{tut['desc']}</p>
+        <ul class="tutorial-steps">
+            {pasos_html}
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if show_dismiss_option:
+        if st.button(f"✕ No mostrar más este tutorial", key=f"btn_dismiss_tut_{modulo_nombre.replace(' ', '_')}"):
+            st.session_state[dismiss_key] = True
+            try:
+                ls_key_dismiss = f"glm_tutorial_dismiss_{modulo_nombre.replace(' ', '_').replace('&', 'y')}"
+                streamlit_js_eval(
+                    js_expressions=f"localStorage.setItem('{ls_key_dismiss}', 'true')",
+                    key=f"write_tut_dismiss_{modulo_nombre.replace(' ', '_')}"
+                )
+            except Exception:
+                pass
+            st.rerun()
+
+BANNER_PATHS = {
+    "clima": "static/images/banner_clima.png",
+    "asesoramiento": "static/images/banner_asesoramiento.png",
+    "riego": "static/images/banner_riego.png",
+    "diagnostico": "static/images/banner_diagnostico.png",
+    "cosecha": "static/images/banner_cosecha.png",
+    "legal": "static/images/banner_legal.png",
+    "seguimiento": "static/images/banner_seguimiento.png",
+}
+
+ICON_PATHS = {
+    "clima": "static/images/icon_clima.png",
+    "asesoramiento": "static/images/icon_asesoramiento.png",
+    "riego": "static/images/icon_riego.png",
+    "diagnostico": "static/images/icon_diagnostico.png",
+    "cosecha": "static/images/icon_cosecha.png",
+    "legal": "static/images/icon_legal.png",
+    "seguimiento": "static/images/icon_seguimiento.png",
+    "temp": "static/images/icon_temp.png",
+    "humedad": "static/images/icon_humedad.png",
+    "viento": "static/images/icon_viento.png",
+    "seedling": "static/images/icon_seedling.png",
+    "remedios": "static/images/icon_remedios.png",
+    "alerta": "static/images/icon_alerta.png",
+    "calendario": "static/images/icon_calendario.png",
+    "vpd": "static/images/icon_vpd.png",
+    "lluvia": "static/images/icon_lluvia.png",
+}
+
+LOGO_PATHS = ["static/images/logo_app_v2.png", "static/images/logo_cannabis.png"]
+GLM_DIGITAL_PATH = "static/images/glm_imagen_digital.png"
+LEAF_PATH = "static/images/leaf_divider.png"
+
+# En desarrollo (GLM_ASSETS_HOT_RELOAD=1) se revisa el mtime en cada uso para recargar imágenes editadas
+ASSETS_HOT_RELOAD = os.environ.get("GLM_ASSETS_HOT_RELOAD", "0") == "1"
+# Detrás de server.py (que lo define para sus workers) las imágenes se piden por URL y las sirve el proxy con
+# caché HTTP; corriendo Streamlit solo, van embebidas en base64
+ASSETS_POR_URL = os.environ.get("GLM_ASSETS_URL", "0") == "1"
+
+def _leer_asset(path):
+    try:
+        mtime = os.path.getmtime(path)
+        with open(path, "rb") as f:
+            datos = f.read()
+        return (mtime, datos, base64.b64encode(datos).decode())
+    except OSError:
+        return (None, b"", "")
+
+@st.cache_resource
+def _registro_assets():
+    registro = {}
+    for path in list(BANNER_PATHS.values()) + list(ICON_PATHS.values()) + LOGO_PATHS + [GLM_DIGITAL_PATH, LEAF_PATH]:
+        registro[path] = _leer_asset(path)
+    return registro
+
+def _asset(path):
+    registro = _registro_assets()
+    entrada = registro.get(path)
+    if entrada is None:
+        entrada = _leer_asset(path)
+        registro[path] = entrada
+    elif ASSETS_HOT_RELOAD:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        if mtime != entrada[0]:
+            entrada = _leer_asset(path)
+            registro[path] = entrada
+    return entrada
+
+def asset_bytes(path):
+    if not path:
+        return b""
+    return _asset(path)[1]
+
+def asset_b64(path):
+    if not path:
+        return ""
+    return _asset(path)[2]
+
+def asset_src(path):
+    if not path:
+        return ""
+    mtime, _, b64 = _asset(path)
+    if mtime is None:
+        return ""
+    if ASSETS_POR_URL:
+        return "/app/" + path
+    return f"data:image/png;base64,{b64}"
+
+def icon_html(icon_key, size=28):
+    src = asset_src(ICON_PATHS.get(icon_key, ""))
+    if src:
+        return f'<img class="glm-icon" src="{src}" style="width:{size}px;height:{size}px;vertical-align:middle;border-radius:6px;margin-right:8px;display:inline-block;"/>'
+    return ""
+
+def icon_title(icon_key, text, tag="h1", size=36):
+    ic = icon_html(icon_key, size)
+    st.markdown(f'<{tag} class="glm-icon-title">{ic}{text}</{tag}>', unsafe_allow_html=True)
+
+def icon_subtitle(icon_key, text, size=26):
+    ic = icon_html(icon_key, size)
+    st.markdown(f'<h3 class="glm-icon-subtitle">{ic}{text}</h3>', unsafe_allow_html=True)
+
+def cannabis_banner(modulo="clima"):
+    datos = asset_bytes(BANNER_PATHS.get(modulo, ""))
+    if datos:
+        st.image(datos, width="stretch")
+
+
+def cannabis_divider():
+    src = asset_src(LEAF_PATH)
+    if src:
+        st.markdown(f'<div class="cannabis-divider"><div class="line-left"></div><img class="leaf-center" src="{src}" alt="🍃"/><div class="line-right"></div></div>', unsafe_allow_html=True)
+    else:
+        st.markdown('<div class="cannabis-divider"><div class="line-left"></div><span style="font-size:1.3em;margin:0 8px;">🍃</span><div class="line-right"></div></div>', unsafe_allow_html=True)
+
+def cannabis_divider_mini():
+    src = asset_src(LEAF_PATH)
+    if src:
+        st.markdown(f'<div class="cannabis-divider-mini"><div class="line-left"></div><img class="leaf-mini" src="{src}" alt="🍃"/><div class="line-right"></div></div>', unsafe_allow_html=True)
+    else:
+        st.markdown('<div class="cannabis-divider-mini"><div class="line-left"></div><div class="dot-center"></div><div class="line-right"></div></div>', unsafe_allow_html=True)
+
+def tabla_markdown(columnas):
+    encabezados = list(columnas.keys())
+    filas = zip(*columnas.values())
+    md = "| " + " | ".join(encabezados) + " |\n"
+    md += "|" + "---|" * len(encabezados) + "\n"
+    for fila in filas:
+        md += "| " + " | ".join(str(v).replace("|", "\\|") for v in fila) + " |\n"
+    st.markdown(md)